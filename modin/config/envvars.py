@@ -445,6 +445,142 @@ class MinPartitionSize(EnvironmentVariable, type=int):
         return min_partition_size
 
 
+class BroadcastJoinThreshold(EnvironmentVariable, type=int):
+    """
+    Maximum number of elements (rows * columns) of the right frame to broadcast in ``merge``.
+
+    Joins with a bigger right frame are done by hash-partitioning both
+    frames on the join keys and joining the matching buckets in parallel.
+    """
+
+    varname = "MODIN_BROADCAST_JOIN_THRESHOLD"
+    default = 10_000_000
+
+    @classmethod
+    def put(cls, value):
+        """
+        Set ``BroadcastJoinThreshold`` with extra checks.
+
+        Parameters
+        ----------
+        value : int
+            Config value to set.
+        """
+        if value < 0:
+            raise ValueError(
+                f"Broadcast join threshold should be >= 0, passed value {value}"
+            )
+        super().put(value)
+
+
+class GroupbyShuffleThreshold(EnvironmentVariable, type=int):
+    """
+    Minimum number of rows in the Map phase output of a groupby aggregation to shuffle it.
+
+    The Map phase output holds a row per group of every row partition. The bigger output
+    is split into buckets by the group keys and the buckets are reduced in parallel
+    instead of reducing each column partition on a single worker.
+    """
+
+    varname = "MODIN_GROUPBY_SHUFFLE_THRESHOLD"
+    default = 1_000_000
+
+    @classmethod
+    def put(cls, value):
+        """
+        Set ``GroupbyShuffleThreshold`` with extra checks.
+
+        Parameters
+        ----------
+        value : int
+            Config value to set.
+        """
+        if value < 0:
+            raise ValueError(
+                f"Groupby shuffle threshold should be >= 0, passed value {value}"
+            )
+        super().put(value)
+
+
+class GroupbyShuffleUnsorted(EnvironmentVariable, type=bool):
+    """
+    Whether to shuffle the Map phase output of groupby aggregations with ``sort=False``.
+
+    The shuffled groups are hash-partitioned, so they do not follow the order of
+    their first appearance as in pandas.
+    """
+
+    varname = "MODIN_GROUPBY_SHUFFLE_UNSORTED"
+    default = False
+
+
+class SQLWriters(EnvironmentVariable, type=int):
+    """
+    Maximum number of row partitions written to a SQL database at the same time by ``to_sql``.
+
+    Every partition is written by its own worker, so this is the limit
+    of concurrent connections to the database.
+    """
+
+    varname = "MODIN_SQL_WRITERS"
+
+    @classmethod
+    def _get_default(cls):
+        """
+        Get default value of the config.
+
+        Returns
+        -------
+        int
+        """
+        return CpuCount.get()
+
+    @classmethod
+    def put(cls, value):
+        """
+        Set ``SQLWriters`` with extra checks.
+
+        Parameters
+        ----------
+        value : int
+            Config value to set.
+        """
+        if value <= 0:
+            raise ValueError(
+                f"Number of SQL writers should be > 0, passed value {value}"
+            )
+        super().put(value)
+
+
+class IteratorPrefetch(EnvironmentVariable, type=int):
+    """
+    Number of row partitions fetched ahead of the consumed one by ``iterrows``, ``itertuples`` and alike.
+
+    The row partitions are held on the driver, so this bounds its memory footprint.
+    It also sets the number of chunks parsed ahead by ``read_csv`` and ``read_fwf``
+    readers returned for `chunksize` or `iterator`.
+    """
+
+    varname = "MODIN_ITERATOR_PREFETCH"
+    default = 2
+
+    @classmethod
+    def put(cls, value):
+        """
+        Set ``IteratorPrefetch`` with extra checks.
+
+        Parameters
+        ----------
+        value : int
+            Config value to set.
+        """
+        if value < 0:
+            raise ValueError(
+                f"Number of prefetched partitions should be >= 0, passed value {value}"
+            )
+        super().put(value)
+
+
 def _check_vars():
     """
     Check validity of environment variables.
@@ -22,6 +22,7 @@ from .binary import Binary
 from .groupby import (
     GroupByReduce,
     groupby_reduce_functions,
+    groupby_moment_functions,
 )
 
 __all__ = [
@@ -33,4 +34,5 @@ __all__ = [
     "Binary",
     "GroupByReduce",
     "groupby_reduce_functions",
+    "groupby_moment_functions",
 ]
@@ -13,6 +13,7 @@
 
 """Module houses builder class for GroupByReduce operator."""
 
+import numpy as np
 import pandas
 
 from .tree_reduce import TreeReduce
@@ -35,7 +36,8 @@ class GroupByReduce(TreeReduce):
         ----------
         map_func : str, dict or callable(pandas.DataFrameGroupBy) -> pandas.DataFrame
             If `str` this parameter will be treated as a function name to register,
-            so `map_func` and `reduce_func` will be grabbed from `groupby_reduce_functions`.
+            so `map_func` and `reduce_func` will be grabbed from `groupby_reduce_functions`
+            or built from the partial moments if it's one of `groupby_moment_functions`.
             If dict or callable then this will be treated as a function to apply to the `GroupByObject`
             at the map phase.
         reduce_func : str, dict or callable(pandas.DataFrameGroupBy) -> pandas.DataFrame, optional
@@ -55,7 +57,13 @@ class GroupByReduce(TreeReduce):
             def build_fn(name):
                 return lambda df, *args, **kwargs: getattr(df, name)(*args, **kwargs)
 
-            map_func, reduce_func = map(build_fn, groupby_reduce_functions[map_func])
+            if map_func in groupby_moment_functions:
+                call_kwds.setdefault("default_to_pandas_func", build_fn(map_func))
+                map_func, reduce_func = cls.build_moments_functions(map_func)
+            else:
+                map_func, reduce_func = map(
+                    build_fn, groupby_reduce_functions[map_func]
+                )
         if reduce_func is None:
             reduce_func = map_func
         assert not (
@@ -206,11 +214,23 @@ class GroupByReduce(TreeReduce):
 
         # since now index levels contain out 'by', in the reduce phace
         # we want to group on these levels
-        groupby_kwargs["level"] = list(range(len(df.index.names)))
+        by = None
+        if (
+            not groupby_kwargs.get("observed", False)
+            and isinstance(df.index, pandas.MultiIndex)
+            and any(
+                isinstance(dtype, pandas.CategoricalDtype) for dtype in df.index.dtypes
+            )
+        ):
+            # Grouping on the levels does not include the unobserved combinations
+            # of the categories, grouping on their values does
+            by = [df.index.get_level_values(i) for i in range(df.index.nlevels)]
+        else:
+            groupby_kwargs["level"] = list(range(len(df.index.names)))
 
         apply_func = cls.try_filter_dict(reduce_func, df)
         result = apply_func(
-            df.groupby(axis=axis, **groupby_kwargs), *agg_args, **agg_kwargs
+            df.groupby(by=by, axis=axis, **groupby_kwargs), *agg_args, **agg_kwargs
         )
 
         if not as_index:
@@ -246,6 +266,7 @@ class GroupByReduce(TreeReduce):
         drop=False,
         method=None,
         default_to_pandas_func=None,
+        apply_indices=None,
     ):
         """
         Execute GroupBy aggregation with TreeReduce approach.
@@ -276,6 +297,9 @@ class GroupByReduce(TreeReduce):
         default_to_pandas_func : callable(pandas.DataFrameGroupBy) -> pandas.DataFrame, optional
             The pandas aggregation function equivalent to the `map_func + reduce_func`.
             Used in case of defaulting to pandas. If not specified `map_func` is used.
+        apply_indices : list of labels, optional
+            Columns to aggregate. If not specified and `map_func` is a dict, its keys are used,
+            otherwise all of the columns are aggregated.
 
         Returns
         -------
@@ -342,16 +366,352 @@ class GroupByReduce(TreeReduce):
         # `self` partition in a way determined by engine (modin_frame.groupby_reduce)
         # Otherwise `by` was already bound to the Map function in `build_map_reduce_functions`.
         broadcastable_by = getattr(by, "_modin_frame", None)
-        apply_indices = list(map_func.keys()) if isinstance(map_func, dict) else None
+        if apply_indices is None and isinstance(map_func, dict):
+            apply_indices = list(map_func.keys())
         new_modin_frame = query_compiler._modin_frame.groupby_reduce(
-            axis, broadcastable_by, map_fn, reduce_fn, apply_indices=apply_indices
+            axis,
+            broadcastable_by,
+            map_fn,
+            reduce_fn,
+            apply_indices=apply_indices,
+            sort=groupby_kwargs.get("sort", True),
         )
 
         result = query_compiler.__constructor__(new_modin_frame)
+        if not groupby_kwargs.get("as_index", True):
+            # The buckets of a shuffled reduce are numbered from zero independently
+            result.index = pandas.RangeIndex(len(result.index))
         if result.index.name == "__reduced__":
             result.index.name = None
         return result
 
+    @staticmethod
+    def map_moments(grp, order, columns=None):
+        """
+        Compute partial central moments of the groups at the Map phase.
+
+        Parameters
+        ----------
+        grp : pandas.core.groupby.DataFrameGroupBy
+            GroupBy object of a single partition.
+        order : int
+            The highest central moment to compute.
+        columns : list of labels, optional
+            Columns to compute the moments of. If not specified, the columns
+            ``grp.mean()`` aggregates are used.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Frame whose first column level holds the name of the statistic: "count",
+            "mean" and the sums of powers of deviations from the mean ("m2", "m3", ...)
+            up to the `order`-th one.
+        """
+        means = (grp if columns is None else grp[columns]).mean()
+        stats = {"count": grp[means.columns].count(), "mean": means}
+        if order > 1:
+            codes = grp.ngroup().to_numpy()
+            # Rows with the missing keys are numbered with -1
+            mask = codes >= 0
+            codes = codes[mask]
+            values = grp.obj[means.columns].to_numpy(dtype=np.float64)[mask]
+            deviations = values - means.to_numpy(dtype=np.float64)[codes]
+            for power in range(2, order + 1):
+                stats[f"m{power}"] = pandas.DataFrame(
+                    GroupByReduce._sum_by_codes(deviations ** power, codes),
+                    index=means.index,
+                    columns=means.columns,
+                )
+        return pandas.concat(stats, axis=1)
+
+    @staticmethod
+    def reduce_moments(df, codes, order):
+        """
+        Merge partial central moments of the same groups at the Reduce phase.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Partial moments of the groups built by `map_moments`.
+        codes : np.ndarray
+            Number of the group of every row in `df`.
+        order : int
+            The highest central moment to merge.
+
+        Returns
+        -------
+        dict
+            Dictionary mapping the names of the statistics to NumPy arrays
+            with one row per group.
+
+        Notes
+        -----
+        The moments are merged around the mean of the whole group instead of
+        summing the raw powers, which keeps the result numerically stable.
+        """
+        total = GroupByReduce._sum_by_codes
+        count = df["count"].to_numpy(dtype=np.float64)
+        mean = df["mean"].to_numpy(dtype=np.float64)
+        stats = {"count": total(count, codes)}
+        with np.errstate(divide="ignore", invalid="ignore"):
+            stats["mean"] = total(count * mean, codes) / stats["count"]
+        if order > 1:
+            delta = mean - stats["mean"][codes]
+            m2 = df["m2"].to_numpy(dtype=np.float64)
+            stats["m2"] = total(m2 + count * delta ** 2, codes)
+            if order > 2:
+                m3 = df["m3"].to_numpy(dtype=np.float64)
+                stats["m3"] = total(m3 + 3 * delta * m2 + count * delta ** 3, codes)
+        return stats
+
+    @staticmethod
+    def finalize_moments(stats, func, ddof=1):
+        """
+        Compute the moment-based aggregation from the merged moments.
+
+        Parameters
+        ----------
+        stats : dict
+            Merged moments of the groups built by `reduce_moments`.
+        func : {"mean", "var", "std", "sem", "skew"}
+            Name of the aggregation.
+        ddof : int, default: 1
+            Delta degrees of freedom of the "var", "std" and "sem" aggregations.
+
+        Returns
+        -------
+        np.ndarray
+            Result of the aggregation with one row per group.
+        """
+        count = stats["count"]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if func == "mean":
+                return stats["mean"]
+            if func == "skew":
+                # Follow ``pandas.core.nanops.nanskew`` treating tiny sums as zeros
+                m2, m3 = (
+                    np.where(np.abs(stats[m]) < 1e-14, 0, stats[m])
+                    for m in ("m2", "m3")
+                )
+                result = (count * (count - 1) ** 0.5 / (count - 2)) * (m3 / m2 ** 1.5)
+                result = np.where(m2 == 0, 0, result)
+                return np.where(count < 3, np.nan, result)
+            result = np.where(count > ddof, stats["m2"] / (count - ddof), np.nan)
+            if func != "var":
+                result = np.sqrt(result)
+            if func == "sem":
+                result = result / np.sqrt(count)
+            return result
+
+    @staticmethod
+    def _sum_by_codes(values, codes):
+        """
+        Sum rows of `values` belonging to the same group skipping missing values.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            2D array to sum.
+        codes : np.ndarray
+            Number of the group of every row, every group is expected to have a row.
+
+        Returns
+        -------
+        np.ndarray
+            2D array with one row per group.
+        """
+        return pandas.DataFrame(values).groupby(codes).sum().to_numpy()
+
+    @classmethod
+    def build_moments_functions(cls, func):
+        """
+        Build map and reduce functions of a moment-based aggregation.
+
+        Parameters
+        ----------
+        func : str
+            Name of the aggregation, one of `groupby_moment_functions`.
+
+        Returns
+        -------
+        Tuple of callable
+            Tuple of map and reduce functions to apply to the `GroupByObject`.
+        """
+        order = groupby_moment_functions[func]
+
+        def map_func(grp, ddof=1):
+            return cls.map_moments(grp, order)
+
+        def reduce_func(grp, ddof=1):
+            df = grp.obj
+            codes = cls._get_group_codes(grp)
+            result = cls.finalize_moments(
+                cls.reduce_moments(df, codes, order), func, ddof
+            )
+            means = df["mean"]
+            result = pandas.DataFrame(
+                {
+                    i: result[:, i].astype(dtype)
+                    for i, dtype in enumerate(cls._get_moments_dtypes(means, func))
+                },
+                index=cls._get_group_labels(df, codes),
+            )
+            result.columns = means.columns
+            return cls._reindex_groups(result, grp)
+
+        return map_func, reduce_func
+
+    @classmethod
+    def build_dict_functions(cls, entries):
+        """
+        Build map and reduce functions of a dictionary aggregation involving moment-based functions.
+
+        Parameters
+        ----------
+        entries : list of tuples
+            List of (column, result label, function name) tuples, where the
+            functions are from either `groupby_reduce_functions` or `groupby_moment_functions`.
+
+        Returns
+        -------
+        Tuple of callable
+            Tuple of map and reduce functions to apply to the `GroupByObject`.
+        """
+
+        def map_func(grp):
+            parts = {}
+            for i, (col, _, func) in enumerate(entries):
+                if col not in grp.obj.columns:
+                    continue
+                if func in groupby_moment_functions:
+                    parts[i] = cls.map_moments(
+                        grp, groupby_moment_functions[func], columns=[col]
+                    )
+                else:
+                    part = getattr(grp[[col]], groupby_reduce_functions[func][0])()
+                    if isinstance(part, pandas.Series):
+                        part = part.to_frame(col)
+                    parts[i] = pandas.concat({"value": part}, axis=1)
+            if len(parts) == 0:
+                return pandas.DataFrame(index=grp.size().index)
+            return pandas.concat(parts, axis=1)
+
+        def reduce_func(grp):
+            df = grp.obj
+            codes = cls._get_group_codes(grp)
+            results = {}
+            for i in df.columns.unique(level=0) if len(df.columns) else []:
+                _, label, func = entries[i]
+                if func in groupby_moment_functions:
+                    part = df[i]
+                    stats = cls.reduce_moments(
+                        part, codes, groupby_moment_functions[func]
+                    )
+                    result = pandas.Series(
+                        cls.finalize_moments(stats, func)[:, 0],
+                        index=cls._get_group_labels(df, codes),
+                    ).astype(cls._get_moments_dtypes(part["mean"], func)[0])
+                    results[label] = cls._reindex_groups(result, grp)
+                else:
+                    reduce_name = groupby_reduce_functions[func][1]
+                    results[label] = getattr(
+                        grp[[col for col in df.columns if col[0] == i]], reduce_name
+                    )().iloc[:, 0]
+            if len(results) == 0:
+                return pandas.DataFrame(index=grp.size().index)
+            return pandas.DataFrame(results)
+
+        return map_func, reduce_func
+
+    @staticmethod
+    def _get_group_codes(grp):
+        """
+        Number the groups of the partial results at the Reduce phase.
+
+        Parameters
+        ----------
+        grp : pandas.core.groupby.DataFrameGroupBy
+            GroupBy object of the partial results.
+
+        Returns
+        -------
+        np.ndarray
+            Number of the group of every row, the groups present in the partial
+            results are numbered consecutively in the order of the groups of `grp`.
+
+        Notes
+        -----
+        The groups of the unobserved categories are numbered by ``ngroup`` too,
+        but they have no rows to number.
+        """
+        _, codes = np.unique(grp.ngroup().to_numpy(), return_inverse=True)
+        return codes
+
+    @staticmethod
+    def _get_group_labels(df, codes):
+        """
+        Get labels of the groups numbered with `codes`.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Grouped frame holding group labels in its index.
+        codes : np.ndarray
+            Number of the group of every row in `df`.
+
+        Returns
+        -------
+        pandas.Index
+            Labels of the groups in the order of their numbers.
+        """
+        _, positions = np.unique(codes, return_index=True)
+        return df.index[positions]
+
+    @staticmethod
+    def _reindex_groups(result, grp):
+        """
+        Conform the result of the aggregation to the groups of `grp`.
+
+        Parameters
+        ----------
+        result : pandas.DataFrame or pandas.Series
+            Aggregation result holding the observed groups only.
+        grp : pandas.core.groupby.DataFrameGroupBy
+            GroupBy object the aggregation is applied to.
+
+        Returns
+        -------
+        pandas.DataFrame or pandas.Series
+            The result in the order of the groups of `grp` that also includes
+            unobserved categories if `grp` is not observed.
+        """
+        return result.reindex(grp.size().index)
+
+    @staticmethod
+    def _get_moments_dtypes(means, func):
+        """
+        Get data types of the moment-based aggregation results.
+
+        Parameters
+        ----------
+        means : pandas.DataFrame
+            Partial means of the groups.
+        func : {"mean", "var", "std", "sem", "skew"}
+            Name of the aggregation.
+
+        Returns
+        -------
+        list of np.dtype
+            Data types of the partial means for "mean" and "var" falling back to
+            ``float64`` for non-float ones, ``float64`` for the other aggregations.
+        """
+        return [
+            dtype
+            if dtype.kind == "f" and func in ("mean", "var")
+            else np.dtype(np.float64)
+            for dtype in means.dtypes
+        ]
+
     @staticmethod
     def try_filter_dict(agg_func, df):
         """
@@ -484,3 +844,13 @@ groupby_reduce_functions = {
     "size": ("size", "sum"),
     "sum": ("sum", "sum"),
 }
+
+# This dict maps names of the functions computed from the partial central
+# moments of the groups to the highest moment they require
+groupby_moment_functions = {
+    "mean": 1,
+    "sem": 2,
+    "skew": 3,
+    "std": 2,
+    "var": 2,
+}
@@ -17,7 +17,8 @@ Module contains class PandasDataframe.
 PandasDataframe is a parent abstract class for any dataframe class
 for pandas storage format.
 """
-from collections import OrderedDict
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import pandas
 import datetime
@@ -32,6 +33,8 @@ from modin.core.storage_formats.pandas.parsers import (
 )
 from modin.core.dataframe.base.dataframe.dataframe import ModinDataframe
 from modin.core.dataframe.base.dataframe.utils import Axis, JoinType
+from modin.core.dataframe.pandas.utils import ShuffleSortFunctions, hash_split
+from modin.config import NPartitions
 from modin.pandas.indexing import is_range_like
 from modin.pandas.utils import is_full_grab_slice, check_both_not_none
 
@@ -705,6 +708,10 @@ class PandasDataframe(object):
             new_col_widths,
             new_dtypes,
         )
+        if row_positions is not None and intermediate._row_lengths_cache is not None:
+            # Selecting rows may leave row partitions of very different lengths,
+            # they are rebalanced only if the lengths are known without waiting
+            intermediate = intermediate.rebalance_partitions(force=False)
         # Check if monotonically increasing, return if it is. Fast track code path for
         # common case to keep it fast.
         if (
@@ -1477,6 +1484,7 @@ class PandasDataframe(object):
             dtypes=dtypes,
         )
 
+    @lazy_metadata_decorator(apply_axis="both")
     def window(
         self,
         axis: Union[int, Axis],
@@ -1491,8 +1499,10 @@ class PandasDataframe(object):
         ----------
         axis : int or modin.core.dataframe.base.utils.Axis
             The axis to slide over.
-        reduce_fn : callable(rowgroup|colgroup) -> row|col
-            The reduce function to apply over the data.
+        reduce_fn : callable(pandas.DataFrame) -> pandas.DataFrame
+            The reduce function to apply over the data. It computes all of the windows
+            of the passed frame at once, returning a row (column) per window ending
+            at each of its rows (columns), e.g. ``lambda df: df.rolling(3).sum()``.
         window_size : int
             The number of row/columns to pass to the function.
             (The size of the sliding window).
@@ -1509,8 +1519,77 @@ class PandasDataframe(object):
         -----
         The user-defined reduce function must reduce each window’s column
         (row if axis=1) down to a single value.
+
+        Every partition is extended with a halo of the last ``window_size - 1``
+        rows (columns) of the partitions preceding it, so the windows are computed
+        for all of the partitions in parallel without building full-axis partitions.
         """
-        pass
+        axis = Axis(axis)
+        new_partitions = self._partition_mgr_cls.map_partitions_with_halo(
+            axis.value,
+            self._partitions,
+            reduce_fn,
+            window_size - 1,
+            self._axes_lengths[axis.value],
+        )
+        return self.__constructor__(
+            new_partitions,
+            self.index,
+            self.columns,
+            self._row_lengths,
+            self._column_widths,
+            None if result_schema is None else pandas.Series(result_schema),
+        )
+
+    @lazy_metadata_decorator(apply_axis="both")
+    def scan(
+        self,
+        axis: Union[int, Axis],
+        scan_fn: Callable,
+        carry_fn: Callable,
+        full_axis: bool = False,
+    ) -> "PandasDataframe":
+        """
+        Apply a cumulative function along the specified axis with a parallel prefix scan.
+
+        Parameters
+        ----------
+        axis : int or modin.core.dataframe.base.utils.Axis
+            The axis to scan along.
+        scan_fn : callable(pandas.DataFrame) -> pandas.DataFrame
+            The cumulative function to apply, e.g. ``lambda df: df.cumsum()``.
+        carry_fn : callable(pandas.DataFrame) -> pandas.DataFrame
+            The function computing the state of `scan_fn` at the end of the passed frame
+            as the rows (columns) continuing the scan, e.g. ``lambda df: df.cumsum().iloc[-1:]``.
+            It must be composable: applied to the concatenated carries it gives
+            the carry of the concatenated frames.
+        full_axis : bool, default: False
+            Whether the functions need the full rows (columns if axis=1) of the frame,
+            the labels of the other axis are recomputed then.
+
+        Returns
+        -------
+        PandasDataframe
+            A new PandasDataframe with the cumulative function applied.
+
+        Notes
+        -----
+        The carries of all of the partitions are computed in parallel and scanned on
+        the driver, then every partition is scanned in parallel starting with
+        the carry of the partitions preceding it, so no full-axis partitions are built.
+        """
+        axis = Axis(axis)
+        new_partitions = self._partition_mgr_cls.scan_partitions(
+            axis.value, self._partitions, scan_fn, carry_fn, full_axis=full_axis
+        )
+        new_axes = [self.index, self.columns]
+        new_lengths = [self._row_lengths, self._column_widths]
+        if full_axis:
+            new_axes[axis.value ^ 1] = self._compute_axis_labels(
+                axis.value ^ 1, new_partitions
+            )
+            new_lengths[axis.value ^ 1] = None
+        return self.__constructor__(new_partitions, *new_axes, *new_lengths)
 
     @lazy_metadata_decorator(apply_axis="both")
     def fold(self, axis, func):
@@ -1665,11 +1744,13 @@ class PandasDataframe(object):
             self._dtypes,
         )
 
+    @lazy_metadata_decorator(apply_axis="both")
     def sort_by(
         self,
         axis: Union[int, Axis],
         columns: Union[str, List[str]],
         ascending: bool = True,
+        **kwargs,
     ) -> "PandasDataframe":
         """
         Logically reorder rows (columns if axis=1) lexicographically by the data in a column or set of columns.
@@ -1680,15 +1761,198 @@ class PandasDataframe(object):
             The axis to perform the sort over.
         columns : string or list
             Column label(s) to use to determine lexicographical ordering.
-        ascending : boolean, default: True
+        ascending : boolean or list of booleans, default: True
             Whether to sort in ascending or descending order.
+        **kwargs : dict
+            Keyword arguments to pass to ``pandas.DataFrame.sort_values``.
 
         Returns
         -------
         PandasDataframe
             A new PandasDataframe sorted into lexicographical order by the specified column(s).
+
+        Notes
+        -----
+        Rows are range-partitioned by the values of the first column via a sample-sort
+        shuffle, so that no single worker or the driver holds the whole frame.
+        Every range is sorted with a stable algorithm, which orders the rows by their
+        keys and then by their original positions, so rows with equal values keep their
+        original order whatever `kind` is requested. pandas sorts a single column with
+        an unstable algorithm by default, so the order of such rows may differ from it.
         """
-        pass
+        axis = Axis(axis)
+        if axis != Axis.ROW_WISE:
+            raise NotImplementedError(
+                "Sorting columns by the values of rows is not supported."
+            )
+        if not isinstance(columns, list):
+            columns = [columns]
+        def sort_function(df):
+            # Index levels named as the sorting columns make ``sort_values`` ambiguous
+            index_names = df.index.names
+            clear_names = any(name in columns for name in index_names)
+            if clear_names:
+                df.index = df.index.set_names([None] * df.index.nlevels)
+            # the pieces of the range are in the original order of rows,
+            # so a stable sort keeps the original order of equal keys
+            result = df.sort_values(
+                by=columns, ascending=ascending, **{**kwargs, "kind": "stable"}
+            )
+            if clear_names:
+                result.index = result.index.set_names(index_names)
+            return result
+
+        return self._sort_rows(
+            sort_function,
+            columns[0],
+            ascending[0] if is_list_like(ascending) else ascending,
+            kwargs.get("na_position", "last"),
+            kwargs.get("key", None),
+        )
+
+    @lazy_metadata_decorator(apply_axis="both")
+    def _sort_rows(
+        self,
+        sort_function,
+        column,
+        ascending,
+        na_position,
+        key=None,
+        new_index=None,
+    ):
+        """
+        Sort rows of the frame with a sample-sort shuffle.
+
+        Parameters
+        ----------
+        sort_function : callable(pandas.DataFrame) -> pandas.DataFrame
+            Function sorting rows of a single new row partition.
+        column : hashable or None
+            Label of the column to range-partition rows by.
+            If None, the rows are range-partitioned by their labels.
+        ascending : bool
+            Whether `sort_function` sorts in ascending order.
+        na_position : {"first", "last"}
+            Where `sort_function` places the rows with missing values.
+        key : callable, optional
+            Function `sort_function` applies to the values before sorting.
+        new_index : pandas.Index, optional
+            Index of the result. We may know this in advance,
+            and if not provided it must be computed.
+
+        Returns
+        -------
+        PandasDataframe
+            A new sorted PandasDataframe.
+        """
+        if len(self.index) == 0 or len(self.columns) == 0 or len(self._partitions) == 1:
+            return self.apply_full_axis(
+                1,
+                sort_function,
+                new_index=new_index,
+                new_columns=self.columns,
+                dtypes="copy",
+            )
+
+        shuffle_functions = ShuffleSortFunctions(
+            column,
+            ascending,
+            na_position,
+            NPartitions.get(),
+            len(self.index),
+            key=key,
+        )
+        if column is None:
+            sample_block_idx = 0
+        else:
+            sample_block_idx = np.searchsorted(
+                np.cumsum(self._column_widths),
+                self.columns.get_indexer_for([column])[0],
+                side="right",
+            )
+        new_partitions = self._partition_mgr_cls.shuffle_partitions(
+            self._partitions, sample_block_idx, shuffle_functions, sort_function
+        )
+        if len(self._column_widths) > 1:
+            # Restore the column partitioning of the original frame
+            new_partitions = self._partition_mgr_cls.map_axis_partitions(
+                1, new_partitions, lambda df: df, lengths=self._column_widths
+            )
+        new_widths = self._column_widths
+        if new_index is None:
+            new_index = self._compute_axis_labels(0, new_partitions)
+        return self.__constructor__(
+            new_partitions,
+            new_index,
+            self.columns,
+            None,
+            new_widths,
+            self._dtypes,
+        )
+
+    @lazy_metadata_decorator(apply_axis="both")
+    def hash_join(
+        self,
+        right,
+        left_on,
+        right_on,
+        join_func,
+        left_position=None,
+        right_position=None,
+    ):
+        """
+        Join two frames bucket by bucket after hash-partitioning both of them on the join keys.
+
+        Parameters
+        ----------
+        right : PandasDataframe
+            The right frame of the join.
+        left_on : list of labels or None
+            Columns of this frame holding the join keys, None to join on its row labels.
+        right_on : list of labels or None
+            Columns of `right` holding the join keys, None to join on its row labels.
+        join_func : callable(pandas.DataFrame, pandas.DataFrame) -> pandas.DataFrame
+            Function joining a bucket of this frame with the same bucket of `right`.
+        left_position : str, optional
+            If specified, a column with this name holding the position of every row
+            in this frame is appended to the buckets of this frame.
+        right_position : str, optional
+            If specified, a column with this name holding the position of every row
+            in `right` is appended to the buckets of `right`.
+
+        Returns
+        -------
+        PandasDataframe
+            A new PandasDataframe with one row partition per bucket.
+
+        Notes
+        -----
+        Rows with equal keys always land into the same bucket, so the
+        result is the union of the bucket joins. Neither of the frames is
+        gathered on a single worker or in the driver.
+        """
+        num_buckets = NPartitions.get()
+
+        def get_offsets(frame):
+            return np.cumsum([0] + frame._row_lengths[:-1]).tolist()
+
+        new_partitions = self._partition_mgr_cls.hash_join_partitions(
+            self._partitions,
+            right._partitions,
+            lambda df, offset: hash_split(
+                df, left_on, num_buckets, left_position, offset
+            ),
+            lambda df, offset: hash_split(
+                df, right_on, num_buckets, right_position, offset
+            ),
+            num_buckets,
+            join_func,
+            get_offsets(self),
+            get_offsets(right),
+        )
+        new_index = self._compute_axis_labels(0, new_partitions)
+        new_columns = self._compute_axis_labels(1, new_partitions)
+        return self.__constructor__(new_partitions, new_index, new_columns)
 
     @lazy_metadata_decorator(apply_axis="both")
     def filter(self, axis: Union[Axis, int], condition: Callable) -> "PandasDataframe":
@@ -1725,16 +1989,55 @@ class PandasDataframe(object):
         )
 
         new_lengths[axis.value] = self._axes_lengths[axis.value]
-        new_lengths[
-            axis.value ^ 1
-        ] = None  # We do not know what the resulting widths will be
+        if axis == Axis.COL_WISE and new_partitions.size > 0:
+            # The partitions are computed along with the row labels, so their
+            # lengths are available without waiting for them again
+            new_lengths[0] = [part.length() for part in new_partitions[:, 0]]
+        else:
+            new_lengths[
+                axis.value ^ 1
+            ] = None  # We do not know what the resulting widths will be
 
-        return self.__constructor__(
+        result = self.__constructor__(
             new_partitions,
             *new_axes,
             *new_lengths,
             self.dtypes if axis == 0 else None,
         )
+        if axis == Axis.COL_WISE:
+            # Filtering rows may leave row partitions of very different lengths
+            result = result.rebalance_partitions(force=False)
+        return result
+
+    @lazy_metadata_decorator(apply_axis=None)
+    def rebalance_partitions(self, force=True):
+        """
+        Redistribute rows between row partitions so that they have about the same length.
+
+        Parameters
+        ----------
+        force : bool, default: True
+            Whether to rebalance the row partitions even if their lengths are not skewed.
+
+        Returns
+        -------
+        PandasDataframe
+            A new PandasDataframe with rebalanced row partitions or this
+            PandasDataframe if they are already balanced.
+        """
+        new_partitions, new_lengths = self._partition_mgr_cls.rebalance_partitions(
+            self._partitions, lengths=self._row_lengths, force=force
+        )
+        if new_partitions is self._partitions:
+            return self
+        return self.__constructor__(
+            new_partitions,
+            self.index,
+            self.columns,
+            new_lengths,
+            self._column_widths,
+            self._dtypes,
+        )
 
     def filter_by_types(self, types: List[Hashable]) -> "PandasDataframe":
         """
@@ -2543,6 +2846,7 @@ class PandasDataframe(object):
         new_index=None,
         new_columns=None,
         apply_indices=None,
+        sort=True,
     ):
         """
         Groupby another Modin DataFrame dataframe and aggregate the result.
@@ -2565,6 +2869,8 @@ class PandasDataframe(object):
             and if not provided it must be computed.
         apply_indices : list-like, default: None
             Indices of `axis ^ 1` to apply groupby over.
+        sort : bool, default: True
+            Whether `reduce_func` sorts the groups.
 
         Returns
         -------
@@ -2582,7 +2888,14 @@ class PandasDataframe(object):
             )
 
         new_partitions = self._partition_mgr_cls.groupby_reduce(
-            axis, self._partitions, by_parts, map_func, reduce_func, apply_indices
+            axis,
+            self._partitions,
+            by_parts,
+            map_func,
+            reduce_func,
+            apply_indices,
+            sort=sort,
+            row_lengths=self._row_lengths if axis == 0 else None,
         )
         new_axes = [
             self._compute_axis_labels(i, new_partitions)
@@ -2710,6 +3023,60 @@ class PandasDataframe(object):
 
         return df
 
+    def to_pandas_chunks(self, prefetch=0):
+        """
+        Convert this Modin DataFrame to pandas DataFrames row partition by row partition.
+
+        The column blocks of every row partition are combined by a remote task,
+        so only one row partition is transferred to the driver at a time. Up to
+        `prefetch` next row partitions are combined and transferred to the driver
+        by background threads while the current one is being consumed.
+
+        Parameters
+        ----------
+        prefetch : int, default: 0
+            Number of row partitions to fetch ahead of the consumed one.
+
+        Yields
+        ------
+        pandas.DataFrame
+            The next row partition.
+        """
+        if self._partitions.size == 0:
+            yield self.to_pandas()
+            return
+
+        def fetch(row_partition):
+            """Combine the blocks of `row_partition` and transfer it to the driver."""
+            return row_partition.apply(
+                lambda df: df, num_splits=1, maintain_partitioning=False
+            )[0].to_pandas()
+
+        row_partitions = self._partition_mgr_cls.row_partitions(self._partitions)
+        executor = ThreadPoolExecutor(max_workers=max(prefetch, 1))
+        pending = deque()
+        start = 0
+        try:
+            for i in range(len(row_partitions)):
+                # The number of the row partitions in flight is bounded,
+                # so is the memory they take on the driver
+                while len(pending) <= prefetch and i + len(pending) < len(
+                    row_partitions
+                ):
+                    pending.append(
+                        executor.submit(fetch, row_partitions[i + len(pending)])
+                    )
+                df = pending.popleft().result()
+                df.index = self.index[start : start + len(df)]
+                df.columns = self.columns
+                start += len(df)
+                yield df
+        finally:
+            # The iteration may be abandoned before reaching the last row partition
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
     def to_numpy(self, **kwargs):
         """
         Convert this Modin DataFrame to a NumPy array.
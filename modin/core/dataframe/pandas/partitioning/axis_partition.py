@@ -124,6 +124,61 @@ class PandasDataframeAxisPartition(BaseDataframeAxisPartition):
         args.extend(self.list_of_blocks)
         return self._wrap_partitions(self.deploy_axis_func(*args))
 
+    def split(self, split_func, num_splits, **kwargs):
+        """
+        Split this axis partition into several partitions using `split_func`.
+
+        Parameters
+        ----------
+        split_func : callable(pandas.DataFrame) -> list of pandas.DataFrame
+            The function that splits the data of the axis partition into
+            exactly `num_splits` pieces.
+        num_splits : int
+            The number of pieces `split_func` returns.
+        **kwargs : dict
+            Additional keywords arguments to be passed in `split_func`.
+
+        Returns
+        -------
+        list
+            A list of `PandasDataframePartition` objects, one per piece.
+
+        Notes
+        -----
+        Unlike `apply` the pieces may have arbitrary lengths that are known
+        only after `split_func` is executed, which makes this method suitable
+        for shuffling rows between partitions.
+        """
+        args = [self.axis, split_func, num_splits, kwargs]
+        args.extend(self.list_of_blocks)
+        return self._wrap_partitions(self.deploy_splitting_func(*args))
+
+    @classmethod
+    def deploy_splitting_func(cls, axis, split_func, num_splits, kwargs, *partitions):
+        """
+        Deploy a splitting function along a full axis.
+
+        Parameters
+        ----------
+        axis : {0, 1}
+            The axis to concatenate `partitions` along.
+        split_func : callable(pandas.DataFrame) -> list of pandas.DataFrame
+            The function that splits the concatenated data.
+        num_splits : int
+            The number of pieces `split_func` returns.
+        kwargs : dict
+            Additional keywords arguments to be passed in `split_func`.
+        *partitions : iterable
+            All partitions that make up the full axis (row or column).
+
+        Returns
+        -------
+        list
+            A list of pandas DataFrames.
+        """
+        dataframe = pandas.concat(list(partitions), axis=axis, copy=False)
+        return split_func(dataframe, **kwargs)
+
     @classmethod
     def deploy_axis_func(
         cls, axis, func, num_splits, kwargs, maintain_partitioning, *partitions
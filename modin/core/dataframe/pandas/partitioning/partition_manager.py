@@ -25,8 +25,19 @@ import warnings
 
 from modin.error_message import ErrorMessage
 from modin.core.storage_formats.pandas.utils import compute_chunksize
-from modin.core.dataframe.pandas.utils import concatenate
-from modin.config import NPartitions, ProgressBar, BenchmarkMode
+from modin.core.dataframe.pandas.utils import (
+    concatenate,
+    get_label_kinds,
+    hash_split_labels,
+    ShuffleSortFunctions,
+)
+from modin.config import (
+    NPartitions,
+    ProgressBar,
+    BenchmarkMode,
+    GroupbyShuffleThreshold,
+    GroupbyShuffleUnsorted,
+)
 
 import os
 
@@ -203,7 +214,15 @@ class PandasDataframePartitionManager(ABC):
 
     @classmethod
     def groupby_reduce(
-        cls, axis, partitions, by, map_func, reduce_func, apply_indices=None
+        cls,
+        axis,
+        partitions,
+        by,
+        map_func,
+        reduce_func,
+        apply_indices=None,
+        sort=True,
+        row_lengths=None,
     ):
         """
         Groupby data using the `map_func` provided along the `axis` over the `partitions` then reduce using `reduce_func`.
@@ -222,11 +241,27 @@ class PandasDataframePartitionManager(ABC):
             Reduce function.
         apply_indices : list of ints, default: None
             Indices of `axis ^ 1` to apply function over.
+        sort : bool, default: True
+            Whether `reduce_func` sorts the groups.
+        row_lengths : list of ints, optional
+            Row lengths of `partitions`. The Map phase output is shuffled only
+            if they are specified.
 
         Returns
         -------
         NumPy array
             Partitions with applied groupby.
+
+        Notes
+        -----
+        If the Map phase output has more than ``GroupbyShuffleThreshold`` rows and
+        its group keys can be shuffled, it is reduced with `groupby_shuffle_reduce`.
+        Getting the size of the Map phase output waits for the Map phase, so it is
+        only done if `partitions` have more rows than the threshold: the Map phase
+        output is never bigger than its input. The Reduce phase of smaller frames
+        is queued right after the Map phase. Aggregations with ``sort=False`` are
+        shuffled only if ``GroupbyShuffleUnsorted`` is set, as the groups of the
+        buckets do not follow the order of their first appearance.
         """
         if apply_indices is not None:
             partitions = (
@@ -239,10 +274,133 @@ class PandasDataframePartitionManager(ABC):
             )
         else:
             mapped_partitions = cls.map_partitions(partitions, map_func)
+        threshold = GroupbyShuffleThreshold.get()
+        if (
+            axis == 0
+            and (sort or GroupbyShuffleUnsorted.get())
+            and row_lengths is not None
+            and len(mapped_partitions) > 1
+            and mapped_partitions.size > 0
+            and sum(row_lengths) > threshold
+            and sum(part.length() for part in mapped_partitions[:, 0]) > threshold
+            and cls._can_shuffle_labels(mapped_partitions, sort=sort)
+        ):
+            return cls.groupby_shuffle_reduce(mapped_partitions, reduce_func, sort=sort)
         return cls.map_axis_partitions(
             axis, mapped_partitions, reduce_func, enumerate_partitions=True
         )
 
+    @classmethod
+    def _can_shuffle_labels(cls, partitions, sort=True):
+        """
+        Check whether the row labels of `partitions` can be split into buckets by value.
+
+        Parameters
+        ----------
+        partitions : NumPy 2D array
+            Partitions which row labels to check.
+        sort : bool, default: True
+            Whether the labels are to be range-partitioned, so they must be orderable.
+
+        Returns
+        -------
+        bool
+
+        Notes
+        -----
+        Categorical labels are never shuffled: every bucket would be reduced with
+        all of the categories, and the sample sort does not follow their order.
+        """
+        kinds_func = cls.preprocess_func(get_label_kinds)
+        kinds = [part.apply(kinds_func) for part in partitions[:, 0]]
+        for level_kinds in zip(*[part.get() for part in kinds]):
+            level_kinds = set(level_kinds) - {"empty"}
+            if "category" in level_kinds:
+                return False
+            if sort and ("unorderable" in level_kinds or len(level_kinds) > 1):
+                return False
+        return True
+
+    @classmethod
+    @wait_computations_if_benchmark_mode
+    def groupby_shuffle_reduce(cls, partitions, reduce_func, sort=True):
+        """
+        Reduce the Map phase output of a groupby aggregation bucket by bucket.
+
+        Every block of `partitions` is split into buckets by the group keys held
+        in its row labels, then the pieces of the same bucket are reduced in parallel.
+
+        Parameters
+        ----------
+        partitions : NumPy 2D array
+            Partitions holding the Map phase output.
+        reduce_func : callable
+            Reduce function, it must be able to accept `partition_idx` kwarg.
+        sort : bool, default: True
+            Whether `reduce_func` sorts the groups. If True, the keys are
+            range-partitioned, so the buckets follow each other in the sorted
+            order, otherwise they are hash-partitioned.
+
+        Returns
+        -------
+        NumPy array
+            Partitions with applied groupby, one row partition per bucket.
+        """
+        num_buckets = NPartitions.get()
+        if sort:
+            # the lengths are already known if `groupby_reduce` decided to shuffle
+            num_rows = sum(part.length() for part in partitions[:, 0])
+            shuffle_functions = ShuffleSortFunctions(
+                None, True, "last", num_buckets, num_rows
+            )
+            sample_func = cls.preprocess_func(shuffle_functions.sample_fn)
+            samples = [part.apply(sample_func) for part in partitions[:, 0]]
+            num_buckets = shuffle_functions.pivot_fn([part.get() for part in samples])
+            split_func = shuffle_functions.split_fn
+        else:
+            ErrorMessage.missmatch_with_pandas(
+                operation="df.groupby(sort=False)",
+                message=(
+                    "the groups of a shuffled aggregation do not follow the order of "
+                    "their first appearance. See `GroupbyShuffleUnsorted` config"
+                ),
+            )
+
+            def split_func(df):
+                return hash_split_labels(df, num_buckets)
+
+        split_func = cls.preprocess_func(split_func)
+        split_partitions = np.array(
+            [
+                [
+                    cls._row_partition_class([part]).split(
+                        split_func, num_splits=num_buckets
+                    )
+                    for part in row
+                ]
+                for row in partitions
+            ]
+        )
+        reduce_func = cls.preprocess_func(reduce_func)
+        return np.array(
+            [
+                [
+                    cls._column_partitions_class(
+                        list(split_partitions[:, col_idx, bucket_idx])
+                    ).apply(
+                        reduce_func,
+                        num_splits=1,
+                        maintain_partitioning=False,
+                        partition_idx=col_idx,
+                    )[
+                        0
+                    ]
+                    for col_idx in range(split_partitions.shape[1])
+                ]
+                for bucket_idx in range(num_buckets)
+            ]
+        )
+
     @classmethod
     @wait_computations_if_benchmark_mode
     def broadcast_apply_select_indices(
@@ -574,6 +732,188 @@ class PandasDataframePartitionManager(ABC):
             **kwargs,
         )
 
+    @classmethod
+    @wait_computations_if_benchmark_mode
+    def map_partitions_with_halo(cls, axis, partitions, map_func, halo_size, lengths):
+        """
+        Apply `map_func` to every partition extended with a halo of the preceding rows (columns).
+
+        The halo of a partition consists of the last `halo_size` rows (columns) of
+        the partitions preceding it along `axis`, so functions looking back at
+        a fixed number of rows (columns), like rolling aggregations, are computed
+        for all of the partitions in parallel. The halo is trimmed from the result.
+
+        Parameters
+        ----------
+        axis : {0, 1}
+            Axis to slide along (0 - index, 1 - columns).
+        partitions : NumPy 2D array
+            Partitions of Modin Frame.
+        map_func : callable(pandas.DataFrame) -> pandas.DataFrame
+            Function to apply, it must keep the length of its input along `axis`.
+        halo_size : int
+            The number of preceding rows (columns) each partition needs.
+        lengths : list of ints
+            Lengths of the partitions along `axis`.
+
+        Returns
+        -------
+        NumPy array
+            An array of new partitions for Modin Frame.
+        """
+        if halo_size == 0 or partitions.shape[axis] < 2:
+            return cls.map_partitions(partitions, map_func)
+
+        def take(df, start=None, stop=None):
+            return df.iloc[start:stop] if axis == 0 else df.iloc[:, start:stop]
+
+        def apply_with_halo(df, skip, halo_length):
+            return take(map_func(take(df, start=skip)), start=halo_length)
+
+        tail_func = cls.preprocess_func(lambda df: take(df, start=-halo_size))
+        apply_func = cls.preprocess_func(apply_with_halo)
+        axis_partition_class = (
+            cls._column_partitions_class if axis == 0 else cls._row_partition_class
+        )
+        partitions = partitions if axis == 0 else partitions.T
+        tails = [[part.apply(tail_func) for part in row] for row in partitions[:-1]]
+
+        new_partitions = [
+            [part.apply(apply_func, skip=0, halo_length=0) for part in partitions[0]]
+        ]
+        for idx in range(1, len(partitions)):
+            # the halo may span several partitions if they are shorter than it
+            first, tails_length = idx, 0
+            while first > 0 and tails_length < halo_size:
+                first -= 1
+                tails_length += min(lengths[first], halo_size)
+            halo_length = min(tails_length, halo_size)
+            new_partitions.append(
+                [
+                    axis_partition_class(
+                        [tail[col_idx] for tail in tails[first:idx]] + [part]
+                    ).apply(
+                        apply_func,
+                        num_splits=1,
+                        maintain_partitioning=False,
+                        skip=tails_length - halo_length,
+                        halo_length=halo_length,
+                    )[
+                        0
+                    ]
+                    for col_idx, part in enumerate(partitions[idx])
+                ]
+            )
+        new_partitions = np.array(new_partitions)
+        return new_partitions if axis == 0 else new_partitions.T
+
+    @classmethod
+    @wait_computations_if_benchmark_mode
+    def scan_partitions(cls, axis, partitions, scan_func, carry_func, full_axis=False):
+        """
+        Apply cumulative `scan_func` along `axis` with a two-pass parallel prefix scan.
+
+        At the first pass the carry of every partition, the state of the scan at its
+        end, is computed in parallel. The carries are scanned exclusively on the driver,
+        so every partition gets the state of the scan of the partitions preceding it.
+        At the second pass that state is prepended to every partition as its first
+        rows (columns) and the partitions are scanned in parallel.
+
+        Parameters
+        ----------
+        axis : {0, 1}
+            Axis to scan along (0 - index, 1 - columns).
+        partitions : NumPy 2D array
+            Partitions of Modin Frame.
+        scan_func : callable(pandas.DataFrame) -> pandas.DataFrame
+            Cumulative function to apply, it must keep the length of its input along `axis`.
+        carry_func : callable(pandas.DataFrame) -> pandas.DataFrame
+            Function computing the state of `scan_func` at the end of the passed frame
+            as the rows (columns) continuing the scan, e.g. the last row of the
+            cumulative sum. Applied to the concatenated carries it must give the carry
+            of the concatenated frames.
+        full_axis : bool, default: False
+            Whether the functions need the full rows (columns) of the frame. If True,
+            the partitions along the other axis are combined into one.
+
+        Returns
+        -------
+        NumPy array
+            An array of new partitions for Modin Frame.
+        """
+
+        def apply_carry(df, carry):
+            if carry is None or len(carry.axes[axis]) == 0:
+                return scan_func(df)
+            if axis == 0 and df.columns.is_unique:
+                # upcast the data to the dtypes of the scan, so the prepended carry
+                # does not turn it into objects (e.g. the cumulative sum of booleans)
+                df = df.astype(
+                    {
+                        col: dtype
+                        for col, dtype in carry.dtypes.items()
+                        if col in df.columns
+                        and isinstance(dtype, np.dtype)
+                        and isinstance(df.dtypes[col], np.dtype)
+                        and df.dtypes[col] != dtype
+                        and np.can_cast(df.dtypes[col], dtype)
+                    },
+                    copy=False,
+                )
+            result = scan_func(pandas.concat([carry, df], axis=axis, copy=False))
+            num_carried = len(carry.axes[axis])
+            return (
+                result.iloc[num_carried:] if axis == 0 else result.iloc[:, num_carried:]
+            )
+
+        partitions = partitions if axis == 0 else partitions.T
+        if full_axis:
+            other_axis_class = (
+                cls._row_partition_class if axis == 0 else cls._column_partitions_class
+            )
+
+            def apply(row, func, **kwargs):
+                return [
+                    other_axis_class(row).apply(
+                        func, num_splits=1, maintain_partitioning=False, **kwargs
+                    )[0]
+                ]
+
+        else:
+
+            def apply(row, func, **kwargs):
+                return [part.apply(func, **kwargs) for part in row]
+
+        carry_parts = [
+            apply(row, cls.preprocess_func(carry_func)) for row in partitions[:-1]
+        ]
+        carries = [[part.get() for part in row] for row in carry_parts]
+        # exclusive scan of the carries, the first partition has nothing to carry
+        prefixes = [[None] * (1 if full_axis else partitions.shape[1])]
+        for row in carries:
+            prefixes.append(
+                [
+                    carry
+                    if prefix is None
+                    else carry_func(pandas.concat([prefix, carry], axis=axis))
+                    for prefix, carry in zip(prefixes[-1], row)
+                ]
+            )
+
+        apply_func = cls.preprocess_func(apply_carry)
+        new_partitions = np.array(
+            [
+                apply(row, apply_func, carry=prefix[0])
+                if full_axis
+                else [
+                    part.apply(apply_func, carry=carry)
+                    for part, carry in zip(row, prefix)
+                ]
+                for row, prefix in zip(partitions, prefixes)
+            ]
+        )
+        return new_partitions if axis == 0 else new_partitions.T
+
     @classmethod
     def concat(cls, axis, left_parts, right_parts):
         """
@@ -1262,6 +1602,122 @@ class PandasDataframePartitionManager(ABC):
         )
         return result if axis else result.T
 
+    @classmethod
+    @wait_computations_if_benchmark_mode
+    def shuffle_partitions(
+        cls, partitions, index, shuffle_functions, final_shuffle_func
+    ):
+        """
+        Range-partition rows of `partitions` across new row partitions and apply `final_shuffle_func` to each of them.
+
+        Parameters
+        ----------
+        partitions : np.ndarray
+            The 2-d array of partitions to shuffle.
+        index : int
+            Index of the column partition holding the values to sample.
+        shuffle_functions : ShuffleSortFunctions
+            Object providing the sampling, pivoting and splitting functions.
+        final_shuffle_func : callable(pandas.DataFrame) -> pandas.DataFrame
+            Function to apply to each new row partition after the shuffle.
+
+        Returns
+        -------
+        np.ndarray
+            A NumPy array with the new partitions, one column partition wide.
+
+        Notes
+        -----
+        The shuffle never brings the data to the driver. Only the samples of the
+        partitioning values are gathered there to pick the pivots.
+        """
+        sample_func = cls.preprocess_func(shuffle_functions.sample_fn)
+        samples = [part.apply(sample_func) for part in partitions[:, index]]
+        num_buckets = shuffle_functions.pivot_fn([part.get() for part in samples])
+
+        split_func = cls.preprocess_func(shuffle_functions.split_fn)
+        split_partitions = np.array(
+            [
+                row.split(split_func, num_splits=num_buckets)
+                for row in cls.row_partitions(partitions)
+            ]
+        )
+        final_shuffle_func = cls.preprocess_func(final_shuffle_func)
+        return np.array(
+            [
+                cls._column_partitions_class(list(bucket)).apply(
+                    final_shuffle_func, num_splits=1, maintain_partitioning=False
+                )
+                for bucket in split_partitions.T
+            ]
+        )
+
+    @classmethod
+    @wait_computations_if_benchmark_mode
+    def hash_join_partitions(
+        cls,
+        left,
+        right,
+        left_split_func,
+        right_split_func,
+        num_buckets,
+        join_func,
+        left_offsets,
+        right_offsets,
+    ):
+        """
+        Hash-partition rows of two frames into buckets and join the matching buckets.
+
+        Parameters
+        ----------
+        left : np.ndarray
+            The 2-d array of partitions of the left frame.
+        right : np.ndarray
+            The 2-d array of partitions of the right frame.
+        left_split_func : callable(pandas.DataFrame, offset) -> list of pandas.DataFrame
+            Function splitting a row partition of `left` into `num_buckets` pieces.
+        right_split_func : callable(pandas.DataFrame, offset) -> list of pandas.DataFrame
+            Function splitting a row partition of `right` into `num_buckets` pieces.
+        num_buckets : int
+            The number of buckets.
+        join_func : callable(pandas.DataFrame, pandas.DataFrame) -> pandas.DataFrame
+            Function joining a bucket of `left` with the same bucket of `right`.
+        left_offsets : list of int
+            Position of the first row of every row partition of `left` in the whole frame.
+        right_offsets : list of int
+            Position of the first row of every row partition of `right` in the whole frame.
+
+        Returns
+        -------
+        np.ndarray
+            A NumPy array with the new partitions, one row partition per bucket.
+        """
+
+        def split(partitions, split_func, offsets):
+            split_func = cls.preprocess_func(split_func)
+            return np.array(
+                [
+                    row.split(split_func, num_splits=num_buckets, offset=offset)
+                    for row, offset in zip(cls.row_partitions(partitions), offsets)
+                ]
+            )
+
+        left_buckets = split(left, left_split_func, left_offsets)
+        right_buckets = split(right, right_split_func, right_offsets)
+        join_func = cls.preprocess_func(join_func)
+        return np.array(
+            [
+                cls._column_partitions_class(list(left_bucket)).apply(
+                    join_func,
+                    num_splits=1,
+                    other_axis_partition=cls._column_partitions_class(
+                        list(right_bucket)
+                    ),
+                )
+                for left_bucket, right_bucket in zip(left_buckets.T, right_buckets.T)
+            ]
+        )
+
     @classmethod
     @wait_computations_if_benchmark_mode
     def finalize(cls, partitions):
@@ -1275,19 +1731,126 @@ class PandasDataframePartitionManager(ABC):
         """
         [part.drain_call_queue() for row in partitions for part in row]
 
+    # We rebalance when the number of row partitions or the length of the
+    # biggest one exceeds the ideal value by this factor. The threshold is
+    # a heuristic that may need to be tuned for performance.
+    _max_excess_for_rebalance = 1.5
+
     @classmethod
-    def rebalance_partitions(cls, partitions):
+    def is_skewed(cls, lengths):
         """
-        Return the provided array of partitions without rebalancing it.
+        Check whether the rows are distributed between row partitions unevenly.
+
+        Parameters
+        ----------
+        lengths : list of int
+            Lengths of the row partitions.
+
+        Returns
+        -------
+        bool
+        """
+        if len(lengths) == 0:
+            return False
+        ideal_lengths = cls._get_balanced_lengths(sum(lengths))
+        max_excess = cls._max_excess_for_rebalance
+        return len(lengths) > max_excess * len(ideal_lengths) or max(
+            lengths
+        ) > max_excess * max(ideal_lengths)
+
+    @staticmethod
+    def _get_balanced_lengths(total_rows):
+        """
+        Get the lengths of row partitions evenly holding `total_rows` rows.
+
+        There are at most ``NPartitions`` row partitions and each of them holds at
+        least ``MinPartitionSize`` rows, except for the last one.
+
+        Parameters
+        ----------
+        total_rows : int
+            The number of rows to distribute.
+
+        Returns
+        -------
+        list of int
+        """
+        chunksize = compute_chunksize(total_rows, NPartitions.get())
+        lengths = [chunksize] * (total_rows // chunksize)
+        if total_rows % chunksize:
+            lengths.append(total_rows % chunksize)
+        return lengths or [0]
+
+    @classmethod
+    def rebalance_partitions(cls, partitions, lengths=None, force=False):
+        """
+        Rebalance a 2-d array of partitions if its row partitions are skewed.
+
+        Row partitions are coalesced and split so that the new ones hold
+        the same number of rows. The number of new row partitions is limited
+        by ``NPartitions`` and ``MinPartitionSize``.
 
         Parameters
         ----------
         partitions : np.ndarray
             The 2-d array of partitions to rebalance.
+        lengths : list of int, optional
+            Lengths of the row partitions. Computed if not provided.
+        force : bool, default: False
+            Whether to rebalance the partitions even if they are not skewed.
 
         Returns
         -------
         np.ndarray
-            The same 2-d array.
+            A new NumPy array with rebalanced partitions.
+        list of int or None
+            Lengths of the new row partitions.
         """
-        return partitions
+        if lengths is None:
+            lengths = [part.length() for part in partitions[:, 0]]
+        if (
+            len(partitions) == 0
+            or sum(lengths) == 0
+            or not (force or cls.is_skewed(lengths))
+        ):
+            return partitions, lengths
+        new_lengths = cls._get_balanced_lengths(sum(lengths))
+        if list(lengths) == new_lengths:
+            return partitions, lengths
+
+        old_bounds = np.cumsum([0] + list(lengths))
+        new_bounds = np.cumsum([0] + new_lengths)
+        new_partitions = []
+        for start, stop in zip(new_bounds[:-1], new_bounds[1:]):
+            # Old row partitions overlapping with the rows [start, stop)
+            first = np.searchsorted(old_bounds, start, side="right") - 1
+            last = np.searchsorted(old_bounds, stop, side="left")
+            if (
+                last - first == 1
+                and old_bounds[first] == start
+                and old_bounds[last] == stop
+            ):
+                new_partitions.append(partitions[first])
+                continue
+            pieces = []
+            for i in range(first, last):
+                if lengths[i] == 0:
+                    continue
+                row_slice = slice(
+                    max(start - old_bounds[i], 0),
+                    min(stop, old_bounds[i + 1]) - old_bounds[i],
+                )
+                pieces.append(
+                    partitions[i]
+                    if row_slice == slice(0, lengths[i])
+                    else [part.mask(row_slice, slice(None)) for part in partitions[i]]
+                )
+            new_partitions.append(
+                [
+                    cls._column_partitions_class(list(column)).apply(
+                        lambda df: df, num_splits=1, maintain_partitioning=False
+                    )[0]
+                    for column in np.array(pieces).T
+                ]
+            )
+        return np.array(new_partitions), new_lengths
@@ -14,8 +14,15 @@
 
 """Collection of utility functions for the PandasDataFrame."""
 
+import numpy as np
 import pandas
-from pandas.api.types import union_categoricals
+from pandas.api.types import (
+    union_categoricals,
+    is_categorical_dtype,
+    is_bool_dtype,
+    is_numeric_dtype,
+)
+from pandas.util import hash_pandas_object
 
 
 def concatenate(dfs):
@@ -42,3 +49,333 @@ def concatenate(dfs):
             df[col] = pandas.Categorical(df[col], categories=uc.categories)
 
     return pandas.concat(dfs)
+
+
+class ShuffleSortFunctions(object):
+    """
+    Functions performing the stages of the sample-sort shuffle of rows.
+
+    The shuffle range-partitions the rows by the values of a single column
+    (or by the row labels) so that sorting every new partition locally gives
+    a globally sorted frame.
+
+    Parameters
+    ----------
+    column : hashable or None
+        Label of the column to range-partition by. If None, the row labels are used.
+    ascending : bool
+        Whether the rows are going to be sorted in ascending order.
+    na_position : {"first", "last"}
+        Where the rows with missing keys are going to be placed.
+    ideal_num_new_partitions : int
+        The desired number of new row partitions.
+    frame_len : int
+        The number of rows in the whole frame.
+    key : callable, optional
+        Function to apply to the partitioning values before comparing them.
+    """
+
+    # The number of samples taken per new partition. The larger it is, the
+    # more balanced the new partitions are.
+    oversampling_factor = 64
+
+    def __init__(
+        self,
+        column,
+        ascending,
+        na_position,
+        ideal_num_new_partitions,
+        frame_len,
+        key=None,
+    ):
+        self.column = column
+        self.ascending = ascending
+        self.na_position = na_position
+        self.ideal_num_new_partitions = ideal_num_new_partitions
+        self.frame_len = frame_len
+        self.key = key
+        self.pivots = None
+
+    @property
+    def num_buckets(self):
+        """
+        Get the number of new partitions defined by the picked pivots.
+
+        Returns
+        -------
+        int
+        """
+        return len(self.pivots) + 1
+
+    def _get_values(self, df):
+        """
+        Get the partitioning values of `df` and the mask of the missing ones.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+
+        Returns
+        -------
+        tuple
+            Tuple of (values, missing values mask) NumPy arrays.
+        """
+        values = (
+            pandas.Series(df.index.to_flat_index())
+            if self.column is None
+            else df[self.column]
+        ).reset_index(drop=True)
+        if self.key is not None:
+            values = pandas.Series(self.key(values))
+        if is_categorical_dtype(values.dtype):
+            # Categories are sorted by the order of their codes
+            codes = values.cat.codes
+            values = codes.where(codes != -1)
+        na_mask = values.isna().to_numpy()
+        return values.to_numpy(), na_mask
+
+    def sample_fn(self, df):
+        """
+        Pick a random sample of the non-missing partitioning values of `df`.
+
+        The sample size is proportional to the size of `df`.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+
+        Returns
+        -------
+        pandas.DataFrame
+            Single-column frame with the sampled values.
+        """
+        values, na_mask = self._get_values(df)
+        values = values[~na_mask]
+        num_samples = int(
+            np.ceil(
+                self.ideal_num_new_partitions
+                * self.oversampling_factor
+                * len(df)
+                / max(self.frame_len, 1)
+            )
+        )
+        if num_samples < len(values):
+            positions = np.random.RandomState(0).choice(
+                len(values), size=num_samples, replace=False
+            )
+            values = values[positions]
+        return pandas.DataFrame({"__sample__": values})
+
+    def pivot_fn(self, samples):
+        """
+        Pick the pivots splitting the value range into buckets of similar size.
+
+        Parameters
+        ----------
+        samples : list of pandas.DataFrame
+            Samples picked by `sample_fn` from every row partition.
+
+        Returns
+        -------
+        int
+            The number of new partitions.
+        """
+        samples = [s["__sample__"].to_numpy() for s in samples if len(s) > 0]
+        if len(samples) == 0:
+            self.pivots = np.array([])
+            return self.num_buckets
+        values = np.sort(np.concatenate(samples), kind="mergesort")
+        positions = [
+            len(values) * i // self.ideal_num_new_partitions
+            for i in range(1, self.ideal_num_new_partitions)
+        ]
+        # Values are sorted, so ``pandas.unique`` keeps the pivots sorted
+        self.pivots = pandas.unique(values[positions])
+        return self.num_buckets
+
+    def split_fn(self, df):
+        """
+        Split `df` into buckets defined by the pivots.
+
+        Rows with equal values always land into the same bucket and the
+        buckets are ordered the way the sorted frame should be.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+
+        Returns
+        -------
+        list of pandas.DataFrame
+            The buckets, preserving the original order of rows inside each of them.
+        """
+        values, na_mask = self._get_values(df)
+        buckets = np.empty(len(df), dtype=np.intp)
+        buckets[~na_mask] = np.searchsorted(self.pivots, values[~na_mask], side="right")
+        if not self.ascending:
+            buckets[~na_mask] = self.num_buckets - 1 - buckets[~na_mask]
+        buckets[na_mask] = 0 if self.na_position == "first" else self.num_buckets - 1
+
+        return split_by_buckets(df, buckets, self.num_buckets)
+
+
+def split_by_buckets(df, buckets, num_buckets):
+    """
+    Split rows of `df` according to the bucket numbers assigned to them.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The frame to split.
+    buckets : np.ndarray
+        Bucket number of every row of `df`.
+    num_buckets : int
+        The number of buckets.
+
+    Returns
+    -------
+    list of pandas.DataFrame
+        `num_buckets` frames, preserving the original order of rows inside each of them.
+    """
+    order = np.argsort(buckets, kind="stable")
+    bounds = np.cumsum([0] + list(np.bincount(buckets, minlength=num_buckets)))
+    df = df.iloc[order]
+    return [df.iloc[bounds[i] : bounds[i + 1]] for i in range(num_buckets)]
+
+
+def hash_split(df, keys, num_buckets, position_column=None, offset=0):
+    """
+    Split rows of `df` into buckets by the hash of their `keys` values.
+
+    Rows that ``pandas.merge`` considers equal on `keys` always land into
+    the same bucket, regardless of the frame they come from.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The frame to split.
+    keys : list of labels or None
+        Columns of `df` to hash, None to hash the row labels.
+    num_buckets : int
+        The number of buckets.
+    position_column : str, optional
+        If specified, a column with this name holding the position of every
+        row in the whole frame is appended to `df` before splitting.
+    offset : int, default: 0
+        Position of the first row of `df` in the whole frame.
+
+    Returns
+    -------
+    list of pandas.DataFrame
+    """
+    buckets = get_hash_buckets(
+        [df.index.get_level_values(i) for i in range(df.index.nlevels)]
+        if keys is None
+        else [df[key] for key in keys],
+        num_buckets,
+    )
+    if position_column is not None:
+        df = df.assign(**{position_column: np.arange(offset, offset + len(df))})
+    return split_by_buckets(df, buckets, num_buckets)
+
+
+def hash_split_labels(df, num_buckets):
+    """
+    Split rows of `df` into buckets by the hash of their labels.
+
+    Rows with equal labels always land into the same bucket, regardless of
+    the frame they come from.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The frame to split.
+    num_buckets : int
+        The number of buckets.
+
+    Returns
+    -------
+    list of pandas.DataFrame
+    """
+    levels = [df.index.get_level_values(i) for i in range(df.index.nlevels)]
+    return split_by_buckets(df, get_hash_buckets(levels, num_buckets), num_buckets)
+
+
+def get_label_kinds(df):
+    """
+    Get kinds of the row labels of `df` telling whether they can be shuffled by value.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The frame which row labels to inspect.
+
+    Returns
+    -------
+    list of str
+        Kind of every level of the row labels: "category" for categorical levels,
+        "unorderable" for levels which values cannot be ordered by the sample sort,
+        "empty" for levels without values, otherwise a name of the values type.
+        The values of two levels can be ordered together only if they have the
+        same kind or one of them is "empty".
+
+    Notes
+    -----
+    The sample sort orders the labels of a MultiIndex as tuples, so a missing value
+    in any level makes the labels unorderable.
+    """
+    kinds = []
+    for i in range(df.index.nlevels):
+        values = df.index.get_level_values(i)
+        if is_categorical_dtype(values.dtype):
+            kinds.append("category")
+        elif df.index.nlevels > 1 and values.hasnans:
+            kinds.append("unorderable")
+        elif is_numeric_dtype(values.dtype):
+            kinds.append("number")
+        elif values.dtype != object:
+            kinds.append(str(values.dtype))
+        else:
+            types = {type(value) for value in values.dropna()}
+            if len(types) == 0:
+                kinds.append("empty")
+            elif all(issubclass(t, str) for t in types):
+                kinds.append("str")
+            elif all(
+                issubclass(t, (int, float, np.number)) and not issubclass(t, bool)
+                for t in types
+            ):
+                kinds.append("number")
+            else:
+                kinds.append("unorderable")
+    return kinds
+
+
+def get_hash_buckets(keys, num_buckets):
+    """
+    Compute bucket numbers of rows by the hash of their key values.
+
+    Parameters
+    ----------
+    keys : list of pandas.Series or pandas.Index
+        Key values of the rows, one item per key.
+    num_buckets : int
+        The number of buckets.
+
+    Returns
+    -------
+    np.ndarray
+        Bucket number of every row.
+    """
+    key_values = {}
+    for i, values in enumerate(keys):
+        values = pandas.Series(values)
+        if is_numeric_dtype(values.dtype) and not is_bool_dtype(values.dtype):
+            # ``pandas.merge`` matches numbers of different dtypes by their values,
+            # so hash all of them as floats. Adding zero turns -0.0 into 0.0.
+            values = values.astype("float64") + 0.0
+        key_values[i] = values.reset_index(drop=True)
+    return (
+        hash_pandas_object(pandas.DataFrame(key_values), index=False).to_numpy()
+        % num_buckets
+    ).astype(np.intp)
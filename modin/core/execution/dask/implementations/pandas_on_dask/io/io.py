@@ -25,17 +25,21 @@ from modin.core.io import (
     CSVDispatcher,
     JSONDispatcher,
     ParquetDispatcher,
+    HDFDispatcher,
     FeatherDispatcher,
     SQLDispatcher,
     ExcelDispatcher,
+    PickleDispatcher,
 )
 from modin.core.storage_formats.pandas.parsers import (
     PandasCSVParser,
     PandasJSONParser,
     PandasParquetParser,
+    PandasHDFParser,
     PandasFeatherParser,
     PandasSQLParser,
     PandasExcelParser,
+    PandasPickleParser,
 )
 from modin.core.execution.dask.common.task_wrapper import DaskTask
 
@@ -52,12 +56,15 @@ class PandasOnDaskIO(BaseIO):
     )
 
     read_csv = type("", (DaskTask, PandasCSVParser, CSVDispatcher), build_args).read
+    to_csv = type("", (DaskTask, PandasCSVParser, CSVDispatcher), build_args).write
     read_json = type("", (DaskTask, PandasJSONParser, JSONDispatcher), build_args).read
     read_parquet = type(
         "", (DaskTask, PandasParquetParser, ParquetDispatcher), build_args
     ).read
-    # Blocked on pandas-dev/pandas#12236. It is faster to default to pandas.
-    # read_hdf = type("", (DaskTask, PandasHDFParser, HDFReader), build_args).read
+    to_parquet = type(
+        "", (DaskTask, PandasParquetParser, ParquetDispatcher), build_args
+    ).write
+    read_hdf = type("", (DaskTask, PandasHDFParser, HDFDispatcher), build_args).read
     read_feather = type(
         "", (DaskTask, PandasFeatherParser, FeatherDispatcher), build_args
     ).read
@@ -65,3 +72,10 @@ class PandasOnDaskIO(BaseIO):
     read_excel = type(
         "", (DaskTask, PandasExcelParser, ExcelDispatcher), build_args
     ).read
+    read_pickle = type(
+        "", (DaskTask, PandasPickleParser, PickleDispatcher), build_args
+    ).read
+    to_pickle = type(
+        "", (DaskTask, PandasPickleParser, PickleDispatcher), build_args
+    ).write
+    to_sql = type("", (DaskTask, PandasSQLParser, SQLDispatcher), build_args).write
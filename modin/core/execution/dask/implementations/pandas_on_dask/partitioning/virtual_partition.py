@@ -104,6 +104,47 @@ class PandasOnDaskDataframeAxisPartition(PandasDataframeAxisPartition):
             for i in range(result_num_splits * 4)
         ]
 
+    @classmethod
+    def deploy_splitting_func(cls, axis, split_func, num_splits, kwargs, *partitions):
+        """
+        Deploy a splitting function along a full axis.
+
+        Parameters
+        ----------
+        axis : {0, 1}
+            The axis to concatenate `partitions` along.
+        split_func : callable(pandas.DataFrame) -> list of pandas.DataFrame
+            The function that splits the concatenated data.
+        num_splits : int
+            The number of pieces `split_func` returns.
+        kwargs : dict
+            Additional keywords arguments to be passed in `split_func`.
+        *partitions : iterable
+            All partitions that make up the full axis (row or column).
+
+        Returns
+        -------
+        list
+            A list of distributed.Future.
+        """
+        client = default_client()
+        axis_result = client.submit(
+            deploy_dask_func,
+            PandasDataframeAxisPartition.deploy_splitting_func,
+            axis,
+            split_func,
+            num_splits,
+            kwargs,
+            *partitions,
+            pure=False,
+        )
+        # We have to do this to split it back up. It is already split, but we need to
+        # get futures for each.
+        return [
+            client.submit(lambda parts, i: parts[i], axis_result, i, pure=False)
+            for i in range(num_splits * 4)
+        ]
+
     @classmethod
     def deploy_func_between_two_axis_partitions(
         cls, axis, func, num_splits, len_of_left, other_shape, kwargs, *partitions
@@ -191,6 +191,11 @@ class FactoryDispatcher(object):
     def read_pickle_distributed(cls, **kwargs):
         return cls.__factory._read_pickle_distributed(**kwargs)
 
+    @classmethod
+    @_inherit_docstrings(factories.ExperimentalBaseFactory._read_hdf_keys)
+    def read_hdf_keys(cls, **kwargs):
+        return cls.__factory._read_hdf_keys(**kwargs)
+
     @classmethod
     @_inherit_docstrings(factories.BaseFactory._read_json)
     def read_json(cls, **kwargs):
@@ -465,12 +465,9 @@ class ExperimentalBaseFactory(BaseFactory):
     @_inherit_docstrings(BaseFactory._read_sql)
     def _read_sql(cls, **kwargs):
         if Engine.get() != "Ray":
-            if "partition_column" in kwargs:
-                if kwargs["partition_column"] is not None:
-                    warnings.warn(
-                        "Distributed read_sql() was only implemented for Ray engine."
-                    )
-                del kwargs["partition_column"]
+            # The core implementation splits `partition_column` into ranges itself
+            if kwargs.get("partition_column", None) is None:
+                kwargs.pop("partition_column", None)
             if "lower_bound" in kwargs:
                 if kwargs["lower_bound"] is not None:
                     warnings.warn(
@@ -491,6 +488,25 @@ class ExperimentalBaseFactory(BaseFactory):
                 del kwargs["max_sessions"]
         return cls.io_cls.read_sql(**kwargs)
 
+    @classmethod
+    def _read_hdf_keys(cls, **kwargs):
+        """
+        Read several groups of an HDF store into query compilers.
+
+        Parameters
+        ----------
+        **kwargs : kwargs
+            Arguments of ``read_hdf`` with `keys` of the groups instead of `key`.
+
+        Returns
+        -------
+        dict
+            Query compilers keyed by the group keys.
+        """
+        keys = kwargs.pop("keys")
+        # Executions without the parallel reader read the groups one by one
+        return {key: cls.io_cls.read_hdf(key=key, **kwargs) for key in keys}
+
 
 @doc(_doc_factory_class, execution_name="experimental PandasOnRay")
 class ExperimentalPandasOnRayFactory(ExperimentalBaseFactory, PandasOnRayFactory):
@@ -521,6 +537,11 @@ class ExperimentalPandasOnRayFactory(ExperimentalBaseFactory, PandasOnRayFactory
     def _read_pickle_distributed(cls, **kwargs):
         return cls.io_cls.read_pickle_distributed(**kwargs)
 
+    @classmethod
+    @_inherit_docstrings(ExperimentalBaseFactory._read_hdf_keys)
+    def _read_hdf_keys(cls, **kwargs):
+        return cls.io_cls.read_hdf_keys(**kwargs)
+
     @classmethod
     def _to_pickle_distributed(cls, *args, **kwargs):
         """
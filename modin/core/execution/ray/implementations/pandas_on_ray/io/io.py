@@ -14,7 +14,6 @@
 """The module holds the factory which performs I/O using pandas on Ray."""
 
 import io
-import os
 
 import pandas
 import ray
@@ -26,18 +25,22 @@ from modin.core.io import (
     FWFDispatcher,
     JSONDispatcher,
     ParquetDispatcher,
+    HDFDispatcher,
     FeatherDispatcher,
     SQLDispatcher,
     ExcelDispatcher,
+    PickleDispatcher,
 )
 from modin.core.storage_formats.pandas.parsers import (
     PandasCSVParser,
     PandasFWFParser,
     PandasJSONParser,
     PandasParquetParser,
+    PandasHDFParser,
     PandasFeatherParser,
     PandasSQLParser,
     PandasExcelParser,
+    PandasPickleParser,
 )
 from modin.core.execution.ray.common.task_wrapper import RayTask, SignalActor
 from modin.core.execution.ray.implementations.pandas_on_ray.partitioning.partition import (
@@ -64,8 +67,10 @@ class PandasOnRayIO(RayIO):
     read_parquet = type(
         "", (RayTask, PandasParquetParser, ParquetDispatcher), build_args
     ).read
-    # Blocked on pandas-dev/pandas#12236. It is faster to default to pandas.
-    # read_hdf = type("", (RayTask, PandasHDFParser, HDFReader), build_args).read
+    to_parquet = type(
+        "", (RayTask, PandasParquetParser, ParquetDispatcher), build_args
+    ).write
+    read_hdf = type("", (RayTask, PandasHDFParser, HDFDispatcher), build_args).read
     read_feather = type(
         "", (RayTask, PandasFeatherParser, FeatherDispatcher), build_args
     ).read
@@ -73,49 +78,14 @@ class PandasOnRayIO(RayIO):
     read_excel = type(
         "", (RayTask, PandasExcelParser, ExcelDispatcher), build_args
     ).read
-
-    @classmethod
-    def to_sql(cls, qc, **kwargs):
-        """
-        Write records stored in the `qc` to a SQL database.
-
-        Parameters
-        ----------
-        qc : BaseQueryCompiler
-            The query compiler of the Modin dataframe that we want to run ``to_sql`` on.
-        **kwargs : dict
-            Parameters for ``pandas.to_sql(**kwargs)``.
-        """
-        # we first insert an empty DF in order to create the full table in the database
-        # This also helps to validate the input against pandas
-        # we would like to_sql() to complete only when all rows have been inserted into the database
-        # since the mapping operation is non-blocking, each partition will return an empty DF
-        # so at the end, the blocking operation will be this empty DF to_pandas
-
-        empty_df = qc.getitem_row_array([0]).to_pandas().head(0)
-        empty_df.to_sql(**kwargs)
-        # so each partition will append its respective DF
-        kwargs["if_exists"] = "append"
-        columns = qc.columns
-
-        def func(df):
-            """
-            Override column names in the wrapped dataframe and convert it to SQL.
-
-            Notes
-            -----
-            This function returns an empty ``pandas.DataFrame`` because ``apply_full_axis``
-            expects a Frame object as a result of operation (and ``to_sql`` has no dataframe result).
-            """
-            df.columns = columns
-            df.to_sql(**kwargs)
-            return pandas.DataFrame()
-
-        # Ensure that the metadata is syncrhonized
-        qc._modin_frame._propagate_index_objs(axis=None)
-        result = qc._modin_frame.apply_full_axis(1, func, new_index=[], new_columns=[])
-        # FIXME: we should be waiting for completion less expensievely, maybe use _modin_frame.materialize()?
-        result.to_pandas()  # blocking operation
+    read_pickle = type(
+        "", (RayTask, PandasPickleParser, PickleDispatcher), build_args
+    ).read
+    to_pickle = type(
+        "", (RayTask, PandasPickleParser, PickleDispatcher), build_args
+    ).write
+    to_sql = type("", (RayTask, PandasSQLParser, SQLDispatcher), build_args).write
+    _csv_writer = type("", (RayTask, PandasCSVParser, CSVDispatcher), build_args)
 
     @staticmethod
     def _to_csv_check_support(kwargs):
@@ -166,6 +136,9 @@ class PandasOnRayIO(RayIO):
         **kwargs : dict
             Parameters for ``pandas.to_csv(**kwargs)``.
         """
+        # Part files and local files are written by all of the workers at once
+        if cls._csv_writer._to_csv_check_support(qc, kwargs):
+            return cls._csv_writer.write(qc, **kwargs)
         if not cls._to_csv_check_support(kwargs):
             return RayIO.to_csv(qc, **kwargs)
 
@@ -240,76 +213,3 @@ class PandasOnRayIO(RayIO):
         )
         # pending completion
         ray.get([partition.oid for partition in result.flatten()])
-
-    @staticmethod
-    def _to_parquet_check_support(kwargs):
-        """
-        Check if parallel version of `to_parquet` could be used.
-
-        Parameters
-        ----------
-        kwargs : dict
-            Keyword arguments passed to `.to_parquet()`.
-
-        Returns
-        -------
-        bool
-            Whether parallel version of `to_parquet` is applicable.
-        """
-        path = kwargs["path"]
-        compression = kwargs["compression"]
-        if not isinstance(path, str):
-            return False
-        if any((path.endswith(ext) for ext in [".gz", ".bz2", ".zip", ".xz"])):
-            return False
-        if compression is None or not compression == "snappy":
-            return False
-        return True
-
-    @classmethod
-    def to_parquet(cls, qc, **kwargs):
-        """
-        Write a ``DataFrame`` to the binary parquet format.
-
-        Parameters
-        ----------
-        qc : BaseQueryCompiler
-            The query compiler of the Modin dataframe that we want to run `to_parquet` on.
-        **kwargs : dict
-            Parameters for `pandas.to_parquet(**kwargs)`.
-        """
-        if not cls._to_parquet_check_support(kwargs):
-            return RayIO.to_parquet(qc, **kwargs)
-
-        def func(df, **kw):
-            """
-            Dump a chunk of rows as parquet, then save them to target maintaining order.
-
-            Parameters
-            ----------
-            df : pandas.DataFrame
-                A chunk of rows to write to a parquet file.
-            **kw : dict
-                Arguments to pass to ``pandas.to_parquet(**kwargs)`` plus an extra argument
-                `partition_idx` serving as chunk index to maintain rows order.
-            """
-            output_path = kwargs["path"]
-            compression = kwargs["compression"]
-            partition_idx = kw["partition_idx"]
-            if not os.path.exists(output_path):
-                os.makedirs(output_path)
-            kwargs[
-                "path"
-            ] = f"{output_path}/part-{partition_idx:04d}.{compression}.parquet"
-            df.to_parquet(**kwargs)
-            return pandas.DataFrame()
-
-        result = qc._modin_frame._partition_mgr_cls.map_axis_partitions(
-            axis=1,
-            partitions=qc._modin_frame._partitions,
-            map_func=func,
-            keep_partitioning=True,
-            lengths=None,
-            enumerate_partitions=True,
-        )
-        ray.get([part.oid for row in result for part in row])
@@ -167,19 +167,19 @@ class PandasOnRayDataframePartitionManager(GenericRayDataframePartitionManager):
             axis, left_parts, right_parts
         )
         if axis == 0:
-            return cls.rebalance_partitions(result)
+            return cls.rebalance_partitions(result)[0]
         else:
             return result
 
     @classmethod
-    def rebalance_partitions(cls, partitions):
+    def rebalance_partitions(cls, partitions, lengths=None, force=False):
         """
         Rebalance a 2-d array of partitions.
 
         Rebalance the partitions by building a new array
         of partitions out of the original ones so that:
           - If all partitions have a length, each new partition has roughly the
-            same number of rows.
+            same number of rows (see ``PandasDataframePartitionManager.rebalance_partitions``).
           - Otherwise, each new partition spans roughly the same number of old
             partitions.
 
@@ -187,104 +187,57 @@ class PandasOnRayDataframePartitionManager(GenericRayDataframePartitionManager):
         ----------
         partitions : np.ndarray
             The 2-d array of partitions to rebalance.
+        lengths : list of int, optional
+            Lengths of the row partitions.
+        force : bool, default: False
+            Whether to rebalance the partitions even if they are not skewed.
 
         Returns
         -------
         np.ndarray
             A new NumPy array with rebalanced partitions.
+        list of int or None
+            Lengths of the new row partitions or None if they are unknown.
         """
-        # We rebalance when the ratio of the number of existing partitions to
-        # the ideal number of partitions is larger than this threshold. The
-        # threshold is a heuristic that may need to be tuned for performance.
-        max_excess_of_num_partitions = 1.5
-        num_existing_partitions = partitions.shape[0]
-        ideal_num_new_partitions = NPartitions.get()
-        if (
-            num_existing_partitions
-            <= ideal_num_new_partitions * max_excess_of_num_partitions
-        ):
-            return partitions
         # If any partition has an unknown length, give each axis partition
         # roughly the same number of row partitions. We use `_length_cache` here
         # to avoid materializing any unmaterialized lengths.
-        if any(
+        if lengths is None and any(
             partition._length_cache is None for row in partitions for partition in row
         ):
+            num_existing_partitions = partitions.shape[0]
+            ideal_num_new_partitions = NPartitions.get()
+            if (
+                not force
+                and num_existing_partitions
+                <= ideal_num_new_partitions * cls._max_excess_for_rebalance
+            ):
+                return partitions, None
             # We need each partition to go into an axis partition, but the
             # number of axis partitions may not evenly divide the number of
             # partitions.
             chunk_size = compute_chunksize(
                 num_existing_partitions, ideal_num_new_partitions, min_block_size=1
             )
-            return np.array(
-                [
-                    cls.column_partitions(
-                        partitions[i : i + chunk_size],
-                        full_axis=False,
-                    )
-                    for i in range(
-                        0,
-                        num_existing_partitions,
-                        chunk_size,
-                    )
-                ]
-            )
-
-        # If we know the number of rows in every partition, then we should try
-        # instead to give each new partition roughly the same number of rows.
-        new_partitions = []
-        # `start` is the index of the first existing partition that we want to
-        # put into the current new partition.
-        start = 0
-        total_rows = sum(part.length() for part in partitions[:, 0])
-        ideal_partition_size = compute_chunksize(
-            total_rows, ideal_num_new_partitions, min_block_size=1
-        )
-        for _ in range(ideal_num_new_partitions):
-            # We might pick up old partitions too quickly and exhaust all of them.
-            if start >= len(partitions):
-                break
-            # `stop` is the index of the last existing partition so far that we
-            # want to put into the current new partition.
-            stop = start
-            partition_size = partitions[start][0].length()
-            # Add existing partitions into the current new partition until the
-            # number of rows in the new partition hits `ideal_partition_size`.
-            while stop < len(partitions) and partition_size < ideal_partition_size:
-                stop += 1
-                if stop < len(partitions):
-                    partition_size += partitions[stop][0].length()
-            # If the new partition is larger than we want, split the last
-            # current partition that it contains into two partitions, where
-            # the first partition has just enough rows to make the current
-            # new partition have length `ideal_partition_size`, and the second
-            # partition has the remainder.
-            if partition_size > ideal_partition_size * max_excess_of_num_partitions:
-                new_last_partition_size = ideal_partition_size - sum(
-                    row[0].length() for row in partitions[start:stop]
-                )
-                partitions = np.insert(
-                    partitions,
-                    stop + 1,
+            return (
+                np.array(
                     [
-                        obj.mask(slice(new_last_partition_size, None), slice(None))
-                        for obj in partitions[stop]
-                    ],
-                    0,
-                )
-                partitions[stop, :] = [
-                    obj.mask(slice(None, new_last_partition_size), slice(None))
-                    for obj in partitions[stop]
-                ]
-                partition_size = ideal_partition_size
-            new_partitions.append(
-                cls.column_partitions(
-                    (partitions[start : stop + 1]),
-                    full_axis=partition_size == total_rows,
-                )
+                        cls.column_partitions(
+                            partitions[i : i + chunk_size],
+                            full_axis=False,
+                        )
+                        for i in range(
+                            0,
+                            num_existing_partitions,
+                            chunk_size,
+                        )
+                    ]
+                ),
+                None,
             )
-            start = stop + 1
-        return np.array(new_partitions)
+        return super(PandasOnRayDataframePartitionManager, cls).rebalance_partitions(
+            partitions, lengths=lengths, force=force
+        )
 
     @classmethod
     def broadcast_apply(cls, axis, apply_func, left, right, other_name="r"):
@@ -178,6 +178,38 @@ class PandasOnRayDataframeVirtualPartition(PandasDataframeAxisPartition):
             *partitions,
         )
 
+    @classmethod
+    def deploy_splitting_func(cls, axis, split_func, num_splits, kwargs, *partitions):
+        """
+        Deploy a splitting function along a full axis.
+
+        Parameters
+        ----------
+        axis : {0, 1}
+            The axis to concatenate `partitions` along.
+        split_func : callable(pandas.DataFrame) -> list of pandas.DataFrame
+            The function that splits the concatenated data.
+        num_splits : int
+            The number of pieces `split_func` returns.
+        kwargs : dict
+            Additional keywords arguments to be passed in `split_func`.
+        *partitions : iterable
+            All partitions that make up the full axis (row or column).
+
+        Returns
+        -------
+        list
+            A list of ``ray.ObjectRef``-s.
+        """
+        return deploy_ray_func.options(num_returns=num_splits * 4).remote(
+            PandasDataframeAxisPartition.deploy_splitting_func,
+            axis,
+            split_func,
+            num_splits,
+            kwargs,
+            *partitions,
+        )
+
     @classmethod
     def deploy_func_between_two_axis_partitions(
         cls, axis, func, num_splits, len_of_left, other_shape, kwargs, *partitions
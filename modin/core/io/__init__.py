@@ -25,7 +25,7 @@ from .column_stores.parquet_dispatcher import ParquetDispatcher
 from .column_stores.hdf_dispatcher import HDFDispatcher
 from .column_stores.feather_dispatcher import FeatherDispatcher
 from .sql.sql_dispatcher import SQLDispatcher
-from .pickle.pickle_dispatcher import PickleExperimentalDispatcher
+from .pickle.pickle_dispatcher import PickleDispatcher, PickleExperimentalDispatcher
 
 __all__ = [
     "BaseIO",
@@ -40,5 +40,6 @@ __all__ = [
     "FeatherDispatcher",
     "SQLDispatcher",
     "ExcelDispatcher",
+    "PickleDispatcher",
     "PickleExperimentalDispatcher",
 ]
@@ -23,6 +23,7 @@ import numpy as np
 import pandas
 
 from modin.core.storage_formats.pandas.utils import compute_chunksize
+from modin.core.storage_formats.pandas.parsers import find_common_type_cat
 from modin.core.io.file_dispatcher import FileDispatcher
 from modin.config import NPartitions
 
@@ -140,6 +141,38 @@ class ColumnStoreDispatcher(FileDispatcher):
             ]
         return index, row_lengths
 
+    @classmethod
+    def build_range_index(cls, index_columns, num_rows):
+        """
+        Build the range index of the file from the ``index_columns`` of its pandas metadata.
+
+        Parameters
+        ----------
+        index_columns : list
+            The ``index_columns`` field of the pandas metadata of the file schema.
+        num_rows : int
+            Number of rows in the file.
+
+        Returns
+        -------
+        pandas.RangeIndex or None
+            The index or None if the index is stored in columns of the file.
+        """
+        if len(index_columns) == 0:
+            return pandas.RangeIndex(num_rows)
+        if len(index_columns) > 1 or not isinstance(index_columns[0], dict):
+            return None
+        index = pandas.RangeIndex(
+            index_columns[0]["start"],
+            index_columns[0]["stop"],
+            index_columns[0]["step"],
+            name=index_columns[0].get("name"),
+        )
+        # pyarrow falls back to the default index if the range does not fit the data
+        if len(index) != num_rows:
+            return pandas.RangeIndex(num_rows)
+        return index
+
     @classmethod
     def build_columns(cls, columns):
         """
@@ -192,6 +225,45 @@ class ColumnStoreDispatcher(FileDispatcher):
         dtypes.index = columns
         return dtypes
 
+    @classmethod
+    def build_common_dtypes(cls, partition_ids, columns):
+        """
+        Compute `dtypes` of the DataFrame columns common for all row partitions.
+
+        Parameters
+        ----------
+        partition_ids : list of lists
+            References to the dtypes of the column partitions, one list per row partition.
+        columns : list
+            List of columns that should be read from file.
+
+        Returns
+        -------
+        dtypes : pandas.Series
+            Series with dtypes for columns.
+
+        Notes
+        -----
+        A column may get different dtypes in different row partitions, e.g. a nullable
+        integer column is read as float64 only by the partitions holding nulls.
+        """
+        widths = [len(row) for row in partition_ids]
+        flat_dtypes = cls.materialize([ids for row in partition_ids for ids in row])
+        starts = np.cumsum([0] + widths)
+        row_dtypes = [
+            pandas.concat(flat_dtypes[start:stop], axis=0)
+            for start, stop in zip(starts[:-1], starts[1:])
+        ]
+        for dtypes in row_dtypes:
+            dtypes.index = columns
+        combined_dtypes = pandas.concat(row_dtypes, axis=1)
+        dtypes = combined_dtypes.iloc[:, 0]
+        if not combined_dtypes.eq(dtypes, axis=0).all(axis=None):
+            dtypes = combined_dtypes.apply(
+                lambda row: find_common_type_cat(row.values), axis=1
+            )
+        return dtypes
+
     @classmethod
     def build_query_compiler(cls, path, columns, **kwargs):
         """
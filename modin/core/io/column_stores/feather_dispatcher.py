@@ -13,9 +13,13 @@
 
 """Module houses `FeatherDispatcher` class, that is used for reading `.feather` files."""
 
+import pandas
+
 from modin.core.io.column_stores.column_store_dispatcher import ColumnStoreDispatcher
+from modin.core.storage_formats.pandas.utils import compute_chunksize
 from modin.utils import import_optional_dependency
 from modin.core.io.file_dispatcher import OpenFile
+from modin.config import NPartitions
 
 
 class FeatherDispatcher(ColumnStoreDispatcher):
@@ -48,17 +52,126 @@ class FeatherDispatcher(ColumnStoreDispatcher):
         https://arrow.apache.org/docs/python/api.html#feather-format
         """
         path = cls.get_path(path)
-        if columns is None:
-            import_optional_dependency(
-                "pyarrow", "pyarrow is required to read feather files."
+        import_optional_dependency(
+            "pyarrow", "pyarrow is required to read feather files."
+        )
+        import pyarrow as pa
+
+        storage_options = kwargs.get("storage_options", None) or {}
+        try:
+            # Feather V2 is the Arrow IPC file format, so only its footer is read here
+            with OpenFile(path, **storage_options) as file:
+                reader = pa.ipc.open_file(file)
+                schema, num_batches = reader.schema, reader.num_record_batches
+        except pa.ArrowInvalid:
+            schema = None
+        if schema is not None:
+            return cls.build_query_compiler_from_batches(
+                path, schema, num_batches, columns, storage_options
             )
+
+        if columns is None:
             from pyarrow.feather import read_feather
 
-            with OpenFile(
-                path,
-                **(kwargs.get("storage_options", None) or {}),
-            ) as file:
+            with OpenFile(path, **storage_options) as file:
                 df = read_feather(file)
             # pyarrow.feather.read_feather doesn't support columns as pandas.Index
             columns = list(df.columns)
         return cls.build_query_compiler(path, columns, use_threads=False)
+
+    @classmethod
+    def build_query_compiler_from_batches(
+        cls, path, schema, num_batches, columns=None, storage_options=None
+    ):
+        """
+        Build query compiler reading ranges of record batches and columns of the file.
+
+        Every worker reads the columns of a column partition from the record
+        batches of a row partition, local files are memory-mapped by the workers
+        so the batches are not copied on reading.
+
+        Parameters
+        ----------
+        path : str or path object
+            The filepath of the feather file.
+        schema : pyarrow.Schema
+            Schema of the file.
+        num_batches : int
+            Number of record batches in the file.
+        columns : array-like, optional
+            Columns to read from file. If not provided, all columns are read.
+        storage_options : dict, optional
+            Parameters for specific storage connection.
+
+        Returns
+        -------
+        new_query_compiler : BaseQueryCompiler
+            Query compiler with imported data for further processing.
+        """
+        index_columns = (schema.pandas_metadata or {}).get("index_columns", [])
+        index_fields = [field for field in index_columns if isinstance(field, str)]
+        if columns is None:
+            fields = [name for name in schema.names if name not in index_fields]
+        else:
+            # pyarrow doesn't restore the index if the columns are selected
+            index_fields = []
+            fields = [
+                schema.names[column] if isinstance(column, int) else column
+                for column in columns
+            ]
+        empty_df = schema.empty_table().select(fields + index_fields).to_pandas()
+        if num_batches == 0:
+            return cls.query_compiler_cls.from_pandas(empty_df, cls.frame_cls)
+
+        col_partitions, column_widths = cls.build_columns(fields)
+        batches_chunksize = compute_chunksize(
+            num_batches, NPartitions.get(), min_block_size=1
+        )
+        partition_ids = [
+            [
+                cls.deploy(
+                    cls.parse,
+                    3,
+                    dict(
+                        fname=path,
+                        columns=cols + index_fields,
+                        batches=(start, min(start + batches_chunksize, num_batches)),
+                        storage_options=storage_options,
+                    ),
+                )
+                for cols in col_partitions
+            ]
+            for start in range(0, num_batches, batches_chunksize)
+        ]
+        index_chunks = cls.materialize([row[0][1] for row in partition_ids])
+        if all(isinstance(index_chunk, int) for index_chunk in index_chunks):
+            row_lengths = index_chunks
+            index = cls.build_range_index(index_columns, sum(row_lengths))
+            if index is None:
+                # The index stored in columns is not read with the selected columns
+                index = pandas.RangeIndex(sum(row_lengths))
+        else:
+            row_lengths = [len(index_chunk) for index_chunk in index_chunks]
+            index = index_chunks[0].append(index_chunks[1:])
+        remote_parts = cls.build_partition(
+            [[ids[0] for ids in row] for row in partition_ids],
+            row_lengths,
+            column_widths,
+        )
+        dtypes = cls.build_common_dtypes(
+            [[ids[2] for ids in row] for row in partition_ids], empty_df.columns
+        )
+        new_query_compiler = cls.query_compiler_cls(
+            cls.frame_cls(
+                remote_parts,
+                index,
+                empty_df.columns,
+                row_lengths,
+                column_widths,
+                dtypes=dtypes,
+            )
+        )
+        if isinstance(index, pandas.RangeIndex):
+            # every partition has its own range index
+            new_query_compiler._modin_frame.synchronize_labels(axis=0)
+        return new_query_compiler
@@ -13,10 +13,12 @@
 
 """Module houses `HDFDispatcher` class, that is used for reading hdf data."""
 
+import os
 import pandas
 
 from modin.core.io.column_stores.column_store_dispatcher import ColumnStoreDispatcher
-from modin.error_message import ErrorMessage
+from modin.core.storage_formats.pandas.utils import compute_chunksize
+from modin.config import NPartitions
 
 
 class HDFDispatcher(ColumnStoreDispatcher):  # pragma: no cover
@@ -28,33 +30,54 @@ class HDFDispatcher(ColumnStoreDispatcher):  # pragma: no cover
     """
 
     @classmethod
-    def _validate_hdf_format(cls, path_or_buf):
+    def _read(cls, path_or_buf, **kwargs):
         """
-        Validate `path_or_buf` and then return `table_type` parameter of store group attribute.
+        Load an h5 file from the file path or buffer, returning a query compiler.
 
         Parameters
         ----------
         path_or_buf : str, buffer or path object
             Path to the file to open, or an open :class:`pandas.HDFStore` object.
+        **kwargs : dict
+            Pass into pandas.read_hdf function.
 
         Returns
         -------
-        str
-            `table_type` parameter of store group attribute.
+        BaseQueryCompiler
+            Query compiler with imported data for further processing.
         """
-        s = pandas.HDFStore(path_or_buf)
-        groups = s.groups()
-        if len(groups) == 0:
-            raise ValueError("No dataset in HDF5 file.")
-        candidate_only_group = groups[0]
-        format = getattr(candidate_only_group._v_attrs, "table_type", None)
-        s.close()
-        return format
+        return cls._build(cls._launch(path_or_buf, **kwargs))
 
     @classmethod
-    def _read(cls, path_or_buf, **kwargs):
+    def read_keys(cls, path_or_buf, keys, **kwargs):
         """
-        Load an h5 file from the file path or buffer, returning a query compiler.
+        Load several groups of an h5 file, returning a dict of query compilers.
+
+        The tasks of all the groups are launched before waiting for any of them.
+
+        Parameters
+        ----------
+        path_or_buf : str, buffer or path object
+            Path to the file to open, or an open :class:`pandas.HDFStore` object.
+        keys : list
+            Keys of the groups to read.
+        **kwargs : dict
+            Pass into pandas.read_hdf function for every group.
+
+        Returns
+        -------
+        dict
+            Query compilers with imported data keyed by the group keys.
+        """
+        pending = {
+            key: cls._launch(path_or_buf, **dict(kwargs, key=key)) for key in keys
+        }
+        return {key: cls._build(group) for key, group in pending.items()}
+
+    @classmethod
+    def _launch(cls, path_or_buf, **kwargs):
+        """
+        Launch tasks to read contiguous row slices of a group of the store.
 
         Parameters
         ----------
@@ -65,26 +88,143 @@ class HDFDispatcher(ColumnStoreDispatcher):  # pragma: no cover
 
         Returns
         -------
-        BaseQueryCompiler
-            Query compiler with imported data for further processing.
+        tuple or BaseQueryCompiler
+            The launched tasks with the metadata needed to build the query compiler
+            or the query compiler itself if the group is read by a single worker.
         """
-        if cls._validate_hdf_format(path_or_buf=path_or_buf) is None:
-            ErrorMessage.default_to_pandas(
-                "File format seems to be `fixed`. For better distribution consider "
-                "saving the file in `table` format. df.to_hdf(format=`table`)."
-            )
+        from modin.pandas.io import HDFStore
+
+        key = kwargs.get("key", None)
+        if isinstance(path_or_buf, HDFStore):
+            # Methods of the Modin store return Modin objects, so the store is read
+            # in place the way ``BaseIO.read_hdf`` does it
+            path_or_buf._return_modin_dataframe = False
+            try:
+                df = pandas.read_hdf(path_or_buf, **kwargs)
+            finally:
+                path_or_buf._return_modin_dataframe = True
+            return cls.query_compiler_cls.from_pandas(df, cls.frame_cls)
+        if isinstance(path_or_buf, os.PathLike):
+            path_or_buf = os.fspath(path_or_buf)
+        if not isinstance(path_or_buf, str):
+            return cls.single_worker_read(path_or_buf, **kwargs)
+        with pandas.HDFStore(path_or_buf, mode="r") as store:
+            groups = store.groups()
+            if key is None and len(groups) == 1:
+                key = groups[0]._v_pathname
+            storer = None if key is None else store.get_storer(key)
+            if storer is None or storer.pandas_kind not in ("frame", "frame_table"):
+                # series and the other kinds of groups are read by a single worker
+                nrows = 0
+            elif storer.is_table:
+                nrows = storer.nrows
+            elif kwargs.get("where", None) is None and kwargs.get("columns") is None:
+                nrows = cls._get_fixed_frame_length(storer.group)
+            else:
+                # `fixed` format stores don't support selection by `where`
+                # and `columns`, pandas raises the errors for us
+                nrows = 0
+        # Both formats keep the rows of each column contiguously, so they are sliced
+        # by `start` and `stop` without reading the rest of the rows, and the
+        # selection by `where` is applied to every slice independently
+        rows = range(nrows)[slice(kwargs.get("start", None), kwargs.get("stop", None))]
+        if (
+            len(rows) == 0
+            or kwargs.get("iterator", False)
+            or kwargs.get("chunksize", None) is not None
+        ):
             return cls.single_worker_read(path_or_buf, **kwargs)
 
-        columns = kwargs.pop("columns", None)
+        kwargs["key"] = key
+        kwargs.pop("start", None)
+        kwargs.pop("stop", None)
+        empty_pd_df = pandas.read_hdf(path_or_buf, start=0, stop=0, **kwargs)
+        columns = empty_pd_df.columns
         # Have to do this because of Dask's keyword arguments
-        kwargs["_key"] = kwargs.pop("key", None)
-        if not columns:
-            start = kwargs.pop("start", None)
-            stop = kwargs.pop("stop", None)
-            empty_pd_df = pandas.read_hdf(path_or_buf, start=0, stop=0, **kwargs)
-            if start is not None:
-                kwargs["start"] = start
-            if stop is not None:
-                kwargs["stop"] = stop
-            columns = empty_pd_df.columns
-        return cls.build_query_compiler(path_or_buf, columns, **kwargs)
+        kwargs["_key"] = kwargs.pop("key")
+
+        num_partitions = NPartitions.get()
+        column_chunksize = compute_chunksize(len(columns), num_partitions)
+        num_splits = max(1, -(-len(columns) // column_chunksize))
+        column_widths = [
+            min(column_chunksize, len(columns) - column_chunksize * i)
+            for i in range(num_splits)
+        ]
+        row_chunksize = compute_chunksize(len(rows), num_partitions)
+        partition_ids = [
+            cls.deploy(
+                cls.parse,
+                num_splits + 2,
+                dict(
+                    fname=path_or_buf,
+                    start=rows[i],
+                    stop=rows[min(i + row_chunksize, len(rows)) - 1] + 1,
+                    num_splits=num_splits,
+                    _split_axis=1,
+                    **kwargs,
+                ),
+            )
+            for i in range(0, len(rows), row_chunksize)
+        ]
+        return partition_ids, columns, column_widths
+
+    @staticmethod
+    def _get_fixed_frame_length(group):
+        """
+        Get the number of rows of a `fixed` format frame from its index dataset.
+
+        Parameters
+        ----------
+        group : tables.Group
+            Group of the store where the frame is kept.
+
+        Returns
+        -------
+        int
+            Number of rows or 0 if the rows can't be sliced.
+        """
+        node = getattr(group, "axis1", None)
+        if node is None:
+            # pandas slices the levels of `MultiIndex` along with its codes,
+            # so a slice of such frame is broken
+            return 0
+        # pandas keeps a placeholder with the real shape in attributes for empty arrays
+        shape = getattr(node._v_attrs, "shape", None)
+        return (node.shape if shape is None else shape)[0]
+
+    @classmethod
+    def _build(cls, pending):
+        """
+        Build query compiler of a group from its launched tasks.
+
+        Parameters
+        ----------
+        pending : tuple or BaseQueryCompiler
+            Launched tasks and metadata of the group returned by `_launch`
+            or query compiler of the group.
+
+        Returns
+        -------
+        BaseQueryCompiler
+        """
+        if not isinstance(pending, tuple):
+            return pending
+        partition_ids, columns, column_widths = pending
+        index_objs = cls.materialize([ids[-2] for ids in partition_ids])
+        row_lengths = [len(index) for index in index_objs]
+        index = index_objs[0].append(index_objs[1:])
+        # The store keeps the dtypes of whole columns, so every slice has them
+        dtypes = cls.materialize(partition_ids[0][-1])
+        remote_parts = cls.build_partition(
+            [ids[:-2] for ids in partition_ids], row_lengths, column_widths
+        )
+        return cls.query_compiler_cls(
+            cls.frame_cls(
+                remote_parts,
+                index,
+                columns,
+                row_lengths,
+                column_widths,
+                dtypes=dtypes,
+            )
+        )
@@ -11,13 +11,224 @@
 # ANY KIND, either express or implied. See the License for the specific language
 # governing permissions and limitations under the License.
 
-"""Module houses `ParquetDispatcher` class, that is used for reading `.parquet` files."""
+"""
+Module houses `ParquetDispatcher` class, that is used for reading and writing `.parquet` files.
 
+Module also houses `ParquetScan` class, that is used for recording the column
+selections and row filters applied to the read data before reading it.
+"""
+
+import copy
+import datetime
 import os
+import re
+
+import numpy as np
+import pandas
+from pandas.api.types import (
+    is_bool_dtype,
+    is_datetime64_any_dtype,
+    is_numeric_dtype,
+    is_object_dtype,
+    is_scalar,
+)
+from pandas.core.indexes.api import ensure_index
 
 from modin.core.io.column_stores.column_store_dispatcher import ColumnStoreDispatcher
+from modin.core.io.io import BaseIO
+from modin.core.io.file_dispatcher import OpenFile
+from modin.core.storage_formats.pandas.utils import compute_chunksize
 from modin.error_message import ErrorMessage
 from modin.utils import import_optional_dependency
+from modin.config import NPartitions
+
+# Names of the files written by `ParquetDispatcher.write`
+PART_FILE_REGEX = re.compile(r"^part-\d{4,}(\.\w+)?\.parquet$")
+PARTITION_DIR_REGEX = re.compile(r"^[^=]+=[^=]*$")
+# Directory name of the null partition keys, the same as pyarrow uses
+HIVE_DEFAULT_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+
+def _get_index_columns(metadata):
+    """
+    Get the ``index_columns`` field of the pandas metadata of a parquet file.
+
+    Parameters
+    ----------
+    metadata : pyarrow.parquet.FileMetaData
+        The metadata of the parquet file.
+
+    Returns
+    -------
+    list
+    """
+    pandas_metadata = metadata.schema.to_arrow_schema().pandas_metadata or {}
+    return pandas_metadata.get("index_columns", [])
+
+
+def _is_number(value):
+    """
+    Check whether the value is a real number, but not a boolean.
+
+    Parameters
+    ----------
+    value : object
+        Value to check.
+
+    Returns
+    -------
+    bool
+    """
+    return isinstance(value, (int, float, np.number)) and not isinstance(
+        value, (bool, np.bool_)
+    )
+
+
+def _infer_parquet_schema(
+    df, columns, object_columns, preserve_index
+):  # pragma: no cover
+    """
+    Infer the arrow types of the object columns and the index of a row partition.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Row partition to infer the types from.
+    columns : pandas.Index
+        Column labels of the partition.
+    object_columns : list
+        Labels of the columns with object dtype.
+    preserve_index : bool or None
+        Whether the index is stored in the file, see ``pyarrow.Table.from_pandas``.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Frame with the serialized arrow schema.
+    """
+    import pyarrow as pa
+
+    df.columns = columns
+    schema = pa.Schema.from_pandas(df[object_columns], preserve_index=preserve_index)
+    return pandas.DataFrame({"schema": [schema.serialize().to_pybytes()]})
+
+
+def _count_nulls(metadata):
+    """
+    Count the missing values of the columns of a parquet file by the statistics of its row groups.
+
+    Parameters
+    ----------
+    metadata : pyarrow.parquet.FileMetaData
+        The metadata of the parquet file.
+
+    Returns
+    -------
+    dict
+        Numbers of the missing values of the columns, None if a row group
+        has no statistics of the column.
+    """
+    counts = {}
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        for j in range(row_group.num_columns):
+            column = row_group.column(j)
+            statistics = column.statistics
+            count = (
+                statistics.null_count
+                if statistics is not None and statistics.has_null_count
+                else None
+            )
+            name = column.path_in_schema
+            if count is None or counts.get(name, 0) is None:
+                counts[name] = None
+            else:
+                counts[name] = counts.get(name, 0) + count
+    return counts
+
+
+def _write_parquet_partition(
+    df,
+    partition_idx,
+    path,
+    columns,
+    schema,
+    preserve_index,
+    partition_cols=None,
+    compression="snappy",
+    **kwargs,
+):  # pragma: no cover
+    """
+    Write a row partition to the parquet dataset and collect the footers of the written files.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Row partition to write.
+    partition_idx : int
+        Position of the row partition, it is used in the names of the files.
+    path : str
+        The directory of the dataset.
+    columns : pandas.Index
+        Column labels of the partition.
+    schema : pyarrow.Schema
+        Schema of the files of the dataset.
+    preserve_index : bool or None
+        Whether the index is stored in the files, see ``pyarrow.Table.from_pandas``.
+    partition_cols : list of str, optional
+        Columns to partition the dataset by.
+    compression : str, optional
+        Compression codec of the files.
+    **kwargs : dict
+        Other parameters for ``pyarrow.parquet.write_table``.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Frame with the serialized footers of the written files.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    df.columns = columns
+    basename = (
+        f"part-{partition_idx:04d}.{compression}.parquet"
+        if compression
+        else f"part-{partition_idx:04d}.parquet"
+    )
+    if partition_cols:
+        data_columns = [column for column in columns if column not in partition_cols]
+        pieces = []
+        for keys, group in df.groupby(partition_cols, observed=True, dropna=False):
+            if not isinstance(keys, tuple):
+                keys = (keys,)
+            directory = "/".join(
+                f"{name}={HIVE_DEFAULT_PARTITION if pandas.isna(value) else value}"
+                for name, value in zip(partition_cols, keys)
+            )
+            pieces.append((f"{directory}/{basename}", group[data_columns]))
+    else:
+        pieces = [(basename, df)]
+    footers = []
+    for relative_path, piece in pieces:
+        table = pa.Table.from_pandas(piece, preserve_index=preserve_index)
+        # The files keep their own pandas metadata, but share the column types
+        table = table.cast(schema.with_metadata(table.schema.metadata))
+        full_path = os.path.join(path, relative_path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        metadata_collector = []
+        pq.write_table(
+            table,
+            full_path,
+            compression=compression,
+            metadata_collector=metadata_collector,
+            **kwargs,
+        )
+        metadata_collector[0].set_file_path(relative_path)
+        sink = pa.BufferOutputStream()
+        metadata_collector[0].write_metadata_file(sink)
+        footers.append(sink.getvalue().to_pybytes())
+    return pandas.DataFrame({"footer": footers}, dtype=object)
 
 
 class ParquetDispatcher(ColumnStoreDispatcher):
@@ -72,9 +283,19 @@ class ParquetDispatcher(ColumnStoreDispatcher):
                     break
             partitioned_columns = list(partitioned_columns)
             if len(partitioned_columns):
-                ErrorMessage.default_to_pandas("Mixed Partitioning Columns in Parquet")
-                return cls.single_worker_read(
-                    path, engine=engine, columns=columns, **kwargs
+                if engine not in ("auto", "pyarrow") or any(
+                    value
+                    for key, value in kwargs.items()
+                    if key not in ("filters", "storage_options")
+                ):
+                    ErrorMessage.default_to_pandas(
+                        "Mixed Partitioning Columns in Parquet"
+                    )
+                    return cls.single_worker_read(
+                        path, engine=engine, columns=columns, **kwargs
+                    )
+                return cls.build_query_compiler_from_fragments(
+                    path, columns, kwargs.get("filters")
                 )
 
         if not columns:
@@ -94,4 +315,890 @@ class ParquetDispatcher(ColumnStoreDispatcher):
                 index_columns = dataset.schema.pandas_metadata.get("index_columns", [])
                 column_names = [c for c in column_names if c not in index_columns]
             columns = [name for name in column_names if not PQ_INDEX_REGEX.match(name)]
+        if engine in ("auto", "pyarrow"):
+            metadata = cls.get_metadata(path, **kwargs)
+            if metadata is not None and metadata.num_row_groups > 1:
+                lazy_scan = ParquetScan(
+                    cls,
+                    path,
+                    metadata,
+                    columns,
+                    storage_options=kwargs.get("storage_options"),
+                )
+                if lazy_scan.is_valid():
+                    return cls.query_compiler_cls(None, lazy_scan=lazy_scan)
+                return cls.build_query_compiler_from_row_groups(
+                    path, columns, metadata, **kwargs
+                )
         return cls.build_query_compiler(path, columns, **kwargs)
+
+    @classmethod
+    def get_metadata(cls, path, storage_options=None, **kwargs):
+        """
+        Get the metadata of a single parquet file if its row groups can be read independently.
+
+        Parameters
+        ----------
+        path : str, path object or file-like object
+            The filepath of the parquet file.
+        storage_options : dict, optional
+            Parameters for the filesystem of `path`.
+        **kwargs : dict
+            Other keyword arguments of `read_parquet` function.
+
+        Returns
+        -------
+        pyarrow.parquet.FileMetaData or None
+            The metadata or None if `path` is a directory or a buffer, or if
+            `kwargs` change the way the data is converted to pandas.
+        """
+        if not isinstance(path, (str, os.PathLike)) or os.path.isdir(path):
+            return None
+        if kwargs.get("use_nullable_dtypes") or any(
+            key != "use_nullable_dtypes" for key in kwargs
+        ):
+            return None
+        from pyarrow.parquet import ParquetFile
+
+        with OpenFile(path, **(storage_options or {})) as file:
+            return ParquetFile(file).metadata
+
+    @classmethod
+    def build_row_group_chunks(cls, row_group_lengths):
+        """
+        Split row groups into chunks, that should be read by workers.
+
+        Parameters
+        ----------
+        row_group_lengths : list of ints
+            Number of rows in every row group of the file.
+
+        Returns
+        -------
+        row_group_chunks : list
+            List of lists with contiguous row groups for reading by workers.
+        row_lengths : list
+            Number of rows in every chunk.
+        """
+        chunksize = compute_chunksize(sum(row_group_lengths), NPartitions.get())
+        row_group_chunks = [[]]
+        row_lengths = [0]
+        for row_group, length in enumerate(row_group_lengths):
+            if row_lengths[-1] >= chunksize:
+                row_group_chunks.append([])
+                row_lengths.append(0)
+            row_group_chunks[-1].append(row_group)
+            row_lengths[-1] += length
+        return row_group_chunks, row_lengths
+
+    @classmethod
+    def build_query_compiler_from_row_groups(
+        cls, path, columns, metadata, filters=(), predicate=None, **kwargs
+    ):
+        """
+        Build query compiler reading chunks of row groups and columns of the file.
+
+        Every worker reads the columns of a column partition from the row groups
+        of a row partition, so the resulting frame comes out as a 2-D grid even
+        for files with a few columns. The row lengths are known from the file
+        metadata, and the index is built from it as well if the pandas metadata
+        stores the index as a range.
+
+        Parameters
+        ----------
+        path : str or path object
+            The filepath of the parquet file.
+        columns : list
+            List of columns that should be read from file.
+        metadata : pyarrow.parquet.FileMetaData
+            The metadata of the parquet file.
+        filters : tuple, default: ()
+            Conditions as ``(column, op, value)`` tuples, that rows should
+            satisfy to be read. Row groups that cannot have such rows according
+            to their statistics are not read at all.
+        predicate : tuple, optional
+            Conditions as ``(column, op, value)`` tuples to read the boolean
+            mask of instead of `columns`.
+        **kwargs : dict
+            Parameters of deploying read_* function.
+
+        Returns
+        -------
+        new_query_compiler : BaseQueryCompiler
+            Query compiler with imported data for further processing.
+        """
+        row_group_lengths = [
+            metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)
+        ]
+        # At least one row group is read to get the empty frame with the right index
+        row_groups = [
+            i
+            for i in range(metadata.num_row_groups)
+            if cls.match_row_group(metadata.row_group(i), filters)
+        ] or [0]
+        row_group_chunks, row_lengths = cls.build_row_group_chunks(
+            [row_group_lengths[i] for i in row_groups]
+        )
+        row_group_chunks = [
+            [row_groups[i] for i in chunk] for chunk in row_group_chunks
+        ]
+        if predicate is None:
+            col_partitions, column_widths = cls.build_columns(columns)
+        else:
+            columns = [predicate[0][0]]
+            col_partitions, column_widths = [columns], [1]
+        index = cls.build_range_index(_get_index_columns(metadata), metadata.num_rows)
+        index_chunks = [None] * len(row_group_chunks)
+        if index is not None:
+            row_starts = np.cumsum([0] + row_group_lengths)
+            index_chunks = [
+                index[row_starts[chunk[0]] : row_starts[chunk[-1] + 1]]
+                if chunk[-1] - chunk[0] == len(chunk) - 1
+                else index[
+                    np.concatenate(
+                        [np.arange(row_starts[i], row_starts[i + 1]) for i in chunk]
+                    )
+                ]
+                for chunk in row_group_chunks
+            ]
+        partition_ids = [
+            [
+                cls.deploy(
+                    cls.parse,
+                    3,
+                    dict(
+                        fname=path,
+                        columns=cols,
+                        row_groups=chunk,
+                        index=index_chunk,
+                        filters=filters,
+                        predicate=predicate,
+                        storage_options=kwargs.get("storage_options"),
+                    ),
+                )
+                for cols in col_partitions
+            ]
+            for chunk, index_chunk in zip(row_group_chunks, index_chunks)
+        ]
+        if index is None or filters:
+            index_chunks = cls.materialize([row[0][1] for row in partition_ids])
+            index = index_chunks[0].append(index_chunks[1:])
+            row_lengths = [len(index_chunk) for index_chunk in index_chunks]
+        remote_parts = cls.build_partition(
+            [[ids[0] for ids in row] for row in partition_ids],
+            row_lengths,
+            column_widths,
+        )
+        dtypes = cls.build_common_dtypes(
+            [[ids[2] for ids in row] for row in partition_ids], columns
+        )
+        return cls.query_compiler_cls(
+            cls.frame_cls(
+                remote_parts,
+                index,
+                columns,
+                row_lengths,
+                column_widths,
+                dtypes=dtypes,
+            )
+        )
+
+    @classmethod
+    def build_query_compiler_from_fragments(cls, path, columns, filters=None):
+        """
+        Build query compiler reading chunks of files and columns of a partitioned dataset.
+
+        Every leaf file of the hive-partitioned directory is a separate
+        fragment of the dataset, so workers read chunks of the fragments instead
+        of reading the whole directory on a single worker. The partition keys
+        of a fragment are read as categorical columns with the values of
+        the whole dataset as categories, the same as pandas does.
+
+        Parameters
+        ----------
+        path : str
+            The path to the directory with the dataset.
+        columns : list or None
+            List of columns that should be read from the dataset.
+        filters : list, optional
+            Filters in the DNF format of `read_parquet` function. The files
+            of partitions not satisfying them are not read at all.
+
+        Returns
+        -------
+        new_query_compiler : BaseQueryCompiler
+            Query compiler with imported data for further processing.
+        """
+        import pyarrow.dataset as ds
+        from modin.pandas.io import PQ_INDEX_REGEX
+
+        try:
+            from pyarrow.parquet import filters_to_expression
+        except ImportError:  # pyarrow < 10.0
+            from pyarrow.parquet import _filters_to_expression as filters_to_expression
+
+        partitioning = ds.HivePartitioning.discover(infer_dictionary=True)
+        metadata_path = os.path.join(path, "_metadata")
+        if os.path.isfile(metadata_path):
+            # The footers of all of the files are collected in the summary file,
+            # so the files are not opened to plan the reading
+            dataset = ds.parquet_dataset(metadata_path, partitioning=partitioning)
+        else:
+            # The dataset is discovered the same way as `pyarrow.parquet.read_table` does
+            dataset = ds.dataset(path, format="parquet", partitioning=partitioning)
+        filters = None if filters is None else filters_to_expression(filters)
+        index_columns = (dataset.schema.pandas_metadata or {}).get("index_columns", [])
+        if not columns:
+            columns = [
+                name
+                for name in dataset.schema.names
+                if name not in index_columns and not PQ_INDEX_REGEX.match(name)
+            ]
+        stored_index_columns = [
+            name for name in index_columns if not isinstance(name, dict)
+        ]
+        # The footers in the summary file are in the order they were written in,
+        # pandas reads the files in the order of their paths
+        fragments = sorted(
+            dataset.get_fragments(filter=filters), key=lambda fragment: fragment.path
+        )
+        chunksize = compute_chunksize(
+            len(fragments), NPartitions.get(), min_block_size=1
+        )
+        fragment_chunks = [
+            fragments[i : i + chunksize] for i in range(0, len(fragments), chunksize)
+        ] or [[]]
+        col_partitions, column_widths = cls.build_columns(columns)
+        partition_ids = [
+            [
+                cls.deploy(
+                    cls.parse,
+                    3,
+                    dict(
+                        fname=path,
+                        columns=cols,
+                        fragments=chunk,
+                        schema=dataset.schema,
+                        read_columns=cols + stored_index_columns,
+                        filters=filters,
+                    ),
+                )
+                for cols in col_partitions
+            ]
+            for chunk in fragment_chunks
+        ]
+        index_chunks = cls.materialize([row[0][1] for row in partition_ids])
+        row_lengths = [len(index_chunk) for index_chunk in index_chunks]
+        if len(stored_index_columns) == 0:
+            # Every fragment has its own range index, the whole dataset
+            # gets the range index stored in the metadata if it fits the data
+            index = cls.build_range_index(index_columns, sum(row_lengths))
+        else:
+            index = index_chunks[0].append(index_chunks[1:])
+        remote_parts = cls.build_partition(
+            [[ids[0] for ids in row] for row in partition_ids],
+            row_lengths,
+            column_widths,
+        )
+        dtypes = cls.build_common_dtypes(
+            [[ids[2] for ids in row] for row in partition_ids], columns
+        )
+        new_frame = cls.frame_cls(
+            remote_parts,
+            index,
+            columns,
+            row_lengths,
+            column_widths,
+            dtypes=dtypes,
+        )
+        if len(stored_index_columns) == 0:
+            new_frame.synchronize_labels(axis=0)
+        return cls.query_compiler_cls(new_frame)
+
+    @classmethod
+    def match_row_group(cls, row_group, filters):
+        """
+        Check whether rows of the row group may satisfy the conditions according to its statistics.
+
+        Parameters
+        ----------
+        row_group : pyarrow.parquet.RowGroupMetaData
+            The metadata of the row group.
+        filters : tuple
+            Conditions as ``(column, op, value)`` tuples.
+
+        Returns
+        -------
+        bool
+            False if no row of the row group satisfies the conditions.
+        """
+        positions = {
+            row_group.column(i).path_in_schema: i for i in range(row_group.num_columns)
+        }
+        for column, op, value in filters:
+            if op not in ("eq", "lt", "le", "gt", "ge") or column not in positions:
+                continue
+            statistics = row_group.column(positions[column]).statistics
+            if statistics is None or not statistics.has_min_max:
+                continue
+            low, high = statistics.min, statistics.max
+            if isinstance(value, (datetime.datetime, np.datetime64)):
+                if not isinstance(low, datetime.datetime):
+                    continue
+                value = pandas.Timestamp(value)
+            elif not (
+                isinstance(value, str)
+                and isinstance(low, str)
+                or _is_number(value)
+                and _is_number(low)
+            ):
+                continue
+            try:
+                if (
+                    op == "eq"
+                    and (value < low or value > high)
+                    or op == "lt"
+                    and low >= value
+                    or op == "le"
+                    and low > value
+                    or op == "gt"
+                    and high <= value
+                    or op == "ge"
+                    and high < value
+                ):
+                    return False
+            except TypeError:
+                # Timestamps with and without time zone cannot be compared
+                continue
+        return True
+
+    @classmethod
+    def _to_parquet_check_support(cls, qc, kwargs):
+        """
+        Check if parallel version of `to_parquet` could be used.
+
+        Parameters
+        ----------
+        qc : BaseQueryCompiler
+            The query compiler of the Modin dataframe to write.
+        kwargs : dict
+            Keyword arguments passed to `.to_parquet()`.
+
+        Returns
+        -------
+        bool
+            Whether parallel version of `to_parquet` is applicable.
+        """
+        from pandas.io.common import is_fsspec_url
+
+        path = kwargs["path"]
+        if not isinstance(path, str) or is_fsspec_url(path):
+            return False
+        # pandas overwrites an existing file with a single file
+        if os.path.isfile(path):
+            return False
+        if any((path.endswith(ext) for ext in [".gz", ".bz2", ".zip", ".xz"])):
+            return False
+        if kwargs.get("engine", "auto") not in ("auto", "pyarrow"):
+            return False
+        if kwargs.get("storage_options"):
+            return False
+        columns = qc.columns
+        # pandas raises for these, so let it produce the errors
+        if not columns.is_unique or not all(isinstance(c, str) for c in columns):
+            return False
+        partition_cols = kwargs.get("partition_cols")
+        if partition_cols is not None and (
+            not isinstance(partition_cols, list)
+            or not all(column in columns for column in partition_cols)
+            or len(partition_cols) == len(columns)
+        ):
+            return False
+        return True
+
+    @staticmethod
+    def _remove_previous_dataset(path):
+        """
+        Remove the files of a dataset previously written to `path`.
+
+        The files of the new dataset may have different names and schema, so
+        the part files and the summary files of the previous one are removed
+        instead of being left next to the new files. Only the part files, the
+        summary files and the ``key=value`` directories of the partition keys
+        left empty are removed, other entries of `path` are kept.
+
+        Parameters
+        ----------
+        path : str
+            The directory of the dataset.
+        """
+
+        def remove_parts(directory):
+            for entry in os.scandir(directory):
+                if entry.is_dir(follow_symlinks=False):
+                    if PARTITION_DIR_REGEX.match(entry.name):
+                        remove_parts(entry.path)
+                        if not os.listdir(entry.path):
+                            os.rmdir(entry.path)
+                elif PART_FILE_REGEX.match(entry.name) or (
+                    directory == path
+                    and entry.name in ("_metadata", "_common_metadata")
+                ):
+                    os.remove(entry.path)
+
+        if os.path.isdir(path):
+            remove_parts(path)
+
+    @classmethod
+    def write(cls, qc, **kwargs):
+        """
+        Write a ``DataFrame`` to a parquet dataset.
+
+        Every row partition is written to its own file (or to its own file in
+        every directory of the ``partition_cols`` hive layout) in parallel. The
+        files share the same arrow schema, the types of the object columns are
+        inferred from all of the rows. The driver then writes the
+        ``_common_metadata`` file with the schema and the ``_metadata`` file
+        with the footers of all of the files, so the dataset can be planned
+        without opening every file. The part files and the summary files of a
+        dataset previously written to the directory are removed first. Rows
+        with null ``partition_cols`` keys are written to the
+        ``__HIVE_DEFAULT_PARTITION__`` directories, like pyarrow does.
+
+        Parameters
+        ----------
+        qc : BaseQueryCompiler
+            The query compiler of the Modin dataframe that we want to run `to_parquet` on.
+        **kwargs : dict
+            Parameters for `pandas.to_parquet(**kwargs)`, `row_group_size` and
+            other parameters of ``pyarrow.parquet.write_table`` are passed to the workers.
+        """
+        if not cls._to_parquet_check_support(qc, kwargs):
+            return BaseIO.to_parquet(qc, **kwargs)
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        kwargs = kwargs.copy()
+        path = kwargs.pop("path")
+        index = kwargs.pop("index", None)
+        partition_cols = kwargs.pop("partition_cols", None) or []
+        for key in ("engine", "storage_options"):
+            kwargs.pop(key, None)
+
+        columns = qc.columns
+        dtypes = qc.dtypes
+        preserve_index = index
+        if partition_cols and index is None and isinstance(qc.index, pandas.RangeIndex):
+            # pandas does not keep the default index in the partitioned datasets
+            preserve_index = False
+        frame = qc._modin_frame
+        # Ensure that the metadata is synchronized
+        frame._propagate_index_objs(axis=None)
+        row_partitions = frame._partition_mgr_cls.row_partitions(frame._partitions)
+
+        empty_df = pandas.DataFrame(columns=columns, index=qc.index[:0]).astype(
+            dict(dtypes)
+        )
+        full_schema = pa.Schema.from_pandas(empty_df, preserve_index=preserve_index)
+        object_columns = [
+            column for column, dtype in dtypes.items() if is_object_dtype(dtype)
+        ]
+        index_dtypes = (
+            qc.index.dtypes
+            if isinstance(qc.index, pandas.MultiIndex)
+            else [qc.index.dtype]
+        )
+        if object_columns or (
+            preserve_index is not False
+            and any(is_object_dtype(dtype) for dtype in index_dtypes)
+        ):
+            # The types of the empty object columns are unknown, so they are
+            # inferred from every partition and unified
+            schemas = [
+                row.apply(
+                    lambda df: _infer_parquet_schema(
+                        df, columns, object_columns, preserve_index
+                    ),
+                    num_splits=1,
+                    maintain_partitioning=False,
+                )[0]
+                for row in row_partitions
+            ]
+            inferred_schema = pa.unify_schemas(
+                [
+                    pa.ipc.read_schema(pa.py_buffer(serialized))
+                    for part in schemas
+                    for serialized in part.get()["schema"]
+                ]
+            )
+            full_schema = pa.schema(
+                [
+                    inferred_schema.field(field.name)
+                    if field.name in inferred_schema.names
+                    else field
+                    for field in full_schema
+                ],
+                metadata=full_schema.metadata,
+            )
+        schema = pa.schema(
+            [field for field in full_schema if field.name not in partition_cols],
+            metadata=pa.Schema.from_pandas(
+                empty_df.drop(columns=partition_cols), preserve_index=preserve_index
+            ).metadata,
+        )
+
+        cls._remove_previous_dataset(path)
+        os.makedirs(path, exist_ok=True)
+        results = [
+            row.apply(
+                lambda df, partition_idx=partition_idx: _write_parquet_partition(
+                    df,
+                    partition_idx,
+                    path,
+                    columns,
+                    schema,
+                    preserve_index,
+                    partition_cols=partition_cols,
+                    **kwargs,
+                ),
+                num_splits=1,
+                maintain_partitioning=False,
+            )[0]
+            for partition_idx, row in enumerate(row_partitions)
+        ]
+        footers = [
+            pq.read_metadata(pa.BufferReader(footer))
+            for result in results
+            for footer in result.get()["footer"]
+        ]
+        pq.write_metadata(full_schema, os.path.join(path, "_common_metadata"))
+        pq.write_metadata(
+            schema, os.path.join(path, "_metadata"), metadata_collector=footers
+        )
+
+
+class ParquetScan:
+    """
+    Pending read of a parquet file with the column selections and comparisons applied to it.
+
+    The scan is kept in a query compiler instead of the Modin Frame until
+    an operation needs the data. Until then selecting columns and filtering rows
+    by comparisons of columns with scalars make another scan reading less data,
+    since the filters skip the row groups, that have no matching rows
+    according to their statistics.
+
+    Parameters
+    ----------
+    dispatcher : type
+        Dispatcher class to read the file with.
+    path : str or path object
+        The filepath of the parquet file.
+    metadata : pyarrow.parquet.FileMetaData
+        The metadata of the parquet file.
+    columns : list
+        Columns of the file to read.
+    labels : pandas.Index, optional
+        Labels of the read columns. `columns` are used if not specified.
+    filters : tuple, default: ()
+        Conditions as ``(column, op, value)`` tuples, that the read rows satisfy.
+    predicate : tuple, optional
+        Conditions as ``(column, op, value)`` tuples to read the boolean mask of
+        instead of `columns`.
+    storage_options : dict, optional
+        Parameters for the filesystem of `path`.
+    """
+
+    _comparisons = ("eq", "ne", "lt", "le", "gt", "ge")
+
+    def __init__(
+        self,
+        dispatcher,
+        path,
+        metadata,
+        columns,
+        labels=None,
+        filters=(),
+        predicate=None,
+        storage_options=None,
+    ):
+        self._dispatcher = dispatcher
+        self._path = path
+        self._metadata = metadata
+        self._columns = list(columns)
+        self._labels = pandas.Index(columns) if labels is None else labels
+        self._filters = filters
+        self._predicate = predicate
+        self._storage_options = storage_options
+        self._file_dtypes = (
+            metadata.schema.to_arrow_schema().empty_table().to_pandas().dtypes
+        )
+        self._null_counts = _count_nulls(metadata)
+        self._file_index = dispatcher.build_range_index(
+            _get_index_columns(metadata), metadata.num_rows
+        )
+
+    def _replace(self, **kwargs):
+        """
+        Build a scan of the same file with the specified parameters replaced.
+
+        Parameters
+        ----------
+        **kwargs : dict
+            Parameters of the constructor to replace.
+
+        Returns
+        -------
+        ParquetScan
+        """
+        new_scan = copy.copy(self)
+        for key, value in kwargs.items():
+            setattr(new_scan, "_" + key, value)
+        return new_scan
+
+    def _is_same_source(self, other):
+        """
+        Check whether the other scan reads the same rows of the same file.
+
+        Parameters
+        ----------
+        other : ParquetScan
+            Scan to compare with.
+
+        Returns
+        -------
+        bool
+        """
+        return (
+            self._metadata is other._metadata
+            and self._path == other._path
+            and self._filters == other._filters
+        )
+
+    def is_valid(self):
+        """
+        Check whether the read columns are data columns of the file.
+
+        Returns
+        -------
+        bool
+        """
+        return len(self._columns) > 0 and all(
+            column in self._file_dtypes.index for column in self._columns
+        )
+
+    @property
+    def columns(self):
+        """
+        Get the column labels of the read frame.
+
+        Returns
+        -------
+        pandas.Index
+        """
+        return self._labels
+
+    @property
+    def index(self):
+        """
+        Get the index of the read frame if it is known without reading the file.
+
+        Returns
+        -------
+        pandas.Index or None
+        """
+        return None if self._filters else self._file_index
+
+    @property
+    def dtypes(self):
+        """
+        Get the dtypes of the read frame if they are known without reading the file.
+
+        Returns
+        -------
+        pandas.Series or None
+        """
+        if self._predicate is not None:
+            if not all(
+                isinstance(self._file_dtypes[column], np.dtype)
+                for column, _, _ in self._predicate
+            ):
+                return None
+            return pandas.Series([np.dtype(bool)], index=self._labels)
+        dtypes = self._file_dtypes[self._columns]
+        if any(isinstance(dtype, pandas.CategoricalDtype) for dtype in dtypes):
+            return None
+        dtypes = list(dtypes)
+        for i, column in enumerate(self._columns):
+            if not isinstance(dtypes[i], np.dtype) or dtypes[i].kind not in "iub":
+                continue
+            null_count = self._null_counts.get(column)
+            if null_count == 0:
+                continue
+            if null_count is None:
+                return None
+            # pandas reads the integer and boolean columns with missing values
+            # as float and object columns, even if the filters drop those rows
+            dtypes[i] = np.dtype(object if dtypes[i].kind == "b" else np.float64)
+        return pandas.Series(dtypes, index=self._labels)
+
+    def project(self, key):
+        """
+        Build a scan reading only the specified columns.
+
+        Parameters
+        ----------
+        key : list-like
+            Labels of the columns to read.
+
+        Returns
+        -------
+        ParquetScan or None
+            None if the columns cannot be selected without reading the file.
+        """
+        if self._predicate is not None or not self._labels.is_unique or len(key) == 0:
+            return None
+        positions = self._labels.get_indexer(key)
+        if (positions < 0).any():
+            return None
+        return self._replace(
+            columns=[self._columns[i] for i in positions],
+            labels=self._labels[positions],
+        )
+
+    def rename(self, labels):
+        """
+        Build a scan reading the columns with the specified labels.
+
+        Parameters
+        ----------
+        labels : list-like
+            New column labels.
+
+        Returns
+        -------
+        ParquetScan or None
+            None if the labels do not match the columns.
+        """
+        labels = ensure_index(labels)
+        if len(labels) != len(self._labels):
+            return None
+        return self._replace(labels=labels)
+
+    def compare(self, op, value):
+        """
+        Build a scan reading the boolean mask of the comparison of the only column with a scalar.
+
+        Parameters
+        ----------
+        op : str
+            Name of the comparison.
+        value : object
+            Scalar to compare the column with.
+
+        Returns
+        -------
+        ParquetScan or None
+            None if the comparison cannot be recorded, or if it may raise an error.
+        """
+        if (
+            op not in self._comparisons
+            or self._predicate is not None
+            or len(self._columns) != 1
+            or not is_scalar(value)
+            or pandas.isna(value)
+        ):
+            return None
+        dtype = self._file_dtypes[self._columns[0]]
+        if op not in ("eq", "ne") and not (
+            is_numeric_dtype(dtype)
+            and not is_bool_dtype(dtype)
+            and _is_number(value)
+            or is_object_dtype(dtype)
+            and isinstance(value, str)
+            or is_datetime64_any_dtype(dtype)
+            and isinstance(value, (datetime.datetime, np.datetime64))
+            and (pandas.Timestamp(value).tz is None)
+            == (getattr(dtype, "tz", None) is None)
+        ):
+            return None
+        return self._replace(predicate=((self._columns[0], op, value),))
+
+    def combine(self, op, other):
+        """
+        Build a scan reading the boolean mask of the conjunction of two scans reading boolean masks.
+
+        Parameters
+        ----------
+        op : str
+            Name of the operator.
+        other : ParquetScan
+            Scan to combine with.
+
+        Returns
+        -------
+        ParquetScan or None
+            None if the scans cannot be combined.
+        """
+        if (
+            op != "__and__"
+            or self._predicate is None
+            or other._predicate is None
+            or not self._is_same_source(other)
+        ):
+            return None
+        return self._replace(predicate=self._predicate + other._predicate)
+
+    def filter(self, other):
+        """
+        Build a scan reading only the rows, where the boolean mask read by the other scan is true.
+
+        Parameters
+        ----------
+        other : ParquetScan
+            Scan reading the boolean mask.
+
+        Returns
+        -------
+        ParquetScan or None
+            None if the mask does not come from the same rows of the same file.
+        """
+        if (
+            self._predicate is not None
+            or other._predicate is None
+            or not self._is_same_source(other)
+        ):
+            return None
+        return self._replace(filters=self._filters + other._predicate)
+
+    def execute(self):
+        """
+        Read the file.
+
+        Returns
+        -------
+        PandasDataframe
+        """
+        frame = self._dispatcher.build_query_compiler_from_row_groups(
+            self._path,
+            self._columns,
+            self._metadata,
+            filters=self._filters,
+            predicate=self._predicate,
+            storage_options=self._storage_options,
+        )._modin_frame
+        if (
+            not frame.columns.equals(self._labels)
+            or frame.columns.names != self._labels.names
+        ):
+            frame.columns = self._labels
+        dtypes = None if self._predicate is not None else self.dtypes
+        if self._filters and dtypes is not None:
+            # The skipped row groups may be the only ones with missing values
+            new_dtypes = {
+                label: dtype
+                for label, dtype, read_dtype in zip(self._labels, dtypes, frame.dtypes)
+                if dtype != read_dtype
+            }
+            if new_dtypes:
+                frame = frame.astype(new_dtypes)
+        return frame
@@ -0,0 +1,687 @@
+# Licensed to Modin Development Team under one or more contributor license agreements.
+# See the NOTICE file distributed with this work for additional information regarding
+# copyright ownership.  The Modin Development Team licenses this file to you under the
+# Apache License, Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific language
+# governing permissions and limitations under the License.
+
+"""
+Module houses `SeekableDecompressor` class.
+
+`SeekableDecompressor` decompresses files unit by unit (gzip members and
+deflate blocks inside them, bz2 blocks and zstd frames) and remembers where
+every unit starts, so seeking in the decompressed data only decompresses the
+data from the closest preceding unit.
+"""
+
+import bisect
+import bz2
+import io
+import os
+import zlib
+
+import numpy as np
+
+from modin.utils import import_optional_dependency
+
+SEEKABLE_COMPRESSIONS = ("gzip", "bz2", "zstd")
+
+# Amount of compressed data read from the file at once
+_CHUNK_SIZE = 64 * 1024
+# Amount of decompressed data between the units inside gzip members
+_GZIP_CHECKPOINT_SPACING = 4 * 1024 * 1024
+# Size of the deflate window, that back-references can point into
+_DEFLATE_WINDOW = 32 * 1024
+# Amount of compressed data fed to zlib at once while looking for block ends
+_DEFLATE_PIECE = 16 * 1024
+# Number of bytes searched for bz2 block magics at once
+_SEARCH_SIZE = 1024 * 1024
+
+_BZ2_BLOCK_MAGIC = 0x314159265359
+_BZ2_EOS_MAGIC = 0x177245385090
+_ZSTD_SKIPPABLE_MAGIC = 0x184D2A50
+
+
+def _gzip_header_size(buffer):
+    """
+    Get the size of the gzip member header at the start of the buffer.
+
+    Parameters
+    ----------
+    buffer : bytes
+        The buffer starting with the member.
+
+    Returns
+    -------
+    int or None
+        Size of the header or None if the buffer does not hold all of it.
+    """
+    if len(buffer) < 10:
+        return None
+    if buffer[:3] != b"\x1f\x8b\x08":
+        raise OSError("Not a gzipped file")
+    flags = buffer[3]
+    size = 10
+    if flags & 4:
+        # FEXTRA
+        if len(buffer) < size + 2:
+            return None
+        size += 2 + int.from_bytes(buffer[size : size + 2], "little")
+    for flag in (8, 16):
+        # zero-terminated FNAME and FCOMMENT
+        if flags & flag:
+            end = buffer.find(b"\0", size)
+            if end < 0:
+                return None
+            size = end + 1
+    if flags & 2:
+        # FHCRC
+        size += 2
+    return size if len(buffer) >= size else None
+
+
+def _shift_bits(buffer, shift):
+    """
+    Drop the lowest bits of the little-endian bit stream in the buffer.
+
+    Parameters
+    ----------
+    buffer : bytes
+        The buffer to shift.
+    shift : int
+        Number of bits to drop.
+
+    Returns
+    -------
+    bytes
+        The shifted buffer of the same length, its last byte is padded with zeroes.
+    """
+    if not shift:
+        return buffer
+    return (int.from_bytes(buffer, "little") >> shift).to_bytes(len(buffer), "little")
+
+
+def _deflate_block_end(inflater, piece, used):
+    """
+    Find the bit the deflate block ends at in the last piece fed to the inflater.
+
+    zlib only reports the bytes it used, so the bits of the last used byte are
+    told apart by altering the ones after each candidate end: the bits after the
+    end of the block do not change the inflated data.
+
+    Parameters
+    ----------
+    inflater : zlib decompress object
+        The inflater before the piece was fed into it.
+    piece : bytes
+        The piece of the compressed data, that the block ends in.
+    used : int
+        Number of bytes of the piece, that the inflater used.
+
+    Returns
+    -------
+    int
+        Number of bits of the piece taken by the block.
+    """
+    inflater = inflater.copy()
+    inflater.decompress(piece[: used - 1])
+    last = piece[used - 1]
+    expected = inflater.copy().decompress(piece[used - 1 : used])
+    for bit in range(1, 8):
+        mask = (1 << bit) - 1
+        trial = inflater.copy()
+        try:
+            data = trial.decompress(bytes([last & mask | ~last & ~mask & 0xFF]))
+        except zlib.error:
+            continue
+        if trial.eof and data == expected:
+            return (used - 1) * 8 + bit
+    return used * 8
+
+
+def _gzip_units(file, position, window=None):
+    """
+    Decompress gzip members of the file deflate block by deflate block.
+
+    The deflate blocks are inflated one by one as raw streams of their own,
+    their BFINAL bits are set to make zlib stop at their ends. A block, that
+    starts after ``_GZIP_CHECKPOINT_SPACING`` bytes of data since the previous
+    unit, is a unit too: like in zran, it is stored together with the last
+    32 KiB of the data before it, that its back-references can point to, so
+    the decompression can start from the middle of a member.
+
+    Parameters
+    ----------
+    file : file-like object
+        The compressed file.
+    position : int
+        Bit offset of the member or of the deflate block to start from.
+    window : bytes, optional
+        zlib-compressed data preceding the deflate block at `position`,
+        None if `position` is the start of a member.
+
+    Yields
+    ------
+    int, tuple or bytes
+        Bit offset of the next member, tuple with the bit offset of the next
+        deflate block unit and its window, or the decompressed data.
+    """
+    base = position // 8
+    file.seek(base)
+    buffer = b""
+    eof = False
+
+    def available(size):
+        """Read the file until `size` bytes after `base` are buffered."""
+        nonlocal buffer, eof
+        while not eof and len(buffer) < size:
+            chunk = file.read(max(size - len(buffer), _CHUNK_SIZE))
+            buffer += chunk
+            eof = not chunk
+        return len(buffer) >= size
+
+    def truncated():
+        """Get the error of the file ending in the middle of a member."""
+        return EOFError(
+            "Compressed file ended before the end-of-stream marker was reached"
+        )
+
+    in_member = window is not None
+    history = zlib.decompress(window) if in_member else b""
+    since_unit = 0
+    while True:
+        # drop the decompressed blocks from the buffer
+        drop = position // 8 - base
+        buffer = buffer[drop:]
+        base += drop
+        if not in_member:
+            # gzip files can be padded with zeroes between and after the members
+            offset = 0
+            while available(offset + 1) and buffer[offset] == 0:
+                offset += 1
+            if not available(offset + 1):
+                return
+            while True:
+                size = _gzip_header_size(buffer[offset:])
+                if size is not None:
+                    break
+                if not available(len(buffer) + 1):
+                    raise truncated()
+            position = (base + offset) * 8
+            yield position
+            position += size * 8
+            in_member = True
+            history = b""
+            since_unit = 0
+            continue
+        byte, shift = divmod(position - base * 8, 8)
+        if not available(byte + 2) and len(buffer) <= byte:
+            raise truncated()
+        header = int.from_bytes(buffer[byte : byte + 2], "little") >> shift
+        last, kind = header & 1, header >> 1 & 3
+        if kind == 0:
+            # stored blocks are aligned to the bytes of the original stream
+            start = (position + 3 + 7) // 8 - base
+            if not available(start + 4):
+                raise truncated()
+            length = int.from_bytes(buffer[start : start + 2], "little")
+            complement = int.from_bytes(buffer[start + 2 : start + 4], "little")
+            if length ^ complement != 0xFFFF:
+                raise OSError("Invalid stored block lengths")
+            if not available(start + 4 + length):
+                raise truncated()
+            data = buffer[start + 4 : start + 4 + length]
+            position = (base + start + 4 + length) * 8
+        elif kind == 3:
+            raise OSError("Invalid block type")
+        else:
+            inflater = (
+                zlib.decompressobj(-zlib.MAX_WBITS, zdict=history)
+                if history
+                else zlib.decompressobj(-zlib.MAX_WBITS)
+            )
+            chunks = []
+            start = byte
+            while True:
+                available(start + _DEFLATE_PIECE + 1)
+                # the extra byte fills the top bits of the last shifted one
+                piece = buffer[start : start + _DEFLATE_PIECE + 1]
+                piece = _shift_bits(piece, shift)[:_DEFLATE_PIECE]
+                if start == byte:
+                    # the final block makes zlib stop at its end
+                    piece = bytes([piece[0] | 1]) + piece[1:]
+                previous = inflater.copy()
+                chunks.append(inflater.decompress(piece))
+                if inflater.eof:
+                    break
+                if len(piece) < _DEFLATE_PIECE:
+                    raise truncated()
+                start += _DEFLATE_PIECE
+            used = len(piece) - len(inflater.unused_data)
+            end = _deflate_block_end(previous, piece, used)
+            data = b"".join(chunks)
+            position = (base + start) * 8 + shift + end
+        if data:
+            yield data
+        history = (history + data)[-_DEFLATE_WINDOW:]
+        since_unit += len(data)
+        if last:
+            # the CRC and the size of the member data follow at the byte boundary
+            position = (position + 7) // 8 * 8 + 64
+            if not available(position // 8 - base):
+                raise truncated()
+            in_member = False
+        elif since_unit >= _GZIP_CHECKPOINT_SPACING:
+            yield position, zlib.compress(history, 1)
+            since_unit = 0
+
+
+def _zstd_units(file, position):
+    """
+    Decompress zstd frames of the file.
+
+    Parameters
+    ----------
+    file : file-like object
+        The compressed file.
+    position : int
+        Byte offset of the frame to start from.
+
+    Yields
+    ------
+    int or bytes
+        Byte offset of the next frame or the decompressed data.
+    """
+    zstandard = import_optional_dependency(
+        "zstandard", "zstandard is required to read zstd compressed files."
+    )
+    context = zstandard.ZstdDecompressor()
+    file.seek(position)
+    decompressor = None
+    data = b""
+    while True:
+        boundary = decompressor is None or decompressor.eof
+        # the frame header is needed to tell the skippable frames apart
+        if not data or boundary and len(data) < 8:
+            chunk = file.read(_CHUNK_SIZE)
+            if not chunk:
+                if data or not boundary:
+                    raise EOFError(
+                        "Compressed file ended before the end-of-stream marker was reached"
+                    )
+                return
+            data += chunk
+            position += len(chunk)
+            continue
+        if boundary:
+            magic = int.from_bytes(data[:4], "little")
+            if magic & 0xFFFFFFF0 == _ZSTD_SKIPPABLE_MAGIC:
+                # skippable frames, like the seek table, have no data
+                skip = 8 + int.from_bytes(data[4:8], "little")
+                while skip > len(data):
+                    skip -= len(data)
+                    data = file.read(max(skip, _CHUNK_SIZE))
+                    position += len(data)
+                    if not data:
+                        raise EOFError("Compressed file ended in a skippable frame")
+                data = data[skip:]
+                continue
+            yield position - len(data)
+            decompressor = context.decompressobj()
+        yield decompressor.decompress(data)
+        data = decompressor.unused_data if decompressor.eof else b""
+
+
+def _find_bits(buffer, pattern, start):
+    """
+    Find the first occurrence of the 48-bit pattern in the buffer.
+
+    Parameters
+    ----------
+    buffer : bytes
+        The buffer to search in.
+    pattern : int
+        The pattern to search for, bits are ordered from the most significant one.
+    start : int
+        Bit offset in the buffer to start the search from.
+
+    Returns
+    -------
+    int or None
+        Bit offset of the pattern or None if it is not found.
+    """
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    mask = np.uint64((1 << 48) - 1)
+    pattern = np.uint64(pattern)
+    for first in range(start // 8, len(data), _SEARCH_SIZE):
+        # every element holds the 7 bytes starting at its offset, which cover
+        # the pattern starting at any bit of the first byte
+        chunk = data[first : first + _SEARCH_SIZE + 6]
+        count = min(_SEARCH_SIZE, len(chunk))
+        chunk = np.concatenate([chunk, np.zeros(6, dtype=np.uint8)])
+        chunk = chunk.astype(np.uint64)
+        windows = chunk[:count] << np.uint64(48)
+        for byte in range(1, 7):
+            windows |= chunk[byte : byte + count] << np.uint64(48 - byte * 8)
+        found = []
+        for shift in range(8):
+            values = (windows >> np.uint64(8 - shift)) & mask
+            hits = np.flatnonzero(values == pattern)
+            bits = (first + hits) * 8 + shift
+            bits = bits[(bits >= start) & (bits + 48 <= len(data) * 8)]
+            if len(bits):
+                found.append(int(bits[0]))
+        if found:
+            return min(found)
+    return None
+
+
+def _bits(buffer, start, stop):
+    """
+    Extract bits of the buffer into an integer.
+
+    Parameters
+    ----------
+    buffer : bytes
+        The buffer to extract the bits from.
+    start : int
+        Bit offset of the first bit.
+    stop : int
+        Bit offset after the last bit.
+
+    Returns
+    -------
+    int
+    """
+    first, last = start // 8, (stop + 7) // 8
+    value = int.from_bytes(buffer[first:last], "big")
+    return (value >> (last * 8 - stop)) & ((1 << (stop - start)) - 1)
+
+
+def _decompress_bz2_block(buffer, start, stop):
+    """
+    Decompress a single bz2 block by wrapping it into a stream of its own.
+
+    Parameters
+    ----------
+    buffer : bytes
+        The buffer with the block.
+    start : int
+        Bit offset of the block magic.
+    stop : int
+        Bit offset after the end of the block.
+
+    Returns
+    -------
+    bytes or None
+        The decompressed data or None if the bits are not a valid block.
+    """
+    length = stop - start
+    block = _bits(buffer, start, stop)
+    # the combined CRC of the stream with a single block is the CRC of the block
+    crc = _bits(buffer, start + 48, start + 80)
+    stream = (((block << 48) | _BZ2_EOS_MAGIC) << 32) | crc
+    padding = -(length + 80) % 8
+    stream = b"BZh9" + (stream << padding).to_bytes((length + 80 + padding) // 8, "big")
+    decompressor = bz2.BZ2Decompressor()
+    try:
+        data = decompressor.decompress(stream)
+    except OSError:
+        return None
+    return data if decompressor.eof else None
+
+
+def _bz2_units(file, position):
+    """
+    Decompress bz2 blocks of the file.
+
+    Parameters
+    ----------
+    file : file-like object
+        The compressed file.
+    position : int
+        Bit offset of the block or the stream header to start from.
+
+    Yields
+    ------
+    int or bytes
+        Bit offset of the next block or the decompressed data.
+    """
+    base = position // 8 * 8
+    file.seek(base // 8)
+    buffer = b""
+    eof = False
+
+    def available(start, size):
+        """Read the file until `size` bytes after the bit offset `start` are buffered."""
+        nonlocal buffer, eof
+        while not eof and len(buffer) - (start - base) // 8 < size:
+            chunk = file.read(_CHUNK_SIZE)
+            buffer += chunk
+            eof = not chunk
+        return len(buffer) - (start - base) // 8 >= size
+
+    start = position
+    while available(start, 1):
+        offset = start - base
+        if offset % 8 == 0 and buffer[offset // 8 : offset // 8 + 3] == b"BZh":
+            # the stream header is followed by the first block
+            start += 32
+            continue
+        marker = _bits(buffer, offset, offset + 48) if available(start, 7) else None
+        if marker == _BZ2_EOS_MAGIC:
+            # the end-of-stream marker is followed by the CRC and the next
+            # stream, that starts at a byte boundary
+            start += 80 + (-(offset + 80) % 8)
+            continue
+        if marker != _BZ2_BLOCK_MAGIC:
+            if offset % 8 == 0 and start != position:
+                # the streams are followed by something else, that is ignored
+                return
+            raise OSError("Invalid data stream")
+        search = offset + 48
+        while True:
+            stops = [
+                stop
+                for stop in (
+                    _find_bits(buffer, _BZ2_BLOCK_MAGIC, search),
+                    _find_bits(buffer, _BZ2_EOS_MAGIC, search),
+                )
+                if stop is not None
+            ]
+            if not stops:
+                if eof:
+                    raise EOFError(
+                        "Compressed file ended before the end-of-stream marker was reached"
+                    )
+                # the end of the buffer can hold the beginning of the next marker
+                search = max(search, len(buffer) * 8 - 48)
+                available(start, len(buffer) - offset // 8 + _CHUNK_SIZE)
+                continue
+            stop = min(stops)
+            data = _decompress_bz2_block(buffer, offset, stop)
+            if data is not None:
+                break
+            # the marker is a part of the compressed data, so the block is longer
+            search = stop + 1
+        yield start
+        yield data
+        start = base + stop
+        # drop the decompressed blocks from the buffer
+        drop = (start - base) // 8
+        buffer = buffer[drop:]
+        base += drop * 8
+
+
+_UNITS = {"gzip": _gzip_units, "bz2": _bz2_units, "zstd": _zstd_units}
+
+
+class SeekableDecompressor(io.RawIOBase):
+    """
+    Decompressed view of a compressed file, that supports seeking.
+
+    The file is decompressed unit by unit (gzip member or deflate block, bz2
+    block or zstd frame), the offsets of the units in the decompressed data
+    are remembered as checkpoints. Seeking restarts the decompression from the
+    closest preceding checkpoint, so seeking to the end of a data range only
+    decompresses the range if the checkpoints are known.
+
+    Parameters
+    ----------
+    file : file-like object
+        The compressed file, it should support seeking.
+    compression : {"gzip", "bz2", "zstd"}
+        Compression of the file.
+    checkpoints : list, optional
+        List of tuples with the offsets of units in the decompressed data,
+        their positions in the compressed file and the states needed to start
+        the decompression from them (None if the units are independent). The
+        list is extended with the units that are found while reading.
+    """
+
+    def __init__(self, file, compression, checkpoints=None):
+        self._file = file
+        self._units = _UNITS[compression]
+        self.checkpoints = [] if checkpoints is None else checkpoints
+        if not self.checkpoints:
+            self.checkpoints.append((0, 0, None))
+        self._size = None
+        self._restart(0)
+
+    def _restart(self, index):
+        """
+        Restart the decompression from the checkpoint.
+
+        Parameters
+        ----------
+        index : int
+            Index of the checkpoint.
+        """
+        self._position, unit_position, state = self.checkpoints[index]
+        self._stream = (
+            self._units(self._file, unit_position)
+            if state is None
+            else self._units(self._file, unit_position, state)
+        )
+        self._buffer = memoryview(b"")
+
+    def _fill(self):
+        """
+        Decompress the next chunk of data into the empty buffer.
+
+        Returns
+        -------
+        bool
+            Whether the end of the data is not reached.
+        """
+        for item in self._stream:
+            if isinstance(item, bytes):
+                if item:
+                    self._buffer = memoryview(item)
+                    return True
+                continue
+            unit_position, state = item if isinstance(item, tuple) else (item, None)
+            if unit_position > self.checkpoints[-1][1]:
+                self.checkpoints.append((self._position, unit_position, state))
+        self._size = self._position
+        return False
+
+    def readable(self):
+        """
+        Return whether the object supports reading.
+
+        Returns
+        -------
+        bool
+        """
+        return True
+
+    def seekable(self):
+        """
+        Return whether the object supports seeking.
+
+        Returns
+        -------
+        bool
+        """
+        return True
+
+    def tell(self):
+        """
+        Return the current position in the decompressed data.
+
+        Returns
+        -------
+        int
+        """
+        return self._position
+
+    def readinto(self, b):
+        """
+        Read decompressed data into a pre-allocated buffer.
+
+        Parameters
+        ----------
+        b : bytearray or memoryview
+            The buffer to read into.
+
+        Returns
+        -------
+        int
+            Number of bytes read, 0 indicates the end of the data.
+        """
+        if not self._buffer and not self._fill():
+            return 0
+        size = min(len(b), len(self._buffer))
+        b[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        self._position += size
+        return size
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        """
+        Change the position in the decompressed data.
+
+        Parameters
+        ----------
+        offset : int
+            The offset relative to the position indicated by `whence`.
+        whence : int, default: os.SEEK_SET
+            ``os.SEEK_SET``, ``os.SEEK_CUR`` or ``os.SEEK_END``.
+
+        Returns
+        -------
+        int
+            The new position.
+        """
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            if self._size is None:
+                # the size is known only after the whole data is decompressed
+                self._position += len(self._buffer)
+                self._buffer = memoryview(b"")
+                while self._fill():
+                    self._position += len(self._buffer)
+                    self._buffer = memoryview(b"")
+            offset += self._size
+        elif whence != os.SEEK_SET:
+            raise ValueError(f"Invalid whence ({whence})")
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+        index = bisect.bisect_right([point[0] for point in self.checkpoints], offset)
+        if offset < self._position or self.checkpoints[index - 1][0] > self._position:
+            self._restart(index - 1)
+        while self._position < offset:
+            if not self._buffer and not self._fill():
+                break
+            size = min(offset - self._position, len(self._buffer))
+            self._buffer = self._buffer[size:]
+            self._position += size
+        return self._position
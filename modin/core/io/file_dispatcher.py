@@ -19,8 +19,11 @@ for direct files processing.
 """
 
 import fsspec
+from fsspec.utils import infer_compression
+import io
 import os
 import re
+from modin.core.io.compression import SeekableDecompressor, SEEKABLE_COMPRESSIONS
 from modin.config import StorageFormat
 from modin.utils import import_optional_dependency
 import numpy as np
@@ -46,6 +49,12 @@ class OpenFile:
         String, which defines which mode file should be open.
     compression : str, default: "infer"
         File compression name.
+    checkpoints : list, optional
+        Checkpoints of the ``SeekableDecompressor``. If specified, files opened
+        in "rb" mode with one of ``SEEKABLE_COMPRESSIONS`` are decompressed
+        by ``SeekableDecompressor``, so seeking does not decompress the file
+        from the beginning. The list is extended with the checkpoints found
+        while reading the file.
     **kwargs : dict
         Keywords arguments to be passed into ``fsspec.open`` function.
 
@@ -57,16 +66,21 @@ class OpenFile:
         String that defines which mode the file should be opened in.
     compression : str
         File compression name.
+    checkpoints : list or None
+        Checkpoints of the ``SeekableDecompressor``.
     file : fsspec.core.OpenFile
         The opened file.
     kwargs : dict
         Keywords arguments to be passed into ``fsspec.open`` function.
     """
 
-    def __init__(self, file_path, mode="rb", compression="infer", **kwargs):
+    def __init__(
+        self, file_path, mode="rb", compression="infer", checkpoints=None, **kwargs
+    ):
         self.file_path = file_path
         self.mode = mode
         self.compression = compression
+        self.checkpoints = checkpoints
         self.kwargs = kwargs
 
     def __enter__(self):
@@ -88,15 +102,28 @@ class OpenFile:
         except ModuleNotFoundError:
             credential_error_type = ()
 
-        args = (self.file_path, self.mode, self.compression)
+        compression = self.compression
+        if compression == "infer" and isinstance(self.file_path, str):
+            compression = infer_compression(self.file_path)
+        seekable = (
+            self.checkpoints is not None
+            and self.mode == "rb"
+            and compression in SEEKABLE_COMPRESSIONS
+        )
+        args = (self.file_path, self.mode, None if seekable else self.compression)
 
         self.file = fsspec.open(*args, **self.kwargs)
         try:
-            return self.file.open()
+            file = self.file.open()
         except credential_error_type:
             self.kwargs["anon"] = True
             self.file = fsspec.open(*args, **self.kwargs)
-        return self.file.open()
+            file = self.file.open()
+        if seekable:
+            return io.BufferedReader(
+                SeekableDecompressor(file, compression, self.checkpoints)
+            )
+        return file
 
     def __exit__(self, *args):
         """
@@ -806,6 +806,8 @@ class BaseIO(object):
         For parameters description please refer to pandas API.
         """
         ErrorMessage.default_to_pandas("`to_sql`")
+        if isinstance(con, ModinDatabaseConnection):
+            con = con.get_connection()
         df = qc.to_pandas()
         df.to_sql(
             name=name,
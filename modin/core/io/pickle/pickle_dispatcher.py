@@ -11,14 +11,307 @@
 # ANY KIND, either express or implied. See the License for the specific language
 # governing permissions and limitations under the License.
 
-"""Module houses ``PickleExperimentalDispatcher`` class that is used for reading `.pkl` files."""
+"""
+Module houses classes that are used for reading and writing `.pkl` files.
+
+``PickleDispatcher`` reads and writes single pickle files in the chunked Modin
+format. ``PickleExperimentalDispatcher`` reads multiple pickle files matching
+a glob pattern.
+"""
 
 import glob
+import os
+import pickle
+import struct
 import warnings
 
+import pandas
+from pandas.io.common import infer_compression, is_fsspec_url, is_url, stringify_path
+
+from modin.core.io.io import BaseIO
 from modin.core.io.file_dispatcher import FileDispatcher
 from modin.config import NPartitions
 
+# A chunked pickle starts with a header stored as a bytes object, which is
+# popped from the stack right away, so the file still unpickles as a single
+# pandas.DataFrame with the plain `pickle.load` or `pandas.read_pickle`:
+#
+#   PROTO 4, BINBYTES <magic + pickled header>, POP,
+#   GLOBAL pandas.concat, EMPTY_LIST, MARK,
+#       (GLOBAL pickle.loads, BINBYTES8 <pickled row block>, TUPLE1, REDUCE) * N,
+#   APPENDS, TUPLE1, REDUCE, STOP
+#
+# Offsets of the row blocks in the header are counted from the end of the
+# header, so every block can be read or written on its own.
+_CHUNKED_PICKLE_MAGIC = b"modin-chunked-pickle-v1\x00"
+_CHUNKED_PICKLE_PREFIX = b"\x80\x04B"
+_CHUNKED_PICKLE_BLOCK_PREFIX = b"cpickle\nloads\n\x8e"
+_CHUNKED_PICKLE_BLOCK_SUFFIX = b"\x85R"
+_CHUNKED_PICKLE_BODY_PREFIX = b"0cpandas\nconcat\n]("
+_CHUNKED_PICKLE_BODY_SUFFIX = b"e\x85R."
+
+
+def _serialize_chunked_pickle_block(df, protocol):  # pragma: no cover
+    """
+    Pickle a row block of the chunked pickle file.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Row block to pickle.
+    protocol : int
+        Pickle protocol to use.
+
+    Returns
+    -------
+    bytes
+        The pickled row block, the partition task returns its length, which is
+        the size of the block, as a separate output.
+    """
+    return pickle.dumps(df, protocol=protocol)
+
+
+def _write_chunked_pickle_block(data, path, offset):  # pragma: no cover
+    """
+    Write a serialized row block into the chunked pickle file at `offset`.
+
+    Parameters
+    ----------
+    data : bytes
+        The pickled row block.
+    path : str
+        Path to the chunked pickle file.
+    offset : int
+        Position of the row block in the file.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Empty frame as the block is only needed to be written.
+    """
+    with open(path, "r+b") as file:
+        file.seek(offset)
+        file.write(data)
+    return pandas.DataFrame()
+
+
+class PickleDispatcher(FileDispatcher):
+    """Class handles utils for reading and writing single pickle files."""
+
+    @classmethod
+    def _read(cls, filepath_or_buffer, **kwargs):
+        """
+        Read data from `filepath_or_buffer` according to `kwargs` parameters.
+
+        Parameters
+        ----------
+        filepath_or_buffer : str, path object or file-like object
+            `filepath_or_buffer` parameter of `read_pickle` function.
+        **kwargs : dict
+            Parameters of `read_pickle` function.
+
+        Returns
+        -------
+        new_query_compiler : BaseQueryCompiler
+            Query compiler with imported data for further processing.
+
+        Notes
+        -----
+        Only files written in the chunked Modin format by ``to_pickle`` are
+        read in parallel, every row block is deserialized by its own worker.
+        Any other pickle is read by a single worker.
+        """
+        header = cls._read_chunked_header(filepath_or_buffer, **kwargs)
+        if header is None:
+            return cls.single_worker_read(filepath_or_buffer, **kwargs)
+
+        fname = stringify_path(filepath_or_buffer)
+        column_widths = header["column_widths"]
+        num_splits = len(column_widths)
+        partition_ids = []
+        lengths_ids = []
+        for offset, nbytes in zip(header["offsets"], header["nbytes"]):
+            partition_id = cls.deploy(
+                cls.parse,
+                num_splits + 1,
+                dict(
+                    fname=fname,
+                    offset=header["data_start"] + offset,
+                    nbytes=nbytes,
+                    num_splits=num_splits,
+                    column_widths=column_widths,
+                ),
+            )
+            partition_ids.append(partition_id[:-1])
+            lengths_ids.append(partition_id[-1])
+        row_lengths = cls.materialize(lengths_ids)
+        partition_ids = cls.build_partition(partition_ids, row_lengths, column_widths)
+        return cls.query_compiler_cls(
+            cls.frame_cls(
+                partition_ids,
+                header["index"],
+                header["columns"],
+                row_lengths,
+                column_widths,
+                header["dtypes"],
+            )
+        )
+
+    @classmethod
+    def _read_chunked_header(
+        cls, filepath_or_buffer, compression="infer", storage_options=None
+    ):
+        """
+        Read the header of a pickle file written in the chunked Modin format.
+
+        Parameters
+        ----------
+        filepath_or_buffer : str, path object or file-like object
+            `filepath_or_buffer` parameter of `read_pickle` function.
+        compression : str or dict, default: "infer"
+            `compression` parameter of `read_pickle` function.
+        storage_options : dict, optional
+            `storage_options` parameter of `read_pickle` function.
+
+        Returns
+        -------
+        dict or None
+            The header or None if the file is not an uncompressed local
+            file in the chunked Modin format.
+        """
+        path = stringify_path(filepath_or_buffer)
+        if (
+            not isinstance(path, str)
+            or is_url(path)
+            or is_fsspec_url(path)
+            or storage_options
+            or infer_compression(path, compression) is not None
+            or not os.path.isfile(path)
+        ):
+            return None
+        with open(path, "rb") as file:
+            prefix = file.read(len(_CHUNKED_PICKLE_PREFIX) + 4)
+            if (
+                not prefix.startswith(_CHUNKED_PICKLE_PREFIX)
+                or len(prefix) != len(_CHUNKED_PICKLE_PREFIX) + 4
+            ):
+                return None
+            (header_size,) = struct.unpack("<I", prefix[len(_CHUNKED_PICKLE_PREFIX) :])
+            header = file.read(header_size)
+        if not header.startswith(_CHUNKED_PICKLE_MAGIC):
+            return None
+        header = pickle.loads(header[len(_CHUNKED_PICKLE_MAGIC) :])
+        header["data_start"] = len(prefix) + header_size
+        return header
+
+    @classmethod
+    def _to_pickle_check_support(cls, qc, kwargs):
+        """
+        Check if the chunked Modin format can be used by ``to_pickle``.
+
+        Parameters
+        ----------
+        qc : BaseQueryCompiler
+            The query compiler of the Modin dataframe to write.
+        kwargs : dict
+            Keyword arguments passed to ``to_pickle``.
+
+        Returns
+        -------
+        bool
+            Whether the chunked Modin format is applicable.
+        """
+        path = stringify_path(kwargs["filepath_or_buffer"])
+        protocol = kwargs.get("protocol", pickle.HIGHEST_PROTOCOL)
+        if protocol < 0:
+            protocol = pickle.HIGHEST_PROTOCOL
+        return (
+            isinstance(qc, cls.query_compiler_cls)
+            and qc._modin_frame._partitions.size > 0
+            and isinstance(path, str)
+            and not is_url(path)
+            and not is_fsspec_url(path)
+            and not kwargs.get("storage_options")
+            and infer_compression(path, kwargs.get("compression", "infer")) is None
+            # BINBYTES8 opcode, which holds the row blocks, appeared in protocol 4
+            and protocol >= 4
+        )
+
+    @classmethod
+    def write(cls, qc, **kwargs):
+        """
+        Write the `qc` to a single pickle file in the chunked Modin format.
+
+        Every row partition is serialized and written to the file by its own worker,
+        the driver only writes the header and the glue between the row blocks.
+
+        Parameters
+        ----------
+        qc : BaseQueryCompiler
+            The query compiler of the Modin dataframe that we want to run ``to_pickle`` on.
+        **kwargs : dict
+            Parameters for ``pandas.to_pickle(**kwargs)``.
+        """
+        if not cls._to_pickle_check_support(qc, kwargs):
+            return BaseIO.to_pickle(qc, **kwargs)
+
+        path = stringify_path(kwargs["filepath_or_buffer"])
+        protocol = kwargs.get("protocol", pickle.HIGHEST_PROTOCOL)
+        frame = qc._modin_frame
+        # Ensure that the metadata is synchronized
+        frame._propagate_index_objs(axis=None)
+        partition_mgr_cls = frame._partition_mgr_cls
+        if frame._partitions.shape[1] == 1:
+            blocks = frame._partitions[:, 0]
+        else:
+            blocks = [
+                row.apply(lambda df: df, num_splits=1, maintain_partitioning=False)[0]
+                for row in partition_mgr_cls.row_partitions(frame._partitions)
+            ]
+        blocks = [
+            block.apply(_serialize_chunked_pickle_block, protocol=protocol)
+            for block in blocks
+        ]
+        # only the sizes of the blocks are fetched, the bytes stay on the workers
+        nbytes = [block.length() for block in blocks]
+
+        block_overhead = len(_CHUNKED_PICKLE_BLOCK_PREFIX) + 8
+        offsets = []
+        position = len(_CHUNKED_PICKLE_BODY_PREFIX)
+        for size in nbytes:
+            offsets.append(position + block_overhead)
+            position += block_overhead + size + len(_CHUNKED_PICKLE_BLOCK_SUFFIX)
+        header = _CHUNKED_PICKLE_MAGIC + pickle.dumps(
+            {
+                "offsets": offsets,
+                "nbytes": nbytes,
+                "column_widths": frame._column_widths,
+                "index": frame.index,
+                "columns": frame.columns,
+                "dtypes": frame._dtypes,
+            },
+            protocol=protocol,
+        )
+        data_start = len(_CHUNKED_PICKLE_PREFIX) + 4 + len(header)
+        with open(path, "wb") as file:
+            file.write(_CHUNKED_PICKLE_PREFIX + struct.pack("<I", len(header)))
+            file.write(header)
+            file.write(_CHUNKED_PICKLE_BODY_PREFIX)
+            for offset, size in zip(offsets, nbytes):
+                file.seek(data_start + offset - block_overhead)
+                file.write(_CHUNKED_PICKLE_BLOCK_PREFIX + struct.pack("<Q", size))
+                file.seek(data_start + offset + size)
+                file.write(_CHUNKED_PICKLE_BLOCK_SUFFIX)
+            file.write(_CHUNKED_PICKLE_BODY_SUFFIX)
+
+        results = [
+            block.apply(_write_chunked_pickle_block, path, data_start + offset)
+            for block, offset in zip(blocks, offsets)
+        ]
+        # pending completion
+        for result in results:
+            result.get()
+
 
 class PickleExperimentalDispatcher(FileDispatcher):
     """Class handles utils for reading pickle files."""
@@ -19,21 +19,105 @@ inherits util functions for handling files from `FileDispatcher` class and can b
 used as base class for dipatchers of SQL queries.
 """
 
+import csv
+import io
+import logging
 import math
+import re
+import time
 import numpy as np
 import pandas
 import warnings
 
+from modin.core.io.io import BaseIO
 from modin.core.io.file_dispatcher import FileDispatcher
 from modin.db_conn import ModinDatabaseConnection
-from modin.config import NPartitions
+from modin.config import NPartitions, SQLWriters
+
+LOGGER = logging.getLogger("[modin.sql]")
+# The lowest bound parameters limit among the common databases (SQLite < 3.32)
+_MAX_INSERT_PARAMETERS = 999
+
+
+def _insert_bulk(table, conn, keys, data_iter):  # pragma: no cover
+    """
+    Insert a batch of rows into the table with a single bulk operation.
+
+    PostgreSQL tables are loaded with ``COPY FROM STDIN`` if the connection
+    uses psycopg2. Databases supporting multi-row ``VALUES`` clauses get the
+    rows with a few multi-row ``INSERT`` statements, like with
+    ``method="multi"``, each one binding at most ``_MAX_INSERT_PARAMETERS``
+    values. Any other database gets the rows with a single ``executemany``.
+
+    Parameters
+    ----------
+    table : pandas.io.sql.SQLTable
+        The table to insert into.
+    conn : sqlalchemy.engine.Connection
+        The connection to the database.
+    keys : list of str
+        Names of the columns.
+    data_iter : iterable of tuples
+        The rows to insert.
+    """
+    dialect = conn.dialect
+    if dialect.name == "postgresql" and dialect.driver == "psycopg2":
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(data_iter)
+        buffer.seek(0)
+        preparer = dialect.identifier_preparer
+        with conn.connection.cursor() as cursor:
+            cursor.copy_expert(
+                "COPY {} ({}) FROM STDIN WITH CSV".format(
+                    preparer.format_table(table.table),
+                    ", ".join(preparer.quote(key) for key in keys),
+                ),
+                buffer,
+            )
+    elif dialect.supports_multivalues_insert:
+        rows = [dict(zip(keys, row)) for row in data_iter]
+        step = max(1, _MAX_INSERT_PARAMETERS // max(1, len(keys)))
+        for start in range(0, len(rows), step):
+            conn.execute(table.table.insert().values(rows[start : start + step]))
+    else:
+        conn.execute(table.table.insert(), [dict(zip(keys, row)) for row in data_iter])
+
+
+def _write_sql_partition(df, columns, con, **kwargs):  # pragma: no cover
+    """
+    Write a row partition to the SQL table in its own transaction.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Row partition to write.
+    columns : pandas.Index
+        Column labels of the partition.
+    con : str or ModinDatabaseConnection
+        Connection to the database.
+    **kwargs : dict
+        Other parameters for ``pandas.DataFrame.to_sql``.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Frame with the number of written rows and the time it took.
+    """
+    start = time.perf_counter()
+    df.columns = columns
+    if isinstance(con, ModinDatabaseConnection):
+        con = con.get_connection()
+    df.to_sql(con=con, **kwargs)
+    return pandas.DataFrame(
+        {"rows": [len(df.index)], "seconds": [time.perf_counter() - start]}
+    )
 
 
 class SQLDispatcher(FileDispatcher):
     """Class handles utils for reading SQL queries or database tables."""
 
     @classmethod
-    def _read(cls, sql, con, index_col=None, **kwargs):
+    def _read(cls, sql, con, index_col=None, partition_column=None, **kwargs):
         """
         Read a SQL query or database table into a query compiler.
 
@@ -45,6 +129,9 @@ class SQLDispatcher(FileDispatcher):
             Connection object to database.
         index_col : str or list of str, optional
             Column(s) to set as index(MultiIndex).
+        partition_column : str, optional
+            Column to split the result of the query into ranges by. If not
+            specified, an indexed column of the queried table is used if any.
         **kwargs : dict
             Parameters to pass into `pandas.read_sql` function.
 
@@ -74,15 +161,43 @@ class SQLDispatcher(FileDispatcher):
         )
         cols_names = cols_names_df.columns
         num_partitions = NPartitions.get()
+        queries = None
+        connectable = cls._get_sqlalchemy_connectable(con)
+        if connectable is not None:
+            try:
+                partition_column = cls._get_partition_column(
+                    sql,
+                    connectable,
+                    list(cols_names) + list(cols_names_df.index.names),
+                    partition_column,
+                )
+                if partition_column is not None:
+                    queries = cls._get_keyset_queries(
+                        sql, connectable, partition_column, row_cnt, num_partitions
+                    )
+            finally:
+                # the engine (connection) is made only to plan the partitions
+                if hasattr(connectable, "dispose"):
+                    connectable.dispose()
+                else:
+                    connectable.close()
+        elif partition_column is not None:
+            warnings.warn(
+                "`partition_column` is only used with SQLAlchemy connections, "
+                + "the query is read with LIMIT/OFFSET queries."
+            )
+        if queries is None:
+            limit = math.ceil(row_cnt / num_partitions)
+            queries = [
+                "SELECT * FROM ({}) as foo LIMIT {} OFFSET {}".format(
+                    sql, limit, part * limit
+                )
+                for part in range(num_partitions)
+            ]
         partition_ids = []
         index_ids = []
         dtype_ids = []
-        limit = math.ceil(row_cnt / num_partitions)
-        for part in range(num_partitions):
-            offset = part * limit
-            query = "SELECT * FROM ({}) as foo LIMIT {} OFFSET {}".format(
-                sql, limit, offset
-            )
+        for query in queries:
             partition_id = cls.deploy(
                 cls.parse,
                 num_partitions + 2,
@@ -110,3 +225,267 @@ class SQLDispatcher(FileDispatcher):
         new_frame = cls.frame_cls(np.array(partition_ids), new_index, cols_names)
         new_frame.synchronize_labels(axis=0)
         return cls.query_compiler_cls(new_frame)
+
+    @staticmethod
+    def _get_sqlalchemy_connectable(con):
+        """
+        Get an SQLAlchemy connectable for the connection if possible.
+
+        Parameters
+        ----------
+        con : str or ModinDatabaseConnection
+            Connection object to database.
+
+        Returns
+        -------
+        SQLAlchemy Engine or Connection or None
+            None if the connection is not made with SQLAlchemy.
+        """
+        if isinstance(con, ModinDatabaseConnection):
+            return con.get_connection() if con.lib == "sqlalchemy" else None
+        try:
+            from sqlalchemy import create_engine
+        except ImportError:
+            return None
+        return create_engine(con)
+
+    @classmethod
+    def _get_partition_column(cls, sql, connectable, columns, partition_column=None):
+        """
+        Find a column to split the result of the SQL query into ranges by.
+
+        A column specified by the user is used if the query returns it.
+        Otherwise, the column is the primary key or the leading column of an
+        index of the only table the query reads from, so that every range is
+        read with an index scan. The ranges return the rows in the order of
+        the column, so a query ordering its rows by another column is not
+        split into ranges.
+
+        Parameters
+        ----------
+        sql : str
+            SQL query to be executed.
+        connectable : SQLAlchemy Engine or Connection
+            Connection to the database.
+        columns : list of str
+            Names of the columns the query returns.
+        partition_column : str, optional
+            Column specified by the user.
+
+        Returns
+        -------
+        str or None
+            Name of the column or None if there is no suitable column.
+        """
+        if not isinstance(sql, str):
+            return None
+        if partition_column is not None:
+            return partition_column if partition_column in columns else None
+        # Only filtered projections of a single table are supported, as joins,
+        # groupings and subqueries may make the table indexes useless
+        match = re.fullmatch(
+            r'\s*select\s+[\w\s,.*"]+?\s+from\s+([\w.]+)(?:\s+where\s+(.+?))?'
+            r'(?:\s+order\s+by\s+"?(\w+)"?(?:\s+asc)?)?\s*;?\s*',
+            sql,
+            flags=re.IGNORECASE | re.DOTALL,
+        )
+        if match is None or (
+            match.group(2) is not None
+            and re.search(
+                r"\b(select|join|group|having|order|limit|offset|fetch|union|intersect|except)\b",
+                match.group(2),
+                flags=re.IGNORECASE,
+            )
+        ):
+            return None
+        from sqlalchemy import inspect
+        from sqlalchemy.exc import SQLAlchemyError
+
+        schema, _, table = match.group(1).rpartition(".")
+        order_column = match.group(3)
+        try:
+            inspector = inspect(connectable)
+            keys = [
+                inspector.get_pk_constraint(table, schema=schema or None)[
+                    "constrained_columns"
+                ]
+            ] + [
+                index["column_names"]
+                for index in inspector.get_indexes(table, schema=schema or None)
+            ]
+        except (SQLAlchemyError, NotImplementedError):
+            return None
+        # Ranges of the leading column of a composite key are index scans too
+        indexed = [key[0] for key in keys if len(key) and key[0] in columns]
+        if order_column is not None:
+            indexed = [
+                column for column in indexed if column.lower() == order_column.lower()
+            ]
+        return indexed[0] if len(indexed) else None
+
+    @classmethod
+    def _get_keyset_queries(cls, sql, connectable, column, row_cnt, num_partitions):
+        """
+        Get the queries reading non-overlapping ranges of `column` values.
+
+        The bounds of the ranges are the quantiles of `column` found with a
+        single ``NTILE`` query, so every query reads about the same number of
+        rows however the values are distributed. If the database has no window
+        functions, the range between ``MIN`` and ``MAX`` of `column` is split
+        evenly. Every query returns its rows ordered by `column`.
+
+        Parameters
+        ----------
+        sql : str
+            SQL query to be executed.
+        connectable : SQLAlchemy Engine or Connection
+            Connection to the database.
+        column : str
+            Name of the indexed column to split the result by.
+        row_cnt : int
+            Number of rows returned by the query.
+        num_partitions : int
+            Number of queries to produce at most.
+
+        Returns
+        -------
+        list of str or None
+            The queries or None if the column values cannot be used as bounds.
+        """
+        from sqlalchemy.exc import SQLAlchemyError
+
+        column = connectable.dialect.identifier_preparer.quote(column)
+        num_partitions = max(1, min(num_partitions, row_cnt))
+        try:
+            bounds = pandas.read_sql(
+                "SELECT MIN({0}) AS bound FROM (SELECT {0}, NTILE({1}) OVER "
+                "(ORDER BY {0}) AS tile FROM ({2}) as foo WHERE {0} IS NOT NULL) "
+                "as tiles GROUP BY tile ORDER BY tile".format(
+                    column, num_partitions, sql
+                ),
+                connectable,
+            )["bound"].tolist()
+            # The smallest value is not a bound, it starts the first range
+            bounds = [bound for bound in bounds[1:] if bound != bounds[0]]
+        except SQLAlchemyError:
+            lower, upper = (
+                pandas.read_sql(
+                    "SELECT MIN({0}) AS min_value, MAX({0}) AS max_value FROM ({1}) as foo".format(
+                        column, sql
+                    ),
+                    connectable,
+                )
+                .iloc[0]
+                .tolist()
+            )
+            if not cls._are_bounds([lower, upper]):
+                return None
+            if isinstance(lower, int) and isinstance(upper, int):
+                bounds = [
+                    lower + (upper - lower) * part // num_partitions
+                    for part in range(1, num_partitions)
+                ]
+            else:
+                bounds = [
+                    lower + (upper - lower) * part / num_partitions
+                    for part in range(1, num_partitions)
+                ]
+        if not cls._are_bounds(bounds):
+            return None
+        bounds = sorted(set(bounds))
+        if len(bounds) == 0:
+            return ["SELECT * FROM ({}) as foo ORDER BY {}".format(sql, column)]
+        conditions = ["{0} < {1!r} OR {0} IS NULL".format(column, bounds[0])]
+        conditions += [
+            "{0} >= {1!r} AND {0} < {2!r}".format(column, lower, upper)
+            for lower, upper in zip(bounds[:-1], bounds[1:])
+        ]
+        conditions.append("{} >= {!r}".format(column, bounds[-1]))
+        return [
+            "SELECT * FROM ({}) as foo WHERE {} ORDER BY {}".format(
+                sql, condition, column
+            )
+            for condition in conditions
+        ]
+
+    @staticmethod
+    def _are_bounds(values):
+        """
+        Check whether the values can be written into a query as range bounds.
+
+        Parameters
+        ----------
+        values : list
+            Values of a column converted to Python objects.
+
+        Returns
+        -------
+        bool
+        """
+        return all(
+            isinstance(value, (int, float))
+            and not isinstance(value, bool)
+            and not math.isnan(value)
+            for value in values
+        )
+
+    @classmethod
+    def write(cls, qc, **kwargs):
+        """
+        Write records stored in the `qc` to a SQL database.
+
+        Every row partition is written by its own worker in a separate
+        transaction. At most ``SQLWriters`` partitions are written at the same
+        time, so the database is not overwhelmed by concurrent writers. Unless
+        `method` is specified, every batch of `chunksize` rows is inserted
+        with a single bulk operation.
+
+        Parameters
+        ----------
+        qc : BaseQueryCompiler
+            The query compiler of the Modin dataframe that we want to run ``to_sql`` on.
+        **kwargs : dict
+            Parameters for ``pandas.to_sql(**kwargs)``.
+        """
+        con = kwargs.pop("con")
+        if not isinstance(con, (str, ModinDatabaseConnection)):
+            # Connection objects cannot be passed to the workers
+            return BaseIO.to_sql(qc, con=con, **kwargs)
+        # we first insert an empty DF in order to create the full table in the database
+        # This also helps to validate the input against pandas
+        empty_df = qc.getitem_row_array([0]).to_pandas().head(0)
+        empty_df.to_sql(
+            con=con.get_connection()
+            if isinstance(con, ModinDatabaseConnection)
+            else con,
+            **kwargs,
+        )
+        # so each partition will append its respective DF
+        kwargs["if_exists"] = "append"
+        if kwargs.get("method", None) is None:
+            kwargs["method"] = _insert_bulk
+
+        columns = qc.columns
+        frame = qc._modin_frame
+        # Ensure that the metadata is synchronized
+        frame._propagate_index_objs(axis=None)
+        row_partitions = frame._partition_mgr_cls.row_partitions(frame._partitions)
+        writers = SQLWriters.get()
+        for start in range(0, len(row_partitions), writers):
+            results = [
+                row.apply(
+                    lambda df: _write_sql_partition(df, columns, con, **kwargs),
+                    num_splits=1,
+                    maintain_partitioning=False,
+                )[0]
+                for row in row_partitions[start : start + writers]
+            ]
+            # pending completion of the writers before starting the next ones
+            for i, result in enumerate(results, start):
+                stats = result.get()
+                rows, seconds = stats["rows"].iloc[0], stats["seconds"].iloc[0]
+                LOGGER.info(
+                    "to_sql: row partition {} wrote {} rows in {:.3f}s ({:.0f} rows/s)".format(
+                        i, rows, seconds, rows / seconds if seconds else float("inf")
+                    )
+                )
@@ -11,14 +11,247 @@
 # ANY KIND, either express or implied. See the License for the specific language
 # governing permissions and limitations under the License.
 
-"""Module houses `CSVDispatcher` class, that is used for reading `.csv` files."""
+"""Module houses `CSVDispatcher` class, that is used for reading and writing `.csv` files."""
 
+import bz2
+import gzip
+import lzma
+
+import numpy as np
 import pandas
+from pandas.io.common import (
+    get_compression_method,
+    infer_compression,
+    is_fsspec_url,
+    is_url,
+)
 
+from modin.core.io.io import BaseIO
 from modin.core.io.text.text_file_dispatcher import TextFileDispatcher
 
+# Compressors of the formats, which streams can be concatenated into a valid file
+_CSV_STREAM_COMPRESSORS = {
+    "gzip": gzip.compress,
+    "bz2": bz2.compress,
+    "xz": lzma.compress,
+}
+
+
+def _write_csv_part(df, partition_idx, path_or_buf, **kwargs):  # pragma: no cover
+    """
+    Write a row block to its own CSV file.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Row block to write.
+    partition_idx : int
+        Number of the row block, replaces `*` in `path_or_buf` padded with zeros,
+        so the names of the files sort in the order of the blocks.
+    path_or_buf : str
+        Path pattern of the files.
+    **kwargs : dict
+        Parameters for ``pandas.DataFrame.to_csv``.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Empty frame as the block is only needed to be written.
+    """
+    df.to_csv(path_or_buf.replace("*", f"{partition_idx:04d}"), **kwargs)
+    return pandas.DataFrame()
+
+
+def _serialize_csv_block(
+    df, encoding, errors, compression, compression_args, **kwargs
+):  # pragma: no cover
+    """
+    Serialize a row block to the bytes of its part of CSV file.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Row block to serialize.
+    encoding : str
+        Encoding of the file.
+    errors : str
+        How encoding errors are to be handled.
+    compression : str or None
+        Compression method of the file.
+    compression_args : dict
+        Parameters of the compressor.
+    **kwargs : dict
+        Parameters for ``pandas.DataFrame.to_csv``.
+
+    Returns
+    -------
+    bytes
+        The row block in the file, the partition task returns its length,
+        which is the size of the block, as a separate output.
+    """
+    data = df.to_csv(path_or_buf=None, **kwargs).encode(encoding, errors)
+    if compression is not None:
+        data = _CSV_STREAM_COMPRESSORS[compression](data, **compression_args)
+    return data
+
+
+def _write_csv_block(data, path, offset):  # pragma: no cover
+    """
+    Write serialized row block into the CSV file at `offset`.
+
+    Parameters
+    ----------
+    data : bytes
+        The serialized row block.
+    path : str
+        Path to the CSV file.
+    offset : int
+        Position of the row block in the file.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Empty frame as the block is only needed to be written.
+    """
+    with open(path, "r+b") as file:
+        file.seek(offset)
+        file.write(data)
+    return pandas.DataFrame()
+
 
 class CSVDispatcher(TextFileDispatcher):
-    """Class handles utils for reading `.csv` files."""
+    """Class handles utils for reading and writing `.csv` files."""
 
     read_callback = pandas.read_csv
+
+    @classmethod
+    def _to_csv_check_support(cls, qc, kwargs):
+        """
+        Check if `qc` can be written by `write` in parallel.
+
+        Parameters
+        ----------
+        qc : BaseQueryCompiler
+            The query compiler of the Modin dataframe that we want to run ``to_csv`` on.
+        kwargs : dict
+            Parameters for ``pandas.to_csv(**kwargs)``.
+
+        Returns
+        -------
+        bool
+            Whether `qc` can be written in parallel.
+        """
+        path = kwargs["path_or_buf"]
+        if (
+            not isinstance(qc, cls.query_compiler_cls)
+            or qc._modin_frame._partitions.size == 0
+            or not isinstance(path, str)
+        ):
+            return False
+        if "*" in path:
+            # every row block is written to its own file by pandas
+            return True
+        compression, _ = get_compression_method(kwargs["compression"])
+        encoding = kwargs["encoding"] or "utf-8"
+        try:
+            # encodings with BOM would put the mark at the beginning of every block
+            has_bom = len("".encode(encoding)) > 0
+        except LookupError:
+            return False
+        return (
+            not is_url(path)
+            and not is_fsspec_url(path)
+            and not kwargs.get("storage_options")
+            and "r" not in kwargs["mode"]
+            and not has_bom
+            and (
+                infer_compression(path, compression) is None
+                or infer_compression(path, compression) in _CSV_STREAM_COMPRESSORS
+            )
+        )
+
+    @classmethod
+    def write(cls, qc, **kwargs):
+        """
+        Write the `qc` to CSV files or a single CSV file in parallel.
+
+        If `path_or_buf` contains `*`, every row partition is written to its own
+        file, which name has `*` replaced by the zero-padded number of the partition,
+        so the files can be read back in order with ``read_csv_glob``. Otherwise, every row
+        partition is serialized (and compressed) by its own worker, and after
+        the sizes of all of them are known each worker writes its bytes at
+        its offset in the file concurrently with the others. Streams of gzip,
+        bz2 and xz formats are concatenated into a valid compressed file.
+
+        Parameters
+        ----------
+        qc : BaseQueryCompiler
+            The query compiler of the Modin dataframe that we want to run ``to_csv`` on.
+        **kwargs : dict
+            Parameters for ``pandas.to_csv(**kwargs)``.
+        """
+        if not cls._to_csv_check_support(qc, kwargs):
+            return BaseIO.to_csv(qc, **kwargs)
+
+        frame = qc._modin_frame
+        # Ensure that the metadata is synchronized
+        frame._propagate_index_objs(axis=None)
+        partition_mgr_cls = frame._partition_mgr_cls
+        if frame._partitions.shape[1] == 1:
+            blocks = frame._partitions[:, 0]
+        else:
+            blocks = [
+                row.apply(lambda df: df, num_splits=1, maintain_partitioning=False)[0]
+                for row in partition_mgr_cls.row_partitions(frame._partitions)
+            ]
+
+        csv_kwargs = kwargs.copy()
+        path = csv_kwargs.pop("path_or_buf")
+        if "*" in path:
+            results = [
+                block.apply(_write_csv_part, i, path, **csv_kwargs)
+                for i, block in enumerate(blocks)
+            ]
+            # pending completion
+            for result in results:
+                result.get()
+            return
+
+        compression, compression_args = get_compression_method(
+            csv_kwargs.pop("compression")
+        )
+        compression = infer_compression(path, compression)
+        encoding = csv_kwargs.pop("encoding") or "utf-8"
+        errors = csv_kwargs.pop("errors")
+        mode = csv_kwargs.pop("mode")
+        csv_kwargs.pop("storage_options", None)
+        header = csv_kwargs.pop("header")
+        blocks = [
+            block.apply(
+                _serialize_csv_block,
+                encoding,
+                errors,
+                compression,
+                compression_args,
+                # It is enough to write the header for the first block
+                header=header if i == 0 else False,
+                **csv_kwargs,
+            )
+            for i, block in enumerate(blocks)
+        ]
+        # only the sizes of the blocks are fetched, the bytes stay on the workers
+        nbytes = [block.length() for block in blocks]
+
+        # "x" mode raises if the file exists, "a" mode keeps the existing content
+        with open(path, mode.replace("b", "").replace("+", "") + "b") as file:
+            start = file.seek(0, 2)
+            # the blocks are written into the file of the final size
+            file.truncate(start + sum(nbytes))
+        offsets = np.cumsum([start] + nbytes[:-1])
+        results = [
+            block.apply(_write_csv_block, path, int(offset))
+            for block, offset in zip(blocks, offsets)
+        ]
+        # pending completion
+        for result in results:
+            result.get()
@@ -321,7 +321,7 @@ class CSVGlobDispatcher(CSVDispatcher):
         Returns
         -------
         list
-            List of strings of absolute file paths.
+            List of strings of absolute file paths sorted by name.
         """
         if S3_ADDRESS_REGEX.search(file_path):
             # S3FS does not allow captial S in s3 addresses.
@@ -334,7 +334,7 @@ class CSVGlobDispatcher(CSVDispatcher):
             from botocore.exceptions import NoCredentialsError
 
             def get_file_path(fs_handle) -> List[str]:
-                file_paths = fs_handle.glob(file_path)
+                file_paths = sorted(fs_handle.glob(file_path))
                 s3_addresses = ["{}{}".format("s3://", path) for path in file_paths]
                 return s3_addresses
 
@@ -346,7 +346,8 @@ class CSVGlobDispatcher(CSVDispatcher):
             s3fs = S3FS.S3FileSystem(anon=True)
             return get_file_path(s3fs)
         else:
-            relative_paths = glob.glob(file_path)
+            # the files are read in the order of their names
+            relative_paths = sorted(glob.glob(file_path))
             abs_paths = [os.path.abspath(path) for path in relative_paths]
             return abs_paths
 
@@ -13,6 +13,8 @@
 
 """Module houses `ExcelDispatcher` class, that is used for reading excel files."""
 
+import glob
+import os
 import pandas
 import re
 import sys
@@ -32,6 +34,76 @@ class ExcelDispatcher(TextFileDispatcher):
         """
         Read data from `io` according to the passed `read_excel` `kwargs` parameters.
 
+        Parameters
+        ----------
+        io : str, bytes, ExcelFile, xlrd.Book, path object, or file-like object
+            `io` parameter of `read_excel` function. A glob pattern reads all
+            of the matching workbooks and concatenates their sheets.
+        **kwargs : dict
+            Parameters of `read_excel` function.
+
+        Returns
+        -------
+        BaseQueryCompiler or dict
+            Query compiler with imported data for further processing or dict
+            of query compilers if several sheets are read.
+        """
+        if (
+            isinstance(io, str)
+            and glob.has_magic(io)
+            and not os.path.exists(io)
+            and len(glob.glob(io)) > 0
+        ):
+            # Launch the tasks for all of the workbooks before waiting for any of them
+            workbooks = [
+                cls._launch_workbook(path, **kwargs) for path in sorted(glob.glob(io))
+            ]
+            # Sheets missing in some of the workbooks are taken from the rest of them
+            keys = list(dict.fromkeys(key for sheets, _ in workbooks for key in sheets))
+            sheets = {
+                key: cls._concat_sheets(
+                    [
+                        cls._build_sheet(sheets[key])
+                        for sheets, _ in workbooks
+                        if key in sheets
+                    ],
+                    ignore_index=kwargs.get("index_col", None) is None,
+                )
+                for key in keys
+            }
+            single_sheet = workbooks[0][1]
+        else:
+            sheets, single_sheet = cls._launch_workbook(io, **kwargs)
+            sheets = {key: cls._build_sheet(sheet) for key, sheet in sheets.items()}
+        return next(iter(sheets.values())) if single_sheet else sheets
+
+    @classmethod
+    def _concat_sheets(cls, query_compilers, ignore_index):
+        """
+        Concatenate the same sheet read from several workbooks.
+
+        Parameters
+        ----------
+        query_compilers : list of BaseQueryCompiler
+            Query compilers with data of the sheet in every workbook.
+        ignore_index : bool
+            Whether to renumber the rows of the result.
+
+        Returns
+        -------
+        BaseQueryCompiler
+        """
+        if len(query_compilers) == 1:
+            return query_compilers[0]
+        return query_compilers[0].concat(
+            0, query_compilers[1:], ignore_index=ignore_index
+        )
+
+    @classmethod
+    def _launch_workbook(cls, io, **kwargs):
+        """
+        Launch tasks to read the requested sheets of the workbook.
+
         Parameters
         ----------
         io : str, bytes, ExcelFile, xlrd.Book, path object, or file-like object
@@ -41,9 +113,14 @@ class ExcelDispatcher(TextFileDispatcher):
 
         Returns
         -------
-        new_query_compiler : BaseQueryCompiler
-            Query compiler with imported data for further processing.
+        sheets : dict
+            Launched tasks of every sheet (or query compilers of the sheets read
+            by pandas) keyed as pandas keys the resulting sheets.
+        single_sheet : bool
+            Whether a single sheet is requested.
         """
+        sheet_name = kwargs.get("sheet_name", 0)
+        single_sheet = sheet_name is not None and not isinstance(sheet_name, list)
         if (
             kwargs.get("engine", None) is not None
             and kwargs.get("engine") != "openpyxl"
@@ -53,24 +130,14 @@ class ExcelDispatcher(TextFileDispatcher):
                 'please specify `engine=None` or `engine="openpyxl"` to '
                 "use Modin's parallel implementation."
             )
-            return cls.single_worker_read(io, **kwargs)
+            result = cls.single_worker_read(io, **kwargs)
+            return ({None: result} if single_sheet else result), single_sheet
         if sys.version_info < (3, 7):
             warnings.warn("Python 3.7 or higher required for parallel `read_excel`.")
-            return cls.single_worker_read(io, **kwargs)
+            result = cls.single_worker_read(io, **kwargs)
+            return ({None: result} if single_sheet else result), single_sheet
 
-        from zipfile import ZipFile
-        from openpyxl.worksheet.worksheet import Worksheet
-        from openpyxl.worksheet._reader import WorksheetReader
         from openpyxl.reader.excel import ExcelReader
-        from modin.core.storage_formats.pandas.parsers import PandasExcelParser
-
-        sheet_name = kwargs.get("sheet_name", 0)
-        if sheet_name is None or isinstance(sheet_name, list):
-            warnings.warn(
-                "`read_excel` functionality is only implemented for a single sheet at a "
-                "time. Multiple sheet reading coming soon!"
-            )
-            return cls.single_worker_read(io, **kwargs)
 
         warnings.warn(
             "Parallel `read_excel` is a new feature! Please email "
@@ -88,12 +155,54 @@ class ExcelDispatcher(TextFileDispatcher):
             # Get shared strings
             ex.read_manifest()
             ex.read_strings()
-            ws = Worksheet(wb)
         finally:
             if isinstance(io, str):
                 # close only if it were us who opened the object
                 io_file.close()
 
+        if sheet_name is None:
+            sheet_names = wb.sheetnames
+        elif single_sheet:
+            sheet_names = [sheet_name]
+        else:
+            sheet_names = sheet_name
+        sheets = {
+            (None if single_sheet else name): cls._launch_sheet(
+                io, ex, wb, **dict(kwargs, sheet_name=name)
+            )
+            for name in sheet_names
+        }
+        return sheets, single_sheet
+
+    @classmethod
+    def _launch_sheet(cls, io, ex, wb, **kwargs):
+        """
+        Launch tasks to read a sheet of the workbook.
+
+        Parameters
+        ----------
+        io : str, bytes, ExcelFile, xlrd.Book, path object, or file-like object
+            `io` parameter of `read_excel` function.
+        ex : openpyxl.reader.excel.ExcelReader
+            Reader of the workbook with the shared strings read.
+        wb : openpyxl.Workbook
+            The workbook.
+        **kwargs : dict
+            Parameters of `read_excel` function with a single `sheet_name`.
+
+        Returns
+        -------
+        dict or BaseQueryCompiler
+            Launched tasks and metadata of the sheet or query compiler of the
+            sheet if it has no rows.
+        """
+        from zipfile import ZipFile
+        from openpyxl.worksheet.worksheet import Worksheet
+        from openpyxl.worksheet._reader import WorksheetReader
+        from modin.core.storage_formats.pandas.parsers import PandasExcelParser
+
+        sheet_name = kwargs["sheet_name"]
+        ws = Worksheet(wb)
         pandas_kw = dict(kwargs)  # preserve original kwargs
         with ZipFile(io) as z:
             from io import BytesIO
@@ -116,12 +225,15 @@ class ExcelDispatcher(TextFileDispatcher):
             f = BytesIO(f.read())
             total_bytes = cls.file_size(f)
 
+            end_of_row_tag = b"</row>"
+            if end_of_row_tag not in f.getbuffer():
+                # There is nothing to split in a sheet without rows
+                return cls.single_worker_read(io, **pandas_kw)
             # Read some bytes from the sheet so we can extract the XML header and first
             # line. We need to make sure we get the first line of the data as well
             # because that is where the column names are. The header information will
             # be extracted and sent to all of the nodes.
             sheet_block = f.read(EXCEL_READ_BLOCK_SIZE)
-            end_of_row_tag = b"</row>"
             while end_of_row_tag not in sheet_block:
                 sheet_block += f.read(EXCEL_READ_BLOCK_SIZE)
             idx_of_header_end = sheet_block.index(end_of_row_tag) + len(end_of_row_tag)
@@ -200,6 +312,36 @@ class ExcelDispatcher(TextFileDispatcher):
                 if b"</sheetData>" in chunk:
                     break
 
+        return dict(
+            data_ids=data_ids,
+            index_ids=index_ids,
+            dtypes_ids=dtypes_ids,
+            column_names=column_names,
+            column_widths=column_widths,
+            index_col=index_col,
+        )
+
+    @classmethod
+    def _build_sheet(cls, sheet):
+        """
+        Build query compiler of a sheet from its launched tasks.
+
+        Parameters
+        ----------
+        sheet : dict or BaseQueryCompiler
+            Launched tasks and metadata of the sheet returned by `_launch_sheet`
+            or query compiler of the sheet.
+
+        Returns
+        -------
+        BaseQueryCompiler
+        """
+        if not isinstance(sheet, dict):
+            return sheet
+        index_col = sheet["index_col"]
+        column_names = sheet["column_names"]
+        column_widths = sheet["column_widths"]
+        index_ids = sheet["index_ids"]
         # Compute the index based on a sum of the lengths of each partition (by default)
         # or based on the column(s) that were requested.
         if index_col is None:
@@ -214,9 +356,9 @@ class ExcelDispatcher(TextFileDispatcher):
         # reported dtypes from differing rows can be different based on the inference in
         # the limited data seen by each worker. We use pandas to compute the exact dtype
         # over the whole column for each column. The index is set below.
-        dtypes = cls.get_dtypes(dtypes_ids)
+        dtypes = cls.get_dtypes(sheet["dtypes_ids"])
 
-        data_ids = cls.build_partition(data_ids, row_lengths, column_widths)
+        data_ids = cls.build_partition(sheet["data_ids"], row_lengths, column_widths)
         # Set the index for the dtypes to the column names
         if isinstance(dtypes, pandas.Series):
             dtypes.index = column_names
@@ -16,11 +16,15 @@
 from modin.core.io.file_dispatcher import OpenFile
 from modin.core.io.text.text_file_dispatcher import TextFileDispatcher
 from io import BytesIO
+import codecs
 import pandas
 import numpy as np
 
 from modin.config import NPartitions
 
+# Size of the blocks the JSON document is scanned by
+_SCAN_BLOCK_SIZE = 4 * 1024 * 1024
+
 
 class JSONDispatcher(TextFileDispatcher):
     """Class handles utils for reading `.json` files."""
@@ -50,7 +54,7 @@ class JSONDispatcher(TextFileDispatcher):
         elif not cls.pathlib_or_pypath(path_or_buf):
             return cls.single_worker_read(path_or_buf, **kwargs)
         if not kwargs.get("lines", False):
-            return cls.single_worker_read(path_or_buf, **kwargs)
+            return cls._read_document(path_or_buf, **kwargs)
         with OpenFile(path_or_buf, "rb") as f:
             columns = pandas.read_json(BytesIO(b"" + f.readline()), lines=True).columns
         kwargs["columns"] = columns
@@ -60,6 +64,7 @@ class JSONDispatcher(TextFileDispatcher):
             partition_ids = []
             index_ids = []
             dtypes_ids = []
+            columns_ids = []
 
             column_widths, num_splits = cls._define_metadata(empty_pd_df, columns)
 
@@ -75,11 +80,14 @@ class JSONDispatcher(TextFileDispatcher):
                 partition_ids.append(partition_id[:-3])
                 index_ids.append(partition_id[-3])
                 dtypes_ids.append(partition_id[-2])
+                columns_ids.append(partition_id[-1])
 
-        # partition_id[-1] contains the columns for each partition, which will be useful
-        # for implementing when `lines=False`.
-        row_lengths = cls.materialize(index_ids)
-        new_index = pandas.RangeIndex(sum(row_lengths))
+        if not all(
+            partition_columns.equals(columns)
+            for partition_columns in cls.materialize(columns_ids)
+        ):
+            raise NotImplementedError("Columns must be the same across all rows.")
+        new_index, row_lengths = cls._define_index(index_ids, None)
 
         dtypes = cls.get_dtypes(dtypes_ids)
         partition_ids = cls.build_partition(partition_ids, row_lengths, column_widths)
@@ -99,3 +107,221 @@ class JSONDispatcher(TextFileDispatcher):
         )
         new_frame.synchronize_labels(axis=0)
         return cls.query_compiler_cls(new_frame)
+
+    @classmethod
+    def _find_document_splits(cls, f, num_partitions):
+        """
+        Find where to split the top-level array or object of a JSON document.
+
+        The document is scanned by blocks with NumPy keeping track of whether the
+        current byte is inside of a string and of the nesting level, so only the
+        commas separating the items of the top-level container are split at.
+
+        Parameters
+        ----------
+        f : file-like object
+            File handle of the JSON document opened in binary mode.
+        num_partitions : int
+            For what number of partitions split the document.
+
+        Returns
+        -------
+        brackets : bytes or None
+            Opening and closing brackets of the top-level container, None if
+            the document is not a container.
+        splits : list
+            List of (start, end) positions of the container items groups.
+        first_item : tuple
+            (start, end) positions of the first item of the container.
+        """
+        file_size = cls.file_size(f)
+        partition_size = max(1, file_size // num_partitions)
+        brackets = start = end = first_comma = None
+        split_points = []
+        in_string = False
+        depth = backslashes = position = 0
+        while end is None:
+            block = f.read(_SCAN_BLOCK_SIZE)
+            if not block:
+                break
+            data = np.frombuffer(block, dtype=np.uint8)
+            if brackets is None:
+                stripped = block.lstrip()
+                if not stripped:
+                    position += len(block)
+                    continue
+                if stripped[:1] not in (b"[", b"{"):
+                    return None, [], None
+                brackets = b"[]" if stripped[:1] == b"[" else b"{}"
+                start = position + len(block) - len(stripped) + 1
+            positions = np.arange(len(data))
+            # a quote is escaped if it follows an odd number of backslashes
+            last_plain = np.maximum.accumulate(
+                np.where(data == ord("\\"), -1, positions)
+            )
+            quotes = np.flatnonzero(data == ord('"'))
+            previous = quotes - 1
+            last_plain_before = np.where(
+                previous >= 0, last_plain[np.maximum(previous, 0)], -1
+            )
+            runs = (
+                previous
+                - last_plain_before
+                + np.where(last_plain_before == -1, backslashes, 0)
+            )
+            toggles = np.zeros(len(data), dtype=np.int64)
+            toggles[quotes[runs % 2 == 0]] = 1
+            inside = (np.cumsum(toggles) + in_string) % 2 == 1
+            outside = ~inside
+            opening = np.isin(data, (ord("["), ord("{"))) & outside
+            closing = np.isin(data, (ord("]"), ord("}"))) & outside
+            depths = np.cumsum(opening.astype(np.int64) - closing) + depth
+            closed = np.flatnonzero(closing & (depths == 0))
+            if len(closed):
+                end = position + closed[0]
+            commas = (
+                np.flatnonzero((data == ord(",")) & outside & (depths == 1)) + position
+            )
+            if end is not None:
+                commas = commas[commas < end]
+            if first_comma is None and len(commas):
+                first_comma = commas[0]
+            # pick the first comma after every `partition_size` bytes
+            target = (split_points[-1] if split_points else start) + partition_size
+            while len(commas):
+                commas = commas[np.searchsorted(commas, target) :]
+                if len(commas):
+                    split_points.append(int(commas[0]))
+                    target = commas[0] + partition_size
+            in_string = bool(inside[-1])
+            depth = int(depths[-1])
+            backslashes = (
+                len(data)
+                - 1
+                - last_plain[-1]
+                + (backslashes if last_plain[-1] == -1 else 0)
+            )
+            position += len(block)
+
+        if end is None:
+            return None, [], None
+        bounds = [start - 1] + split_points + [end]
+        splits = [(begin + 1, finish) for begin, finish in zip(bounds[:-1], bounds[1:])]
+        first_item = (start, end if first_comma is None else int(first_comma))
+        return brackets, splits, first_item
+
+    @classmethod
+    def _read_document(cls, path_or_buf, **kwargs):
+        """
+        Read a JSON document that is not in the lines format.
+
+        Items of a top-level array (``records`` and ``values`` orients) or of a
+        top-level object with the ``index`` orient are read by groups of rows,
+        items of a top-level object with the ``columns`` orient are read by groups
+        of columns.
+
+        Parameters
+        ----------
+        path_or_buf : str or path object
+            `path_or_buf` parameter of `read_json` function.
+        **kwargs : dict
+            Parameters of `read_json` function.
+
+        Returns
+        -------
+        BaseQueryCompiler
+            Query compiler with imported data for further processing.
+        """
+        orient = kwargs.get("orient", None)
+        encoding = kwargs.get("encoding", None)
+        if (
+            kwargs.get("typ", "frame") != "frame"
+            or orient not in (None, "records", "values", "columns", "index")
+            or kwargs.get("chunksize", None) is not None
+            or kwargs.get("nrows", None) is not None
+            or encoding is not None
+            and codecs.lookup(encoding).name not in ("utf-8", "ascii")
+        ):
+            return cls.single_worker_read(path_or_buf, **kwargs)
+
+        with OpenFile(path_or_buf, "rb", kwargs.get("compression", "infer")) as f:
+            brackets, splits, first_item = cls._find_document_splits(
+                f, NPartitions.get()
+            )
+            if first_item is not None:
+                f.seek(first_item[0])
+                first_item = f.read(first_item[1] - first_item[0])
+        by_columns = brackets == b"{}" and orient in (None, "columns")
+        if (
+            len(splits) < 2
+            or brackets == b"[]"
+            and orient not in (None, "records", "values")
+            or brackets == b"{}"
+            and orient not in (None, "columns", "index")
+        ):
+            return cls.single_worker_read(path_or_buf, **kwargs)
+
+        args = {"fname": path_or_buf, "brackets": brackets, **kwargs}
+        if by_columns:
+            columns = None
+            num_splits = 1
+        else:
+            columns = pandas.read_json(
+                BytesIO(brackets[:1] + first_item + brackets[1:]), **kwargs
+            ).columns
+            if orient == "index" and len(columns) == 1:
+                # pandas sorts the rows of a single column
+                return cls.single_worker_read(path_or_buf, **kwargs)
+            column_widths, num_splits = cls._define_metadata(
+                pandas.DataFrame(columns=columns), columns
+            )
+        args.update({"columns": columns, "num_splits": num_splits})
+
+        partition_ids = []
+        index_ids = []
+        dtypes_ids = []
+        columns_ids = []
+        for start, end in splits:
+            args.update({"start": start, "end": end})
+            partition_id = cls.deploy(cls.parse, num_splits + 3, args)
+            partition_ids.append(partition_id[:-3])
+            index_ids.append(partition_id[-3])
+            dtypes_ids.append(partition_id[-2])
+            columns_ids.append(partition_id[-1])
+
+        partition_columns = cls.materialize(columns_ids)
+        if by_columns:
+            # groups of columns have to share the index
+            indices = [
+                pandas.RangeIndex(index) if isinstance(index, int) else index
+                for index in cls.materialize(index_ids)
+            ]
+            if not all(index.equals(indices[0]) for index in indices):
+                return cls.single_worker_read(path_or_buf, **kwargs)
+            new_index, row_lengths = cls._define_index(index_ids[:1], None)
+            columns = partition_columns[0].append(partition_columns[1:])
+            column_widths = [len(partition) for partition in partition_columns]
+            partition_ids = [[ids[0] for ids in partition_ids]]
+            dtypes = pandas.concat(cls.materialize(dtypes_ids))
+        else:
+            if not all(partition.equals(columns) for partition in partition_columns):
+                return cls.single_worker_read(path_or_buf, **kwargs)
+            new_index, row_lengths = cls._define_index(index_ids, None)
+            dtypes = cls.get_dtypes(dtypes_ids)
+
+        partition_ids = cls.build_partition(partition_ids, row_lengths, column_widths)
+        if isinstance(dtypes, pandas.Series):
+            dtypes.index = columns
+        else:
+            dtypes = pandas.Series(dtypes, index=columns)
+
+        new_frame = cls.frame_cls(
+            np.array(partition_ids),
+            new_index,
+            columns,
+            row_lengths,
+            column_widths,
+            dtypes=dtypes,
+        )
+        new_frame.synchronize_labels(axis=0)
+        return cls.query_compiler_cls(new_frame)
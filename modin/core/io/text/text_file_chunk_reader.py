@@ -0,0 +1,288 @@
+# Licensed to Modin Development Team under one or more contributor license agreements.
+# See the NOTICE file distributed with this work for additional information regarding
+# copyright ownership.  The Modin Development Team licenses this file to you under the
+# Apache License, Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific language
+# governing permissions and limitations under the License.
+
+"""
+Module houses `TextFileChunkReader` class.
+
+`TextFileChunkReader` is the Modin counterpart of ``pandas.io.parsers.TextFileReader``
+returned by ``read_csv`` and ``read_fwf`` when `chunksize` or `iterator` is specified.
+"""
+
+from collections import deque
+
+import pandas
+
+from modin.config import NPartitions, IteratorPrefetch
+
+
+class TextFileChunkReader:
+    """
+    Iterator over the chunks of a text file that reads every chunk in parallel.
+
+    The file is split by bytes once, the splits are parsed by batches of
+    ``NPartitions`` workers and the parsed rows are re-sliced into chunks of
+    `chunksize` rows. The batches following the consumed one are launched ahead,
+    so workers keep parsing while the caller processes the current chunk.
+
+    Parameters
+    ----------
+    dispatcher : TextFileDispatcher
+        Dispatcher class used to launch parsing tasks and to build query compilers.
+    opened_file : OpenFile
+        Context manager of the file to split.
+    partition_kwargs : dict
+        Parameters of the parsing tasks.
+    qc_kwargs : dict
+        Parameters of ``dispatcher._get_new_qc`` except of the partition references.
+    empty_df : pandas.DataFrame
+        Empty frame with the resulting columns and dtypes, returned if the file has no data rows.
+    split_kwargs : dict
+        Parameters of ``dispatcher.partitioned_file`` (quoting, encoding and newline).
+    header_size : int
+        Number of rows occupied by header.
+    skiprows : int
+        Number of rows to skip after the header.
+    chunksize : int, optional
+        Number of rows in each chunk returned on iteration.
+    nrows : int, optional
+        Total number of rows to read.
+    index_col : IndexColType
+        `index_col` parameter of the read function.
+    """
+
+    # upper bound of the split size in bytes
+    _split_size = 16 * 1024 * 1024
+
+    def __init__(
+        self,
+        dispatcher,
+        opened_file,
+        partition_kwargs,
+        qc_kwargs,
+        empty_df,
+        split_kwargs,
+        header_size,
+        skiprows,
+        chunksize=None,
+        nrows=None,
+        index_col=None,
+    ):
+        self._dispatcher = dispatcher
+        self._partition_kwargs = partition_kwargs
+        self._qc_kwargs = qc_kwargs
+        self._empty_df = empty_df
+        self.chunksize = chunksize
+        self.nrows = nrows
+        self._range_index = index_col is None or index_col is False
+        # number of rows returned to the caller
+        self._currow = 0
+        # parsing tasks launched ahead, one item per batch of splits
+        self._pending = deque()
+        # parsed rows that did not fit into the previously returned chunks
+        self._leftover = None
+        self._closed = False
+
+        with opened_file as f:
+            # bounded splits let a large file be parsed a few batches at a time
+            num_partitions = NPartitions.get()
+            batch_size = num_partitions * self._split_size
+            num_batches = -(-dispatcher.file_size(f) // batch_size)
+            self._splits = deque(
+                dispatcher.partitioned_file(
+                    f,
+                    num_partitions=num_partitions * max(1, num_batches),
+                    nrows=nrows,
+                    skiprows=skiprows,
+                    header_size=header_size,
+                    **split_kwargs,
+                )
+            )
+
+    def _launch(self):
+        """
+        Launch the parsing tasks of the next batch of splits.
+
+        Returns
+        -------
+        bool
+            Whether any splits were left to launch.
+        """
+        if not self._splits or self._closed:
+            return False
+        splits = [
+            self._splits.popleft()
+            for _ in range(min(NPartitions.get(), len(self._splits)))
+        ]
+        self._pending.append(
+            self._dispatcher._launch_tasks(splits, **self._partition_kwargs)
+        )
+        return True
+
+    def _collect(self):
+        """
+        Build the query compiler of the oldest launched chunk.
+
+        Returns
+        -------
+        BaseQueryCompiler
+        """
+        partition_ids, index_ids, dtypes_ids = self._pending.popleft()
+        return self._dispatcher._get_new_qc(
+            partition_ids=partition_ids,
+            index_ids=index_ids,
+            dtypes_ids=dtypes_ids,
+            **self._qc_kwargs,
+        )
+
+    def read(self, nrows=None):
+        """
+        Read the next `nrows` rows of the file.
+
+        Parameters
+        ----------
+        nrows : int, optional
+            Number of rows to read, all the remaining rows are read if not specified.
+
+        Returns
+        -------
+        BaseQueryCompiler
+            Query compiler with the read rows.
+        """
+        if self.nrows is not None:
+            if self._currow >= self.nrows > 0:
+                self.close()
+                raise StopIteration
+            nrows = min(
+                self.nrows - self._currow, self.nrows if nrows is None else nrows
+            )
+        parts = [] if self._leftover is None else [self._leftover]
+        self._leftover = None
+        num_rows = sum(len(part.index) for part in parts)
+
+        if nrows is None:
+            while self._launch():
+                pass
+            while self._pending:
+                parts.append(self._collect())
+        else:
+            while num_rows < nrows:
+                # keep the workers busy with the batches that follow
+                while len(self._pending) <= IteratorPrefetch.get() and self._launch():
+                    pass
+                if not self._pending:
+                    break
+                part = self._collect()
+                parts.append(part)
+                num_rows += len(part.index)
+
+        parts = [part for part in parts if len(part.index) > 0]
+        if len(parts) == 0:
+            if self._currow > 0:
+                self.close()
+                raise StopIteration
+            return self._dispatcher.query_compiler_cls.from_pandas(
+                self._empty_df, self._dispatcher.frame_cls
+            )
+        result = parts[0].concat(0, parts[1:]) if len(parts) > 1 else parts[0]
+        if nrows is not None and len(result.index) > nrows:
+            self._leftover = result.view(
+                index=pandas.RangeIndex(nrows, len(result.index))
+            )
+            result = result.view(index=pandas.RangeIndex(nrows))
+        # categories of the chunk are united across its partitions
+        dtypes = result.dtypes
+        categorical = {
+            col: dtype
+            for col, dtype in dtypes.items()
+            if isinstance(dtype, pandas.CategoricalDtype)
+        }
+        if categorical:
+            result = result.astype(categorical)
+        if self._range_index:
+            result.index = pandas.RangeIndex(
+                self._currow, self._currow + len(result.index)
+            )
+        self._currow += len(result.index)
+        return result
+
+    def get_chunk(self, size=None):
+        """
+        Read the next chunk of the file.
+
+        Parameters
+        ----------
+        size : int, optional
+            Number of rows to read, `chunksize` is used if not specified.
+
+        Returns
+        -------
+        BaseQueryCompiler
+            Query compiler with the read rows.
+        """
+        if size is None:
+            size = self.chunksize
+        return self.read(nrows=size)
+
+    def __iter__(self):
+        """
+        Iterate over the chunks of the file.
+
+        Returns
+        -------
+        TextFileChunkReader
+        """
+        return self
+
+    def __next__(self):
+        """
+        Read the next chunk of the file.
+
+        Returns
+        -------
+        BaseQueryCompiler
+            Query compiler with the read rows.
+        """
+        try:
+            return self.get_chunk()
+        except StopIteration:
+            self.close()
+            raise
+
+    def close(self):
+        """Drop the batches launched ahead and the splits left."""
+        if not self._closed:
+            self._closed = True
+            self._pending.clear()
+            self._splits.clear()
+            self._leftover = None
+
+    def __enter__(self):
+        """
+        Enter the runtime context of the reader.
+
+        Returns
+        -------
+        TextFileChunkReader
+        """
+        return self
+
+    def __exit__(self, *args):
+        """
+        Close the reader on exit from the runtime context.
+
+        Parameters
+        ----------
+        *args : any type
+            Variable positional arguments, all unused.
+        """
+        self.close()
@@ -33,6 +33,7 @@ from modin.core.io.file_dispatcher import FileDispatcher, OpenFile
 from modin.core.storage_formats.pandas.utils import compute_chunksize
 from modin.utils import _inherit_docstrings
 from modin.core.io.text.utils import CustomNewlineIterator
+from modin.core.io.text.text_file_chunk_reader import TextFileChunkReader
 from modin.config import NPartitions
 
 ColumnNamesTypes = Tuple[Union[pandas.Index, pandas.MultiIndex]]
@@ -214,6 +215,8 @@ class TextFileDispatcher(FileDispatcher):
         newline: bytes = None,
         header_size: int = 0,
         pre_reading: int = 0,
+        fname=None,
+        storage_options: dict = None,
     ):
         """
         Compute chunk sizes in bytes for every partition.
@@ -241,6 +244,11 @@ class TextFileDispatcher(FileDispatcher):
             Number of rows, that occupied by header.
         pre_reading : int, default: 0
             Number of rows between header and skipped rows, that should be read.
+        fname : str or file-like object, optional
+            Path of the uncompressed file `f` to open by the workers. If specified,
+            the split points of a quoted file are searched by the workers in parallel.
+        storage_options : dict, optional
+            Parameters to open `fname` with.
 
         Returns
         -------
@@ -308,6 +316,19 @@ class TextFileDispatcher(FileDispatcher):
                 # add outside_quotes
                 if is_quoting and not outside_quotes:
                     warnings.warn("File has mismatched quotes")
+        elif is_quoting and fname is not None and num_partitions > 1:
+            result.extend(
+                cls._find_quoted_splits(
+                    fname,
+                    start=start,
+                    file_size=file_size,
+                    partition_size=max(1, num_partitions, file_size // num_partitions),
+                    quotechar=quotechar,
+                    encoding=encoding,
+                    newline=newline,
+                    storage_options=storage_options,
+                )
+            )
         else:
             partition_size = max(1, num_partitions, file_size // num_partitions)
             while f.tell() < file_size:
@@ -329,6 +350,86 @@ class TextFileDispatcher(FileDispatcher):
 
         return result
 
+    @classmethod
+    def _find_quoted_splits(
+        cls,
+        fname,
+        start: int,
+        file_size: int,
+        partition_size: int,
+        quotechar: bytes = b'"',
+        encoding: str = None,
+        newline: bytes = None,
+        storage_options: dict = None,
+    ):
+        """
+        Find the split points of a quoted file by scanning its parts in parallel.
+
+        The file is cut at every `partition_size` bytes. Every worker counts the
+        quotes of its part and finds the end of the row the part ends in for both
+        cases of the part end being inside and outside of quotes. Once the parity of
+        quotes before every cut is known, the driver picks the matching row ends
+        without reading the file.
+
+        Parameters
+        ----------
+        fname : str or file-like object
+            Path of the uncompressed file to open by the workers.
+        start : int
+            Position of the first data row.
+        file_size : int
+            Size of the file in bytes.
+        partition_size : int
+            Number of bytes between cuts.
+        quotechar : bytes, default: b'"'
+            Indicate quote in a file.
+        encoding : str, optional
+            Encoding of the file.
+        newline : bytes, optional
+            Byte or sequence of bytes indicating line endings.
+        storage_options : dict, optional
+            Parameters to open `fname` with.
+
+        Returns
+        -------
+        list
+            List of (start, end) positions of the partitions.
+        """
+        cuts = list(range(start, file_size, partition_size)) + [file_size]
+        scan_ids = [
+            cls.deploy(
+                _scan_quoted_range,
+                3,
+                dict(
+                    fname=fname,
+                    start=part_start,
+                    end=part_end,
+                    quotechar=quotechar,
+                    encoding=encoding,
+                    newline=newline,
+                    storage_options=storage_options,
+                ),
+            )
+            for part_start, part_end in zip(cuts[:-1], cuts[1:])
+        ]
+        end_ids = []
+        outside_quotes = True
+        for odd_quotes, (_, outside_end_id, inside_end_id) in zip(
+            cls.materialize([scan_id[0] for scan_id in scan_ids]), scan_ids
+        ):
+            if odd_quotes:
+                outside_quotes = not outside_quotes
+            end_ids.append(outside_end_id if outside_quotes else inside_end_id)
+        result = []
+        for end in cls.materialize(end_ids):
+            # a quoted field spanning several parts moves the split to a later part
+            if end > start:
+                result.append((start, end))
+                start = end
+        if not outside_quotes:
+            warnings.warn("File has mismatched quotes")
+        return result
+
     @classmethod
     def _read_rows(
         cls,
@@ -637,8 +738,14 @@ class TextFileDispatcher(FileDispatcher):
         elif not cls.pathlib_or_pypath(filepath_or_buffer):
             return False
 
-        if read_kwargs["chunksize"] is not None:
-            return False
+        if read_kwargs["chunksize"] is not None or read_kwargs.get("iterator", False):
+            # Chunks are read in parallel only if the rows to skip can be
+            # skipped while splitting the file
+            skiprows = read_kwargs.get("skiprows")
+            if read_kwargs.get("skipfooter", 0) != 0 or not (
+                skiprows is None or isinstance(skiprows, int)
+            ):
+                return False
 
         return True
 
@@ -794,11 +901,13 @@ class TextFileDispatcher(FileDispatcher):
             Partitions rows lengths.
         """
         index_objs = cls.materialize(index_ids)
-        if len(index_objs) == 0 or isinstance(index_objs[0], int):
+        if all(isinstance(o, int) for o in index_objs):
             row_lengths = index_objs
             new_index = pandas.RangeIndex(sum(index_objs))
         else:
-            row_lengths = [len(o) for o in index_objs]
+            # partitions without rows can report their length only
+            row_lengths = [o if isinstance(o, int) else len(o) for o in index_objs]
+            index_objs = [o for o in index_objs if not isinstance(o, int)]
             new_index = index_objs[0].append(index_objs[1:])
             new_index.name = index_name
 
@@ -976,9 +1085,17 @@ class TextFileDispatcher(FileDispatcher):
             skiprows is not None or kwargs["skipfooter"] != 0
         )
 
+        chunked = kwargs["chunksize"] is not None or kwargs.get("iterator", False)
         pd_df_metadata = cls.read_callback(
             filepath_or_buffer,
-            **dict(kwargs, nrows=1, skipfooter=0, index_col=index_col),
+            **dict(
+                kwargs,
+                nrows=1,
+                skipfooter=0,
+                index_col=index_col,
+                chunksize=None,
+                iterator=False,
+            ),
         )
         column_names = pd_df_metadata.columns
         column_widths, num_splits = cls._define_metadata(pd_df_metadata, column_names)
@@ -995,9 +1112,30 @@ class TextFileDispatcher(FileDispatcher):
             skiprows=None,
             nrows=None,
             compression=compression_infered,
+            chunksize=None,
+            iterator=False,
         )
 
-        with OpenFile(filepath_or_buffer_md, "rb", compression_infered) as f:
+        # The checkpoints found while splitting the file let the workers
+        # decompress only their own part of the file
+        checkpoints = []
+        partition_kwargs["checkpoints"] = checkpoints
+        if chunked:
+            return cls._read_chunked(
+                filepath_or_buffer_md,
+                compression_infered,
+                checkpoints,
+                partition_kwargs,
+                pd_df_metadata,
+                column_widths=column_widths,
+                header_size=header_size,
+                skiprows_partitioning=skiprows_partitioning,
+                is_quoting=is_quoting,
+                **kwargs,
+            )
+        with OpenFile(
+            filepath_or_buffer_md, "rb", compression_infered, checkpoints=checkpoints
+        ) as f:
             old_pos = f.tell()
             fio = io.TextIOWrapper(f, encoding=encoding, newline="")
             newline, quotechar = cls.compute_newline(
@@ -1015,6 +1153,8 @@ class TextFileDispatcher(FileDispatcher):
                 newline=newline,
                 header_size=header_size,
                 pre_reading=pre_reading,
+                fname=filepath_or_buffer_md if compression_infered is None else None,
+                storage_options=kwargs.get("storage_options"),
             )
 
         partition_ids, index_ids, dtypes_ids = cls._launch_tasks(
@@ -1037,6 +1177,85 @@ class TextFileDispatcher(FileDispatcher):
         )
         return new_query_compiler
 
+    @classmethod
+    def _read_chunked(
+        cls,
+        fname,
+        compression_infered,
+        checkpoints,
+        partition_kwargs,
+        pd_df_metadata,
+        column_widths,
+        header_size,
+        skiprows_partitioning,
+        is_quoting,
+        **kwargs,
+    ):
+        """
+        Create a reader that reads the file by chunks, each in parallel.
+
+        Parameters
+        ----------
+        fname : str or file-like object
+            Path or buffer of the file to read.
+        compression_infered : str
+            Inferred compression of the file.
+        checkpoints : list
+            Checkpoints of the decompressor shared with the workers.
+        partition_kwargs : dict
+            Parameters of the parsing tasks.
+        pd_df_metadata : pandas.DataFrame
+            First row of the file parsed by pandas.
+        column_widths : list
+            Number of columns in each partition.
+        header_size : int
+            Number of rows occupied by header.
+        skiprows_partitioning : int
+            Number of rows to skip after the header.
+        is_quoting : bool
+            Whether or not to consider quotes.
+        **kwargs : dict
+            Parameters of the read function.
+
+        Returns
+        -------
+        TextFileChunkReader
+        """
+        encoding = kwargs["encoding"]
+        opened_file = OpenFile(
+            fname, "rb", compression_infered, checkpoints=checkpoints
+        )
+        with OpenFile(fname, "rb", compression_infered) as f:
+            fio = io.TextIOWrapper(f, encoding=encoding, newline="")
+            newline, quotechar = cls.compute_newline(
+                fio, encoding, kwargs.get("quotechar", '"')
+            )
+        return TextFileChunkReader(
+            cls,
+            opened_file,
+            dict(partition_kwargs, callback=cls.read_callback),
+            qc_kwargs=dict(
+                index_col=kwargs["index_col"],
+                index_name=pd_df_metadata.index.name,
+                column_widths=column_widths,
+                column_names=pd_df_metadata.columns,
+                header_size=header_size,
+                parse_dates=kwargs["parse_dates"],
+            ),
+            empty_df=pd_df_metadata.iloc[:0],
+            split_kwargs=dict(
+                quotechar=quotechar,
+                is_quoting=is_quoting,
+                encoding=encoding,
+                newline=newline,
+            ),
+            header_size=header_size,
+            skiprows=skiprows_partitioning,
+            chunksize=kwargs["chunksize"],
+            nrows=kwargs["nrows"],
+            index_col=kwargs["index_col"],
+        )
+
     @classmethod
     def _get_skip_mask(cls, rows_index: pandas.Index, skiprows: Callable):
         """
@@ -1066,3 +1285,54 @@ class TextFileDispatcher(FileDispatcher):
             mask = rows_index.map(skiprows)
 
         return mask
+
+
+def _scan_quoted_range(
+    fname, start, end, quotechar, encoding=None, newline=None, storage_options=None
+):
+    """
+    Count quotes of the file part and find the row end it ends in.
+
+    Parameters
+    ----------
+    fname : str or file-like object
+        Path of the uncompressed file.
+    start : int
+        Position of the part start.
+    end : int
+        Position of the part end.
+    quotechar : bytes
+        Indicate quote in a file.
+    encoding : str, optional
+        Encoding of the file.
+    newline : bytes, optional
+        Byte or sequence of bytes indicating line endings.
+    storage_options : dict, optional
+        Parameters to open `fname` with.
+
+    Returns
+    -------
+    bool
+        Whether the part has an odd number of quotes.
+    int
+        Row end if the part ends outside of quotes.
+    int
+        Row end if the part ends inside of quotes.
+    """
+    with OpenFile(fname, "rb", None, **(storage_options or {})) as f:
+        f.seek(start)
+        odd_quotes = bool(f.read(end - start).count(quotechar) % 2)
+        row_ends = []
+        for outside_quotes in (True, False):
+            f.seek(end)
+            TextFileDispatcher._read_rows(
+                f,
+                nrows=1,
+                quotechar=quotechar,
+                is_quoting=True,
+                outside_quotes=outside_quotes,
+                encoding=encoding,
+                newline=newline,
+            )
+            row_ends.append(f.tell())
+    return [odd_quotes] + row_ends
@@ -61,3 +61,65 @@ class CustomNewlineIterator:
     def seek(self):
         """Change the stream positition to where the last returned line ends."""
         self.file.seek(self.bytes_read - self.chunk_size, 1)
+
+
+class ChainedBuffersReader(io.RawIOBase):
+    """
+    Read-only binary stream over a sequence of buffers without joining them.
+
+    Parameters
+    ----------
+    buffers : list of bytes-like objects
+        Buffers to read one after another, e.g. a header and a memoryview over
+        a memory-mapped file.
+    """
+
+    def __init__(self, buffers):
+        self._buffers = [memoryview(buffer).cast("B") for buffer in buffers]
+        self._index = 0
+        self._pos = 0
+
+    def readable(self):
+        """
+        Whether the stream can be read from.
+
+        Returns
+        -------
+        bool
+        """
+        return True
+
+    def readinto(self, b):
+        """
+        Read bytes into a pre-allocated, writable bytes-like object.
+
+        Parameters
+        ----------
+        b : bytes-like object
+            Buffer to read into.
+
+        Returns
+        -------
+        int
+            Number of bytes read, 0 indicates EOF.
+        """
+        with memoryview(b) as out:
+            out = out.cast("B")
+            written = 0
+            while written < len(out) and self._index < len(self._buffers):
+                buffer = self._buffers[self._index]
+                size = min(len(out) - written, len(buffer) - self._pos)
+                out[written : written + size] = buffer[self._pos : self._pos + size]
+                written += size
+                self._pos += size
+                if self._pos == len(buffer):
+                    self._index += 1
+                    self._pos = 0
+            return written
+
+    def close(self):
+        """Release the buffers and close the stream."""
+        for buffer in self._buffers:
+            buffer.release()
+        self._buffers = []
+        super().close()
@@ -617,7 +617,7 @@ def doc_window_method(
     )
 
 
-def doc_groupby_method(result, refer_to, action=None):
+def doc_groupby_method(result, refer_to, action=None, params=""):
     """
     Build decorator which adds docstring for the groupby reduce method.
 
@@ -630,6 +630,9 @@ def doc_groupby_method(result, refer_to, action=None):
         for more information about parameters and output format.
     action : str, optional
         What method does with groups.
+    params : str, default: ""
+        Method-specific parameters in the NumPy docstyle format to append
+        to the common parameters of the groupby methods.
 
     Returns
     -------
@@ -653,7 +656,7 @@ def doc_groupby_method(result, refer_to, action=None):
         Key arguments to pass to the `agg_func`.
     drop : bool, default: False
         If `by` is a QueryCompiler indicates whether or not by-data came
-        from the `self`.
+        from the `self`.{extra_params}
 
     Returns
     -------
@@ -678,5 +681,9 @@ def doc_groupby_method(result, refer_to, action=None):
         action = f"compute {result}"
 
     return doc_qc_method(
-        template, result=result, action=action, refer_to=f"GroupBy.{refer_to}"
+        template,
+        result=result,
+        action=action,
+        refer_to=f"GroupBy.{refer_to}",
+        extra_params=params,
     )
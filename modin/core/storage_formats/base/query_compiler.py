@@ -275,6 +275,21 @@ class BaseQueryCompiler(abc.ABC):
         """Finalize constructing the dataframe calling all deferred functions which were used to build it."""
         pass
 
+    def repartition(self):
+        """
+        Redistribute the data between partitions so that they have about the same size.
+
+        Returns
+        -------
+        BaseQueryCompiler
+            QueryCompiler with rebalanced partitions.
+
+        Notes
+        -----
+        Query compilers that do not partition their data return themselves.
+        """
+        return self
+
     # END Data Management Methods
 
     # To/From Pandas
@@ -290,6 +305,26 @@ class BaseQueryCompiler(abc.ABC):
         """
         pass
 
+    def to_pandas_chunks(self, prefetch=0):
+        """
+        Convert underlying query compilers data to ``pandas.DataFrame``-s chunk by chunk of rows.
+
+        Parameters
+        ----------
+        prefetch : int, default: 0
+            Number of chunks to convert ahead of the consumed one.
+
+        Yields
+        ------
+        pandas.DataFrame
+            The next chunk of rows.
+
+        Notes
+        -----
+        Query compilers that do not partition their data yield the whole frame.
+        """
+        yield self.to_pandas()
+
     @classmethod
     @abc.abstractmethod
     def from_pandas(cls, df, data_cls):
@@ -1504,10 +1539,13 @@ class BaseQueryCompiler(abc.ABC):
         refer_to="nunique",
         params="""
         axis : {0, 1}
-        dropna : bool""",
+        dropna : bool
+        approx : bool, default: False
+            Whether the number of unique values may be estimated with HyperLogLog
+            sketches. Storage formats that do not support it compute the exact value.""",
         extra_params=["**kwargs"],
     )
-    def nunique(self, **kwargs):  # noqa: PR02
+    def nunique(self, approx=False, **kwargs):  # noqa: PR02
         return DataFrameDefault.register(pandas.DataFrame.nunique)(self, **kwargs)
 
     @doc_utils.doc_reduce_agg(
@@ -1517,10 +1555,13 @@ class BaseQueryCompiler(abc.ABC):
         q : float
         axis : {0, 1}
         numeric_only : bool
-        interpolation : {"linear", "lower", "higher", "midpoint", "nearest"}""",
+        interpolation : {"linear", "lower", "higher", "midpoint", "nearest"}
+        approx : bool, default: False
+            Whether the quantiles may be estimated with t-digest sketches. Storage
+            formats that do not support it compute the exact values.""",
         extra_params=["**kwargs"],
     )
-    def quantile_for_single_value(self, **kwargs):  # noqa: PR02
+    def quantile_for_single_value(self, approx=False, **kwargs):  # noqa: PR02
         return DataFrameDefault.register(pandas.DataFrame.quantile)(self, **kwargs)
 
     @doc_utils.doc_reduce_agg(
@@ -1934,10 +1975,13 @@ class BaseQueryCompiler(abc.ABC):
         q : list-like
         axis : {0, 1}
         numeric_only : bool
-        interpolation : {"linear", "lower", "higher", "midpoint", "nearest"}""",
+        interpolation : {"linear", "lower", "higher", "midpoint", "nearest"}
+        approx : bool, default: False
+            Whether the quantiles may be estimated with t-digest sketches. Storage
+            formats that do not support it compute the exact values.""",
         extra_params=["**kwargs"],
     )
-    def quantile_for_list_of_values(self, **kwargs):  # noqa: PR02
+    def quantile_for_list_of_values(self, approx=False, **kwargs):  # noqa: PR02
         return DataFrameDefault.register(pandas.DataFrame.quantile)(self, **kwargs)
 
     # END Abstract map across rows/columns
@@ -2540,6 +2584,30 @@ class BaseQueryCompiler(abc.ABC):
             drop=drop,
         )
 
+    @doc_utils.doc_groupby_method(
+        action="compute standard error of the mean",
+        result="standard error of the mean",
+        refer_to="sem",
+    )
+    def groupby_sem(
+        self,
+        by,
+        axis,
+        groupby_kwargs,
+        agg_args,
+        agg_kwargs,
+        drop=False,
+    ):
+        return self.groupby_agg(
+            by=by,
+            agg_func="sem",
+            axis=axis,
+            groupby_kwargs=groupby_kwargs,
+            agg_args=agg_args,
+            agg_kwargs=agg_kwargs,
+            drop=drop,
+        )
+
     @doc_utils.doc_groupby_method(
         action="compute standart deviation", result="standart deviation", refer_to="std"
     )
@@ -2610,6 +2678,10 @@ class BaseQueryCompiler(abc.ABC):
         action="get the number of unique values",
         result="number of unique values",
         refer_to="nunique",
+        params="""
+    approx : bool, default: False
+        Whether the number of unique values may be estimated with HyperLogLog
+        sketches. Storage formats that do not support it compute the exact values.""",
     )
     def groupby_nunique(
         self,
@@ -2619,6 +2691,7 @@ class BaseQueryCompiler(abc.ABC):
         agg_args,
         agg_kwargs,
         drop=False,
+        approx=False,
     ):
         return self.groupby_agg(
             by=by,
@@ -2631,7 +2704,13 @@ class BaseQueryCompiler(abc.ABC):
         )
 
     @doc_utils.doc_groupby_method(
-        action="get the median value", result="median value", refer_to="median"
+        action="get the median value",
+        result="median value",
+        refer_to="median",
+        params="""
+    approx : bool, default: False
+        Whether the medians may be estimated with t-digest sketches. Storage
+        formats that do not support it compute the exact values.""",
     )
     def groupby_median(
         self,
@@ -2641,6 +2720,7 @@ class BaseQueryCompiler(abc.ABC):
         agg_args,
         agg_kwargs,
         drop=False,
+        approx=False,
     ):
         return self.groupby_agg(
             by=by,
@@ -2656,6 +2736,10 @@ class BaseQueryCompiler(abc.ABC):
         action="compute specified quantile",
         result="quantile value",
         refer_to="quantile",
+        params="""
+    approx : bool, default: False
+        Whether the quantiles may be estimated with t-digest sketches. Storage
+        formats that do not support it compute the exact values.""",
     )
     def groupby_quantile(
         self,
@@ -2665,6 +2749,7 @@ class BaseQueryCompiler(abc.ABC):
         agg_args,
         agg_kwargs,
         drop=False,
+        approx=False,
     ):
         return self.groupby_agg(
             by=by,
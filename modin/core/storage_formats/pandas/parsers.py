@@ -26,7 +26,8 @@ Data parsing mechanism differs depending on the data format type:
   `fname`, binary data is read by python `read` function. Then resulting data is passed
   into `pandas.read_*` function as `io.BytesIO` object to get corresponding
   `pandas.DataFrame` (we need to do this because Modin partitions internally stores data
-  as `pandas.DataFrame`).
+  as `pandas.DataFrame`). Local uncompressed CSV and FWF files are memory-mapped instead,
+  and the parser reads the header and the mapped bytes without copying them first.
 
 * columnar store type (FEATHER, HDF, PARQUET):
   In this case data chunk to be read is defined by columns names passed as `columns`
@@ -37,12 +38,21 @@ Data parsing mechanism differs depending on the data format type:
 * SQL type:
   Chunking is incorporated in the `sql` parameter as part of query, so `parse`
   parameters are passed into `pandas.read_sql` function without modification.
+
+* PICKLE type:
+  Files written in the chunked Modin format hold a pickled row block per
+  partition, so `offset` and `nbytes` parameters from `parse` kwargs define
+  the bytes of the block that are unpickled in the concrete partition.
 """
 
 from collections import OrderedDict
-from io import BytesIO, TextIOWrapper
+from io import BufferedReader, BytesIO, TextIOWrapper
+import json
+import mmap
 import numpy as np
+import os
 import pandas
+import pickle
 from pandas.core.dtypes.cast import find_common_type
 from pandas.core.dtypes.concat import union_categoricals
 from pandas.io.common import infer_compression
@@ -50,6 +60,7 @@ from pandas.util._decorators import doc
 import warnings
 
 from modin.core.io.file_dispatcher import OpenFile
+from modin.core.io.text.utils import ChainedBuffersReader
 from modin.db_conn import ModinDatabaseConnection
 from modin.core.storage_formats.pandas.utils import split_result_of_axis_func_pandas
 from modin.error_message import ErrorMessage
@@ -135,6 +146,27 @@ def find_common_type_cat(types):
         return find_common_type(list(types))
 
 
+def _get_local_path(fname):
+    """
+    Get the path of a local file.
+
+    Parameters
+    ----------
+    fname : str, path object or file-like object
+        Name of the file or file-like object.
+
+    Returns
+    -------
+    str or None
+        Path of the file or None if `fname` is not a local file.
+    """
+    if isinstance(fname, os.PathLike):
+        fname = os.fspath(fname)
+    if isinstance(fname, str) and "://" not in fname and os.path.isfile(fname):
+        return fname
+    return None
+
+
 class PandasParser(object):
     """Base class for parser classes with pandas storage format."""
 
@@ -148,16 +180,25 @@ class PandasParser(object):
         header_size = kwargs.pop("header_size", None)
         encoding = kwargs.get("encoding", None)
         callback = kwargs.pop("callback")
+        checkpoints = kwargs.pop("checkpoints", None)
         if start is None or end is None:
             # This only happens when we are reading with only one worker (Default)
             return callback(fname, **kwargs)
 
         # pop "compression" from kwargs because bio is uncompressed
+        compression = kwargs.pop("compression", "infer")
+        storage_options = kwargs.pop("storage_options", None) or {}
+        local_path = (
+            _get_local_path(fname)
+            if not storage_options and infer_compression(fname, compression) is None
+            else None
+        )
         with OpenFile(
             fname,
             "rb",
-            kwargs.pop("compression", "infer"),
-            **(kwargs.pop("storage_options", None) or {}),
+            compression,
+            checkpoints=checkpoints,
+            **storage_options,
         ) as bio:
             header = b""
             # In this case we beware that first line can contain BOM, so
@@ -187,15 +228,31 @@ class PandasParser(object):
                 for _ in range(header_size):
                     header += bio.readline()
 
-            bio.seek(start)
-            to_read = header + bio.read(end - start)
+            if local_path is None or end <= start:
+                bio.seek(start)
+                to_read = header + bio.read(end - start)
+                local_path = None
         if "memory_map" in kwargs:
             kwargs = kwargs.copy()
             del kwargs["memory_map"]
-        pandas_df = callback(BytesIO(to_read), **kwargs)
+        if local_path is None:
+            pandas_df = callback(BytesIO(to_read), **kwargs)
+        else:
+            # hand the parser a window over the mapped file instead of a copy of it
+            with open(local_path, "rb") as f, mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mapped:
+                with memoryview(mapped) as view, ChainedBuffersReader(
+                    [header, view[start:end]]
+                ) as reader:
+                    pandas_df = callback(BufferedReader(reader), **kwargs)
+        # a range of blank or commented lines is parsed into an empty object index
         index = (
             pandas_df.index
             if not isinstance(pandas_df.index, pandas.RangeIndex)
+            and not (
+                len(pandas_df) == 0 and kwargs.get("index_col", None) in (None, False)
+            )
             else len(pandas_df)
         )
         return _split_result_for_readers(1, num_splits, pandas_df) + [
@@ -379,6 +436,33 @@ class PandasPickleExperimentalParser(PandasParser):
         return _split_result_for_readers(1, num_splits, df) + [length, width]
 
 
+@doc(_doc_pandas_parser_class, data_type="pickle files")
+class PandasPickleParser(PandasParser):
+    @staticmethod
+    @doc(
+        _doc_parse_func,
+        parameters="""fname : str or path object
+    Name of the file or path to read.
+offset : int
+    Position of the pickled row block in the file.
+nbytes : int
+    Size of the pickled row block.
+column_widths : list of ints
+    Widths of the column partitions to split the row block into.""",
+    )
+    def parse(fname, **kwargs):
+        num_splits = kwargs.pop("num_splits", None)
+        if num_splits is None:
+            return pandas.read_pickle(fname, **kwargs)
+
+        with open(fname, "rb") as file:
+            file.seek(kwargs["offset"])
+            df = pickle.loads(file.read(kwargs["nbytes"]))
+        return split_result_of_axis_func_pandas(
+            1, num_splits, df, list(kwargs["column_widths"])
+        ) + [len(df.index)]
+
+
 @doc(_doc_pandas_parser_class, data_type="tables with fixed-width formatted lines")
 class PandasFWFParser(PandasParser):
     @staticmethod
@@ -600,6 +684,8 @@ class PandasJSONParser(PandasParser):
         end = kwargs.pop("end", None)
         if start is not None and end is not None:
             # pop "compression" from kwargs because bio is uncompressed
+            # items of a JSON document are read without their container brackets
+            brackets = kwargs.pop("brackets", b"")
             with OpenFile(
                 fname,
                 "rb",
@@ -607,19 +693,30 @@ class PandasJSONParser(PandasParser):
                 **(kwargs.pop("storage_options", None) or {}),
             ) as bio:
                 bio.seek(start)
-                to_read = b"" + bio.read(end - start)
-            columns = kwargs.pop("columns")
+                to_read = brackets[:1] + bio.read(end - start) + brackets[1:]
+            kwargs.pop("columns")
             pandas_df = pandas.read_json(BytesIO(to_read), **kwargs)
+            if (
+                brackets == b"{}"
+                and kwargs.get("orient", None) in (None, "columns")
+                and len(pandas_df.columns) == 1
+            ):
+                # pandas sorts the labels of a single column, while the labels of
+                # several columns keep the order of the document
+                labels = np.array(list(next(iter(json.loads(to_read).values()))))
+                pandas_df = pandas_df.iloc[np.argsort(np.argsort(labels))]
         else:
             # This only happens when we are reading with only one worker (Default)
             return pandas.read_json(fname, **kwargs)
-        if not pandas_df.columns.equals(columns):
-            raise NotImplementedError("Columns must be the same across all rows.")
-        partition_columns = pandas_df.columns
+        index = (
+            pandas_df.index
+            if not isinstance(pandas_df.index, pandas.RangeIndex)
+            else len(pandas_df)
+        )
         return _split_result_for_readers(1, num_splits, pandas_df) + [
-            len(pandas_df),
+            index,
             pandas_df.dtypes,
-            partition_columns,
+            pandas_df.columns,
         ]
 
 
@@ -630,6 +727,60 @@ class PandasParquetParser(PandasParser):
     def parse(fname, **kwargs):
         num_splits = kwargs.pop("num_splits", None)
         columns = kwargs.get("columns", None)
+        row_groups = kwargs.pop("row_groups", None)
+        fragments = kwargs.pop("fragments", None)
+        if fragments is not None:
+            import pyarrow.dataset as ds
+
+            schema = kwargs.pop("schema")
+            read_columns = kwargs.pop("read_columns")
+            table = (
+                ds.FileSystemDataset(
+                    fragments,
+                    schema,
+                    ds.ParquetFileFormat(),
+                    filesystem=fragments[0].filesystem,
+                ).to_table(columns=read_columns, filter=kwargs.pop("filters", None))
+                if len(fragments)
+                else schema.empty_table().select(read_columns)
+            )
+            df = table.to_pandas()
+            df = df[[c for c in columns if c not in df.index.names and c in df.columns]]
+            return [df, df.index, df.dtypes]
+        if row_groups is not None:
+            from pyarrow.parquet import ParquetFile
+
+            index = kwargs.pop("index", None)
+            filters = kwargs.pop("filters", None) or ()
+            predicate = kwargs.pop("predicate", None) or ()
+            with OpenFile(
+                fname,
+                **(kwargs.pop("storage_options", None) or {}),
+            ) as file:
+                df = (
+                    ParquetFile(file)
+                    .read_row_groups(
+                        row_groups,
+                        columns=list(
+                            dict.fromkeys(
+                                list(columns)
+                                + [column for column, _, _ in filters + predicate]
+                            )
+                        ),
+                        use_pandas_metadata=True,
+                    )
+                    .to_pandas()
+                )
+            if index is not None:
+                df.index = index
+            if filters:
+                df = df[PandasParquetParser._evaluate_conditions(df, filters)]
+            if predicate:
+                df = PandasParquetParser._evaluate_conditions(df, predicate).to_frame(
+                    columns[0]
+                )
+            df = df[[c for c in columns if c not in df.index.names and c in df.columns]]
+            return [df, df.index, df.dtypes]
         if num_splits is None:
             return pandas.read_parquet(fname, **kwargs)
         kwargs["use_pandas_metadata"] = True
@@ -644,6 +795,29 @@ class PandasParquetParser(PandasParser):
         # Append the length of the index here to build it externally
         return _split_result_for_readers(0, num_splits, df) + [idx, df.dtypes]
 
+    @staticmethod
+    def _evaluate_conditions(df, conditions):
+        """
+        Evaluate the conjunction of comparisons of columns with scalars.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Frame with the compared columns.
+        conditions : tuple
+            Conditions as ``(column, op, value)`` tuples.
+
+        Returns
+        -------
+        pandas.Series
+            The boolean mask of the rows satisfying the conditions.
+        """
+        mask = None
+        for column, op, value in conditions:
+            result = getattr(df[column], op)(value)
+            mask = result if mask is None else mask & result
+        return mask
+
 
 @doc(_doc_pandas_parser_class, data_type="HDF data")
 class PandasHDFParser(PandasParser):  # pragma: no cover
@@ -654,13 +828,19 @@ class PandasHDFParser(PandasParser):  # pragma: no cover
     Name of the file, path pandas.HDFStore or file-like object to read.""",
     )
     def parse(fname, **kwargs):
-        kwargs["key"] = kwargs.pop("_key", None)
+        kwargs["key"] = kwargs.pop("_key", kwargs.get("key", None))
         num_splits = kwargs.pop("num_splits", None)
+        # row slices of `fixed` format frames are split by columns
+        split_axis = kwargs.pop("_split_axis", 0)
         if num_splits is None:
             return pandas.read_hdf(fname, **kwargs)
         df = pandas.read_hdf(fname, **kwargs)
-        # Append the length of the index here to build it externally
-        return _split_result_for_readers(0, num_splits, df) + [len(df.index), df.dtypes]
+        if split_axis == 0 and isinstance(df.index, pandas.RangeIndex):
+            idx = len(df.index)
+        else:
+            idx = df.index
+        # Append the index or its length here to build it externally
+        return _split_result_for_readers(split_axis, num_splits, df) + [idx, df.dtypes]
 
 
 @doc(_doc_pandas_parser_class, data_type="FEATHER files")
@@ -674,6 +854,9 @@ class PandasFeatherParser(PandasParser):
     def parse(fname, **kwargs):
         from pyarrow import feather
 
+        batches = kwargs.pop("batches", None)
+        if batches is not None:
+            return PandasFeatherParser._read_batches(fname, batches, **kwargs)
         num_splits = kwargs.pop("num_splits", None)
         if num_splits is None:
             return pandas.read_feather(fname, **kwargs)
@@ -686,6 +869,46 @@ class PandasFeatherParser(PandasParser):
         # Append the length of the index here to build it externally
         return _split_result_for_readers(0, num_splits, df) + [len(df.index), df.dtypes]
 
+    @staticmethod
+    def _read_batches(fname, batches, columns, storage_options=None):
+        """
+        Read the columns of a range of record batches of Feather V2 file.
+
+        Parameters
+        ----------
+        fname : str or path object
+            Name of the file to read.
+        batches : tuple of ints
+            The first and the past-the-end numbers of the record batches to read.
+        columns : list
+            Names of the fields to read.
+        storage_options : dict, optional
+            Parameters for specific storage connection.
+
+        Returns
+        -------
+        list
+            The read frame, its index or the index length if the index is a
+            range and the dtypes of the frame.
+        """
+        import pyarrow as pa
+
+        local_path = _get_local_path(fname) if not storage_options else None
+        # Memory mapping doesn't copy the uncompressed buffers of the batches,
+        # pandas columns of the types allowing that are built on them as well
+        with (
+            pa.memory_map(local_path)
+            if local_path is not None
+            else OpenFile(fname, **(storage_options or {}))
+        ) as file:
+            reader = pa.ipc.open_file(file)
+            table = pa.Table.from_batches(
+                [reader.get_batch(i) for i in range(*batches)], schema=reader.schema
+            ).select(columns)
+            df = table.to_pandas(use_threads=False, split_blocks=True)
+        idx = len(df.index) if isinstance(df.index, pandas.RangeIndex) else df.index
+        return [df, idx, df.dtypes]
+
 
 @doc(_doc_pandas_parser_class, data_type="SQL queries or tables")
 class PandasSQLParser(PandasParser):
@@ -25,6 +25,7 @@ from pandas.core.common import is_bool_indexer
 from pandas.core.indexing import check_bool_indexer
 from pandas.core.indexes.api import ensure_index_from_sequences
 from pandas.core.dtypes.common import (
+    is_integer,
     is_list_like,
     is_numeric_dtype,
     is_datetime_or_timedelta_dtype,
@@ -35,6 +36,7 @@ from typing import List, Hashable
 import warnings
 
 
+from modin.config import BroadcastJoinThreshold
 from modin.core.storage_formats.base.query_compiler import BaseQueryCompiler
 from modin.error_message import ErrorMessage
 from modin.utils import (
@@ -51,8 +53,10 @@ from modin.core.dataframe.algebra import (
     Binary,
     GroupByReduce,
     groupby_reduce_functions,
+    groupby_moment_functions,
 )
 from modin.core.dataframe.algebra.default2pandas.groupby import GroupBy, GroupByDefault
+from .sketches import HyperLogLog, TDigest
 
 
 def _get_axis(axis):
@@ -69,9 +73,20 @@ def _get_axis(axis):
     callable(PandasQueryCompiler) -> pandas.Index
     """
     if axis == 0:
-        return lambda self: self._modin_frame.index
+
+        def get_axis(self):
+            if self._lazy_scan is not None and self._lazy_scan.index is not None:
+                return self._lazy_scan.index
+            return self._modin_frame.index
+
     else:
-        return lambda self: self._modin_frame.columns
+
+        def get_axis(self):
+            if self._lazy_scan is not None:
+                return self._lazy_scan.columns
+            return self._modin_frame.columns
+
+    return get_axis
 
 
 def _set_axis(axis):
@@ -95,11 +110,53 @@ def _set_axis(axis):
     else:
 
         def set_axis(self, cols):
+            if self._lazy_scan is not None:
+                lazy_scan = self._lazy_scan.rename(cols)
+                if lazy_scan is not None:
+                    self._lazy_scan = lazy_scan
+                    return
             self._modin_frame.columns = cols
 
     return set_axis
 
 
+def _lazy_scan_op(op, func):
+    """
+    Build binary operator that is recorded in the pending lazy scan if possible.
+
+    Parameters
+    ----------
+    op : str
+        Name of the operator.
+    func : callable(PandasQueryCompiler, other, broadcast, *args, **kwargs)
+        Query compiler method to execute the operator with otherwise.
+
+    Returns
+    -------
+    callable(PandasQueryCompiler, other, broadcast, *args, **kwargs)
+    """
+
+    def caller(query_compiler, other, broadcast=False, *args, **kwargs):
+        lazy_scan = query_compiler._lazy_scan
+        if (
+            lazy_scan is not None
+            and not args
+            and kwargs.get("level", None) is None
+            and kwargs.get("fill_value", None) is None
+        ):
+            if not isinstance(other, type(query_compiler)):
+                lazy_scan = lazy_scan.compare(op, other)
+            elif other._lazy_scan is not None:
+                lazy_scan = lazy_scan.combine(op, other._lazy_scan)
+            else:
+                lazy_scan = None
+            if lazy_scan is not None:
+                return query_compiler.__constructor__(None, lazy_scan=lazy_scan)
+        return func(query_compiler, other, broadcast, *args, **kwargs)
+
+    return caller
+
+
 def _str_map(func_name):
     """
     Build function that calls specified string function on frames ``str`` accessor.
@@ -214,6 +271,92 @@ def copy_df_for_func(func, display_name: str = None):
     return caller
 
 
+def _rolling_func(func):
+    """
+    Build query compiler method applying specified rolling aggregation.
+
+    Windows of a fixed number of trailing rows (columns) are computed for every
+    partition in parallel with ``PandasDataframe.window``, other windows are
+    computed along the full axis.
+
+    Parameters
+    ----------
+    func : callable(pandas.DataFrame, rolling_args, *args, **kwargs) -> pandas.DataFrame
+        Function computing the rolling aggregation of the passed frame.
+
+    Returns
+    -------
+    callable(PandasQueryCompiler, rolling_args, *args, **kwargs) -> PandasQueryCompiler
+    """
+
+    def caller(query_compiler, rolling_args, *args, **kwargs):
+        """Apply the rolling aggregation to the passed query compiler."""
+        window, _, center, _, on, axis, closed, method = rolling_args
+        axis = 1 if axis in (1, "columns") else 0
+        if (
+            is_integer(window)
+            and window > 0
+            and not center
+            and on is None
+            and closed in (None, "right")
+            and method == "single"
+        ):
+            return query_compiler.__constructor__(
+                query_compiler._modin_frame.window(
+                    axis, lambda df: func(df, rolling_args, *args, **kwargs), window
+                )
+            )
+        return Fold.register(func, axis=axis)(
+            query_compiler, rolling_args, *args, **kwargs
+        )
+
+    return caller
+
+
+def _cumulative_func(func):
+    """
+    Build query compiler method applying specified cumulative function.
+
+    Along the index the function is applied with ``PandasDataframe.scan``, so
+    the row partitions are scanned in parallel. Along the columns, and along
+    the index of frames with extension dtypes, it is applied to the full axis.
+
+    Parameters
+    ----------
+    func : callable(pandas.DataFrame, axis, skipna, **kwargs) -> pandas.DataFrame
+        Cumulative function to apply, like ``pandas.DataFrame.cumsum``.
+
+    Returns
+    -------
+    callable(PandasQueryCompiler, axis, skipna, **kwargs) -> PandasQueryCompiler
+    """
+
+    def caller(query_compiler, axis=0, skipna=True, **kwargs):
+        """Apply the cumulative function to the passed query compiler."""
+        if axis not in (0, "index") or not all(
+            isinstance(dtype, np.dtype) for dtype in query_compiler.dtypes
+        ):
+            # missing values of the extension dtypes do not follow the NaN
+            # semantics the carry is built with
+            return Fold.register(func)(
+                query_compiler, axis=axis, skipna=skipna, **kwargs
+            )
+
+        def scan_fn(df):
+            return func(df, axis=0, skipna=skipna, **kwargs)
+
+        def carry_fn(df):
+            result = scan_fn(df)
+            # skipped NaN values do not reset the scan, so its state is the last valid value
+            return (result if skipna is False else result.ffill()).iloc[-1:]
+
+        return query_compiler.__constructor__(
+            query_compiler._modin_frame.scan(0, scan_fn, carry_fn)
+        )
+
+    return caller
+
+
 @_inherit_docstrings(BaseQueryCompiler)
 class PandasQueryCompiler(BaseQueryCompiler):
     """
@@ -226,10 +369,53 @@ class PandasQueryCompiler(BaseQueryCompiler):
     ----------
     modin_frame : PandasDataframe
         Modin Frame to query with the compiled queries.
+    lazy_scan : ParquetScan, optional
+        Pending read of a file that builds the Modin Frame on the first access
+        to it. Column selections and comparisons of the query compiler are
+        recorded in the scan while it is pending.
     """
 
-    def __init__(self, modin_frame):
-        self._modin_frame = modin_frame
+    def __init__(self, modin_frame, lazy_scan=None):
+        self._modin_frame_cache = modin_frame
+        self._lazy_scan = lazy_scan
+
+    @property
+    def _modin_frame(self):
+        """
+        Get the Modin Frame, executing the pending lazy scan if there is one.
+
+        Returns
+        -------
+        PandasDataframe
+        """
+        if self._lazy_scan is not None:
+            self._modin_frame_cache = self._lazy_scan.execute()
+            self._lazy_scan = None
+        return self._modin_frame_cache
+
+    @_modin_frame.setter
+    def _modin_frame(self, modin_frame):
+        """
+        Replace the Modin Frame, dropping the pending lazy scan if there is one.
+
+        Parameters
+        ----------
+        modin_frame : PandasDataframe
+            The new Modin Frame.
+        """
+        self._modin_frame_cache = modin_frame
+        self._lazy_scan = None
+
+    @property
+    def lazy_execution(self):
+        """
+        Whether the Modin Frame is not built yet.
+
+        Returns
+        -------
+        bool
+        """
+        return self._lazy_scan is not None
 
     def default_to_pandas(self, pandas_op, *args, **kwargs):
         op_name = getattr(pandas_op, "__name__", str(pandas_op))
@@ -253,9 +439,15 @@ class PandasQueryCompiler(BaseQueryCompiler):
     def finalize(self):
         self._modin_frame.finalize()
 
+    def repartition(self):
+        return self.__constructor__(self._modin_frame.rebalance_partitions())
+
     def to_pandas(self):
         return self._modin_frame.to_pandas()
 
+    def to_pandas_chunks(self, prefetch=0):
+        return self._modin_frame.to_pandas_chunks(prefetch)
+
     @classmethod
     def from_pandas(cls, df, data_cls):
         return cls(data_cls.from_pandas(df))
@@ -269,6 +461,8 @@ class PandasQueryCompiler(BaseQueryCompiler):
 
     @property
     def dtypes(self):
+        if self._lazy_scan is not None and self._lazy_scan.dtypes is not None:
+            return self._lazy_scan.dtypes
         return self._modin_frame.dtypes
 
     # END Index, columns, and dtypes objects
@@ -287,6 +481,8 @@ class PandasQueryCompiler(BaseQueryCompiler):
     # copies if we end up modifying something here. We copy all of the metadata
     # to prevent that.
     def copy(self):
+        if self._lazy_scan is not None:
+            return self.__constructor__(None, lazy_scan=self._lazy_scan)
         return self.__constructor__(self._modin_frame.copy())
 
     # END Copy
@@ -353,15 +549,15 @@ class PandasQueryCompiler(BaseQueryCompiler):
     add = Binary.register(pandas.DataFrame.add)
     combine = Binary.register(pandas.DataFrame.combine)
     combine_first = Binary.register(pandas.DataFrame.combine_first)
-    eq = Binary.register(pandas.DataFrame.eq)
+    eq = _lazy_scan_op("eq", Binary.register(pandas.DataFrame.eq))
     floordiv = Binary.register(pandas.DataFrame.floordiv)
-    ge = Binary.register(pandas.DataFrame.ge)
-    gt = Binary.register(pandas.DataFrame.gt)
-    le = Binary.register(pandas.DataFrame.le)
-    lt = Binary.register(pandas.DataFrame.lt)
+    ge = _lazy_scan_op("ge", Binary.register(pandas.DataFrame.ge))
+    gt = _lazy_scan_op("gt", Binary.register(pandas.DataFrame.gt))
+    le = _lazy_scan_op("le", Binary.register(pandas.DataFrame.le))
+    lt = _lazy_scan_op("lt", Binary.register(pandas.DataFrame.lt))
     mod = Binary.register(pandas.DataFrame.mod)
     mul = Binary.register(pandas.DataFrame.mul)
-    ne = Binary.register(pandas.DataFrame.ne)
+    ne = _lazy_scan_op("ne", Binary.register(pandas.DataFrame.ne))
     pow = Binary.register(pandas.DataFrame.pow)
     rfloordiv = Binary.register(pandas.DataFrame.rfloordiv)
     rmod = Binary.register(pandas.DataFrame.rmod)
@@ -370,7 +566,7 @@ class PandasQueryCompiler(BaseQueryCompiler):
     rtruediv = Binary.register(pandas.DataFrame.rtruediv)
     sub = Binary.register(pandas.DataFrame.sub)
     truediv = Binary.register(pandas.DataFrame.truediv)
-    __and__ = Binary.register(pandas.DataFrame.__and__)
+    __and__ = _lazy_scan_op("__and__", Binary.register(pandas.DataFrame.__and__))
     __or__ = Binary.register(pandas.DataFrame.__or__)
     __rand__ = Binary.register(pandas.DataFrame.__rand__)
     __ror__ = Binary.register(pandas.DataFrame.__ror__)
@@ -432,7 +628,18 @@ class PandasQueryCompiler(BaseQueryCompiler):
         right_index = kwargs.get("right_index", False)
         sort = kwargs.get("sort", False)
 
-        if how in ["left", "inner"] and left_index is False and right_index is False:
+        can_broadcast = (
+            how in ["left", "inner"] and left_index is False and right_index is False
+        )
+        if not can_broadcast or (
+            len(right.index) * len(right.columns) > BroadcastJoinThreshold.get()
+        ):
+            join_keys = self._get_merge_keys(
+                right, on, left_on, right_on, left_index, right_index
+            )
+            if how in ["left", "right", "inner", "outer"] and join_keys is not None:
+                return self._shuffle_merge(right, *join_keys, **kwargs)
+        if can_broadcast:
             right = right.to_pandas()
 
             kwargs["sort"] = False
@@ -454,10 +661,11 @@ class PandasQueryCompiler(BaseQueryCompiler):
                     else True
                 )
                 if sort:
+                    sort_keys = left_on + [o for o in right_on if o not in left_on]
                     new_self = (
-                        new_self.sort_rows_by_column_values(left_on.append(right_on))
+                        new_self.sort_rows_by_column_values(sort_keys)
                         if is_reset_index
-                        else new_self.sort_index(axis=0, level=left_on.append(right_on))
+                        else new_self.sort_index(axis=0, level=sort_keys)
                     )
             if on:
                 on = on if is_list_like(on) else [on]
@@ -474,11 +682,248 @@ class PandasQueryCompiler(BaseQueryCompiler):
         else:
             return self.default_to_pandas(pandas.DataFrame.merge, right, **kwargs)
 
+    def _get_merge_keys(self, right, on, left_on, right_on, left_index, right_index):
+        """
+        Get the columns holding the join keys of ``merge``.
+
+        Parameters
+        ----------
+        right : PandasQueryCompiler
+            The right frame of the join.
+        on : label or list of labels or None
+            Column names to join on in both frames.
+        left_on : label or list of labels or None
+            Column names to join on in this frame.
+        right_on : label or list of labels or None
+            Column names to join on in `right`.
+        left_index : bool
+            Whether to use the index of this frame as the join key.
+        right_index : bool
+            Whether to use the index of `right` as the join key.
+
+        Returns
+        -------
+        tuple of two lists or None
+            Labels of the key columns of this frame and of `right`, None in place
+            of the labels of a frame joined on its index. None if the keys are
+            neither columns nor a single-level index of both frames.
+
+        Notes
+        -----
+        ``pandas.merge`` takes the row labels of a frame joined with the
+        levels of a MultiIndex from the row positions in the whole frames,
+        so such a join cannot be done bucket by bucket.
+        """
+        if any(
+            isinstance(qc.columns, pandas.MultiIndex) or not qc.columns.is_unique
+            for qc in (self, right)
+        ):
+            return None
+        if left_index or right_index:
+            if (
+                on is not None
+                or (left_index and left_on is not None)
+                or (right_index and right_on is not None)
+                or (left_index and self.index.nlevels > 1)
+                or (right_index and right.index.nlevels > 1)
+            ):
+                return None
+        else:
+            if on is None and left_on is None and right_on is None:
+                on = [col for col in self.columns if col in right.columns]
+                if len(on) == 0:
+                    return None
+            if on is not None:
+                left_on = right_on = on
+        if (left_on is None and not left_index) or (
+            right_on is None and not right_index
+        ):
+            return None
+
+        def as_keys(keys):
+            if keys is None:
+                return None
+            return list(keys) if is_list_like(keys) else [keys]
+
+        def are_columns(qc, keys):
+            try:
+                return keys is None or all(
+                    key in qc.columns and key not in qc.index.names for key in keys
+                )
+            except TypeError:
+                return False
+
+        left_on, right_on = as_keys(left_on), as_keys(right_on)
+        if len(left_on or [None]) != len(right_on or [None]):
+            return None
+        if not (are_columns(self, left_on) and are_columns(right, right_on)):
+            return None
+        return left_on, right_on
+
+    def _shuffle_merge(self, right, left_key_columns, right_key_columns, **kwargs):
+        """
+        Merge two frames by hash-partitioning both of them on the join keys.
+
+        Parameters
+        ----------
+        right : PandasQueryCompiler
+            The right frame of the join.
+        left_key_columns : list of labels or None
+            Columns of this frame holding the join keys, None if this frame
+            is joined on its index.
+        right_key_columns : list of labels or None
+            Columns of `right` holding the join keys, None if `right` is
+            joined on its index.
+        **kwargs : dict
+            Parameters to pass into `pandas.merge` function.
+
+        Returns
+        -------
+        PandasQueryCompiler
+            New QueryCompiler with the result of the merge.
+
+        Notes
+        -----
+        Every bucket is joined with ``sort=False`` and the order of rows of
+        ``pandas.merge`` is restored afterwards by a distributed sort on the
+        positions of the source rows, which are carried in hidden columns.
+        The index of a frame joined on its index stays in its rows, so the
+        buckets are hashed and joined on the index like on the key columns.
+        """
+        how = kwargs.get("how", "inner")
+        sort = kwargs.get("sort", False)
+        kwargs["sort"] = False
+        index_keys = left_key_columns is None or right_key_columns is None
+        if left_key_columns is None and right_key_columns is None:
+            # Joining two indexes returns the rows sorted by the keys unless
+            # both indexes are unique and the join is not an outer one
+            sort = sort or how == "outer" or not (
+                self.index.is_unique and right.index.is_unique
+            )
+        num_keys = len(left_key_columns or right_key_columns or [None])
+        left_position = "__modin_merge_left_position__"
+        right_position = "__modin_merge_right_position__"
+        left_first = "__modin_merge_left_first__"
+        right_first = "__modin_merge_right_first__"
+        group = "__modin_merge_group__"
+        left_keys = [f"__modin_merge_left_key_{i}__" for i in range(num_keys)]
+        right_keys = [f"__modin_merge_right_key_{i}__" for i in range(num_keys)]
+        sort_keys = [f"__modin_merge_key_{i}__" for i in range(num_keys)]
+        num_left_rows = len(self.index)
+
+        def key_values(df, keys):
+            if keys is None:
+                return [df.index.get_level_values(i) for i in range(df.index.nlevels)]
+            return [df[key] for key in keys]
+
+        def first_positions(df, keys, position):
+            # Position of the first row holding the same keys as each row of `df`.
+            # Missing values are considered equal, like ``pandas.merge`` does.
+            codes = None
+            for values in key_values(df, keys):
+                key_codes, uniques = pandas.factorize(values, na_sentinel=None)
+                codes = (
+                    key_codes
+                    if codes is None
+                    else pandas.factorize(codes * (len(uniques) + 1) + key_codes)[0]
+                )
+            _, first_rows = np.unique(codes, return_index=True)
+            positions = df[position].to_numpy()
+            return positions[first_rows][codes] if len(df) else positions
+
+        def join_func(left, right):
+            if how in ["inner", "outer"]:
+                left = left.assign(
+                    **{
+                        left_first: first_positions(
+                            left, left_key_columns, left_position
+                        )
+                    }
+                )
+                right = right.assign(
+                    **{
+                        right_first: first_positions(
+                            right, right_key_columns, right_position
+                        )
+                    }
+                )
+            if sort:
+                left = left.assign(
+                    **dict(zip(left_keys, key_values(left, left_key_columns)))
+                )
+                right = right.assign(
+                    **dict(zip(right_keys, key_values(right, right_key_columns)))
+                )
+            result = pandas.merge(left, right, **kwargs)
+            if len(left) == 0 and num_left_rows > 0 and not index_keys:
+                # ``pandas.merge`` moves the key columns of an empty left frame
+                # to the right, so restore the order of the non-empty buckets
+                result = result[
+                    pandas.merge(left.reindex([0]), right.iloc[:0], **kwargs).columns
+                ]
+            if how in ["inner", "outer"]:
+                result[group] = result[left_first].fillna(
+                    result[right_first] + num_left_rows
+                )
+            if sort:
+                for name, left_key, right_key in zip(sort_keys, left_keys, right_keys):
+                    result[name] = result[left_key].combine_first(result[right_key])
+            return result
+
+        new_self = self.__constructor__(
+            self._modin_frame.hash_join(
+                right._modin_frame,
+                left_key_columns,
+                right_key_columns,
+                join_func,
+                left_position=left_position,
+                right_position=right_position,
+            )
+        )
+        by = [right_position, left_position]
+        if how != "right":
+            by = by[::-1]
+        if how in ["inner", "outer"]:
+            by = [group] + by
+        if sort:
+            by = sort_keys + by
+        hidden_columns = [left_position, right_position] + (
+            [left_first, right_first, group] if how in ["inner", "outer"] else []
+        )
+        if sort:
+            hidden_columns += left_keys + right_keys + sort_keys
+        new_self = new_self.sort_rows_by_column_values(
+            by, ascending=True, kind="mergesort", na_position="last"
+        ).drop(columns=hidden_columns)
+        # The result of joining on an index is labeled by the joined rows
+        return new_self if index_keys else new_self.reset_index(drop=True)
+
     def join(self, right, **kwargs):
         on = kwargs.get("on", None)
         how = kwargs.get("how", "left")
         sort = kwargs.get("sort", False)
 
+        if how not in ["left", "inner"] or (
+            len(right.index) * len(right.columns) > BroadcastJoinThreshold.get()
+        ):
+            join_keys = self._get_merge_keys(right, None, on, None, False, True)
+            # Overlapping columns without suffixes are reported by pandas
+            has_suffixes = kwargs.get("lsuffix", "") or kwargs.get("rsuffix", "")
+            if (
+                how in ["left", "right", "inner", "outer"]
+                and join_keys is not None
+                and (has_suffixes or not self.columns.intersection(right.columns).size)
+            ):
+                # ``DataFrame.join`` joins the `on` columns with the index of `right`
+                return self._shuffle_merge(
+                    right,
+                    *join_keys,
+                    how=how,
+                    left_on=on,
+                    right_index=True,
+                    suffixes=(kwargs.get("lsuffix", ""), kwargs.get("rsuffix", "")),
+                    sort=sort,
+                )
         if how in ["left", "inner"]:
             right = right.to_pandas()
 
@@ -657,6 +1102,10 @@ class PandasQueryCompiler(BaseQueryCompiler):
         return self.__constructor__(self._modin_frame.transpose())
 
     def columnarize(self):
+        # Frames read from files are never transposed, so the index is not checked
+        # to keep the pending lazy scan
+        if self._lazy_scan is not None and len(self.columns) == 1:
+            return self
         if len(self.columns) != 1 or (
             len(self.index) == 1 and self.index[0] == "__reduced__"
         ):
@@ -770,7 +1219,6 @@ class PandasQueryCompiler(BaseQueryCompiler):
     idxmax = Reduce.register(pandas.DataFrame.idxmax)
     idxmin = Reduce.register(pandas.DataFrame.idxmin)
     median = Reduce.register(pandas.DataFrame.median)
-    nunique = Reduce.register(pandas.DataFrame.nunique)
     skew = Reduce.register(pandas.DataFrame.skew)
     kurt = Reduce.register(pandas.DataFrame.kurt)
     sem = Reduce.register(pandas.DataFrame.sem)
@@ -778,9 +1226,127 @@ class PandasQueryCompiler(BaseQueryCompiler):
     var = Reduce.register(pandas.DataFrame.var)
     sum_min_count = Reduce.register(pandas.DataFrame.sum)
     prod_min_count = Reduce.register(pandas.DataFrame.prod)
-    quantile_for_single_value = Reduce.register(pandas.DataFrame.quantile)
     mad = Reduce.register(pandas.DataFrame.mad)
 
+    def nunique(self, approx=False, **kwargs):
+        if not approx or kwargs.get("axis", 0) != 0 or len(self.columns) == 0:
+            return Reduce.register(pandas.DataFrame.nunique)(self, **kwargs)
+
+        dropna = kwargs.get("dropna", True)
+
+        def map_fn(df, **kwargs):
+            """Build HyperLogLog sketch of every column of a partition."""
+            return df.apply(HyperLogLog.from_values, dropna=dropna)
+
+        def reduce_fn(df, **kwargs):
+            """Merge the sketches of every column and estimate its number of unique values."""
+            return df.apply(lambda sketches: HyperLogLog.merge(sketches).estimate())
+
+        return TreeReduce.register(map_fn, reduce_fn)(self, axis=0)
+
+    def quantile_for_single_value(self, approx=False, **kwargs):
+        if approx and self._can_approx_quantile(**kwargs):
+            return self._approx_quantile(**kwargs)
+        return Reduce.register(pandas.DataFrame.quantile)(self, **kwargs)
+
+    def _can_approx_quantile(
+        self, axis=0, numeric_only=True, interpolation="linear", **kwargs
+    ):
+        """
+        Check whether the quantiles can be estimated from t-digest sketches.
+
+        Parameters
+        ----------
+        axis : {0, 1}, default: 0
+            Axis to compute quantiles along.
+        numeric_only : bool, default: True
+            Whether to compute quantiles of numeric columns only.
+        interpolation : str, default: "linear"
+            Interpolation method to use between the data points.
+        **kwargs : dict
+            Other parameters of the quantile computation, unused.
+
+        Returns
+        -------
+        bool
+            True if the quantiles are linearly interpolated along columns and
+            all of them are numeric, False otherwise.
+        """
+        # The estimates are always linearly interpolated between the centroids
+        if axis != 0 or interpolation != "linear":
+            return False
+        dtypes = self.dtypes
+        if numeric_only:
+            dtypes = dtypes[self._modin_frame.numeric_columns()]
+        return len(dtypes) > 0 and all(
+            isinstance(dtype, np.dtype) and dtype.kind in "iuf" for dtype in dtypes
+        )
+
+    def _approx_quantile(self, q, numeric_only=True, **kwargs):
+        """
+        Estimate quantiles of every column from t-digest sketches.
+
+        The sketches are built for every partition and merged via TreeReduce approach,
+        so the columns are never materialized at once.
+
+        Parameters
+        ----------
+        q : float or list-like
+            Quantiles to compute.
+        numeric_only : bool, default: True
+            Whether to compute quantiles of numeric columns only.
+        **kwargs : dict
+            Other parameters of the quantile computation, unused. Estimated values
+            are always linearly interpolated.
+
+        Returns
+        -------
+        PandasQueryCompiler
+            QueryCompiler with the estimated quantiles, one row per quantile
+            if `q` is list-like, a single row otherwise.
+        """
+        query_compiler = (
+            self.getitem_column_array(self._modin_frame.numeric_columns())
+            if numeric_only
+            else self
+        )
+
+        def map_fn(df, **kwargs):
+            """Build t-digest sketch of every column of a partition."""
+            return df.apply(TDigest.from_values)
+
+        if not is_list_like(q):
+
+            def reduce_fn(df, **kwargs):
+                """Merge the sketches of every column and estimate its quantile."""
+                return df.apply(lambda digests: TDigest.merge(digests).quantile(q))
+
+            return TreeReduce.register(map_fn, reduce_fn)(query_compiler, axis=0)
+
+        q_index = pandas.Float64Index(q)
+        digests = TreeReduce.register(
+            map_fn, lambda df, **kwargs: df.apply(TDigest.merge)
+        )(query_compiler, axis=0)
+
+        def quantile_builder(df):
+            """Estimate the quantiles from the merged sketches of the columns."""
+            values = [digest.quantile(np.asarray(q)) for digest in df.iloc[0]]
+            return pandas.DataFrame(
+                np.array(values, dtype=np.float64).reshape(len(values), len(q_index)).T,
+                index=q_index,
+                columns=df.columns,
+            )
+
+        return self.__constructor__(
+            digests._modin_frame.apply_full_axis(
+                0,
+                quantile_builder,
+                new_index=q_index,
+                new_columns=query_compiler.columns,
+                dtypes=np.float64,
+            )
+        )
+
     def to_datetime(self, *args, **kwargs):
         if len(self.columns) == 1:
             return Map.register(
@@ -1025,75 +1591,75 @@ class PandasQueryCompiler(BaseQueryCompiler):
     def resample_quantile(self, resample_kwargs, q, **kwargs):
         return self._resample_func(resample_kwargs, "quantile", q=q, **kwargs)
 
-    window_mean = Fold.register(
+    window_mean = _rolling_func(
         lambda df, rolling_args, *args, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).mean(*args, **kwargs)
         )
     )
-    window_sum = Fold.register(
+    window_sum = _rolling_func(
         lambda df, rolling_args, *args, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).sum(*args, **kwargs)
         )
     )
-    window_var = Fold.register(
+    window_var = _rolling_func(
         lambda df, rolling_args, ddof, *args, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).var(ddof=ddof, *args, **kwargs)
         )
     )
-    window_std = Fold.register(
+    window_std = _rolling_func(
         lambda df, rolling_args, ddof, *args, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).std(ddof=ddof, *args, **kwargs)
         )
     )
-    rolling_count = Fold.register(
+    rolling_count = _rolling_func(
         lambda df, rolling_args: pandas.DataFrame(df.rolling(*rolling_args).count())
     )
-    rolling_sum = Fold.register(
+    rolling_sum = _rolling_func(
         lambda df, rolling_args, *args, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).sum(*args, **kwargs)
         )
     )
-    rolling_mean = Fold.register(
+    rolling_mean = _rolling_func(
         lambda df, rolling_args, *args, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).mean(*args, **kwargs)
         )
     )
-    rolling_median = Fold.register(
+    rolling_median = _rolling_func(
         lambda df, rolling_args, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).median(**kwargs)
         )
     )
-    rolling_var = Fold.register(
+    rolling_var = _rolling_func(
         lambda df, rolling_args, ddof, *args, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).var(ddof=ddof, *args, **kwargs)
         )
     )
-    rolling_std = Fold.register(
+    rolling_std = _rolling_func(
         lambda df, rolling_args, ddof, *args, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).std(ddof=ddof, *args, **kwargs)
         )
     )
-    rolling_min = Fold.register(
+    rolling_min = _rolling_func(
         lambda df, rolling_args, *args, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).min(*args, **kwargs)
         )
     )
-    rolling_max = Fold.register(
+    rolling_max = _rolling_func(
         lambda df, rolling_args, *args, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).max(*args, **kwargs)
         )
     )
-    rolling_skew = Fold.register(
+    rolling_skew = _rolling_func(
         lambda df, rolling_args, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).skew(**kwargs)
         )
     )
-    rolling_kurt = Fold.register(
+    rolling_kurt = _rolling_func(
         lambda df, rolling_args, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).kurt(**kwargs)
         )
     )
-    rolling_apply = Fold.register(
+    rolling_apply = _rolling_func(
         lambda df, rolling_args, func, raw, engine, engine_kwargs, args, kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).apply(
                 func=func,
@@ -1105,7 +1671,7 @@ class PandasQueryCompiler(BaseQueryCompiler):
             )
         )
     )
-    rolling_quantile = Fold.register(
+    rolling_quantile = _rolling_func(
         lambda df, rolling_args, quantile, interpolation, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).quantile(
                 quantile=quantile, interpolation=interpolation, **kwargs
@@ -1580,10 +2146,10 @@ class PandasQueryCompiler(BaseQueryCompiler):
     # that is being operated on. This means that we have to put all of that
     # data in the same place.
 
-    cummax = Fold.register(pandas.DataFrame.cummax)
-    cummin = Fold.register(pandas.DataFrame.cummin)
-    cumsum = Fold.register(pandas.DataFrame.cumsum)
-    cumprod = Fold.register(pandas.DataFrame.cumprod)
+    cummax = _cumulative_func(pandas.DataFrame.cummax)
+    cummin = _cumulative_func(pandas.DataFrame.cummin)
+    cumsum = _cumulative_func(pandas.DataFrame.cumsum)
+    cumprod = _cumulative_func(pandas.DataFrame.cumprod)
     diff = Fold.register(pandas.DataFrame.diff)
 
     def clip(self, lower, upper, **kwargs):
@@ -1907,7 +2473,9 @@ class PandasQueryCompiler(BaseQueryCompiler):
             new_modin_frame = self._modin_frame.map(fillna)
         return self.__constructor__(new_modin_frame)
 
-    def quantile_for_list_of_values(self, **kwargs):
+    def quantile_for_list_of_values(self, approx=False, **kwargs):
+        if approx and self._can_approx_quantile(**kwargs):
+            return self._approx_quantile(**kwargs)
         axis = kwargs.get("axis", 0)
         q = kwargs.get("q")
         numeric_only = kwargs.get("numeric_only", True)
@@ -2000,15 +2568,36 @@ class PandasQueryCompiler(BaseQueryCompiler):
         else:
             new_index = pandas.Series(self.index).sort_values(**kwargs)
             new_columns = self.columns
-        new_modin_frame = self._modin_frame.apply_full_axis(
-            axis,
-            lambda df: df.sort_index(
+
+        def sort_function(df):
+            return df.sort_index(
                 axis=axis, level=level, sort_remaining=sort_remaining, **kwargs
-            ),
-            new_index,
-            new_columns,
-            dtypes="copy" if axis == 0 else None,
-        )
+            )
+
+        if axis == 0 and not kwargs.get("ignore_index", False):
+            new_modin_frame = self._modin_frame._sort_rows(
+                # rows with equal labels keep their original order, which may differ
+                # from the order given by the default unstable sort of pandas
+                lambda df: df.sort_index(
+                    axis=axis,
+                    level=level,
+                    sort_remaining=sort_remaining,
+                    **{**kwargs, "kind": "stable"},
+                ),
+                None,
+                ascending,
+                kwargs.get("na_position", "last"),
+                kwargs.get("key", None),
+                new_index=new_index,
+            )
+        else:
+            new_modin_frame = self._modin_frame.apply_full_axis(
+                axis,
+                sort_function,
+                new_index,
+                new_columns,
+                dtypes="copy" if axis == 0 else None,
+            )
         return self.__constructor__(new_modin_frame)
 
     def melt(
@@ -2115,6 +2704,14 @@ class PandasQueryCompiler(BaseQueryCompiler):
 
     # __getitem__ methods
     def getitem_array(self, key):
+        if (
+            isinstance(key, type(self))
+            and self._lazy_scan is not None
+            and key._lazy_scan is not None
+        ):
+            lazy_scan = self._lazy_scan.filter(key._lazy_scan)
+            if lazy_scan is not None:
+                return self.__constructor__(None, lazy_scan=lazy_scan)
         # TODO: dont convert to pandas for array indexing
         if isinstance(key, type(self)):
             key = key.to_pandas().squeeze(axis=1)
@@ -2152,6 +2749,10 @@ class PandasQueryCompiler(BaseQueryCompiler):
             return self.getitem_column_array(key)
 
     def getitem_column_array(self, key, numeric=False):
+        if self._lazy_scan is not None and not numeric:
+            lazy_scan = self._lazy_scan.project(key)
+            if lazy_scan is not None:
+                return self.__constructor__(None, lazy_scan=lazy_scan)
         # Convert to list for type checking
         if numeric:
             new_modin_frame = self._modin_frame.mask(col_positions=key)
@@ -2468,6 +3069,385 @@ class PandasQueryCompiler(BaseQueryCompiler):
     groupby_prod = GroupByReduce.register("prod")
     groupby_sum = GroupByReduce.register("sum")
 
+    def _can_reduce_moments(self, columns):
+        """
+        Check whether moment-based aggregations of the `columns` can be computed via TreeReduce approach.
+
+        Parameters
+        ----------
+        columns : list-like
+            Labels of the columns to aggregate.
+
+        Returns
+        -------
+        bool
+        """
+        dtypes = self.dtypes[self.columns.isin(columns)]
+        return all(
+            isinstance(dtype, np.dtype) and dtype.kind in "biuf" for dtype in dtypes
+        )
+
+    def _groupby_moments_reduce(
+        self,
+        func,
+        by,
+        axis,
+        groupby_kwargs,
+        agg_args,
+        agg_kwargs,
+        drop=False,
+    ):
+        """
+        Group underlying data and compute a moment-based aggregation of each group.
+
+        The aggregation is computed via TreeReduce approach from the partial central
+        moments of the groups if all of the aggregated columns are numeric, otherwise
+        the full-axis implementation of the base query compiler is used.
+
+        Parameters
+        ----------
+        func : {"mean", "sem", "skew", "std", "var"}
+            Name of the aggregation.
+        by : PandasQueryCompiler, column or index label, Grouper or list of such
+            Object that determine groups.
+        axis : {0, 1}
+            Axis to group and apply aggregation function along.
+            0 is for index, when 1 is for columns.
+        groupby_kwargs : dict
+            GroupBy parameters in the format of ``modin.pandas.DataFrame.groupby`` signature.
+        agg_args : list-like
+            Positional arguments to pass to the aggregation function.
+        agg_kwargs : dict
+            Keyword arguments to pass to the aggregation function.
+        drop : bool, default: False
+            If `by` is a QueryCompiler indicates whether or not by-data came
+            from the `self`.
+
+        Returns
+        -------
+        PandasQueryCompiler
+            New QueryCompiler containing the result of groupby aggregation.
+        """
+        query_compiler = self
+        by_columns = self._get_by_columns(by, drop)
+        if isinstance(by, type(self)) and drop:
+            # The partial moments of the 'by' columns are not dropped
+            # at the Reduce phase, so excluding them beforehand
+            query_compiler = self.drop(columns=by_columns)
+        if (
+            len(agg_args) == 0
+            and set(agg_kwargs.keys()) <= {"ddof"}
+            and self._can_reduce_moments(self.columns.difference(by_columns))
+        ):
+            return GroupByReduce.register(func)(
+                query_compiler=query_compiler,
+                by=by,
+                axis=axis,
+                groupby_kwargs=groupby_kwargs,
+                agg_args=agg_args,
+                agg_kwargs=agg_kwargs,
+                drop=drop,
+            )
+        return getattr(super(), f"groupby_{func}")(
+            by=by,
+            axis=axis,
+            groupby_kwargs=groupby_kwargs,
+            agg_args=agg_args,
+            agg_kwargs=agg_kwargs,
+            drop=drop,
+        )
+
+    def _get_by_columns(self, by, drop=False):
+        """
+        Get labels of the columns of `self` that determine groups.
+
+        Parameters
+        ----------
+        by : PandasQueryCompiler, column or index label, Grouper or list of such
+            Object that determine groups.
+        drop : bool, default: False
+            If `by` is a QueryCompiler indicates whether or not by-data came
+            from the `self`.
+
+        Returns
+        -------
+        list-like
+        """
+        if isinstance(by, type(self)):
+            return by.columns if drop else []
+        return [
+            o
+            for o in (by if isinstance(by, list) else [by])
+            if hashable(o) and o in self.columns
+        ]
+
+    def _groupby_sketch_reduce(
+        self,
+        build_sketch,
+        finalize,
+        default_to_pandas_func,
+        by,
+        axis,
+        groupby_kwargs,
+        drop=False,
+    ):
+        """
+        Group underlying data and estimate an aggregation of each group from mergeable sketches.
+
+        A sketch of every group and column is built for every partition at the Map
+        phase, the sketches of the same group are merged at the Reduce phase.
+
+        Parameters
+        ----------
+        build_sketch : callable(pandas.Series) -> object
+            Function building the sketch of the values of a group.
+        finalize : callable(pandas.Series) -> scalar
+            Function merging the sketches of a group and estimating the aggregation.
+        default_to_pandas_func : callable(pandas.DataFrameGroupBy) -> pandas.DataFrame
+            The exact pandas aggregation used in case of defaulting to pandas.
+        by : PandasQueryCompiler, column or index label, Grouper or list of such
+            Object that determine groups.
+        axis : {0, 1}
+            Axis to group and apply aggregation function along.
+            0 is for index, when 1 is for columns.
+        groupby_kwargs : dict
+            GroupBy parameters in the format of ``modin.pandas.DataFrame.groupby`` signature.
+        drop : bool, default: False
+            If `by` is a QueryCompiler indicates whether or not by-data came
+            from the `self`.
+
+        Returns
+        -------
+        PandasQueryCompiler
+            New QueryCompiler containing the result of groupby aggregation.
+        """
+        return GroupByReduce.register(
+            lambda grp: grp.agg(build_sketch),
+            lambda grp: grp.agg(finalize),
+            default_to_pandas_func=default_to_pandas_func,
+        )(
+            query_compiler=self,
+            by=by,
+            axis=axis,
+            groupby_kwargs=groupby_kwargs,
+            agg_args=[],
+            agg_kwargs={},
+            drop=drop,
+        )
+
+    def _can_approx_groupby_quantile(self, by, drop, agg_args):
+        """
+        Check whether the quantiles of the groups can be estimated from t-digest sketches.
+
+        Parameters
+        ----------
+        by : PandasQueryCompiler, column or index label, Grouper or list of such
+            Object that determine groups.
+        drop : bool
+            If `by` is a QueryCompiler indicates whether or not by-data came
+            from the `self`.
+        agg_args : list-like
+            Positional arguments to pass to the aggregation function.
+
+        Returns
+        -------
+        bool
+        """
+        dtypes = self.dtypes[~self.columns.isin(self._get_by_columns(by, drop))]
+        return len(agg_args) == 0 and all(
+            isinstance(dtype, np.dtype) and dtype.kind in "iuf" for dtype in dtypes
+        )
+
+    def _groupby_scan(
+        self, agg_func, by, axis, groupby_kwargs, agg_args, agg_kwargs, drop=False
+    ):
+        """
+        Group underlying data and apply cumulative function to each group with a parallel prefix scan.
+
+        The carry of every row partition holds the last state of the scan of every
+        group met in it, so the row partitions are scanned in parallel starting with
+        the state of the groups in the preceding partitions.
+
+        Parameters
+        ----------
+        agg_func : {"cumsum", "cumprod", "cummax", "cummin"}
+            Name of the cumulative function.
+        by : PandasQueryCompiler, column or index label, Grouper or list of such
+            Object that determine groups.
+        axis : {0, 1}
+            Axis to group and apply aggregation function along.
+            0 is for index, when 1 is for columns.
+        groupby_kwargs : dict
+            GroupBy parameters in the format of ``modin.pandas.DataFrame.groupby`` signature.
+        agg_args : list-like
+            Positional arguments to pass to the aggregation function.
+        agg_kwargs : dict
+            Keyword arguments to pass to the aggregation function.
+        drop : bool, default: False
+            If `by` is a QueryCompiler indicates whether or not by-data came
+            from the `self`.
+
+        Returns
+        -------
+        PandasQueryCompiler
+            New QueryCompiler containing the result of groupby aggregation.
+        """
+        by_columns = self._get_by_columns(by, drop)
+        dtypes = self.dtypes[~self.columns.isin(by_columns)]
+        if not (
+            axis == 0
+            and isinstance(by, type(self))
+            and drop
+            and groupby_kwargs.get("level") is None
+            and len(agg_args) == 0
+            and agg_kwargs.get("axis", 0) in (0, "index")
+            and set(agg_kwargs.keys()) <= {"axis"}
+            and self.columns.is_unique
+            and all(
+                isinstance(dtype, np.dtype) and dtype.kind in "biuf" for dtype in dtypes
+            )
+        ):
+            return getattr(super(), f"groupby_{agg_func}")(
+                by, axis, groupby_kwargs, agg_args, agg_kwargs, drop
+            )
+        by_columns = list(by_columns)
+
+        def scan_fn(df):
+            return getattr(df.groupby(by_columns, **groupby_kwargs), agg_func)()
+
+        def carry_fn(df):
+            result = pandas.concat([df[by_columns], scan_fn(df)], axis=1)
+            # `last` skips NaN values, that do not reset the scan of a group
+            return (
+                result.groupby(
+                    by_columns,
+                    sort=False,
+                    observed=True,
+                    dropna=groupby_kwargs.get("dropna", True),
+                )
+                .last()
+                .reset_index()[df.columns]
+            )
+
+        return self.__constructor__(
+            self._modin_frame.scan(0, scan_fn, carry_fn, full_axis=True)
+        )
+
+    def groupby_cumsum(
+        self, by, axis, groupby_kwargs, agg_args, agg_kwargs, drop=False
+    ):
+        return self._groupby_scan(
+            "cumsum", by, axis, groupby_kwargs, agg_args, agg_kwargs, drop
+        )
+
+    def groupby_cummax(
+        self, by, axis, groupby_kwargs, agg_args, agg_kwargs, drop=False
+    ):
+        return self._groupby_scan(
+            "cummax", by, axis, groupby_kwargs, agg_args, agg_kwargs, drop
+        )
+
+    def groupby_cummin(
+        self, by, axis, groupby_kwargs, agg_args, agg_kwargs, drop=False
+    ):
+        return self._groupby_scan(
+            "cummin", by, axis, groupby_kwargs, agg_args, agg_kwargs, drop
+        )
+
+    def groupby_cumprod(
+        self, by, axis, groupby_kwargs, agg_args, agg_kwargs, drop=False
+    ):
+        return self._groupby_scan(
+            "cumprod", by, axis, groupby_kwargs, agg_args, agg_kwargs, drop
+        )
+
+    def groupby_nunique(
+        self, by, axis, groupby_kwargs, agg_args, agg_kwargs, drop=False, approx=False
+    ):
+        if approx and len(agg_args) == 0 and set(agg_kwargs.keys()) <= {"dropna"}:
+            dropna = agg_kwargs.get("dropna", True)
+            return self._groupby_sketch_reduce(
+                lambda values: HyperLogLog.from_values(values, dropna=dropna),
+                lambda sketches: HyperLogLog.merge(sketches).estimate(),
+                lambda grp: grp.nunique(dropna=dropna),
+                by,
+                axis,
+                groupby_kwargs,
+                drop,
+            )
+        return super().groupby_nunique(
+            by, axis, groupby_kwargs, agg_args, agg_kwargs, drop
+        )
+
+    def groupby_median(
+        self, by, axis, groupby_kwargs, agg_args, agg_kwargs, drop=False, approx=False
+    ):
+        if (
+            approx
+            and len(agg_kwargs) == 0
+            and self._can_approx_groupby_quantile(by, drop, agg_args)
+        ):
+            return self._groupby_sketch_reduce(
+                TDigest.from_values,
+                lambda digests: TDigest.merge(digests).quantile(0.5),
+                lambda grp: grp.median(),
+                by,
+                axis,
+                groupby_kwargs,
+                drop,
+            )
+        return super().groupby_median(
+            by, axis, groupby_kwargs, agg_args, agg_kwargs, drop
+        )
+
+    def groupby_quantile(
+        self, by, axis, groupby_kwargs, agg_args, agg_kwargs, drop=False, approx=False
+    ):
+        q = agg_kwargs.get("q", 0.5)
+        if (
+            approx
+            and not is_list_like(q)
+            and agg_kwargs.get("interpolation", "linear") == "linear"
+            and self._can_approx_groupby_quantile(by, drop, agg_args)
+        ):
+            return self._groupby_sketch_reduce(
+                TDigest.from_values,
+                lambda digests: TDigest.merge(digests).quantile(q),
+                lambda grp: grp.quantile(**agg_kwargs),
+                by,
+                axis,
+                groupby_kwargs,
+                drop,
+            )
+        return super().groupby_quantile(
+            by, axis, groupby_kwargs, agg_args, agg_kwargs, drop
+        )
+
+    def groupby_mean(self, by, axis, groupby_kwargs, agg_args, agg_kwargs, drop=False):
+        return self._groupby_moments_reduce(
+            "mean", by, axis, groupby_kwargs, agg_args, agg_kwargs, drop
+        )
+
+    def groupby_sem(self, by, axis, groupby_kwargs, agg_args, agg_kwargs, drop=False):
+        return self._groupby_moments_reduce(
+            "sem", by, axis, groupby_kwargs, agg_args, agg_kwargs, drop
+        )
+
+    def groupby_skew(self, by, axis, groupby_kwargs, agg_args, agg_kwargs, drop=False):
+        return self._groupby_moments_reduce(
+            "skew", by, axis, groupby_kwargs, agg_args, agg_kwargs, drop
+        )
+
+    def groupby_std(self, by, axis, groupby_kwargs, agg_args, agg_kwargs, drop=False):
+        return self._groupby_moments_reduce(
+            "std", by, axis, groupby_kwargs, agg_args, agg_kwargs, drop
+        )
+
+    def groupby_var(self, by, axis, groupby_kwargs, agg_args, agg_kwargs, drop=False):
+        return self._groupby_moments_reduce(
+            "var", by, axis, groupby_kwargs, agg_args, agg_kwargs, drop
+        )
+
     def groupby_size(
         self,
         by,
@@ -2522,7 +3502,7 @@ class PandasQueryCompiler(BaseQueryCompiler):
             Dictionary that maps row/column labels to the function names.
             **Note:** specified functions have to be supported by ``modin.core.dataframe.algebra.GroupByReduce``.
             Supported functions are listed in the ``modin.core.dataframe.algebra.GroupByReduce.groupby_reduce_functions``
-            dictionary.
+            and ``modin.core.dataframe.algebra.GroupByReduce.groupby_moment_functions`` dictionaries.
         axis : {0, 1}
             Axis to group and apply aggregation function along.
             0 is for index, when 1 is for columns.
@@ -2543,37 +3523,52 @@ class PandasQueryCompiler(BaseQueryCompiler):
         PandasQueryCompiler
             New QueryCompiler containing the result of groupby dictionary aggregation.
         """
-        map_dict = {}
-        reduce_dict = {}
         rename_columns = any(
             not isinstance(fn, str) and isinstance(fn, Iterable)
             for fn in agg_func.values()
         )
+        entries = []
         for col, col_funcs in agg_func.items():
             if not rename_columns:
-                map_dict[col], reduce_dict[col] = groupby_reduce_functions[col_funcs]
+                entries.append((col, col, col_funcs))
                 continue
-
-            if isinstance(col_funcs, str):
-                col_funcs = [col_funcs]
-
-            map_fns = []
-            for i, fn in enumerate(col_funcs):
-                if not isinstance(fn, str) and isinstance(fn, Iterable):
-                    new_col_name, func = fn
-                elif isinstance(fn, str):
-                    new_col_name, func = fn, fn
-                else:
-                    raise TypeError
-
-                map_fns.append((new_col_name, groupby_reduce_functions[func][0]))
-                reduced_col_name = (
-                    (*col, new_col_name)
-                    if isinstance(col, tuple)
-                    else (col, new_col_name)
+            for fn in [col_funcs] if isinstance(col_funcs, str) else col_funcs:
+                new_col_name, func = (fn, fn) if isinstance(fn, str) else fn
+                entries.append(
+                    (
+                        col,
+                        (*col, new_col_name)
+                        if isinstance(col, tuple)
+                        else (col, new_col_name),
+                        func,
+                    )
                 )
-                reduce_dict[reduced_col_name] = groupby_reduce_functions[func][1]
-            map_dict[col] = map_fns
+        if any(func in groupby_moment_functions for _, _, func in entries):
+            # Moment-based functions produce several partial aggregates per column,
+            # so such a dictionary can't be passed to ``DataFrameGroupBy.agg``
+            map_fn, reduce_fn = GroupByReduce.build_dict_functions(entries)
+            kwargs.setdefault("default_to_pandas_func", lambda grp: grp.agg(agg_func))
+            return GroupByReduce.register(
+                map_fn, reduce_fn, apply_indices=list(agg_func.keys()), **kwargs
+            )(
+                query_compiler=self,
+                by=by,
+                axis=axis,
+                groupby_kwargs=groupby_kwargs,
+                agg_args=agg_args,
+                agg_kwargs=agg_kwargs,
+                drop=drop,
+            )
+
+        map_dict = {}
+        reduce_dict = {}
+        for col, label, func in entries:
+            map_func, reduce_func = groupby_reduce_functions[func]
+            if rename_columns:
+                map_dict.setdefault(col, []).append((label[-1], map_func))
+            else:
+                map_dict[col] = map_func
+            reduce_dict[label] = reduce_func
         return GroupByReduce.register(map_dict, reduce_dict, **kwargs)(
             query_compiler=self,
             by=by,
@@ -2634,10 +3629,22 @@ class PandasQueryCompiler(BaseQueryCompiler):
                     if deep_level == 0
                     else is_reduce_fn(fn[1], deep_level + 1)
                 )
-            return isinstance(fn, str) and fn in groupby_reduce_functions
+            return isinstance(fn, str) and (
+                fn in groupby_reduce_functions or fn in groupby_moment_functions
+            )
+
+        def has_moment_fn(fn):
+            """Check whether `fn` defines any function computed from the partial moments."""
+            if isinstance(fn, str):
+                return fn in groupby_moment_functions
+            return any(has_moment_fn(f if isinstance(f, str) else f[1]) for f in fn)
 
-        if isinstance(agg_func, dict) and all(
-            is_reduce_fn(x) for x in agg_func.values()
+        if (
+            isinstance(agg_func, dict)
+            and all(is_reduce_fn(x) for x in agg_func.values())
+            and self._can_reduce_moments(
+                [col for col, fn in agg_func.items() if has_moment_fn(fn)]
+            )
         ):
             return self._groupby_dict_reduce(
                 by, agg_func, axis, groupby_kwargs, agg_args, agg_kwargs, drop
@@ -3076,37 +4083,11 @@ class PandasQueryCompiler(BaseQueryCompiler):
         kwargs["ignore_index"] = False
         if not is_list_like(columns):
             columns = [columns]
-        # Currently, sort_values will just reindex based on the sorted values.
-        # TODO create a more efficient way to sort
-        ErrorMessage.default_to_pandas("sort_values")
-        broadcast_value_dict = {
-            col: self.getitem_column_array([col]).to_pandas().squeeze(axis=1)
-            for col in columns
-        }
-        # Clear index level names because they also appear in broadcast_value_dict
-        orig_index_level_names = self.index.names
-        tmp_index = self.index.copy()
-        tmp_index.names = [None] * tmp_index.nlevels
-        # Index may contain duplicates
-        broadcast_values1 = pandas.DataFrame(broadcast_value_dict, index=tmp_index)
-        # Index without duplicates
-        broadcast_values2 = pandas.DataFrame(broadcast_value_dict)
-        broadcast_values2 = broadcast_values2.reset_index(drop=True)
-        # Index may contain duplicates
-        new_index1 = broadcast_values1.sort_values(
-            by=columns, axis=0, ascending=ascending, **kwargs
-        ).index
-        # Index without duplicates
-        new_index2 = broadcast_values2.sort_values(
-            by=columns, axis=0, ascending=ascending, **kwargs
-        ).index
-
-        result = self.reset_index(drop=True).reindex(axis=0, labels=new_index2)
+        result = self.__constructor__(
+            self._modin_frame.sort_by(0, columns, ascending=ascending, **kwargs)
+        )
         if ignore_index:
             result = result.reset_index(drop=True)
-        else:
-            result.index = new_index1
-            result.index.names = orig_index_level_names
         return result
 
     def sort_columns_by_row_values(self, rows, ascending=True, **kwargs):
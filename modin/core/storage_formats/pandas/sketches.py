@@ -0,0 +1,272 @@
+# Licensed to Modin Development Team under one or more contributor license agreements.
+# See the NOTICE file distributed with this work for additional information regarding
+# copyright ownership.  The Modin Development Team licenses this file to you under the
+# Apache License, Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific language
+# governing permissions and limitations under the License.
+
+"""
+Module houses mergeable sketches used by the approximate aggregations.
+
+Sketches are built for the data of every partition at the Map phase of TreeReduce
+and are merged at the Reduce phase, so the approximate aggregations never need
+a full column in one place.
+"""
+
+import numpy as np
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+from pandas.util import hash_pandas_object
+
+
+class HyperLogLog:
+    """
+    HyperLogLog sketch estimating the number of distinct values.
+
+    Registers are stored sparsely as ``index << 6 | rank`` codes, so sketches
+    of small groups take as much memory as the number of their distinct values.
+
+    Parameters
+    ----------
+    codes : np.ndarray, optional
+        Sorted codes of the non-empty registers, one code per register.
+    """
+
+    # 2 ** 12 registers give about 1.6% of relative standard error
+    precision = 12
+
+    def __init__(self, codes=None):
+        self.codes = np.empty(0, dtype=np.uint64) if codes is None else codes
+
+    @classmethod
+    def from_values(cls, values, dropna=True):
+        """
+        Build the sketch of the values.
+
+        Parameters
+        ----------
+        values : pandas.Series
+            Values to count.
+        dropna : bool, default: True
+            Whether to exclude NaN values from the count.
+
+        Returns
+        -------
+        HyperLogLog
+        """
+        if dropna:
+            values = values.dropna()
+        if is_numeric_dtype(values.dtype) and not is_bool_dtype(values.dtype):
+            # the same number may have different dtypes in different partitions,
+            # so hash all of them as floats. Adding zero turns -0.0 into 0.0.
+            values = values.astype("float64") + 0.0
+        hashes = hash_pandas_object(values, index=False).to_numpy()
+        bits = np.uint64(64 - cls.precision)
+        index = hashes >> bits
+        rest = hashes & np.uint64((1 << (64 - cls.precision)) - 1)
+        # 1-based position of the leftmost set bit of the rest of the hash,
+        # `rest` fits into the mantissa of float64, so its logarithm is exact
+        rank = np.where(
+            rest == 0,
+            int(bits) + 1,
+            int(bits) - np.floor(np.log2(np.maximum(rest, 1).astype(np.float64))),
+        ).astype(np.uint64)
+        return cls(cls._compact((index << np.uint64(6)) | rank))
+
+    @classmethod
+    def merge(cls, sketches):
+        """
+        Merge several sketches into one.
+
+        Parameters
+        ----------
+        sketches : iterable of HyperLogLog
+            Sketches to merge.
+
+        Returns
+        -------
+        HyperLogLog
+        """
+        codes = [sketch.codes for sketch in sketches]
+        if len(codes) == 0:
+            return cls()
+        return cls(cls._compact(np.concatenate(codes)))
+
+    @staticmethod
+    def _compact(codes):
+        """
+        Keep the code with the maximum rank of every register.
+
+        Parameters
+        ----------
+        codes : np.ndarray
+            Register codes, several codes per register are allowed.
+
+        Returns
+        -------
+        np.ndarray
+            Sorted codes, one per register.
+        """
+        codes = np.unique(codes)
+        index = codes >> np.uint64(6)
+        # codes of the same register are sorted by their rank
+        return codes[np.append(index[1:] != index[:-1], True)]
+
+    def estimate(self):
+        """
+        Estimate the number of distinct values.
+
+        Returns
+        -------
+        int
+        """
+        num_registers = 1 << self.precision
+        ranks = (self.codes & np.uint64(63)).astype(np.float64)
+        zeros = num_registers - len(self.codes)
+        alpha = 0.7213 / (1 + 1.079 / num_registers)
+        estimate = alpha * num_registers ** 2 / (zeros + np.sum(np.exp2(-ranks)))
+        if estimate <= 2.5 * num_registers and zeros > 0:
+            # linear counting is more accurate for small cardinalities
+            estimate = num_registers * np.log(num_registers / zeros)
+        return int(round(estimate))
+
+
+class TDigest:
+    """
+    t-digest sketch estimating quantiles of numeric values.
+
+    The values are summarized by weighted centroids, that are smaller near the
+    tails of the distribution, so extreme quantiles are estimated more precisely.
+
+    Parameters
+    ----------
+    means : np.ndarray
+        Sorted means of the centroids.
+    weights : np.ndarray
+        Number of values of every centroid.
+    min : float
+        The minimum of the values.
+    max : float
+        The maximum of the values.
+    """
+
+    # the number of centroids is about a half of the compression
+    compression = 200
+
+    def __init__(self, means, weights, min, max):
+        self.means = means
+        self.weights = weights
+        self.min = min
+        self.max = max
+
+    @classmethod
+    def from_values(cls, values):
+        """
+        Build the digest of the values, NaN values are skipped.
+
+        Parameters
+        ----------
+        values : pandas.Series
+            Numeric values to summarize.
+
+        Returns
+        -------
+        TDigest
+        """
+        values = values.dropna().to_numpy(dtype=np.float64)
+        return cls._compress(values, np.ones(len(values)))
+
+    @classmethod
+    def merge(cls, digests):
+        """
+        Merge several digests into one.
+
+        Parameters
+        ----------
+        digests : iterable of TDigest
+            Digests to merge.
+
+        Returns
+        -------
+        TDigest
+        """
+        digests = [digest for digest in digests if len(digest.means) > 0]
+        if len(digests) == 0:
+            return cls._compress(np.empty(0), np.empty(0))
+        return cls._compress(
+            np.concatenate([digest.means for digest in digests]),
+            np.concatenate([digest.weights for digest in digests]),
+            min=min(digest.min for digest in digests),
+            max=max(digest.max for digest in digests),
+        )
+
+    @classmethod
+    def _compress(cls, means, weights, min=None, max=None):
+        """
+        Combine the centroids, so the quantile range of each spans a unit of the scale function.
+
+        Parameters
+        ----------
+        means : np.ndarray
+            Means of the centroids, in any order.
+        weights : np.ndarray
+            Weights of the centroids.
+        min : float, optional
+            The minimum of the values, the smallest mean is used if not specified.
+        max : float, optional
+            The maximum of the values, the largest mean is used if not specified.
+
+        Returns
+        -------
+        TDigest
+        """
+        if len(means) == 0:
+            return cls(means, weights, np.nan, np.nan)
+        order = np.argsort(means, kind="mergesort")
+        means, weights = means[order], weights[order]
+        total = weights.sum()
+        quantiles = (np.cumsum(weights) - weights / 2) / total
+        # arcsine scale function makes the centroids small near the tails
+        scale = cls.compression / (2 * np.pi) * np.arcsin(2 * quantiles - 1)
+        ids = np.floor(scale - scale[0]).astype(np.intp)
+        new_weights = np.bincount(ids, weights=weights)
+        new_means = np.bincount(ids, weights=weights * means)
+        nonempty = new_weights > 0
+        new_weights = new_weights[nonempty]
+        return cls(
+            new_means[nonempty] / new_weights,
+            new_weights,
+            means[0] if min is None else min,
+            means[-1] if max is None else max,
+        )
+
+    def quantile(self, q):
+        """
+        Estimate quantiles of the values.
+
+        Parameters
+        ----------
+        q : float or np.ndarray
+            Quantiles to compute, between 0 and 1.
+
+        Returns
+        -------
+        float or np.ndarray
+            The estimated values, linearly interpolated between the centroids.
+        """
+        total = self.weights.sum()
+        if total == 0:
+            return np.full(np.shape(q), np.nan)[()]
+        positions = np.cumsum(self.weights) - self.weights / 2
+        # a single value is positioned at the middle of its unit weight, so the
+        # quantiles of the digests of singletons match the ones of pandas
+        return np.interp(
+            np.asarray(q) * (total - 1) + 0.5,
+            np.concatenate([[0], positions, [total]]),
+            np.concatenate([[self.min], self.means, [self.max]]),
+        )[()]
@@ -197,3 +197,33 @@ def from_partitions(
         frame.synchronize_labels(axis=labels_axis_to_sync)
 
     return DataFrame(query_compiler=PandasQueryCompiler(frame))
+
+
+def repartition(api_layer_object):
+    """
+    Redistribute rows of the ``api_layer_object`` evenly between its row partitions.
+
+    Parameters
+    ----------
+    api_layer_object : DataFrame or Series
+        The API layer object.
+
+    Returns
+    -------
+    DataFrame or Series
+        A new object of the same type with rebalanced partitions.
+
+    Notes
+    -----
+    The number of new row partitions is limited by ``modin.config.NPartitions``
+    and every one of them holds at least ``modin.config.MinPartitionSize`` rows.
+    Modin also rebalances the partitions automatically after row filters when
+    their lengths get too skewed.
+    """
+    if not hasattr(api_layer_object, "_query_compiler"):
+        raise ValueError(
+            f"Only API Layer objects may be passed in here, got {type(api_layer_object)} instead."
+        )
+    return type(api_layer_object)(
+        query_compiler=api_layer_object._query_compiler.repartition()
+    )
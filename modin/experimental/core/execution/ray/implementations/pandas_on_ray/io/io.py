@@ -25,11 +25,16 @@ import warnings
 from modin.core.storage_formats.pandas.parsers import (
     _split_result_for_readers,
     PandasCSVGlobParser,
+    PandasHDFParser,
     PandasPickleExperimentalParser,
 )
 from modin.core.storage_formats.pandas.query_compiler import PandasQueryCompiler
 from modin.core.execution.ray.implementations.pandas_on_ray.io import PandasOnRayIO
-from modin.core.io import CSVGlobDispatcher, PickleExperimentalDispatcher
+from modin.core.io import (
+    CSVGlobDispatcher,
+    HDFDispatcher,
+    PickleExperimentalDispatcher,
+)
 from modin.core.execution.ray.implementations.pandas_on_ray.dataframe.dataframe import (
     PandasOnRayDataframe,
 )
@@ -63,6 +68,9 @@ class ExperimentalPandasOnRayIO(PandasOnRayIO):
         (RayTask, PandasPickleExperimentalParser, PickleExperimentalDispatcher),
         build_args,
     )._read
+    read_hdf_keys = type(
+        "", (RayTask, PandasHDFParser, HDFDispatcher), build_args
+    ).read_keys
 
     @classmethod
     def read_sql(
@@ -122,7 +130,8 @@ class ExperimentalPandasOnRayIO(PandasOnRayIO):
             to include in each chunk.
         partition_column : str, optional
             Column name used for data partitioning between the workers
-            (MUST be an INTEGER column).
+            (MUST be an INTEGER column). If the bounds are not specified, they
+            are found from the quantiles of the column values.
         lower_bound : int, optional
             The minimum value to be requested from the `partition_column`.
         upper_bound : int, optional
@@ -148,6 +157,7 @@ class ExperimentalPandasOnRayIO(PandasOnRayIO):
                 parse_dates=parse_dates,
                 columns=columns,
                 chunksize=chunksize,
+                partition_column=partition_column,
             )
         #  starts the distributed alternative
         cols_names, query = get_query_info(sql, con, partition_column)
@@ -44,12 +44,14 @@ def is_distributed(partition_column, lower_bound, upper_bound):
             return True
         else:
             raise InvalidArguments("upper_bound must be greater than lower_bound.")
-    elif (partition_column is None) and (lower_bound is None) and (upper_bound is None):
+    elif (lower_bound is None) and (upper_bound is None):
+        # The core implementation finds the bounds of `partition_column` itself
         return False
     else:
         raise InvalidArguments(
             "Invalid combination of partition_column, lower_bound, upper_bound."
-            "All these arguments should be passed (distributed) or none of them (standard pandas)."
+            "All these arguments should be passed (distributed), only partition_column "
+            "(distributed with the bounds found by Modin) or none of them."
         )
 
 
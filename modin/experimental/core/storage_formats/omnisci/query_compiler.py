@@ -384,7 +384,7 @@ class DFAlgQueryCompiler(BaseQueryCompiler):
     def mean(self, **kwargs):
         return self._agg("mean", **kwargs)
 
-    def nunique(self, axis=0, dropna=True):
+    def nunique(self, axis=0, dropna=True, approx=False):
         if axis != 0 or not dropna:
             raise NotImplementedError(
                 f"OmniSci's nunique does not support such set of parameters: axis={axis}, dropna={dropna}."
@@ -44,6 +44,7 @@ from .io import (  # noqa F401
     read_sql,
     read_csv_glob,
     read_pickle_distributed,
+    read_hdf_keys,
     to_pickle_distributed,
 )
 import warnings
@@ -85,6 +85,8 @@ def read_sql(
         number of rows to include in each chunk.
     partition_column : str, optional
         Column used to share the data between the workers (MUST be a INTEGER column).
+        If `lower_bound` and `upper_bound` are not specified, they are found from
+        the quantiles of the column values on every engine.
     lower_bound : int, optional
         The minimum value to be requested from the partition_column.
     upper_bound : int, optional
@@ -287,6 +289,38 @@ def read_pickle_distributed(
     return DataFrame(query_compiler=FactoryDispatcher.read_pickle_distributed(**kwargs))
 
 
+def read_hdf_keys(path_or_buf, keys, **kwargs) -> dict:
+    """
+    Read several groups of an HDF store into a dict of DataFrames.
+
+    This experimental feature launches reading of all the groups before waiting
+    for any of them, so the groups are read in parallel with each other.
+
+    Parameters
+    ----------
+    path_or_buf : str or path object
+        Path to the HDF file.
+    keys : list
+        Keys of the groups to read.
+    **kwargs : dict
+        Keyword arguments of ``read_hdf`` applied to every group.
+
+    Returns
+    -------
+    dict
+        DataFrames keyed by the group keys.
+    """
+    Engine.subscribe(_update_engine)
+    assert IsExperimental.get(), "This only works in experimental mode"
+    query_compilers = FactoryDispatcher.read_hdf_keys(
+        path_or_buf=path_or_buf, keys=keys, **kwargs
+    )
+    return {
+        key: DataFrame(query_compiler=query_compiler)
+        for key, query_compiler in query_compilers.items()
+    }
+
+
 def to_pickle_distributed(
     self,
     filepath_or_buffer,
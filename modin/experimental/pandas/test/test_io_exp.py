@@ -18,7 +18,12 @@ import pytest
 import modin.experimental.pandas as pd
 from modin.config import Engine
 from modin.utils import get_current_execution
-from modin.pandas.test.utils import df_equals, teardown_test_files, test_data
+from modin.pandas.test.utils import (
+    df_equals,
+    get_unique_filename,
+    teardown_test_files,
+    test_data,
+)
 from modin.test.test_utils import warns_that_defaulting_to_pandas
 
 
@@ -75,6 +80,23 @@ def test_from_sql_defaults(make_sql_connection):  # noqa: F811
     df_equals(modin_df_from_table, pandas_df)
 
 
+@pytest.mark.skipif(
+    Engine.get() == "Dask",
+    reason="Dask does not have experimental API",
+)
+def test_from_sql_partition_column_without_bounds(make_sql_connection):  # noqa: F811
+    filename = "test_from_sql_partition_column_without_bounds.db"
+    table = "test_from_sql_partition_column_without_bounds"
+    conn = make_sql_connection(filename, table)
+    query = "select * from {0}".format(table)
+
+    pandas_df = pandas.read_sql(query, conn)
+    # The bounds of the column ranges are found by Modin
+    modin_df = pd.read_sql(query, conn, partition_column="col2")
+
+    df_equals(modin_df, pandas_df)
+
+
 @pytest.mark.usefixtures("TestReadGlobCSVFixture")
 @pytest.mark.skipif(
     Engine.get() != "Ray", reason="Currently only support Ray engine for glob paths."
@@ -114,6 +136,20 @@ class TestCsvGlob:
 
         df_equals(modin_df, pandas_df)
 
+    def test_read_csv_glob_part_files(self, tmp_path):
+        pandas_df = pandas.DataFrame(
+            {"a": range(120), "b": [i / 2 for i in range(120)]}
+        )
+        # Every piece is its own row partition, so more than ten files are written
+        modin_df = pd.concat(
+            [pd.DataFrame(pandas_df.iloc[i : i + 10]) for i in range(0, 120, 10)]
+        )
+        modin_df.to_csv(str(tmp_path / "part*.csv"), index=False)
+        df_equals(
+            pd.read_csv_glob(str(tmp_path / "part*.csv")).reset_index(drop=True),
+            pandas_df,
+        )
+
     def test_read_csv_without_glob(self):
         with pytest.warns(UserWarning, match=r"Shell-style wildcard"):
             with pytest.raises(FileNotFoundError):
@@ -199,3 +235,19 @@ def test_distributed_pickling(filename, compression):
 
     pickle_files = glob.glob(filename)
     teardown_test_files(pickle_files)
+
+
+def test_read_hdf_keys():
+    unique_filename = get_unique_filename(extension="hdf")
+    try:
+        pandas_df = pandas.DataFrame(test_data["int_data"])
+        pandas_df.to_hdf(unique_filename, key="fixed")
+        pandas_df.to_hdf(unique_filename, key="table", format="table")
+
+        keys = ["table", "fixed"]
+        modin_dfs = pd.read_hdf_keys(unique_filename, keys)
+        assert list(modin_dfs.keys()) == keys
+        for key in keys:
+            df_equals(modin_dfs[key], pandas.read_hdf(unique_filename, key=key))
+    finally:
+        teardown_test_files([unique_filename])
@@ -1833,10 +1833,10 @@ class BasePandasDataset(object):
 
     notnull = notna
 
-    def nunique(self, axis=0, dropna=True):
+    def nunique(self, axis=0, dropna=True, approx=False):
         axis = self._get_axis_number(axis)
         return self._reduce_dimension(
-            self._query_compiler.nunique(axis=axis, dropna=dropna)
+            self._query_compiler.nunique(axis=axis, dropna=dropna, approx=approx)
         )
 
     def pct_change(self, periods=1, fill_method="pad", limit=None, freq=None, **kwargs):
@@ -1864,7 +1864,9 @@ class BasePandasDataset(object):
 
     radd = add
 
-    def quantile(self, q=0.5, axis=0, numeric_only=True, interpolation="linear"):
+    def quantile(
+        self, q=0.5, axis=0, numeric_only=True, interpolation="linear", approx=False
+    ):
         axis = self._get_axis_number(axis)
 
         def check_dtype(t):
@@ -1904,6 +1906,7 @@ class BasePandasDataset(object):
                     axis=axis,
                     numeric_only=numeric_only,
                     interpolation=interpolation,
+                    approx=approx,
                 )
             )
         else:
@@ -1913,6 +1916,7 @@ class BasePandasDataset(object):
                     axis=axis,
                     numeric_only=numeric_only,
                     interpolation=interpolation,
+                    approx=approx,
                 )
             )
             if isinstance(result, BasePandasDataset):
@@ -3148,6 +3152,8 @@ class BasePandasDataset(object):
             if callable(attr) and self.empty and hasattr(self._pandas_class, item):
 
                 def default_handler(*args, **kwargs):
+                    # `approx` is a Modin extension, pandas does not accept it
+                    kwargs.pop("approx", None)
                     return self._default_to_pandas(item, *args, **kwargs)
 
                 return default_handler
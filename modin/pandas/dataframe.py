@@ -1203,9 +1203,11 @@ class DataFrame(BasePandasDataset):
         Iterate over ``DataFrame`` rows as (index, ``Series``) pairs.
         """
 
-        def iterrow_builder(s):
-            """Return tuple of the given `s` parameter name and the parameter themself."""
-            return s.name, s
+        def iterrow_builder(df):
+            """Return the iterator over (index, ``pandas.Series``) pairs of the given `df`."""
+            # The rows are already on the driver, wrapping each of them into a Modin
+            # Series would put every row back into the engine
+            return df.iterrows()
 
         partition_iterator = PartitionIterator(self, 0, iterrow_builder)
         for v in partition_iterator:
@@ -1235,9 +1237,9 @@ class DataFrame(BasePandasDataset):
         Iterate over ``DataFrame`` rows as ``namedtuple``-s.
         """
 
-        def itertuples_builder(s):
-            """Return the next ``namedtuple``."""
-            return next(s._to_pandas().to_frame().T.itertuples(index=index, name=name))
+        def itertuples_builder(df):
+            """Return the iterator over ``namedtuple``-s of the given `df`."""
+            return df.itertuples(index=index, name=name)
 
         partition_iterator = PartitionIterator(self, 0, itertuples_builder)
         for v in partition_iterator:
@@ -128,7 +128,11 @@ class DataFrameGroupBy(object):
         return self._default_to_pandas(lambda df: df.ffill(limit=limit))
 
     def sem(self, ddof=1):
-        return self._default_to_pandas(lambda df: df.sem(ddof=ddof))
+        return self._wrap_aggregation(
+            type(self._query_compiler).groupby_sem,
+            agg_kwargs=dict(ddof=ddof),
+            numeric_only=True,
+        )
 
     def mean(self, numeric_only=None):
         return self._check_index(
@@ -712,23 +716,25 @@ class DataFrameGroupBy(object):
     def ngroup(self, ascending=True):
         return self._default_to_pandas(lambda df: df.ngroup(ascending))
 
-    def nunique(self, dropna=True):
+    def nunique(self, dropna=True, approx=False):
         return self._check_index(
             self._wrap_aggregation(
                 type(self._query_compiler).groupby_nunique,
                 numeric_only=False,
                 agg_kwargs=dict(dropna=dropna),
+                approx=approx,
             )
         )
 
     def resample(self, rule, *args, **kwargs):
         return self._default_to_pandas(lambda df: df.resample(rule, *args, **kwargs))
 
-    def median(self, numeric_only=None):
+    def median(self, numeric_only=None, approx=False):
         return self._check_index(
             self._wrap_aggregation(
                 type(self._query_compiler).groupby_median,
                 numeric_only=numeric_only,
+                approx=approx,
             )
         )
 
@@ -820,7 +826,7 @@ class DataFrameGroupBy(object):
     def hist(self):
         return self._default_to_pandas(lambda df: df.hist())
 
-    def quantile(self, q=0.5, interpolation="linear"):
+    def quantile(self, q=0.5, interpolation="linear", approx=False):
         if is_list_like(q):
             return self._default_to_pandas(
                 lambda df: df.quantile(q=q, interpolation=interpolation)
@@ -831,6 +837,7 @@ class DataFrameGroupBy(object):
                 type(self._query_compiler).groupby_quantile,
                 numeric_only=False,
                 agg_kwargs=dict(q=q, interpolation=interpolation),
+                approx=approx,
             )
         )
 
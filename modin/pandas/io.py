@@ -57,9 +57,11 @@ def _read(**kwargs):
     from modin.core.execution.dispatching.factories.dispatcher import FactoryDispatcher
 
     squeeze = kwargs.pop("squeeze", False)
+    from modin.core.io.text.text_file_chunk_reader import TextFileChunkReader
+
     pd_obj = FactoryDispatcher.read_csv(**kwargs)
     # This happens when `read_csv` returns a TextFileReader object for iterating through
-    if isinstance(pd_obj, pandas.io.parsers.TextFileReader):
+    if isinstance(pd_obj, (pandas.io.parsers.TextFileReader, TextFileChunkReader)):
         reader = pd_obj.read
         pd_obj.read = lambda *args, **kwargs: DataFrame(
             query_compiler=reader(*args, **kwargs)
@@ -488,6 +490,7 @@ def read_fwf(
     Engine.subscribe(_update_engine)
     from modin.core.execution.dispatching.factories.dispatcher import FactoryDispatcher
     from pandas.io.parsers.base_parser import parser_defaults
+    from modin.core.io.text.text_file_chunk_reader import TextFileChunkReader
 
     _, _, _, kwargs = inspect.getargvalues(inspect.currentframe())
     kwargs.update(kwargs.pop("kwds", {}))
@@ -495,7 +498,7 @@ def read_fwf(
     target_kwargs.update(kwargs)
     pd_obj = FactoryDispatcher.read_fwf(**target_kwargs)
     # When `read_fwf` returns a TextFileReader object for iterating through
-    if isinstance(pd_obj, pandas.io.parsers.TextFileReader):
+    if isinstance(pd_obj, (pandas.io.parsers.TextFileReader, TextFileChunkReader)):
         reader = pd_obj.read
         pd_obj.read = lambda *args, **kwargs: DataFrame(
             query_compiler=reader(*args, **kwargs)
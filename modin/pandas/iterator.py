@@ -14,12 +14,18 @@
 """Place to define the Modin iterator."""
 
 from collections.abc import Iterator
+from itertools import chain
+
+from modin.config import IteratorPrefetch
 
 
 class PartitionIterator(Iterator):
     """
     Iterator on partitioned data.
 
+    Rows are iterated over row partition by row partition converted to pandas,
+    while the next ``IteratorPrefetch`` row partitions are fetched in the background.
+
     Parameters
     ----------
     df : modin.pandas.DataFrame
@@ -27,24 +33,26 @@ class PartitionIterator(Iterator):
     axis : {0, 1}
         Axis to iterate over.
     func : callable
-        The function to get inner iterables from each partition.
+        The function to get inner iterables from each row partition
+        (a ``pandas.DataFrame``) if `axis` is 0, or the function to apply
+        to each column (a ``modin.pandas.Series``) if `axis` is 1.
     """
 
     def __init__(self, df, axis, func):
         self.df = df
         self.axis = axis
-        self.index_iter = (
-            zip(
-                iter(slice(None) for _ in range(len(self.df.columns))),
-                range(len(self.df.columns)),
+        self.func = func
+        if axis:
+            self.iterator = (
+                func(self.df.iloc[:, i]) for i in range(len(self.df.columns))
             )
-            if axis
-            else zip(
-                range(len(self.df.index)),
-                iter(slice(None) for _ in range(len(self.df.index))),
+        else:
+            self.iterator = chain.from_iterable(
+                func(partition)
+                for partition in self.df._query_compiler.to_pandas_chunks(
+                    prefetch=IteratorPrefetch.get()
+                )
             )
-        )
-        self.func = func
 
     def __iter__(self):
         """
@@ -66,6 +74,4 @@ class PartitionIterator(Iterator):
         PartitionIterator
             Incremented iterator object.
         """
-        key = next(self.index_iter)
-        df = self.df.iloc[key]
-        return self.func(df)
+        return next(self.iterator)
@@ -1215,8 +1215,8 @@ class Series(BasePandasDataset):
         Lazily iterate over (index, value) tuples.
         """
 
-        def item_builder(s):
-            return s.name, s.squeeze()
+        def item_builder(df):
+            return df.iloc[:, 0].items()
 
         partition_iterator = PartitionIterator(self.to_frame(), 0, item_builder)
         for v in partition_iterator:
@@ -1690,12 +1690,14 @@ class Series(BasePandasDataset):
 
     rdiv = rtruediv
 
-    def quantile(self, q=0.5, interpolation="linear"):  # noqa: PR01, RT01, D200
+    def quantile(
+        self, q=0.5, interpolation="linear", approx=False
+    ):  # noqa: PR01, RT01, D200
         """
         Return value at the given quantile.
         """
         return super(Series, self).quantile(
-            q=q, numeric_only=False, interpolation=interpolation
+            q=q, numeric_only=False, interpolation=interpolation, approx=approx
         )
 
     def reorder_levels(self, order):  # noqa: PR01, RT01, D200
@@ -2208,11 +2210,11 @@ class Series(BasePandasDataset):
         """
         return 1
 
-    def nunique(self, dropna=True):  # noqa: PR01, RT01, D200
+    def nunique(self, dropna=True, approx=False):  # noqa: PR01, RT01, D200
         """
         Return number of unique elements in the object.
         """
-        return super(Series, self).nunique(dropna=dropna)
+        return super(Series, self).nunique(dropna=dropna, approx=approx)
 
     @property
     def shape(self):  # noqa: RT01, D200
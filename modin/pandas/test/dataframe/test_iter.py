@@ -29,7 +29,7 @@ from modin.pandas.test.utils import (
     create_test_dfs,
     test_data,
 )
-from modin.config import NPartitions
+from modin.config import NPartitions, IteratorPrefetch
 from modin.test.test_utils import warns_that_defaulting_to_pandas
 
 NPartitions.put(4)
@@ -52,6 +52,49 @@ def test_items_iteritems_iterrows(method):
         assert pandas_index == modin_index
 
 
+@pytest.mark.parametrize("prefetch", [0, 1, 8])
+def test_iterrows_itertuples_prefetch(prefetch):
+    modin_df, pandas_df = create_test_dfs(
+        {"a": np.arange(1000), "b": np.arange(1000) * 0.5, "c": ["x", "y"] * 500}
+    )
+    modin_df.index = pandas_df.index = [f"i{i}" for i in range(1000)]
+    old_prefetch = IteratorPrefetch.get()
+    try:
+        IteratorPrefetch.put(prefetch)
+        modin_rows = list(modin_df.iterrows())
+        assert len(modin_rows) == len(pandas_df)
+        for (modin_index, modin_row), (pandas_index, pandas_row) in zip(
+            modin_rows, pandas_df.iterrows()
+        ):
+            assert modin_index == pandas_index
+            df_equals(modin_row, pandas_row)
+        # Abandoning the iteration must not wait for the prefetched partitions
+        assert next(modin_df.itertuples()) == next(pandas_df.itertuples())
+        assert list(modin_df.itertuples()) == list(pandas_df.itertuples())
+    finally:
+        IteratorPrefetch.put(old_prefetch)
+
+
+def test_iterrows_does_not_put_rows(monkeypatch):
+    modin_df = pd.DataFrame({"a": np.arange(100), "b": np.arange(100) * 0.5})
+    partition_cls = (
+        modin_df._query_compiler._modin_frame._partition_mgr_cls._partition_class
+    )
+    puts = []
+    put = partition_cls.put
+
+    def counting_put(obj):
+        puts.append(obj)
+        return put(obj)
+
+    monkeypatch.setattr(partition_cls, "put", counting_put)
+    rows = list(modin_df.iterrows())
+    assert len(rows) == 100
+    # The rows are taken from the fetched row partitions, none of them
+    # is put back into the engine
+    assert len(puts) == 0
+
+
 @pytest.mark.parametrize("name", [None, "NotPandas"])
 def test_itertuples_name(name):
     data = test_data["float_nan_data"]
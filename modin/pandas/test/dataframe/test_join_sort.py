@@ -31,11 +31,12 @@ from modin.pandas.test.utils import (
     test_data,
     generate_multiindex,
     eval_general,
+    create_test_dfs,
     rotate_decimal_digits_or_symbols,
     extra_test_parameters,
     default_to_pandas_ignore_string,
 )
-from modin.config import NPartitions
+from modin.config import NPartitions, BroadcastJoinThreshold
 from modin.test.test_utils import warns_that_defaulting_to_pandas
 
 NPartitions.put(4)
@@ -327,6 +328,75 @@ def test_merge(test_data, test_data2):
         modin_df.merge("Non-valid type")
 
 
+@pytest.mark.parametrize("how", ["left", "right", "inner", "outer"])
+@pytest.mark.parametrize("on", ["key", ["key", "key2"]])
+@pytest.mark.parametrize("sort", [False, True])
+def test_merge_shuffle(how, on, sort):
+    random_state = np.random.RandomState(42)
+    left_keys = random_state.randint(0, 60, 400).astype(float)
+    left_keys[::37] = np.nan
+    frame_data = {
+        "key": left_keys,
+        "key2": random_state.randint(0, 3, 400),
+        "value": np.arange(400),
+    }
+    frame_data2 = {
+        "key": random_state.randint(20, 80, 300),
+        "key2": random_state.randint(0, 3, 300),
+        "value": np.arange(300),
+    }
+    old_threshold = BroadcastJoinThreshold.get()
+    BroadcastJoinThreshold.put(0)
+    try:
+        eval_general(
+            *create_test_dfs(frame_data),
+            lambda df: df.merge(
+                (pd if isinstance(df, pd.DataFrame) else pandas).DataFrame(frame_data2),
+                how=how,
+                on=on,
+                sort=sort,
+            ),
+        )
+    finally:
+        BroadcastJoinThreshold.put(old_threshold)
+
+
+@pytest.mark.parametrize("how", ["left", "right", "inner", "outer"])
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"left_index": True, "right_on": "key"},
+        {"left_on": "key", "right_index": True},
+        {"on": "key", "lsuffix": "_left", "rsuffix": "_right"},
+    ],
+    ids=["left_index", "right_index", "join"],
+)
+@pytest.mark.parametrize("sort", [False, True])
+def test_merge_shuffle_index(how, kwargs, sort):
+    random_state = np.random.RandomState(42)
+    frame_data = {"key": random_state.randint(0, 60, 400), "value": np.arange(400)}
+    frame_data2 = {"key": random_state.randint(20, 80, 300), "value": np.arange(300)}
+    index = random_state.permutation(400) % 70
+    index2 = random_state.permutation(300) % 90
+    # The right frame is considered too large to be broadcast
+    old_threshold = BroadcastJoinThreshold.get()
+    BroadcastJoinThreshold.put(0)
+    try:
+
+        def merge(df):
+            right = (pd if isinstance(df, pd.DataFrame) else pandas).DataFrame(
+                frame_data2, index=index2
+            )
+            if "on" in kwargs:
+                return df.join(right, how=how, sort=sort, **kwargs)
+            return df.merge(right, how=how, sort=sort, **kwargs)
+
+        modin_df, pandas_df = create_test_dfs(frame_data, index=index)
+        df_equals(merge(modin_df), merge(pandas_df))
+    finally:
+        BroadcastJoinThreshold.put(old_threshold)
+
+
 @pytest.mark.parametrize("axis", [0, 1])
 @pytest.mark.parametrize(
     "ascending", bool_arg_values, ids=arg_keys("ascending", bool_arg_keys)
@@ -499,6 +569,10 @@ def test_sort_values(
         start = 0 if ascending == "list_first_False" else 1
         ascending = [i & 1 > 0 for i in range(start, len(by_list) + start)]
 
+    # Modin keeps the original order of the rows with equal values whatever `kind`
+    # is, which pandas does only for the stable sorts
+    pandas_kind = "stable" if axis in (0, "index") else kind
+
     eval_general(
         modin_df,
         pandas_df,
@@ -507,7 +581,7 @@ def test_sort_values(
             axis=axis,
             ascending=ascending,
             inplace=inplace,
-            kind=kind,
+            kind=kind if isinstance(df, pd.DataFrame) else pandas_kind,
             na_position=na_position,
             ignore_index=ignore_index,
             key=key,
@@ -77,6 +77,38 @@ def test_cummin_cummax_int_and_float(axis, method):
     eval_general(*create_test_dfs(data), lambda df: getattr(df, method)(axis=axis))
 
 
+@pytest.mark.parametrize(
+    "skipna", bool_arg_values, ids=arg_keys("skipna", bool_arg_keys)
+)
+@pytest.mark.parametrize("method", ["cumprod", "cummin", "cummax", "cumsum"])
+def test_cumulative_scan_mixed_types(skipna, method):
+    data = {
+        "floats": [i * 0.01 + 0.5 for i in range(1000)],
+        "ints": [i % 7 - 3 for i in range(1000)],
+        "bools": [i % 3 == 0 for i in range(1000)],
+        "nans": [np.nan] * 1000,
+    }
+    # NaN values in the beginning and at the end of the row partitions
+    for i in [0, 1, 250, 499, 500, 999]:
+        data["floats"][i] = np.nan
+    eval_general(*create_test_dfs(data), lambda df: getattr(df, method)(skipna=skipna))
+
+
+@pytest.mark.parametrize(
+    "skipna", bool_arg_values, ids=arg_keys("skipna", bool_arg_keys)
+)
+@pytest.mark.parametrize("method", ["cumprod", "cummin", "cummax", "cumsum"])
+def test_cumulative_scan_extension_types(skipna, method):
+    data = {
+        "ints": pandas.array([i % 3 for i in range(1000)], dtype="Int64"),
+        "floats": pandas.array([1 + i * 1e-4 for i in range(1000)], dtype="Float64"),
+        "bools": pandas.array([i % 2 == 0 for i in range(1000)], dtype="boolean"),
+    }
+    for values in data.values():
+        values[[51, 499, 500]] = pandas.NA
+    eval_general(*create_test_dfs(data), lambda df: getattr(df, method)(skipna=skipna))
+
+
 @pytest.mark.parametrize("axis", [0, 1])
 @pytest.mark.parametrize(
     "periods", int_arg_values, ids=arg_keys("periods", int_arg_keys)
@@ -645,6 +677,60 @@ def test_quantile(request, data, q):
             modin_df.T.quantile(q)
 
 
+@pytest.mark.parametrize("dropna", [True, False])
+def test_nunique_approx(dropna):
+    random_state = np.random.RandomState(seed=42)
+    data = {
+        "small": random_state.randint(0, 100, 10000),
+        "large": random_state.randint(0, 10 ** 6, 10000),
+        "floats": random_state.rand(10000),
+        "strings": random_state.choice(["a", "b", "c", None], 10000),
+    }
+    modin_result = pd.DataFrame(data).nunique(dropna=dropna, approx=True)
+    pandas_result = pandas.DataFrame(data).nunique(dropna=dropna)
+    np.testing.assert_allclose(
+        modin_result.to_numpy(), pandas_result.to_numpy(), rtol=0.05
+    )
+    # a handful of values is counted exactly
+    assert modin_result["strings"] == pandas_result["strings"]
+
+
+@pytest.mark.parametrize("q", [0.5, [0.01, 0.25, 0.5, 0.75, 0.99]])
+def test_quantile_approx(q):
+    random_state = np.random.RandomState(seed=42)
+    data = {
+        "normal": random_state.randn(10000),
+        "ints": random_state.randint(0, 10 ** 6, 10000),
+        "strings": random_state.choice(["a", "b", "c"], 10000),
+    }
+    data["normal"][::10] = np.nan
+    modin_result = pd.DataFrame(data).quantile(q, approx=True)
+    pandas_result = pandas.DataFrame(data).quantile(q)
+    assert modin_result.shape == pandas_result.shape
+    # estimated values are compared by their ranks
+    for col in ["normal", "ints"]:
+        values = pandas.Series(data[col]).dropna()
+        estimated = np.atleast_1d(modin_result[col])
+        ranks = [(values <= value).mean() for value in estimated]
+        np.testing.assert_allclose(ranks, np.atleast_1d(q), atol=0.01)
+
+
+def test_approx_exact_fallbacks():
+    # `approx` is dropped when defaulting to pandas on empty frames
+    modin_df = pd.DataFrame({"a": []})
+    for method, args in [("quantile", (0.5,)), ("nunique", ())]:
+        with warns_that_defaulting_to_pandas():
+            modin_result = getattr(modin_df, method)(*args, approx=True)
+        with warns_that_defaulting_to_pandas():
+            df_equals(modin_result, getattr(modin_df, method)(*args))
+    # only the linear interpolation is estimated, others are computed exactly
+    data = {"ints": np.random.RandomState(seed=42).randint(0, 10 ** 6, 10000)}
+    df_equals(
+        pd.DataFrame(data).quantile([0.1, 0.9], interpolation="lower", approx=True),
+        pandas.DataFrame(data).quantile([0.1, 0.9], interpolation="lower"),
+    )
+
+
 @pytest.mark.parametrize("axis", ["rows", "columns"])
 @pytest.mark.parametrize(
     "na_option", ["keep", "top", "bottom"], ids=["keep", "top", "bottom"]
@@ -172,6 +172,8 @@ def test_dataframe_api_equality():
 
     # These have to be checked manually
     allowed_different = ["to_hdf", "hist"]
+    # Modin extensions of the pandas API
+    allowed_extra_params = ["approx"]
     difference = []
 
     # Check that we don't have extra params
@@ -231,7 +233,11 @@ def test_dataframe_api_equality():
         if not pandas_sig == modin_sig:
             append_val = (
                 m,
-                {i: modin_sig[i] for i in modin_sig.keys() if i not in pandas_sig},
+                {
+                    i: modin_sig[i]
+                    for i in modin_sig.keys()
+                    if i not in pandas_sig and i not in allowed_extra_params
+                },
             )
             try:
                 # This validates that there are actually values to add to the difference
@@ -259,6 +265,8 @@ def test_series_api_equality():
 
     # These have to be checked manually
     allowed_different = ["to_hdf", "hist"]
+    # Modin extensions of the pandas API
+    allowed_extra_params = ["approx"]
     difference = []
 
     for m in modin_dir:
@@ -311,7 +319,11 @@ def test_series_api_equality():
         if not pandas_sig == modin_sig:
             append_val = (
                 m,
-                {i: modin_sig[i] for i in modin_sig.keys() if i not in pandas_sig},
+                {
+                    i: modin_sig[i]
+                    for i in modin_sig.keys()
+                    if i not in pandas_sig and i not in allowed_extra_params
+                },
             )
             try:
                 # This validates that there are actually values to add to the difference
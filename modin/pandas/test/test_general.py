@@ -11,7 +11,6 @@
 # ANY KIND, either express or implied. See the License for the specific language
 # governing permissions and limitations under the License.
 
-import contextlib
 import pandas
 import pytest
 import modin.pandas as pd
@@ -109,8 +108,7 @@ def test_merge():
 
     join_types = ["outer", "inner"]
     for how in join_types:
-        with warns_that_defaulting_to_pandas() if how == "outer" else contextlib.nullcontext():
-            modin_result = pd.merge(modin_df, modin_df2, how=how)
+        modin_result = pd.merge(modin_df, modin_df2, how=how)
         pandas_result = pandas.merge(pandas_df, pandas_df2, how=how)
         df_equals(modin_result, pandas_result)
 
@@ -135,28 +133,18 @@ def test_merge():
         df_equals(modin_result, pandas_result)
 
         # left_on and right_on col1
-        if how == "outer":
-            warning_catcher = warns_that_defaulting_to_pandas()
-        else:
-            warning_catcher = contextlib.nullcontext()
-        with warning_catcher:
-            modin_result = pd.merge(
-                modin_df, modin_df2, how=how, left_on="col1", right_on="col1"
-            )
+        modin_result = pd.merge(
+            modin_df, modin_df2, how=how, left_on="col1", right_on="col1"
+        )
         pandas_result = pandas.merge(
             pandas_df, pandas_df2, how=how, left_on="col1", right_on="col1"
         )
         df_equals(modin_result, pandas_result)
 
         # left_on and right_on col2
-        if how == "outer":
-            warning_catcher = warns_that_defaulting_to_pandas()
-        else:
-            warning_catcher = contextlib.nullcontext()
-        with warning_catcher:
-            modin_result = pd.merge(
-                modin_df, modin_df2, how=how, left_on="col2", right_on="col2"
-            )
+        modin_result = pd.merge(
+            modin_df, modin_df2, how=how, left_on="col2", right_on="col2"
+        )
         pandas_result = pandas.merge(
             pandas_df, pandas_df2, how=how, left_on="col2", right_on="col2"
         )
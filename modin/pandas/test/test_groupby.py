@@ -13,6 +13,7 @@
 
 import pytest
 import itertools
+import contextlib
 import pandas
 import numpy as np
 import modin.pandas as pd
@@ -33,7 +34,7 @@ from .utils import (
     value_equals,
     default_to_pandas_ignore_string,
 )
-from modin.config import NPartitions
+from modin.config import NPartitions, GroupbyShuffleThreshold, GroupbyShuffleUnsorted
 
 NPartitions.put(4)
 
@@ -2076,3 +2077,202 @@ def test_sum_with_level():
     }
     modin_df, pandas_df = pd.DataFrame(data), pandas.DataFrame(data)
     eval_general(modin_df, pandas_df, lambda df: df.set_index("C").groupby("C").sum())
+
+
+@contextlib.contextmanager
+def config_value(parameter, value):
+    old_value = parameter.get()
+    parameter.put(value)
+    try:
+        yield
+    finally:
+        parameter.put(old_value)
+
+
+@pytest.fixture
+def shuffle_every_groupby():
+    with config_value(GroupbyShuffleThreshold, 0):
+        yield
+
+
+@pytest.mark.parametrize("by", ["key1", ["key1", "key2"]])
+@pytest.mark.parametrize("as_index", [True, False])
+def test_groupby_shuffle_reduce(by, as_index, shuffle_every_groupby):
+    random_state = np.random.RandomState(seed=42)
+    data = {
+        "key1": random_state.randint(0, 200, 1000),
+        "key2": random_state.choice(["a", "b", "c"], 1000),
+        "value1": random_state.rand(1000),
+        "value2": np.arange(1000),
+    }
+    md_df, pd_df = create_test_dfs(data)
+    md_grp = md_df.groupby(by, as_index=as_index)
+    pd_grp = pd_df.groupby(by, as_index=as_index)
+    eval_general(md_grp, pd_grp, lambda grp: grp.sum())
+    eval_general(md_grp, pd_grp, lambda grp: grp.count())
+    eval_general(md_grp, pd_grp, lambda grp: grp.agg({"value1": "max"}))
+
+
+@pytest.mark.parametrize("by", ["key1", ["key1", "key2"]])
+def test_groupby_shuffle_reduce_unsorted(by, shuffle_every_groupby):
+    random_state = np.random.RandomState(seed=42)
+    data = {
+        "key1": random_state.randint(0, 200, 1000),
+        "key2": random_state.choice(["a", "b", "c"], 1000),
+        "value": random_state.rand(1000),
+    }
+    md_df, pd_df = create_test_dfs(data)
+    # The groups are not shuffled by default, so they keep the order of their
+    # first appearance
+    eval_general(md_df, pd_df, lambda df: df.groupby(by, sort=False).sum())
+    with config_value(GroupbyShuffleUnsorted, True):
+        # The shuffled groups come in the order of their buckets
+        df_equals(
+            md_df.groupby(by, sort=False).sum().sort_index(),
+            pd_df.groupby(by, sort=False).sum().sort_index(),
+        )
+
+
+@pytest.mark.parametrize("by", ["key", ["key", "flag"]])
+@pytest.mark.parametrize("as_index", [True, False])
+def test_groupby_moments(by, as_index):
+    random_state = np.random.RandomState(seed=42)
+    data = {
+        "key": random_state.randint(0, 20, 1000),
+        "flag": random_state.choice(["a", "b"], 1000),
+        # large offset checks that the moments are not computed from raw power sums
+        "offset": random_state.rand(1000) + 1e9,
+        "value": random_state.randint(0, 100, 1000).astype(float),
+        "ints": np.arange(1000),
+    }
+    data["value"][::7] = np.nan
+    md_df, pd_df = create_test_dfs(data)
+    md_grp = md_df.groupby(by, as_index=as_index)
+    pd_grp = pd_df.groupby(by, as_index=as_index)
+    for func in ["mean", "var", "std", "sem"]:
+        eval_general(
+            md_grp,
+            pd_grp,
+            lambda grp: getattr(grp[["offset", "value", "ints"]], func)(),
+        )
+    # pandas loses precision computing skew of the offset column itself
+    eval_general(md_grp, pd_grp, lambda grp: grp[["value", "ints"]].skew())
+    eval_general(md_grp, pd_grp, lambda grp: grp[["offset", "value"]].std(ddof=0))
+    eval_general(
+        md_grp,
+        pd_grp,
+        lambda grp: grp.agg({"offset": "std", "value": "mean", "ints": "sum"}),
+    )
+    eval_general(
+        md_grp,
+        pd_grp,
+        lambda grp: grp.agg({"offset": ["var", "count"], "value": ["skew", "max"]}),
+    )
+
+
+@pytest.mark.parametrize("as_index", [True, False])
+def test_groupby_approx_sketches(as_index):
+    random_state = np.random.RandomState(seed=42)
+    data = {
+        "key": random_state.randint(0, 10, 10000),
+        "ints": random_state.randint(0, 10 ** 6, 10000),
+        "floats": random_state.rand(10000),
+    }
+    md_df, pd_df = create_test_dfs(data)
+    md_grp = md_df.groupby("key", as_index=as_index)
+    pd_grp = pd_df.groupby("key", as_index=as_index)
+    for func, kwargs, rtol in [
+        ("nunique", {}, 0.05),
+        ("median", {}, 0.02),
+        ("quantile", {"q": 0.9}, 0.02),
+        # only the linear interpolation is estimated, others are computed exactly
+        ("quantile", {"q": 0.9, "interpolation": "lower"}, 0),
+    ]:
+        modin_result = getattr(md_grp, func)(approx=True, **kwargs)
+        pandas_result = getattr(pd_grp, func)(**kwargs)
+        df_equals(modin_result.index, pandas_result.index)
+        df_equals(modin_result.columns, pandas_result.columns)
+        np.testing.assert_allclose(
+            try_cast_to_pandas(modin_result).to_numpy(dtype=np.float64),
+            pandas_result.to_numpy(dtype=np.float64),
+            rtol=rtol,
+        )
+
+
+@pytest.mark.parametrize("by", ["key", ["key", "flag"]])
+@pytest.mark.parametrize("dropna", [True, False])
+@pytest.mark.parametrize("method", ["cumsum", "cumprod", "cummax", "cummin"])
+def test_groupby_cumulative_scan(by, dropna, method):
+    random_state = np.random.RandomState(seed=42)
+    data = {
+        # pandas leaves garbage in the rows of NaN keys dropped from the groups
+        "key": random_state.choice([0, 1, 2] if dropna else [0, 1, 2, np.nan], 1000),
+        "flag": random_state.choice(["a", "b"], 1000),
+        "value": random_state.rand(1000) + 0.5,
+        "ints": random_state.randint(-3, 4, 1000),
+        "bools": random_state.choice([True, False], 1000),
+    }
+    data["value"][::7] = np.nan
+    md_df, pd_df = create_test_dfs(data)
+    # the groups are spread across all of the row partitions
+    eval_general(
+        md_df,
+        pd_df,
+        lambda df: getattr(df.groupby(by, dropna=dropna), method)(),
+    )
+
+
+@pytest.mark.parametrize("observed", [True, False])
+def test_groupby_shuffle_reduce_categorical(observed, shuffle_every_groupby):
+    random_state = np.random.RandomState(seed=42)
+    data = {
+        "key": pandas.Categorical(
+            random_state.choice(["a", "b", "c", "d"], 1000),
+            categories=["d", "c", "b", "a", "unused"],
+        ),
+        "value": random_state.rand(1000),
+    }
+    eval_general(
+        *create_test_dfs(data),
+        lambda df: df.groupby("key", observed=observed).sum(),
+    )
+
+
+def test_groupby_shuffle_reduce_unorderable_keys():
+    random_state = np.random.RandomState(seed=42)
+    data = {
+        "key1": random_state.randint(0, 5, 1000),
+        "key2": random_state.choice(["x", "y", None], 1000),
+        "value": random_state.rand(1000),
+    }
+    md_df, pd_df = create_test_dfs(data)
+    eval_general(md_df, pd_df, lambda df: df.groupby("key2", dropna=False).sum())
+
+    def groupby_sum(df):
+        return df.groupby(["key1", "key2"], dropna=False).sum()
+
+    expected = groupby_sum(md_df)
+    with config_value(GroupbyShuffleThreshold, 0):
+        # The keys holding both strings and missing values cannot be ordered
+        # by the sample sort, so they are reduced without the shuffle
+        df_equals(groupby_sum(md_df), expected)
+        eval_general(md_df, pd_df, lambda df: df.groupby("key2", dropna=False).sum())
+
+
+@pytest.mark.parametrize("by", ["key", ["key", "flag"]])
+@pytest.mark.parametrize("func", ["mean", "var", "std", "sem"])
+def test_groupby_moments_unobserved_categories(by, func):
+    data = {
+        # "c" is never observed, "a" is observed in the first rows only
+        "key": pandas.Categorical(
+            ["a", "b", "d"] + ["b", "d"] * 100, categories=["a", "b", "c", "d"]
+        ),
+        "flag": np.arange(203) % 2,
+        "float32": np.arange(203, dtype=np.float32),
+        "ints": np.arange(203),
+    }
+    md_df, pd_df = create_test_dfs(data)
+    md_result = getattr(md_df.groupby(by)[["float32", "ints"]], func)()
+    pd_result = getattr(pd_df.groupby(by)[["float32", "ints"]], func)()
+    df_equals(md_result, pd_result)
+    assert md_result.dtypes.equals(pd_result.dtypes)
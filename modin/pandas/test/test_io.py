@@ -19,17 +19,33 @@ import pandas._libs.lib as lib
 from pandas.core.dtypes.common import is_list_like
 from collections import OrderedDict
 from modin.db_conn import ModinDatabaseConnection, UnsupportedDatabaseException
-from modin.config import TestDatasetSize, Engine, StorageFormat, IsExperimental
+from modin.core.io import SQLDispatcher, TextFileDispatcher
+from modin.core.io.file_dispatcher import OpenFile
+from modin.core.io.text.utils import ChainedBuffersReader
+from modin.config import (
+    TestDatasetSize,
+    Engine,
+    StorageFormat,
+    IsExperimental,
+    SQLWriters,
+)
 from modin.utils import to_pandas
 from modin.pandas.utils import from_arrow
 from modin.test.test_utils import warns_that_defaulting_to_pandas
 import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
 import os
+import glob
 from scipy import sparse
 import sys
 import shutil
 import sqlalchemy as sa
 import csv
+import bz2
+import gzip
+import io
+import pathlib
 import tempfile
 
 from .utils import (
@@ -566,6 +582,48 @@ class TestCsv:
 
         df_equals(modin_df, pd_df)
 
+    @pytest.mark.parametrize("chunksize", [1, 7, 64, 1000])
+    @pytest.mark.parametrize(
+        "kwargs", [{}, {"index_col": 0}, {"nrows": 50}, {"skiprows": 3}]
+    )
+    def test_read_csv_chunks(self, make_csv_file, chunksize, kwargs):
+        unique_filename = get_unique_filename()
+        make_csv_file(filename=unique_filename, row_size=300, add_blank_lines=True)
+
+        modin_chunks = list(pd.read_csv(unique_filename, chunksize=chunksize, **kwargs))
+        pandas_chunks = list(
+            pandas.read_csv(unique_filename, chunksize=chunksize, **kwargs)
+        )
+        assert len(modin_chunks) == len(pandas_chunks)
+        for modin_df, pandas_df in zip(modin_chunks, pandas_chunks):
+            df_equals(modin_df, pandas_df)
+
+        with pd.read_csv(unique_filename, iterator=True, **kwargs) as modin_reader:
+            pandas_reader = pandas.read_csv(unique_filename, iterator=True, **kwargs)
+            for size in [chunksize % 40 + 1, 10]:
+                df_equals(modin_reader.get_chunk(size), pandas_reader.get_chunk(size))
+
+    def test_read_csv_chunks_split_once(self, make_csv_file, monkeypatch):
+        unique_filename = get_unique_filename()
+        make_csv_file(filename=unique_filename, row_size=300)
+        launch_tasks = TextFileDispatcher._launch_tasks.__func__
+        launched = []
+
+        def count_launches(cls, splits, **partition_kwargs):
+            launched.append(len(splits))
+            return launch_tasks(cls, splits, **partition_kwargs)
+
+        monkeypatch.setattr(
+            TextFileDispatcher, "_launch_tasks", classmethod(count_launches)
+        )
+        modin_chunks = list(pd.read_csv(unique_filename, chunksize=1))
+        pandas_chunks = list(pandas.read_csv(unique_filename, chunksize=1))
+        assert len(modin_chunks) == len(pandas_chunks)
+        for modin_df, pandas_df in zip(modin_chunks, pandas_chunks):
+            df_equals(modin_df, pandas_df)
+        # the small file is parsed by a single batch of tasks, not a task per row
+        assert len(launched) == 1
+
     def test_read_csv_encoding_976(self):
         file_name = "modin/pandas/test/data/issue_976.csv"
         names = [str(i) for i in range(11)]
@@ -608,6 +666,57 @@ class TestCsv:
             engine=engine,
         )
 
+    @pytest.mark.parametrize(
+        "compression, members",
+        [("gzip", "many"), ("gzip", "single"), ("bz2", "single")],
+    )
+    def test_read_csv_seekable_compression(self, compression, members, monkeypatch):
+        # the driver indexes the deflate blocks of a gzip member every 64 KiB
+        monkeypatch.setattr(
+            "modin.core.io.compression._GZIP_CHECKPOINT_SPACING", 64 * 1024
+        )
+        data = (
+            pandas.DataFrame(
+                {"a": np.arange(100_000), "b": [f"s{i}" for i in range(100_000)]}
+            )
+            .to_csv(index=False)
+            .encode()
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            path = f"{directory}/data.csv.{COMP_TO_EXT[compression]}"
+            with open(path, "wb") as f:
+                if compression == "gzip" and members == "many":
+                    # every member of the file can be decompressed separately
+                    for i in range(0, len(data), 100_000):
+                        f.write(gzip.compress(data[i : i + 100_000]))
+                elif compression == "gzip":
+                    # so can the deflate blocks with the data preceding them
+                    f.write(gzip.compress(data))
+                else:
+                    # so can every 100k block
+                    f.write(bz2.compress(data, compresslevel=1))
+
+            checkpoints = []
+            with OpenFile(path, "rb", "infer", checkpoints=checkpoints) as f:
+                assert f.read() == data
+            assert len(checkpoints) > 1
+            with OpenFile(path, "rb", "infer", checkpoints=checkpoints) as f:
+                f.seek(len(data) // 2)
+                assert f.read(1000) == data[len(data) // 2 : len(data) // 2 + 1000]
+
+            eval_io(fn_name="read_csv", filepath_or_buffer=path)
+
+    def test_read_csv_chained_buffers(self):
+        data = b"a,b\n" + b"".join(b"%d,s%d\n" % (i, i) for i in range(1000))
+        header, body = data[:4], memoryview(data)[4 + 30 * 7 :]
+        with ChainedBuffersReader([header, body]) as reader:
+            df_equals(
+                pandas.read_csv(io.BufferedReader(reader)),
+                pandas.read_csv(io.BytesIO(header + body.tobytes())),
+            )
+        # the buffers are released once the reader is closed
+        body.release()
+
     @pytest.mark.parametrize(
         "encoding",
         [
@@ -970,6 +1079,27 @@ class TestCsv:
             cast_to_str=StorageFormat.get() != "Omnisci",
         )
 
+    def test_read_csv_long_quoted_fields(self):
+        unique_filename = get_unique_filename()
+        # quoted fields spanning several partitions and quotes of both parities
+        # at the partition cuts
+        values = ['a "b" c', "multi\nline" * 500, '"', "plain", "x,y\n" * 50]
+        pandas.DataFrame(
+            {
+                "col1": np.arange(200),
+                "col2": [values[i % len(values)] for i in range(200)],
+                "col3": [values[i % 3] for i in range(200)],
+            }
+        ).to_csv(unique_filename, index=False)
+        try:
+            eval_io(
+                fn_name="read_csv",
+                # read_csv kwargs
+                filepath_or_buffer=unique_filename,
+            )
+        finally:
+            teardown_test_files([unique_filename])
+
     def test_read_csv_sep_none(self):
         eval_io(
             fn_name="read_csv",
@@ -1186,6 +1316,39 @@ class TestCsv:
         ).set_index("key")
         eval_to_file(modin_df, pandas_df, "to_csv", "csv")
 
+    @pytest.mark.parametrize("compression", ["gzip", "bz2", "xz"])
+    def test_to_csv_compression(self, compression):
+        pandas_df = generate_dataframe()
+        modin_df = pd.DataFrame(pandas_df)
+        with tempfile.TemporaryDirectory() as directory:
+            modin_path = os.path.join(
+                directory, f"modin.csv.{COMP_TO_EXT[compression]}"
+            )
+            pandas_path = os.path.join(
+                directory, f"pandas.csv.{COMP_TO_EXT[compression]}"
+            )
+            modin_df.to_csv(modin_path)
+            pandas_df.to_csv(pandas_path)
+            df_equals(pandas.read_csv(modin_path), pandas.read_csv(pandas_path))
+
+    @pytest.mark.skipif(
+        Engine.get() == "Python",
+        reason="Python engine writes CSV files with pandas that doesn't expand globs",
+    )
+    def test_to_csv_part_files(self):
+        pandas_df = generate_dataframe()
+        modin_df = pd.DataFrame(pandas_df)
+        with tempfile.TemporaryDirectory() as directory:
+            modin_df.to_csv(os.path.join(directory, "part*.csv"), index=False)
+            paths = sorted(glob.glob(os.path.join(directory, "part*.csv")))
+            assert len(paths) == len(modin_df._query_compiler._modin_frame._partitions)
+            df_equals(
+                pandas.concat(
+                    [pandas.read_csv(path) for path in paths], ignore_index=True
+                ),
+                pandas_df,
+            )
+
 
 class TestTable:
     def test_read_table(self, make_csv_file):
@@ -1305,6 +1468,124 @@ class TestParquet:
         finally:
             os.remove(unique_filename)
 
+    @pytest.mark.xfail(
+        condition="config.getoption('--simulate-cloud').lower() != 'off'",
+        reason="The reason of tests fail in `cloud` mode is unknown for now - issue #3264",
+    )
+    @pytest.mark.parametrize("index", [None, "range", "idx", ["idx", "A"]])
+    def test_read_parquet_row_groups(self, index):
+        unique_filename = get_unique_filename(extension="parquet")
+        pandas_df = pandas.DataFrame(
+            {
+                "idx": np.random.randint(0, 100_000, size=2000),
+                "A": np.random.randint(0, 100_000, size=2000),
+                "B": ["a", "b"] * 1000,
+            }
+        )
+        if index == "range":
+            pandas_df.index = pandas.RangeIndex(10, 6010, 3, name="range")
+        elif index is not None:
+            pandas_df = pandas_df.set_index(index)
+        try:
+            # A few columns but many row groups, which are read by separate workers
+            pandas_df.to_parquet(unique_filename, row_group_size=300)
+            eval_io(
+                fn_name="read_parquet",
+                # read_parquet kwargs
+                path=unique_filename,
+            )
+            eval_io(
+                fn_name="read_parquet",
+                # read_parquet kwargs
+                path=unique_filename,
+                columns=["B"],
+            )
+        finally:
+            os.remove(unique_filename)
+
+    @pytest.mark.xfail(
+        condition="config.getoption('--simulate-cloud').lower() != 'off'",
+        reason="The reason of tests fail in `cloud` mode is unknown for now - issue #3264",
+    )
+    def test_read_parquet_row_groups_common_dtypes(self):
+        unique_filename = get_unique_filename(extension="parquet")
+        # Only the last row group has a null in the integer column
+        table = pa.table({"A": pa.array(list(range(1999)) + [None], pa.int64())})
+        try:
+            pq.write_table(table, unique_filename, row_group_size=300)
+            modin_df = pd.read_parquet(unique_filename)
+            pandas_df = pandas.read_parquet(unique_filename)
+            df_equals(modin_df, pandas_df)
+            assert modin_df.dtypes.equals(pandas_df.dtypes)
+        finally:
+            os.remove(unique_filename)
+
+    @pytest.mark.xfail(
+        condition="config.getoption('--simulate-cloud').lower() != 'off'",
+        reason="The reason of tests fail in `cloud` mode is unknown for now - issue #3264",
+    )
+    @pytest.mark.parametrize("index", [None, "idx"])
+    @pytest.mark.parametrize(
+        "query",
+        [
+            lambda df: df[df.A > 1500][["B", "C"]],
+            lambda df: df[(df.A >= 300) & (df.A < 330) & (df.B == "b")],
+            lambda df: df[df.C <= pandas.Timestamp("2020-01-01 10:00")].B,
+            lambda df: df[df.A < 1000].pipe(lambda df: df[df.B != "a"]),
+            lambda df: df[df.A > 100_000],
+            lambda df: df.A > 1000,
+        ],
+    )
+    def test_read_parquet_filters_pushdown(self, index, query):
+        unique_filename = get_unique_filename(extension="parquet")
+        pandas_df = pandas.DataFrame(
+            {
+                "idx": np.random.randint(0, 100_000, size=2000),
+                "A": np.arange(2000),
+                "B": ["a", "b", "c", "d"] * 500,
+                "C": pandas.date_range("2020-01-01", periods=2000, freq="min"),
+            }
+        )
+        if index is not None:
+            pandas_df = pandas_df.set_index(index)
+        try:
+            # The comparisons are recorded before reading the row groups
+            pandas_df.to_parquet(unique_filename, row_group_size=300)
+            df_equals(
+                query(pd.read_parquet(unique_filename)),
+                query(pandas.read_parquet(unique_filename)),
+            )
+        finally:
+            os.remove(unique_filename)
+
+    @pytest.mark.xfail(
+        condition="config.getoption('--simulate-cloud').lower() != 'off'",
+        reason="The reason of tests fail in `cloud` mode is unknown for now - issue #3264",
+    )
+    def test_read_parquet_filters_pushdown_dtypes(self):
+        unique_filename = get_unique_filename(extension="parquet")
+        size = 2000
+        # Only one row group has missing values
+        table = pa.table(
+            {
+                "A": pa.array(range(size), pa.int64()),
+                "B": pa.array([None if i == 1900 else i for i in range(size)]),
+                "C": pa.array([None if i == 1900 else i % 2 == 0 for i in range(size)]),
+            }
+        )
+        try:
+            pq.write_table(table, unique_filename, row_group_size=300)
+            modin_df = pd.read_parquet(unique_filename)
+            pandas_df = pandas.read_parquet(unique_filename)
+            assert modin_df.dtypes.equals(pandas_df.dtypes)
+            # The skipped row groups hold the only missing values
+            modin_df = modin_df[modin_df.A < 500]
+            pandas_df = pandas_df[pandas_df.A < 500]
+            assert modin_df.dtypes.equals(pandas_df.dtypes)
+            df_equals(modin_df, pandas_df)
+        finally:
+            os.remove(unique_filename)
+
     @pytest.mark.xfail(
         condition="config.getoption('--simulate-cloud').lower() != 'off'",
         reason="The reason of tests fail in `cloud` mode is unknown for now - issue #3264",
@@ -1329,6 +1610,65 @@ class TestParquet:
         finally:
             shutil.rmtree(unique_filename)
 
+    @pytest.mark.xfail(
+        condition="config.getoption('--simulate-cloud').lower() != 'off'",
+        reason="The reason of tests fail in `cloud` mode is unknown for now - issue #3264",
+    )
+    @pytest.mark.parametrize(
+        "filters",
+        [
+            None,
+            [("A", "=", 3)],
+            [("A", ">=", 5), ("idx", "<", 50_000)],
+            [[("B", "=", "a")], [("idx", "<", 1000)]],
+            [("A", "=", 100)],
+        ],
+    )
+    @pytest.mark.parametrize("index", [None, "idx"])
+    def test_read_parquet_hive_partitioned(self, filters, index):
+        unique_filename = get_unique_filename(extension=None)
+        pandas_df = pandas.DataFrame(
+            {
+                "idx": np.random.randint(0, 100_000, size=2000),
+                "A": np.random.randint(0, 10, size=2000),
+                "B": ["a", "b"] * 1000,
+                "C": np.random.rand(2000),
+            }
+        )
+        if index is not None:
+            pandas_df = pandas_df.set_index(index)
+        try:
+            pandas_df.to_parquet(unique_filename, partition_cols=["A", "B"])
+            eval_io(
+                fn_name="read_parquet",
+                # read_parquet kwargs
+                path=unique_filename,
+                filters=filters,
+            )
+        finally:
+            shutil.rmtree(unique_filename)
+
+    @pytest.mark.xfail(
+        condition="config.getoption('--simulate-cloud').lower() != 'off'",
+        reason="The reason of tests fail in `cloud` mode is unknown for now - issue #3264",
+    )
+    def test_read_parquet_hive_partitioned_common_dtypes(self):
+        unique_filename = get_unique_filename(extension=None)
+        # Only the second partition has nulls in the integer column
+        for key, values in [("a", range(100)), ("b", [1, None] * 50)]:
+            os.makedirs(os.path.join(unique_filename, f"k={key}"))
+            pq.write_table(
+                pa.table({"x": pa.array(values, pa.int64())}),
+                os.path.join(unique_filename, f"k={key}", "part.parquet"),
+            )
+        try:
+            modin_df = pd.read_parquet(unique_filename)
+            pandas_df = pandas.read_parquet(unique_filename)
+            df_equals(modin_df, pandas_df)
+            assert modin_df.dtypes.equals(pandas_df.dtypes)
+        finally:
+            shutil.rmtree(unique_filename)
+
     @pytest.mark.xfail(
         condition="config.getoption('--simulate-cloud').lower() != 'off'",
         reason="The reason of tests fail in `cloud` mode is unknown for now - issue #3264",
@@ -1400,6 +1740,88 @@ class TestParquet:
             extension="parquet",
         )
 
+    @pytest.mark.parametrize("partition_cols", [None, ["A"], ["A", "B"]])
+    def test_to_parquet_dataset(self, partition_cols):
+        modin_df, pandas_df = create_test_dfs(
+            {
+                "A": np.arange(256) % 3,
+                "B": ["a", "b"] * 128,
+                "C": [None] * 64 + [f"c{i}" for i in range(192)],
+                "D": np.arange(256.0),
+            }
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            modin_path = f"{directory}/modin"
+            pandas_path = f"{directory}/pandas"
+            modin_df.to_parquet(
+                modin_path, partition_cols=partition_cols, row_group_size=32
+            )
+            pandas_df.to_parquet(
+                pandas_path, partition_cols=partition_cols, row_group_size=32
+            )
+            if Engine.get() in ("Ray", "Dask"):
+                metadata = pq.read_metadata(f"{modin_path}/_metadata")
+                assert metadata.num_rows == len(pandas_df)
+                assert all(
+                    metadata.row_group(i).num_rows <= 32
+                    for i in range(metadata.num_row_groups)
+                )
+            # The rows of the partitioned datasets are read in the order of the files
+            df_equals(
+                pd.read_parquet(modin_path).sort_values("D", ignore_index=True),
+                pandas.read_parquet(pandas_path).sort_values("D", ignore_index=True),
+            )
+            df_equals(pd.read_parquet(modin_path), pandas.read_parquet(modin_path))
+
+    @pytest.mark.parametrize("partition_cols", [["A"], ["A", "B"]])
+    def test_to_parquet_dataset_null_keys(self, partition_cols):
+        modin_df, pandas_df = create_test_dfs(
+            {
+                "A": [None, "a1", "a2", None] * 64,
+                "B": ["b1", None] * 128,
+                "D": np.arange(256.0),
+            }
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            modin_path = f"{directory}/modin"
+            pandas_path = f"{directory}/pandas"
+            modin_df.to_parquet(modin_path, partition_cols=partition_cols)
+            pandas_df.to_parquet(pandas_path, partition_cols=partition_cols)
+            # The rows with the null keys are kept
+            assert len(pandas.read_parquet(modin_path)) == len(pandas_df)
+            assert sorted(
+                name for name in os.listdir(modin_path) if "=" in name
+            ) == sorted(os.listdir(pandas_path))
+            df_equals(
+                pd.read_parquet(modin_path).sort_values("D", ignore_index=True),
+                pandas.read_parquet(pandas_path).sort_values("D", ignore_index=True),
+            )
+
+    @pytest.mark.skipif(
+        Engine.get() not in ("Ray", "Dask"),
+        reason="pandas adds the files of a partitioned dataset to the existing ones",
+    )
+    @pytest.mark.parametrize("partition_cols", [None, ["A"]])
+    def test_to_parquet_dataset_overwrite(self, partition_cols):
+        modin_df, pandas_df = create_test_dfs(
+            {
+                "A": np.arange(256) % 3,
+                "B": [f"b{i}" for i in range(256)],
+            }
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            path = f"{directory}/data"
+            modin_df.to_parquet(path, partition_cols=partition_cols)
+            # Entries not written by to_parquet are kept
+            os.makedirs(f"{path}/_notes")
+            # The smaller dataset has fewer files and another type of "B"
+            modin_df.iloc[:2].assign(B=None).to_parquet(
+                path, partition_cols=partition_cols
+            )
+            df_equals(pd.read_parquet(path), pandas.read_parquet(path))
+            assert len(pandas.read_parquet(path)) == 2
+            assert os.path.isdir(f"{path}/_notes")
+
     @pytest.mark.xfail(
         condition="config.getoption('--simulate-cloud').lower() != 'off'",
         reason="The reason of tests fail in `cloud` mode is unknown for now - issue #3264",
@@ -1439,6 +1861,30 @@ class TestJson:
             storage_options=storage_options,
         )
 
+    @pytest.mark.parametrize(
+        "orient", ["records", "values", "columns", "index", "split", None]
+    )
+    def test_read_json_document(self, orient):
+        unique_filename = get_unique_filename(extension="json")
+        pandas_df = pandas.DataFrame(
+            {
+                "col1": np.arange(1000),
+                "col2": [f'"str{i}", {{[\\' for i in range(1000)],
+                "col3": np.linspace(0, 1, 1000),
+            },
+            index=[f"row{i}" for i in range(1000)],
+        )
+        pandas_df.to_json(unique_filename, orient=orient or "columns")
+        try:
+            eval_io(
+                fn_name="read_json",
+                # read_json kwargs
+                path_or_buf=unique_filename,
+                orient=orient,
+            )
+        finally:
+            teardown_test_files([unique_filename])
+
     def test_read_json_categories(self):
         eval_io(
             fn_name="read_json",
@@ -1564,10 +2010,61 @@ class TestExcel:
         for key in pandas_df.keys():
             df_equals(modin_df.get(key), pandas_df.get(key))
 
-    @pytest.mark.xfail(
-        Engine.get() != "Python",
-        reason="pandas throws the exception. See pandas issue #39250 for more info",
+    @check_file_leaks
+    @pytest.mark.parametrize("sheet_name", [["Sheet2", 0], None])
+    def test_read_excel_several_sheets(self, sheet_name):
+        unique_filename = get_unique_filename(extension="xlsx")
+        try:
+            with pandas.ExcelWriter(unique_filename) as writer:
+                for i in range(3):
+                    pandas.DataFrame(
+                        {
+                            "col1": np.arange(i, 500 + i),
+                            "col2": [f"str{j}" for j in range(500)],
+                        }
+                    ).to_excel(writer, sheet_name=f"Sheet{i}", index=False)
+
+            pandas_dfs = pandas.read_excel(unique_filename, sheet_name=sheet_name)
+            modin_dfs = pd.read_excel(unique_filename, sheet_name=sheet_name)
+
+            assert list(modin_dfs.keys()) == list(pandas_dfs.keys())
+            for key in pandas_dfs.keys():
+                df_equals(modin_dfs[key], pandas_dfs[key])
+        finally:
+            teardown_test_files([unique_filename])
+
+    @pytest.mark.skipif(
+        Engine.get() == "Python",
+        reason="Python engine reads Excel files with pandas that doesn't expand globs",
     )
+    @pytest.mark.parametrize("sheet_name", [0, None])
+    def test_read_excel_glob(self, sheet_name):
+        with tempfile.TemporaryDirectory() as directory:
+            pandas_dfs = []
+            for i in range(3):
+                unique_filename = os.path.join(directory, f"book{i}.xlsx")
+                with pandas.ExcelWriter(unique_filename) as writer:
+                    for j in range(2):
+                        pandas.DataFrame(
+                            {"col1": np.arange(100) + i * 100, "col2": j}
+                        ).to_excel(writer, sheet_name=f"Sheet{j}", index=False)
+                pandas_dfs.append(
+                    pandas.read_excel(unique_filename, sheet_name=sheet_name)
+                )
+
+            modin_dfs = pd.read_excel(
+                os.path.join(directory, "*.xlsx"), sheet_name=sheet_name
+            )
+
+        if sheet_name is None:
+            for key in pandas_dfs[0].keys():
+                df_equals(
+                    modin_dfs[key],
+                    pandas.concat([dfs[key] for dfs in pandas_dfs], ignore_index=True),
+                )
+        else:
+            df_equals(modin_dfs, pandas.concat(pandas_dfs, ignore_index=True))
+
     @check_file_leaks
     def test_read_excel_sheetname_title(self):
         eval_io(
@@ -1642,9 +2139,6 @@ class TestExcel:
         finally:
             teardown_test_files([unique_filename_modin, unique_filename_pandas])
 
-    @pytest.mark.xfail(
-        Engine.get() != "Python", reason="Test fails because of issue 3305"
-    )
     @check_file_leaks
     @pytest.mark.xfail(
         condition="config.getoption('--simulate-cloud').lower() != 'off'",
@@ -1675,6 +2169,27 @@ class TestHdf:
             key="df",
         )
 
+    @pytest.mark.parametrize("format", [None, "table"])
+    @pytest.mark.parametrize("start, stop", [(10, None), (None, -30), (5, 7)])
+    def test_read_hdf_row_slices(self, make_hdf_file, format, start, stop):
+        eval_io(
+            fn_name="read_hdf",
+            # read_hdf kwargs
+            path_or_buf=make_hdf_file(format=format),
+            key="df",
+            start=start,
+            stop=stop,
+        )
+
+    @pytest.mark.parametrize("format", [None, "table"])
+    def test_read_hdf_path_object(self, make_hdf_file, format):
+        eval_io(
+            fn_name="read_hdf",
+            # read_hdf kwargs
+            path_or_buf=pathlib.Path(make_hdf_file(format=format)),
+            key="df",
+        )
+
     @pytest.mark.xfail(
         condition="config.getoption('--simulate-cloud').lower() != 'off'",
         reason="The reason of tests fail in `cloud` mode is unknown for now - issue #3264",
@@ -1795,6 +2310,108 @@ class TestSql:
         with pytest.raises(UnsupportedDatabaseException):
             ModinDatabaseConnection("unsupported_database")
 
+    def test_read_sql_keyset_queries(self, make_sql_connection):
+        import sqlalchemy as sa
+
+        filename = get_unique_filename(extension="db")
+        table = "test_read_sql_keyset_queries"
+        conn = make_sql_connection(filename)
+        engine = sa.create_engine(conn)
+        with engine.begin() as connection:
+            connection.execute(
+                sa.text(
+                    f"CREATE TABLE {table} "
+                    + "(key INTEGER PRIMARY KEY, value INTEGER, permuted INTEGER)"
+                )
+            )
+            connection.execute(
+                sa.text(f"CREATE INDEX ix_permuted ON {table} (permuted)")
+            )
+        # Most of the keys are packed into a small part of the keys range
+        keys = np.concatenate([np.arange(90), np.arange(10 ** 6, 10 ** 6 + 10)])
+        pandas.DataFrame(
+            {
+                "key": keys,
+                "value": np.arange(100),
+                "permuted": np.random.RandomState(42).permutation(100),
+            }
+        ).to_sql(table, conn, if_exists="append", index=False)
+        query = f"select * from {table}"
+        columns = ["key", "value", "permuted"]
+
+        column = SQLDispatcher._get_partition_column(query, engine, columns)
+        assert column == "key"
+        queries = SQLDispatcher._get_keyset_queries(query, engine, column, 100, 4)
+        parts = [pandas.read_sql(part_query, conn) for part_query in queries]
+        assert [len(part) for part in parts] == [25] * 4
+        df_equals(pandas.concat(parts, ignore_index=True), pandas.read_sql(query, conn))
+
+        assert (
+            SQLDispatcher._get_partition_column(
+                f"{query} where value > 10", engine, columns
+            )
+            == "key"
+        )
+        assert (
+            SQLDispatcher._get_partition_column(
+                f"{query} where value > 10 limit 5", engine, columns
+            )
+            is None
+        )
+        # Indexed columns other than the primary key are used too,
+        # the ranges return the rows ordered by the column
+        assert (
+            SQLDispatcher._get_partition_column(
+                f"select value, permuted from {table}", engine, ["value", "permuted"]
+            )
+            == "permuted"
+        )
+        df_equals(
+            pd.read_sql(f"select value, permuted from {table}", conn),
+            pandas.read_sql(
+                f"select value, permuted from {table} order by permuted", conn
+            ),
+        )
+
+        # The rows of a table with a key other than the rowid alias are read
+        # ordered by the key, unless the query orders them by another column
+        other_table = f"{table}_bigint"
+        with engine.begin() as connection:
+            connection.execute(
+                sa.text(
+                    f"CREATE TABLE {other_table} (key BIGINT PRIMARY KEY, v INTEGER)"
+                )
+            )
+        pandas.DataFrame(
+            {"key": np.random.RandomState(42).permutation(100), "v": np.arange(100)}
+        ).to_sql(other_table, conn, if_exists="append", index=False)
+        for query, expected_column, expected_query in [
+            (f"select * from {other_table}", "key", "order by key"),
+            (f"select * from {other_table} order by key", "key", "order by key"),
+            (f"select * from {other_table} order by v", None, "order by v"),
+        ]:
+            assert (
+                SQLDispatcher._get_partition_column(query, engine, ["key", "v"])
+                == expected_column
+            )
+            df_equals(
+                pd.read_sql(query, conn),
+                pandas.read_sql(f"select * from {other_table} {expected_query}", conn),
+            )
+        # A column specified by the user is used for any query returning it
+        query = (
+            f"select a.key, a.v from {other_table} a join {table} b on a.v = b.value"
+        )
+        assert (
+            SQLDispatcher._get_partition_column(query, engine, ["key", "v"], "v")
+            == "v"
+        )
+        assert (
+            SQLDispatcher._get_partition_column(query, engine, ["key", "v"], "w")
+            is None
+        )
+        engine.dispose()
+
     @pytest.mark.xfail(
         condition="config.getoption('--simulate-cloud').lower() != 'off'",
         reason="The reason of tests fail in `cloud` mode is unknown for now - issue #3264",
@@ -1831,6 +2448,33 @@ class TestSql:
 
         assert df_modin_sql.sort_index().equals(df_pandas_sql.sort_index())
 
+    @pytest.mark.parametrize("chunksize", [None, 7])
+    def test_to_sql_modin_database_connection(self, make_sql_connection, chunksize):
+        table_name = f"test_to_sql_modin_database_connection_{chunksize}"
+        modin_df, pandas_df = create_test_dfs(TEST_DATA)
+
+        # We do not pass the table name so the fixture won't generate a table
+        conn = make_sql_connection(f"{table_name}_modin.db")
+        old_writers = SQLWriters.get()
+        SQLWriters.put(1)
+        try:
+            modin_df.to_sql(
+                table_name,
+                ModinDatabaseConnection("sqlalchemy", conn),
+                index=False,
+                chunksize=chunksize,
+            )
+        finally:
+            SQLWriters.put(old_writers)
+        df_modin_sql = pandas.read_sql(table_name, con=conn)
+
+        # We do not pass the table name so the fixture won't generate a table
+        conn = make_sql_connection(f"{table_name}_pandas.db")
+        pandas_df.to_sql(table_name, conn, index=False, chunksize=chunksize)
+        df_pandas_sql = pandas.read_sql(table_name, con=conn)
+
+        assert df_modin_sql.equals(df_pandas_sql)
+
 
 class TestHtml:
     @pytest.mark.xfail(reason="read_html is not yet implemented properly - issue #1296")
@@ -2105,6 +2749,42 @@ class TestFeather:
             path=make_feather_file(),
         )
 
+    @pytest.mark.parametrize("compression", ["lz4", "uncompressed"])
+    @pytest.mark.parametrize("columns", [None, ["col3", "col1"]])
+    def test_read_feather_record_batches(self, compression, columns):
+        unique_filename = get_unique_filename(extension="feather")
+        try:
+            pandas.DataFrame(
+                {
+                    "col1": np.arange(1000),
+                    "col2": np.arange(1000) * 0.5,
+                    "col3": [f"str{i}" for i in range(1000)],
+                }
+            ).to_feather(unique_filename, compression=compression, chunksize=64)
+            eval_io(
+                fn_name="read_feather",
+                # read_feather kwargs
+                path=unique_filename,
+                columns=columns,
+            )
+        finally:
+            teardown_test_files([unique_filename])
+
+    def test_read_feather_record_batches_common_dtypes(self):
+        unique_filename = get_unique_filename(extension="feather")
+        # Only the last record batch has a null in the integer column
+        table = pa.table({"col1": pa.array(list(range(999)) + [None], pa.int64())})
+        try:
+            feather.write_feather(
+                table, unique_filename, compression="uncompressed", chunksize=64
+            )
+            modin_df = pd.read_feather(unique_filename)
+            pandas_df = pandas.read_feather(unique_filename)
+            df_equals(modin_df, pandas_df)
+            assert modin_df.dtypes.equals(pandas_df.dtypes)
+        finally:
+            teardown_test_files([unique_filename])
+
     @pytest.mark.xfail(
         condition="config.getoption('--simulate-cloud').lower() != 'off'",
         reason="The reason of tests fail in `cloud` mode is unknown for now - issue #3264",
@@ -2168,19 +2848,38 @@ class TestPickle:
     )
     def test_to_pickle(self):
         modin_df, pandas_df = create_test_dfs(TEST_DATA)
-        eval_to_file(
-            modin_obj=modin_df, pandas_obj=pandas_df, fn="to_pickle", extension="pkl"
-        )
-
-        unique_filename_modin = get_unique_filename(extension="pkl")
-        unique_filename_pandas = get_unique_filename(extension="pkl")
+        unique_filename = get_unique_filename(extension="pkl")
         try:
-            pd.to_pickle(modin_df, unique_filename_modin)
-            pandas.to_pickle(pandas_df, unique_filename_pandas)
+            modin_df.to_pickle(unique_filename)
+            # Files written in the chunked Modin format still are plain pickles
+            df_equals(pandas.read_pickle(unique_filename), pandas_df)
+            df_equals(pd.read_pickle(unique_filename), pandas_df)
 
-            assert assert_files_eq(unique_filename_modin, unique_filename_pandas)
+            pd.to_pickle(modin_df, unique_filename)
+            df_equals(pandas.read_pickle(unique_filename), pandas_df)
         finally:
-            teardown_test_files([unique_filename_modin, unique_filename_pandas])
+            teardown_test_files([unique_filename])
+
+    @pytest.mark.xfail(
+        condition="config.getoption('--simulate-cloud').lower() != 'off'",
+        reason="There is no point in writing to local files.",
+    )
+    @pytest.mark.parametrize("compression", [None, "gzip"])
+    def test_read_pickle_chunked(self, compression):
+        pandas_df = pandas.DataFrame(
+            np.random.randint(0, 100, size=(1000, 64)),
+            index=pandas.Index(np.arange(1000) * 2, name="index"),
+        ).add_prefix("col")
+        pandas_df["str_col"] = "str"
+        modin_df = pd.DataFrame(pandas_df)
+        unique_filename = get_unique_filename(extension="pkl")
+        try:
+            modin_df.to_pickle(unique_filename, compression=compression)
+            df_equals(
+                pd.read_pickle(unique_filename, compression=compression), pandas_df
+            )
+        finally:
+            teardown_test_files([unique_filename])
 
 
 @pytest.mark.xfail(
@@ -93,6 +93,29 @@ def test_dataframe(data, window, min_periods, win_type):
         df_equals(modin_rolled.quantile(0.1), pandas_rolled.quantile(0.1))
 
 
+@pytest.mark.parametrize("axis", [0, 1])
+@pytest.mark.parametrize("window", [1, 7, 100])
+@pytest.mark.parametrize("min_periods", [None, 1])
+def test_dataframe_trailing_window(axis, window, min_periods):
+    # trailing windows are computed per partition with the halo of the preceding
+    # rows (columns), so the windows spanning several partitions are checked
+    data = np.random.RandomState(seed=42).randn(300, 80)
+    data[10:150, 3] = np.nan
+    modin_df, pandas_df = create_test_dfs(data)
+    modin_rolled = modin_df.rolling(window, min_periods=min_periods, axis=axis)
+    pandas_rolled = pandas_df.rolling(window, min_periods=min_periods, axis=axis)
+    for func in ["count", "sum", "mean", "median", "var", "min", "max", "kurt"]:
+        df_equals(getattr(modin_rolled, func)(), getattr(pandas_rolled, func)())
+    df_equals(modin_rolled.quantile(0.1), pandas_rolled.quantile(0.1))
+    df_equals(
+        modin_rolled.apply(np.sum, raw=True), pandas_rolled.apply(np.sum, raw=True)
+    )
+    df_equals(
+        modin_df.rolling(window, win_type="triang", axis=axis).mean(),
+        pandas_df.rolling(window, win_type="triang", axis=axis).mean(),
+    )
+
+
 @pytest.mark.parametrize("axis", [0, "columns"])
 @pytest.mark.parametrize("on", [None, "DateCol"])
 @pytest.mark.parametrize("closed", ["both", "right"])
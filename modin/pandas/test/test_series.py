@@ -2320,6 +2320,15 @@ def test_nunique(data, dropna):
     df_equals(modin_series.nunique(dropna=dropna), pandas_series.nunique(dropna=dropna))
 
 
+def test_nunique_approx():
+    modin_series, pandas_series = create_test_series(
+        np.random.RandomState(seed=42).randint(0, 10 ** 6, 10000)
+    )
+    np.testing.assert_allclose(
+        modin_series.nunique(approx=True), pandas_series.nunique(), rtol=0.05
+    )
+
+
 @pytest.mark.parametrize("data", test_data_values, ids=test_data_keys)
 def test_pct_change(data):
     modin_series, pandas_series = create_test_series(data)
@@ -3024,10 +3033,9 @@ def test_sort_values(data, ascending, na_position):
     # Since we use `DataFrame.sort_values` even for Series, the index can be different
     # between `pandas.Series.sort_values`. For this reason, we check that the values are
     # identical instead of the index as well.
-    if ascending:
-        df_equals(modin_result, pandas_result)
-    else:
-        np.testing.assert_equal(modin_result.values, pandas_result.values)
+    # The same goes for `ascending=True`: Modin keeps the original order of equal
+    # values, pandas sorts them with an unstable algorithm by default.
+    np.testing.assert_equal(modin_result.values, pandas_result.values)
 
     modin_series_cp = modin_series.copy()
     pandas_series_cp = pandas_series.copy()
@@ -3037,11 +3045,24 @@ def test_sort_values(data, ascending, na_position):
     pandas_series_cp.sort_values(
         ascending=ascending, na_position=na_position, inplace=True
     )
-    # See above about `ascending=False`
-    if ascending:
-        df_equals(modin_series_cp, pandas_series_cp)
-    else:
-        np.testing.assert_equal(modin_series_cp.values, pandas_series_cp.values)
+    # See above about the order of equal values
+    np.testing.assert_equal(modin_series_cp.values, pandas_series_cp.values)
+
+
+@pytest.mark.parametrize("ascending", [True, False])
+@pytest.mark.parametrize("na_position", ["first", "last"])
+def test_sort_values_stable(ascending, na_position):
+    # Stable sorts are done by the sample-sort shuffle of the row partitions,
+    # equal values keep their original order across the partitions
+    values = np.concatenate(
+        [np.repeat([1.0, 2.0], 300), np.arange(500.0), np.full(50, np.nan)]
+    )
+    np.random.RandomState(42).shuffle(values)
+    modin_series, pandas_series = create_test_series(values)
+    kwargs = {"ascending": ascending, "na_position": na_position, "kind": "stable"}
+    modin_result = modin_series.sort_values(**kwargs)
+    df_equals(modin_result, pandas_series.sort_values(**kwargs))
+    assert len(modin_result._query_compiler._modin_frame._partitions) > 1
 
 
 @pytest.mark.parametrize("data", test_data_values, ids=test_data_keys)
@@ -15,6 +15,7 @@ import modin.pandas as pd
 from modin.pandas.test.utils import create_test_dfs, test_data_values, df_equals
 from modin.config import NPartitions
 
+import numpy as np
 import pytest
 
 NPartitions.put(4)
@@ -110,3 +111,82 @@ def test_apply_func_to_both_axis(has_partitions_shape_cache, has_frame_shape_cac
     md_df._query_compiler._modin_frame = new_modin_frame
 
     df_equals(md_df, pd_df)
+
+
+@pytest.mark.parametrize("ascending", [True, False])
+@pytest.mark.parametrize("na_position", ["first", "last"])
+def test_sort_values_shuffle(ascending, na_position):
+    """
+    Test that ``PandasDataframe.sort_by`` range-partitions rows instead of gathering them.
+    """
+    # Skewed keys with duplicates and NaNs make sure that equal keys land into
+    # the same partition and that missing keys are placed properly.
+    values = np.concatenate(
+        [np.repeat([1.0, 2.0], 300), np.arange(500.0), np.full(50, np.nan)]
+    )
+    np.random.RandomState(42).shuffle(values)
+    data = {"a": values, "b": np.arange(len(values)), "c": values % 7}
+    md_df, pd_df = create_test_dfs(data)
+
+    kwargs = {"ascending": ascending, "na_position": na_position, "kind": "mergesort"}
+    md_result = md_df.sort_values(["a", "c"], **kwargs)
+    pd_result = pd_df.sort_values(["a", "c"], **kwargs)
+    df_equals(md_result, pd_result)
+
+    result_frame = md_result._query_compiler._modin_frame
+    source_frame = md_df._query_compiler._modin_frame
+    assert len(result_frame._partitions) > 1
+    assert result_frame._column_widths == source_frame._column_widths
+
+    df_equals(md_result.sort_index(), pd_result.sort_index())
+
+
+@pytest.mark.parametrize("ascending", [True, False])
+@pytest.mark.parametrize("kind", ["quicksort", "stable"])
+def test_sort_ties_keep_original_order(ascending, kind):
+    """
+    Test that rows with equal sorting keys keep their original order whatever `kind` is.
+    """
+    random_state = np.random.RandomState(42)
+    data = {
+        "s": random_state.choice(["a", "b", None], 1000),
+        "t": random_state.choice([1, 2], 1000),
+        "v": np.arange(1000),
+    }
+    md_df, pd_df = create_test_dfs(data)
+
+    for by in ["s", ["s", "t"]]:
+        df_equals(
+            md_df.sort_values(by, ascending=ascending, kind=kind),
+            pd_df.sort_values(by, ascending=ascending, kind="stable"),
+        )
+    df_equals(
+        md_df.set_index("s").sort_index(ascending=ascending, kind=kind),
+        pd_df.set_index("s").sort_index(ascending=ascending, kind="stable"),
+    )
+
+
+def test_rebalance_partitions_after_row_filters():
+    modin_df, pandas_df = create_test_dfs({"a": np.arange(1000), "b": np.arange(1000)})
+
+    # Only the first two of four row partitions keep any rows
+    modin_result = modin_df.query("a < 300")
+    assert modin_result._query_compiler._modin_frame._row_lengths == [75] * 4
+    df_equals(modin_result, pandas_df.query("a < 300"))
+
+    positions = np.r_[0:10, 900:1000]
+    modin_result = modin_df.iloc[positions]
+    assert modin_result._query_compiler._modin_frame._row_lengths == [32, 32, 32, 14]
+    df_equals(modin_result, pandas_df.iloc[positions])
+
+    # `dropna` filters the rows of the full row partitions
+    modin_nans, pandas_nans = create_test_dfs(
+        {"a": np.where(np.arange(1000) < 300, np.arange(1000.0), np.nan)}
+    )
+    modin_result = modin_nans.dropna()
+    assert modin_result._query_compiler._modin_frame._row_lengths == [75] * 4
+    df_equals(modin_result, pandas_nans.dropna())
+
+    # A filter keeping no rows must leave the frame usable
+    modin_result = modin_df.query("a < 0")
+    df_equals(modin_result + modin_result, pandas_df.query("a < 0") * 2)
@@ -16,7 +16,11 @@ import pandas
 import pytest
 
 import modin.pandas as pd
-from modin.distributed.dataframe.pandas import unwrap_partitions, from_partitions
+from modin.distributed.dataframe.pandas import (
+    unwrap_partitions,
+    from_partitions,
+    repartition,
+)
 from modin.config import Engine, NPartitions
 from modin.pandas.test.utils import df_equals
 from modin.pandas.indexing import compute_sliced_len
@@ -179,6 +183,25 @@ def test_from_partitions_mismatched_labels(axis, index, columns):
     df_equals(expected_df, actual_df)
 
 
+def test_repartition():
+    data = np.random.randint(0, 100, size=(2 ** 10, 2 ** 4))
+    lengths = [1000, 10, 10, 4]
+    bounds = np.cumsum([0] + lengths)
+    expected_df = pandas.DataFrame(data)
+    df = from_partitions(
+        [
+            put_func(expected_df.iloc[start:stop])
+            for start, stop in zip(bounds[:-1], bounds[1:])
+        ],
+        axis=0,
+        row_lengths=lengths,
+    )
+
+    actual_df = repartition(df)
+    assert actual_df._query_compiler._modin_frame._row_lengths == [256] * 4
+    df_equals(actual_df, expected_df)
+
+
 @pytest.mark.parametrize("row_labels", [[0, 2], slice(None)])
 @pytest.mark.parametrize("col_labels", [[0, 2], slice(None)])
 @pytest.mark.parametrize("is_length_future", [False, True])